@@ -149,7 +149,7 @@ from utils.theme_manager import (
     apply_theme, resolve_theme, get_theme_colors,
     make_hint_icon, font_role,
     get_overflow_trigger_qss,
-    SystemThemeWatcher,
+    SystemThemeWatcher, theme_version, prewarm_theme_tables,
 )
 from utils.build_flavor import window_title, app_name, is_beta
 from utils import perf_trace
@@ -489,6 +489,9 @@ class MultiToonTool(QMainWindow):
         self.setCentralWidget(self.container)
 
         self._apply_full_theme()
+        # Build the other theme's token tables at idle so the first dark/light
+        # toggle only looks them up.
+        QTimer.singleShot(0, prewarm_theme_tables)
         self._apply_window_chrome()
         self._refresh_header_session_status()
         # Demo mode (TTMT_DEMO_LAUNCH_TAB) jumps directly to the Launch tab so
@@ -1702,6 +1705,7 @@ class MultiToonTool(QMainWindow):
         )
 
     def _apply_full_theme(self):
+        self._styled_theme_version = theme_version()
         c = self._theme_colors()
 
         # Container card + header corners/stroke (rounded vs native/maximized)
@@ -1737,7 +1741,11 @@ class MultiToonTool(QMainWindow):
 
     def on_theme_changed(self):
         theme = resolve_theme(self.settings_manager)
-        apply_theme(QApplication.instance(), theme)
+        version = apply_theme(QApplication.instance(), theme)
+        if version == getattr(self, "_styled_theme_version", None):
+            # Same theme re-applied (e.g. System -> Dark while the OS is dark):
+            # every sheet would come out identical, so skip the restyle.
+            return
         self._apply_full_theme()
 
     @Slot(str)
@@ -1914,6 +1922,11 @@ class MultiToonTool(QMainWindow):
                 print("[shutdown]    update_checker.shutdown() returned")
         except Exception as e:
             print(f"[Main] update_checker shutdown error: {e}")
+        try:
+            if hasattr(self, "update_runner"):
+                self.update_runner.shutdown()
+        except Exception as e:
+            print(f"[Main] update_runner shutdown error: {e}")
         print(f"[shutdown] complete pid={os.getpid()}")
 
     def closeEvent(self, event):
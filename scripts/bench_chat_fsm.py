@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""ChatFsm keydown throughput and retained allocations per event.
+
+Feeds seeded key streams (held movement, chat typing, and a mixed stream
+with chords, Escape and ticks) through ``ChatFsm`` and reports events per
+second plus memory blocks still allocated per event afterwards (should be
+~0 now that decisions and results are shared, preallocated instances).
+
+Usage:
+  python3 scripts/bench_chat_fsm.py [--events 200000] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.chat_fsm import ChatCtx, ChatFsm  # noqa: E402
+
+CTX = ChatCtx(bound_keys=frozenset({"w", "a", "s", "d", "space", "Up", "Down",
+                                    "Left", "Right", "Delete", "End"}))
+
+
+def _stream(kind, rng, n):
+    movement = ["w", "a", "s", "d", "Up", "Left", "space"]
+    letters = list("hello there friend ") + ["BackSpace"]
+    events, t = [], 0.0
+    for _ in range(n):
+        t += rng.random() * 0.05
+        if kind == "movement":
+            key = rng.choice(movement)
+        elif kind == "typing":
+            key = rng.choice(letters)
+            key = "space" if key == " " else key
+        else:
+            r = rng.random()
+            if r < 0.02:
+                key = "Return"
+            elif r < 0.03:
+                key = "Escape"
+            elif r < 0.1:
+                events.append(("tick", None, t))
+                continue
+            else:
+                key = rng.choice(movement + letters[:-1] + ["Shift_L", "F1"])
+                key = "space" if key == " " else key
+        events.append(("down", key, t))
+        events.append(("up", key, t + 0.03))
+    return events
+
+
+def _replay(events):
+    fsm = ChatFsm()
+    down, up, tick = fsm.on_keydown, fsm.on_keyup, fsm.on_tick
+    for what, key, t in events:
+        if what == "down":
+            down(key, t, CTX)
+        elif what == "up":
+            up(key, t, CTX)
+        else:
+            tick(t, CTX)
+    return fsm
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--events", type=int, default=200_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    rng = random.Random(1)
+    print(f"{'stream':>9} {'events':>8} {'ms':>8} {'events/s':>11} {'blocks/event':>13}")
+    for kind in ("movement", "typing", "mixed"):
+        events = _stream(kind, rng, args.events // 2)
+        if kind == "typing":
+            # Open chat first so the stream exercises the capture table.
+            events.insert(0, ("down", "Return", -1.0))
+        t = _best(lambda: _replay(events), args.repeat)
+        _replay(events)                                 # warm caches
+        before = sys.getallocatedblocks()
+        fsm = _replay(events)
+        retained = sys.getallocatedblocks() - before
+        del fsm
+        print(f"{kind:>9} {len(events):>8} {t * 1e3:>8.1f} "
+              f"{len(events) / t:>11,.0f} {retained / len(events):>13.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
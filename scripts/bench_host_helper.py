@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Flatpak host-command benchmark: long-lived helper vs one spawn per call.
+
+Runs ``--calls`` sequential ``host_run`` commands through the host helper
+(utils/host_helper.py) and then through plain per-command flatpak-spawn,
+against a local flatpak-spawn stand-in (a Python script that drops its own
+flags and execs the command, like tests/test_host_helper.py uses). Outside
+a sandbox the stand-in is the only spawn cost measured; inside a real
+Flatpak the per-spawn portal round trip widens the gap further.
+
+Usage:
+  python3 scripts/bench_host_helper.py [--calls 100] [--repeat 3] [--cmd true]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shlex
+import stat
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import host_helper, host_spawn  # noqa: E402
+
+FAKE_SPAWN = """#!{python}
+import os, sys
+args = sys.argv[1:]
+while args and args[0].startswith("--"):
+    args.pop(0)
+os.execvp(args[0], args)
+"""
+
+
+def _install_stand_in(tmp: str) -> None:
+    spawn = os.path.join(tmp, "flatpak-spawn")
+    with open(spawn, "w") as fh:
+        fh.write(FAKE_SPAWN.format(python=sys.executable))
+    os.chmod(spawn, os.stat(spawn).st_mode | stat.S_IEXEC)
+    host_spawn.in_flatpak = lambda: True
+    host_spawn.shutil.which = lambda name: spawn
+    host_helper._HELPER_PYTHON = sys.executable
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--calls", type=int, default=100)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--cmd", default="true")
+    args = ap.parse_args()
+    argv = shlex.split(args.cmd)
+
+    def run_calls():
+        for _ in range(args.calls):
+            host_spawn.host_run(argv, capture_output=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _install_stand_in(tmp)
+        try:
+            host_spawn.host_run(argv)           # start the helper
+            t_helper = _best(run_calls, args.repeat)
+            os.environ["TTMT_HOST_HELPER"] = "0"
+            t_spawn = _best(run_calls, args.repeat)
+        finally:
+            os.environ.pop("TTMT_HOST_HELPER", None)
+            host_helper.shutdown()
+
+    print(f"{'path':>8} {'calls':>6} {'total ms':>9} {'per call ms':>12}")
+    for name, t in (("helper", t_helper), ("spawn", t_spawn)):
+        print(f"{name:>8} {args.calls:>6} {t * 1e3:>9.1f} {t / args.calls * 1e3:>12.2f}")
+    print(f"speedup {t_spawn / t_helper:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""macOS injection helper fan-out benchmark against a stand-in engine.
+
+Drives the real scripts/macos_inject_helper.py request loop (serve()) with a
+fake delivery engine whose every posted event costs ``--delay`` seconds, the
+way a busy SkyLight post can. For each delay it sends ``--frames`` motion
+frames fanned out to ``--windows`` windows and times how long the helper
+takes to drain them (until a ping round trip returns), once with the
+batched protocol-2 fan-out and once with protocol-1 per-window lines.
+Runs on any platform; no SkyLight needed.
+
+Usage:
+  python3 scripts/bench_macos_inject_fanout.py [--delays 0,0.005,0.02] [--frames 100]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+import utils.macos_inject_remote as rem  # noqa: E402
+
+_STAND_IN = r'''
+import sys, time
+sys.path.insert(0, {scripts!r})
+import macos_inject_helper as h
+
+
+class Engine:
+    available = True
+
+    def resolve_psn(self, wid):
+        return bytes([wid % 256]) * 8
+
+    def resolve_owner(self, wid):
+        return 5000 + wid
+
+    def _post(self):
+        if {delay!r}:
+            time.sleep({delay!r})
+        return True
+
+    def press(self, pid, wid, psn, win, scr):
+        return self._post()
+
+    def release(self, pid, wid, psn, win, scr):
+        return self._post()
+
+    def motion(self, pid, wid, psn, win, scr, dragging):
+        return self._post()
+
+
+h.serve(Engine(), hello=lambda: {{"protocol": h.PROTOCOL, "platform_binary": True,
+                                 "objc_ok": True, "skylight_ok": True,
+                                 "preflight_post_access": True}})
+'''
+
+
+def _delivery(tmp: str, delay: float) -> rem._RemoteDelivery:
+    script = os.path.join(tmp, f"stand_in_{delay}.py")
+    with open(script, "w") as fh:
+        fh.write(_STAND_IN.format(scripts=os.path.join(_REPO, "scripts"), delay=delay))
+    rem._helper_path = lambda: script
+    d = rem._RemoteDelivery()
+    if not d.available:
+        raise SystemExit(f"stand-in helper failed: {d.last_reason()}")
+    return d
+
+
+def _run(d, protocol: int, frames: int, windows: int):
+    d._protocol = protocol
+    wids = range(11, 11 + windows)
+    before = d._rpc("ping")
+    t0 = time.perf_counter()
+    for x in range(frames):
+        d.post_fanout("motion", [(4000 + w, w, bytes([w]) * 8, (float(x), 1.0),
+                                  (float(x) + 100, 2.0), False) for w in wids])
+    t_send = time.perf_counter() - t0
+    after = d._rpc("ping", timeout=120.0)
+    t_drain = time.perf_counter() - t0
+    return (t_send, t_drain, after["posted"] - before["posted"],
+            after["coalesced"] - before["coalesced"])
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--delays", default="0,0.005,0.02")
+    ap.add_argument("--frames", type=int, default=100)
+    ap.add_argument("--windows", type=int, default=4)
+    args = ap.parse_args()
+    rem.macos_clt.clt_state = lambda: (True, None, sys.executable)
+    print(f"{'delay ms':>9} {'proto':>6} {'send ms':>8} {'drain ms':>9} "
+          f"{'posted':>7} {'coalesced':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_CACHE_HOME"] = os.path.join(tmp, "cache")
+        for delay in (float(s) for s in args.delays.split(",")):
+            d = _delivery(tmp, delay)
+            try:
+                for protocol in (2, 1):
+                    t_send, t_drain, posted, coalesced = _run(
+                        d, protocol, args.frames, args.windows)
+                    print(f"{delay * 1e3:>9.1f} {protocol:>6} {t_send * 1e3:>8.1f} "
+                          f"{t_drain * 1e3:>9.1f} {posted:>7} {coalesced:>10}")
+            finally:
+                d.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
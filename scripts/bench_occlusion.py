@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Ghost-glove occlusion benchmark across z-order snapshot sizes.
+
+Compares the per-glove QRegion subtraction (``_region_from_inputs``, the
+one-shot path) with the per-snapshot ``OcclusionIndex`` the renderers use:
+for each snapshot size, one index build plus ``--frames`` frames of
+``--gloves`` glove queries, against the same queries done by subtraction.
+
+Usage:
+  python3 scripts/bench_occlusion.py [--sizes 8,32,128,512] [--frames 240]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QRect  # noqa: E402
+
+from tabs.multitoon._ghost_cursors import CURSOR_SIZE, _region_from_inputs  # noqa: E402
+from utils.occlusion_index import OcclusionIndex  # noqa: E402
+
+GAME_RECT = QRect(0, 0, 2560, 1440)
+
+
+def _snapshot(rng, n):
+    return GAME_RECT, [QRect(rng.randint(-300, 2500), rng.randint(-300, 1400),
+                             rng.randint(60, 700), rng.randint(60, 500))
+                       for _ in range(n)]
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="8,32,128,512")
+    ap.add_argument("--frames", type=int, default=240)
+    ap.add_argument("--gloves", type=int, default=4)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    rng = random.Random(1)
+    n_queries = args.frames * args.gloves
+    print(f"{'windows':>8} {'rects':>6} {'build ms':>9} {'index ms':>9} "
+          f"{'subtract ms':>12} {'speedup':>8}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        inputs = _snapshot(rng, n)
+        gloves = [QRect(rng.randint(0, 2560), rng.randint(0, 1440),
+                        CURSOR_SIZE, CURSOR_SIZE) for _ in range(n_queries)]
+        t_build = _best(lambda: OcclusionIndex(inputs), args.repeat)
+        index = OcclusionIndex(inputs)
+        t_index = _best(lambda: [index.visible_region(g) for g in gloves], args.repeat)
+        t_sub = _best(lambda: [_region_from_inputs(g, inputs) for g in gloves],
+                      args.repeat)
+        total = t_build + t_index
+        print(f"{n:>8} {index.rect_count:>6} {t_build * 1e3:>9.2f} "
+              f"{t_index * 1e3:>9.2f} {t_sub * 1e3:>12.2f} {t_sub / total:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Local API port->PID lookup: /proc resolver vs `ss -tlnp`.
+
+Builds a synthetic /proc (six TTREngine listeners on 1547-1552 among
+``--procs`` unrelated processes, each with ``--fds`` open files) and times
+utils.linux_ttr_ports cold (fd walk) and warm (inode cache), next to one
+real ``ss -tlnp`` spawn when ss is installed.
+
+Usage:
+  python3 scripts/bench_proc_ports.py [--procs 400] [--fds 40] [--repeat 50]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import linux_ttr_ports  # noqa: E402
+
+PORTS = range(1547, 1553)
+
+
+def _build_proc(root, n_procs, n_fds):
+    os.makedirs(os.path.join(root, "net"))
+    rows = ["  sl  local_address rem_address   st ... inode"]
+    for i, port in enumerate(PORTS):
+        rows.append(f"   {i}: 0100007F:{port:04X} 00000000:0000 0A 00000000:00000000 "
+                    f"00:00000000 00000000  1000        0 {70000 + i} 1 0 100 0 0 10 0")
+    with open(os.path.join(root, "net", "tcp"), "w") as fh:
+        fh.write("\n".join(rows) + "\n")
+    with open(os.path.join(root, "net", "tcp6"), "w") as fh:
+        fh.write(rows[0] + "\n")
+    engines = {1000 + 37 * i: 70000 + i for i in range(len(PORTS))}
+    for pid in range(1000, 1000 + n_procs):
+        fd_dir = os.path.join(root, str(pid), "fd")
+        os.makedirs(fd_dir)
+        with open(os.path.join(root, str(pid), "comm"), "w") as fh:
+            fh.write("TTREngine\n" if pid in engines else "bash\n")
+        for fd in range(n_fds):
+            os.symlink(f"/dev/pts/{fd}", os.path.join(fd_dir, str(fd)))
+        if pid in engines:
+            os.symlink(f"socket:[{engines[pid]}]", os.path.join(fd_dir, str(n_fds)))
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--procs", type=int, default=400)
+    ap.add_argument("--fds", type=int, default=40)
+    ap.add_argument("--repeat", type=int, default=50)
+    args = ap.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        _build_proc(tmp, args.procs, args.fds)
+        linux_ttr_ports._PROC_ROOT = tmp
+        lookup = lambda: linux_ttr_ports.port_to_host_pid(PORTS[0], PORTS[-1])  # noqa: E731
+
+        def cold():
+            linux_ttr_ports.reset_cache()
+            return lookup()
+
+        found = cold()
+        assert sorted(found) == list(PORTS), found
+        t_cold = _best(cold, args.repeat)
+        lookup()
+        t_warm = _best(lookup, args.repeat)
+    print(f"{'path':>12} {'ports':>6} {'ms':>9}")
+    print(f"{'proc cold':>12} {len(PORTS):>6} {t_cold * 1e3:>9.3f}")
+    print(f"{'proc warm':>12} {len(PORTS):>6} {t_warm * 1e3:>9.3f}")
+    if shutil.which("ss"):
+        t_ss = _best(lambda: subprocess.run(["ss", "-tlnp"], capture_output=True),
+                     min(args.repeat, 5))
+        print(f"{'ss -tlnp':>12} {'-':>6} {t_ss * 1e3:>9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
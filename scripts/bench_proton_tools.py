@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Proton tool enumeration: cold scan vs the mtime-validated cache.
+
+Builds a synthetic Steam root with ``--tools`` user-installed tools plus a
+handful of official Protons (all backdated past the racy window) and times
+services.steam_proton_tools.enumerate_proton_tools cold (cache reset before
+each call) and warm.
+
+Usage:
+  python3 scripts/bench_proton_tools.py [--tools 50] [--repeat 50]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import steam_proton_tools  # noqa: E402
+
+OFFICIAL = ("Proton 9.0", "Proton 8.0", "Proton 7.0", "Proton - Experimental")
+VDF = ('"compatibilitytools"\n{\n  "compat_tools"\n  {\n    "%s"\n    {\n'
+       '      "install_path" "."\n      "display_name" "%s"\n    }\n  }\n}\n')
+
+
+def _make(base, vdf_name=None):
+    os.makedirs(base)
+    proton = os.path.join(base, "proton")
+    with open(proton, "w") as fh:
+        fh.write("#!/bin/sh\nexit 0\n")
+    os.chmod(proton, 0o755)
+    if vdf_name:
+        with open(os.path.join(base, "compatibilitytool.vdf"), "w") as fh:
+            fh.write(VDF % (vdf_name, vdf_name))
+
+
+def _build_root(root, n_tools):
+    for i in range(n_tools):
+        name = f"GE-Proton9-{i}"
+        _make(os.path.join(root, "compatibilitytools.d", name), name)
+    for name in OFFICIAL:
+        _make(os.path.join(root, "steamapps", "common", name))
+    past = time.time() - 3600
+    for dirpath, dirnames, filenames in os.walk(root):
+        for n in dirnames + filenames:
+            os.utime(os.path.join(dirpath, n), (past, past))
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--tools", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=50)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "Steam")
+        _build_root(root, args.tools)
+        roots = [root]
+
+        def cold():
+            steam_proton_tools.reset_cache()
+            steam_proton_tools.enumerate_proton_tools(roots)
+
+        def warm():
+            steam_proton_tools.enumerate_proton_tools(roots)
+
+        n = len(steam_proton_tools.enumerate_proton_tools(roots))
+        rows = [("cold scan", _best(cold, args.repeat)),
+                ("warm (cached)", _best(warm, args.repeat))]
+
+    print(f"{n} tools, best of {args.repeat}")
+    print(f"{'path':<16}{'ms':>10}")
+    for label, secs in rows:
+        print(f"{label:<16}{secs * 1000:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
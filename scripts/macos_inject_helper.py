@@ -28,6 +28,7 @@ os.dup2(2, 1)
 
 import ctypes  # noqa: E402
 import json  # noqa: E402
+import select  # noqa: E402
 import sys  # noqa: E402
 
 # ---- own-location import (flat .app layout), with a repo-source fallback ------
@@ -41,11 +42,18 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(_HERE))
     from utils import macos_mouse_delivery as mmd  # noqa: E402
 
-PROTOCOL = 1
+# 2: `resolve` (psn + owner in one round trip), `fanout` frames, drained-pipe
+# motion coalescing, and post counters on `ping`.
+PROTOCOL = 2
 
 # Ops that send a reply line back to the parent. The post ops (press/release/
-# motion) are FIRE-AND-FORGET (no reply) so the parent never blocks on a post.
-REPLYING_OPS = ("hello", "ping", "resolve_psn", "resolve_owner")
+# motion, and `fanout`, which carries one of them for several windows) are
+# FIRE-AND-FORGET (no reply) so the parent never blocks on a post.
+REPLYING_OPS = ("hello", "ping", "resolve", "resolve_psn", "resolve_owner")
+POST_OPS = ("press", "release", "motion")
+
+# Post counters, reported on `ping` (diagnostics + the protocol tests).
+STATS = {"posted": 0, "coalesced": 0}
 
 
 def log(msg):
@@ -113,74 +121,163 @@ def _request_post_access():
         return None
 
 
-log(f"start sys.executable={sys.executable} ppid={os.getppid()} cwd={os.getcwd()}")
-log(f"engine module={mmd.__file__}")
-# Trigger the Accessibility prompt for the helper identity ONCE at startup (first use).
-log(f"request_post_access={_request_post_access()}")
-eng = mmd.MacOSMouseDelivery()
-log(f"engine.available={eng.available}")
-
-
 def handle(req):
     op = req["op"]
     if op == "hello":
-        return {"ok": True, **_selftest()}
+        return {"ok": True, **_hello()}
     if op == "ping":
-        return {"ok": True, "available": bool(eng.available)}
+        return {"ok": True, "available": bool(eng.available), **STATS}
+    if op == "resolve":
+        wid = int(req["wid"])
+        psn = eng.resolve_psn(wid)
+        return {"ok": True, "psn": psn.hex() if psn else "",
+                "owner": eng.resolve_owner(wid)}
     if op == "resolve_psn":
         psn = eng.resolve_psn(int(req["wid"]))
         return {"ok": True, "psn": psn.hex() if psn else ""}
     if op == "resolve_owner":
         return {"ok": True, "owner": eng.resolve_owner(int(req["wid"]))}
-    if op in ("press", "release", "motion"):
-        pid, wid = int(req["pid"]), int(req["wid"])
-        psn = bytes.fromhex(req["psn"]) if req.get("psn") else None
-        win = (float(req["win"][0]), float(req["win"][1]))
-        scr = (float(req["screen"][0]), float(req["screen"][1]))
-        log(f"{op} pid={pid} wid={wid} psn={'set' if psn else 'NONE'} win={win} scr={scr}")
-        if op == "press":
-            r = eng.press(pid, wid, psn, win, scr)
-        elif op == "release":
-            r = eng.release(pid, wid, psn, win, scr)
-        else:
-            r = eng.motion(pid, wid, psn, win, scr, dragging=bool(req.get("dragging")))
-        return {"ok": True, "result": bool(r)}
+    if op in POST_OPS:
+        return _post(req)
     return {"ok": False, "error": f"unknown op {op}"}
 
 
-for line in sys.stdin:
-    line = line.strip()
-    if not line:
-        continue
-    req = None
+def _post(req):
+    op = req["op"]
+    pid, wid = int(req["pid"]), int(req["wid"])
+    psn = bytes.fromhex(req["psn"]) if req.get("psn") else None
+    win = (float(req["win"][0]), float(req["win"][1]))
+    scr = (float(req["screen"][0]), float(req["screen"][1]))
+    log(f"{op} pid={pid} wid={wid} psn={'set' if psn else 'NONE'} win={win} scr={scr}")
+    if op == "press":
+        r = eng.press(pid, wid, psn, win, scr)
+    elif op == "release":
+        r = eng.release(pid, wid, psn, win, scr)
+    else:
+        r = eng.motion(pid, wid, psn, win, scr, dragging=bool(req.get("dragging")))
+    STATS["posted"] += 1
+    return {"ok": True, "result": bool(r)}
+
+
+def _expand(req):
+    """The post ops a request line carries: a `fanout` frame is one gesture kind
+    for several windows, each target shaped like a single post op minus `op`."""
+    if req.get("op") == "fanout":
+        kind = req["kind"]
+        if kind not in POST_OPS:
+            raise ValueError(f"bad fanout kind {kind!r}")
+        return [dict(t, op=kind) for t in req["targets"]]
+    return [req]
+
+
+def _run_post(req):
     try:
-        req = json.loads(line)
-        resp = handle(req)
-        # Only the REPLYING_OPS write a reply line; post ops stay fire-and-forget so
-        # the parent never blocks on a post. This keeps the channel in sync: the proxy
-        # reads a reply ONLY for ops the helper actually replies to. Echo any
-        # correlation id the request carried back on the reply.
-        if req.get("op") in REPLYING_OPS:
-            if "id" in req:
-                resp["id"] = req["id"]
-            reply(resp)
-    except Exception as e:
+        _post(req)
+    except Exception:
         import traceback
         traceback.print_exc(file=sys.stderr)
-        # Emit an error reply ONLY for an op the parent is actually awaiting. For a
-        # fire-and-forget post op (failing in arg-parse before the engine's own guards)
-        # or an unparseable / non-dict line, stay SILENT on stdout: the parent's
-        # _send_noreply never reads, so a stray line would be misread as the NEXT
-        # replying op's reply and desync the channel. This mirrors the success path's
-        # "write a line only for REPLYING_OPS" invariant.
-        op = req.get("op") if isinstance(req, dict) else None
-        if op in REPLYING_OPS:
-            try:
-                err = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def _process(lines):
+    """Handle every complete line drained from the pipe in one pass. Motion is
+    display-paced, so queued motion for a window is NEWEST-WINS: while the
+    helper lags (a slow post), everything the parent wrote meanwhile arrives in
+    one drain and only the newest motion per window is posted. Any other op is
+    a barrier - pending motion is posted first - so press/release ordering and
+    replies are unchanged."""
+    pending = {}   # wid -> newest motion op, in arrival order
+
+    def flush():
+        for m in pending.values():
+            _run_post(m)
+        pending.clear()
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        req = None
+        try:
+            req = json.loads(line)
+            op = req.get("op")
+            if op == "fanout" or op in POST_OPS:
+                for p in _expand(req):
+                    if p["op"] == "motion":
+                        wid = int(p["wid"])
+                        if pending.pop(wid, None) is not None:
+                            STATS["coalesced"] += 1
+                        pending[wid] = p
+                    else:
+                        flush()
+                        _run_post(p)
+                continue
+            flush()
+            resp = handle(req)
+            # Only the REPLYING_OPS write a reply line; post ops stay fire-and-forget
+            # so the parent never blocks on a post. This keeps the channel in sync:
+            # the proxy reads a reply ONLY for ops the helper actually replies to.
+            # Echo any correlation id the request carried back on the reply.
+            if op in REPLYING_OPS:
                 if "id" in req:
-                    err["id"] = req["id"]
-                reply(err)
-            except Exception:
-                pass
+                    resp["id"] = req["id"]
+                reply(resp)
+        except Exception as e:
+            import traceback
+            traceback.print_exc(file=sys.stderr)
+            # Emit an error reply ONLY for an op the parent is actually awaiting. For a
+            # fire-and-forget post op (failing in arg-parse before the engine's own
+            # guards) or an unparseable / non-dict line, stay SILENT on stdout: the
+            # parent's _send_noreply never reads, so a stray line would be misread as
+            # the NEXT replying op's reply and desync the channel. This mirrors the
+            # success path's "write a line only for REPLYING_OPS" invariant.
+            op = req.get("op") if isinstance(req, dict) else None
+            if op in REPLYING_OPS:
+                try:
+                    err = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                    if "id" in req:
+                        err["id"] = req["id"]
+                    reply(err)
+                except Exception:
+                    pass
+    flush()
+
+
+def serve(engine, hello=_selftest, fd=0):
+    """Answer requests read from `fd` until EOF. Each pass takes EVERYTHING the
+    pipe holds (a blocking read for the first bytes, then non-blocking drains),
+    so _process can coalesce the motion that queued up behind a slow post."""
+    global eng, _hello
+    eng, _hello = engine, hello
+    buf = b""
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        buf += chunk
+        while select.select([fd], [], [], 0)[0]:
+            more = os.read(fd, 65536)
+            if not more:
+                break
+            buf += more
+        *lines, buf = buf.split(b"\n")
+        _process(lines)
+    if buf.strip():
+        _process([buf])
+
+
+def main():
+    log(f"start sys.executable={sys.executable} ppid={os.getppid()} cwd={os.getcwd()}")
+    log(f"engine module={mmd.__file__}")
+    # Trigger the Accessibility prompt for the helper identity ONCE at startup (first use).
+    log(f"request_post_access={_request_post_access()}")
+    engine = mmd.MacOSMouseDelivery()
+    log(f"engine.available={engine.available}")
+    serve(engine)
+    log("stdin closed; exiting")
+
+
+eng = None
+_hello = _selftest
 
-log("stdin closed; exiting")
+if __name__ == "__main__":
+    main()
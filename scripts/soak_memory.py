@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Headless long-session memory soak for the Multitoon tab.
+
+Drives synthetic window churn, toon logins/logouts, theme swaps and input
+toggles in compressed time (one iteration == one 5 s refresh tick), sampling
+memory through utils.leak_watch every ``--sample-every`` iterations. Prints
+the top allocation growers and exits nonzero when RSS, traced bytes or Qt
+object counts keep climbing after warm-up.
+
+Usage (real X server, the configuration the 8 h sessions run under):
+  xvfb-run -a python3 scripts/soak_memory.py --hours 8
+Without DISPLAY it falls back to the offscreen platform.
+
+  --hours H          simulated session length (default 8)
+  --sample-every N   iterations between samples (default 360 = 30 min)
+  --warmup N         samples treated as warm-up (default 2)
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get("DISPLAY"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("TTMT_NO_VENV_REEXEC", "1")
+
+from PySide6.QtCore import QObject, Signal  # noqa: E402
+from PySide6.QtGui import QColor  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+TICK_S = 5
+NAMES = ("Flippy", "Clarabelle", "Daffodil", "Sir Kippy", "Lil Oldman",
+         "Professor Pete", "Gyro", "Barnacle Bessie")
+
+
+class _FakeWindowManager(QObject):
+    window_ids_updated = Signal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.ttr_window_ids = []
+        self.window_games = {}
+
+    def get_window_ids(self): return list(self.ttr_window_ids)
+    def get_window_geometry(self, _wid): return None
+    def get_active_window(self): return None
+    def clear_window_ids(self): self.ttr_window_ids = []
+    def assign_windows(self): pass
+    def enable_detection(self): pass
+    def disable_detection(self): pass
+
+
+def _build_tab(app):
+    from tabs.debug_tab import DebugTab
+    from tabs.multitoon._tab import MultitoonTab
+    from utils.settings_manager import SettingsManager
+    wm = _FakeWindowManager()
+    debug = DebugTab()
+    debug.logging_enabled = True
+    tab = MultitoonTab(settings_manager=SettingsManager(), window_manager=wm)
+    tab.set_toon_capture_sink(lambda *a, **k: None)
+    app.processEvents()
+    return tab, wm, debug
+
+
+def _iteration(i, rng, app, tab, wm, debug, next_wid):
+    """One compressed 5 s tick of a busy multitoon session."""
+    from utils import toon_pattern_assets, ttr_api
+    from utils.game_registry import GameRegistry
+
+    # Window churn: every ~2 simulated minutes a toon closes and a new
+    # window (fresh X id) replaces it.
+    wids = list(wm.ttr_window_ids)
+    if not wids or i % 24 == 0:
+        if len(wids) >= 4 or (wids and rng.random() < 0.5):
+            wids.pop(rng.randrange(len(wids)))
+        while len(wids) < rng.randint(1, 4):
+            wids.append(str(next_wid[0]))
+            next_wid[0] += 1
+        wm.ttr_window_ids = wids
+        wm.window_games = {w: "ttr" for w in wids}
+        wm.window_ids_updated.emit(list(wids))
+
+    # Logins / logouts / laff ticks through the merged toon-data path.
+    names = [rng.choice(NAMES) if rng.random() > 0.1 else None for _ in wids]
+    laffs = [rng.randint(1, 137) for _ in wids]
+    tab._apply_merged_toon_data(wids, names, [None] * len(wids),
+                                ["#ff8800"] * len(wids), laffs,
+                                [137] * len(wids), [rng.randint(0, 40000)] * len(wids))
+    pid_for = GameRegistry.pid_for_window
+    GameRegistry.pid_for_window = staticmethod(lambda _wid: 4242)
+    try:
+        for wid, name, laff in zip(wids, names, laffs):
+            if name:
+                tab._capture_account_toon(wid, name, "", laff=laff)
+    finally:
+        GameRegistry.pid_for_window = pid_for
+
+    # Input: toggle chat/keep-alive on a random slot and back.
+    slot = rng.randrange(4)
+    tab.toggle_chat(slot)
+    tab.toggle_chat(slot)
+
+    # Theme swap every simulated 10 minutes.
+    if i % 120 == 0:
+        sm = tab.settings_manager
+        sm.set("theme", "light" if sm.get("theme", "dark") == "dark" else "dark")
+        tab.refresh_theme()
+
+    # Module-level caches fed by free-form keys.
+    toon_pattern_assets.tinted_pattern_pixmap(
+        "dots", QColor(rng.randrange(1 << 24)), 24)
+    ttr_api._debug_log(f"soak_{rng.randrange(10_000)}", f"[Soak] tick {i}")
+    debug.append_log(f"[Soak] tick {i} wids={wids}")
+
+    app.processEvents()
+
+
+def run(hours: float, sample_every: int, warmup: int, seed: int = 1) -> int:
+    from utils import ttr_api
+    from utils.leak_watch import LeakWatch
+
+    cfg = tempfile.mkdtemp(prefix="ttmt-soak-")
+    os.environ["TTMT_CONFIG_DIR"] = cfg
+    os.environ["HOME"] = cfg
+
+    app = QApplication.instance() or QApplication([])
+    ttr_api.set_debug(True)
+    ttr_api.set_log_callback(lambda _msg: None)
+    tab, wm, debug = _build_tab(app)
+    rng = random.Random(seed)
+    next_wid = [0x3a00001]
+
+    watch = LeakWatch(warmup=warmup)
+    watch.start()
+    iterations = int(hours * 3600 / TICK_S)
+    try:
+        for i in range(iterations):
+            _iteration(i, rng, app, tab, wm, debug, next_wid)
+            if i % sample_every == 0:
+                s = watch.sample()
+                print(f"[soak] t={i * TICK_S / 3600:5.2f}h rss={s.rss / 2**20:7.1f}MiB "
+                      f"traced={s.traced_bytes / 2**20:6.2f}MiB "
+                      f"qobjects={s.qt_objects} widgets={s.qt_widgets}", flush=True)
+        watch.sample()
+    finally:
+        if getattr(tab, "input_service", None) is not None:
+            tab.input_service.shutdown()
+
+    print("[soak] top growers since warm-up:")
+    for line in watch.top_growers():
+        print(f"  {line}")
+    verdict = watch.verdict()
+    watch.stop()
+    for reason in verdict.reasons:
+        print(f"[soak] FAIL: {reason}")
+    print("[soak] PASS" if verdict.ok else "[soak] leak suspected")
+    return 0 if verdict.ok else 1
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--hours", type=float, default=8.0)
+    ap.add_argument("--sample-every", type=int, default=360)
+    ap.add_argument("--warmup", type=int, default=2)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+    return run(args.hours, max(1, args.sample_every), args.warmup, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
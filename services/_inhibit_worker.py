@@ -1,6 +1,7 @@
 """Run SleepInhibitor.acquire() off the GUI thread.
 
-acquire() shells out to systemd-inhibit and polls `systemd-inhibit --list`;
+acquire() makes blocking D-Bus calls and, when no bus is usable, falls back
+to shelling out to systemd-inhibit and polling `systemd-inhibit --list`;
 under Flatpak that crosses flatpak-spawn, which can be slow. Doing it on the
 GUI thread would freeze Keep-Alive activation, so it runs in a QThread and
 emits the resulting InhibitStatus back to the GUI thread.
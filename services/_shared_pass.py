@@ -0,0 +1,70 @@
+"""In-flight de-duplication for the game-file verify passes.
+
+Several account launches against the same install used to serialize on a
+process-wide lock, each one re-fetching the manifest and (on a cache miss)
+re-hashing the install. ``SharedPasses.run(key, work)`` instead lets the first
+caller for a key run ``work()`` while concurrent callers for the same key block
+on that one result; callers for *different* keys (the TTR and CC installs, or
+two TTR installs) run in parallel.
+
+A successful result is also reused for ``reuse_s`` seconds after it finishes,
+so the accounts of one launch group that finish logging in a few seconds apart
+share a single manifest fetch instead of one each. Failures are never reused:
+the next caller retries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class _Pass:
+    __slots__ = ("done", "result", "finished_at")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.finished_at = 0.0
+
+
+class SharedPasses:
+    def __init__(self, reuse_s: float = 0.0, clock=time.monotonic):
+        self._reuse_s = reuse_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._inflight: dict[str, _Pass] = {}
+        self._recent: dict[str, _Pass] = {}
+
+    def clear(self) -> None:
+        """Forget reusable results (in-flight passes are left to finish)."""
+        with self._lock:
+            self._recent.clear()
+
+    def run(self, key: str, work, reusable=lambda result: True):
+        """Return ``(result, owner)``: ``owner`` is True when this call ran
+        ``work()`` itself, False when it joined (or reused) another caller's
+        pass. ``work`` must not raise; report failures in its result."""
+        with self._lock:
+            recent = self._recent.get(key)
+            if recent is not None:
+                if self._clock() - recent.finished_at <= self._reuse_s:
+                    return recent.result, False
+                del self._recent[key]
+            p = self._inflight.get(key)
+            owner = p is None
+            if owner:
+                p = self._inflight[key] = _Pass()
+        if not owner:
+            p.done.wait()
+            return p.result, False
+        try:
+            p.result = work()
+        finally:
+            p.finished_at = self._clock()
+            with self._lock:
+                del self._inflight[key]
+                if self._reuse_s > 0 and reusable(p.result):
+                    self._recent[key] = p
+            p.done.set()
+        return p.result, True
@@ -20,6 +20,7 @@ import requests
 from PySide6.QtCore import QObject, Signal
 
 from services.cc_login_service import CC_METADATA_URL, CC_HEADERS
+from services._shared_pass import SharedPasses
 from services.ttr_patcher import place_file, local_sha1
 from utils.host_spawn import host_run, in_flatpak
 
@@ -165,13 +166,16 @@ def ensure_parent_dir(dest_path: str) -> None:
 # still re-verifying if CC pushes an update mid-session.
 _verified_manifests = {}
 
-# Serializes verify+patch across concurrent account launches so they don't
-# redundantly re-download and collide on shared staging/temp paths.
-_patch_lock = threading.Lock()
+# One verify pass per game dir at a time; see ttr_patcher._passes. Joiners
+# share the owner's manifest fetch and hash walk (the launcher token only
+# authorizes the download-server lookup, so any account's token serves).
+_PASS_REUSE_S = 15.0
+_passes = SharedPasses(reuse_s=_PASS_REUSE_S)
 
 
 def reset_verify_cache() -> None:
     _verified_manifests.clear()
+    _passes.clear()
 
 
 def _manifest_sha(files: list) -> str:
@@ -189,44 +193,55 @@ class CCPatcher(QObject):
                          realm: str = "production") -> None:
         """Verify the selected CC install against CC's manifest and repair
         stale files on a background thread. Emits exactly one terminal signal
-        (up_to_date | patched | failed)."""
+        (up_to_date | patched | failed); a call joining another launch's
+        in-flight pass for the same game dir gets that pass's outcome."""
         game_dir = os.path.realpath(game_dir)
         platform = _platform_for_os()
 
         def _run():
             self.progress.emit("Checking Corporate Clash files…", 0)
-            with _patch_lock:
-                try:
-                    try:
-                        files = fetch_all_manifests(realm, platform)
-                    except requests.RequestException as e:
-                        print(f"[CCPatcher] manifest unreachable, proceeding: {e}")
-                        self.up_to_date.emit()
-                        return
-                    msha = _manifest_sha(files)
-                    if _verified_manifests.get(game_dir) == msha:
-                        self.up_to_date.emit()
-                        return
-                    stale = select_stale(files, game_dir)
-                    if not stale:
-                        _verified_manifests[game_dir] = msha
-                        self.up_to_date.emit()
-                        return
-                    base, server_name = resolve_download_server(launcher_token, realm)
-                    updated = []
-                    total = len(stale)
-                    for i, entry in enumerate(stale):
-                        self.progress.emit(f"Updating {entry['filePath']}…",
-                                           int(i / total * 100))
-                        data = fetch_verified(entry, base, server_name)
-                        dest = _local_path(game_dir, entry["filePath"])
-                        ensure_parent_dir(dest)
-                        place_file(data, dest)
-                        updated.append(entry["filePath"])
-                    _verified_manifests[game_dir] = msha
-                    self.progress.emit("Corporate Clash files updated.", 100)
-                    self.patched.emit(updated)
-                except Exception as e:
-                    self.failed.emit(f"Corporate Clash file update failed: {e}")
+            (kind, payload), owner = _passes.run(
+                f"{realm}:{game_dir}",
+                lambda: self._verify(game_dir, launcher_token, realm, platform),
+                reusable=lambda r: r[0] != "failed")
+            if kind == "failed":
+                self.failed.emit(payload)
+            elif kind == "patched" and owner:
+                self.progress.emit("Corporate Clash files updated.", 100)
+                self.patched.emit(payload)
+            else:
+                self.up_to_date.emit()
 
         threading.Thread(target=_run, daemon=True).start()
+
+    def _verify(self, game_dir, launcher_token, realm, platform) -> tuple[str, object]:
+        """The shared pass body: ("up_to_date", None) | ("patched", [paths])
+        | ("failed", message). Never raises."""
+        try:
+            try:
+                files = fetch_all_manifests(realm, platform)
+            except requests.RequestException as e:
+                print(f"[CCPatcher] manifest unreachable, proceeding: {e}")
+                return "up_to_date", None
+            msha = _manifest_sha(files)
+            if _verified_manifests.get(game_dir) == msha:
+                return "up_to_date", None
+            stale = select_stale(files, game_dir)
+            if not stale:
+                _verified_manifests[game_dir] = msha
+                return "up_to_date", None
+            base, server_name = resolve_download_server(launcher_token, realm)
+            updated = []
+            total = len(stale)
+            for i, entry in enumerate(stale):
+                self.progress.emit(f"Updating {entry['filePath']}…",
+                                   int(i / total * 100))
+                data = fetch_verified(entry, base, server_name)
+                dest = _local_path(game_dir, entry["filePath"])
+                ensure_parent_dir(dest)
+                place_file(data, dest)
+                updated.append(entry["filePath"])
+            _verified_manifests[game_dir] = msha
+            return "patched", updated
+        except Exception as e:
+            return "failed", f"Corporate Clash file update failed: {e}"
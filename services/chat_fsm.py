@@ -114,6 +114,28 @@ class ChatFsmConfig:
     capture_ttl: float = 15.0    # hands-off backstop; also composition-context expiry
 
 
+# Shared immutable results for the payload-free cases (see the compiled
+# dispatch note below).
+_DECISIONS = {kind: KeyDecision(kind) for kind in KeyClass}
+_NO_UP = UpResult()
+_NO_TICK = TickResult()
+_TRANSITIONS: dict = {}
+
+
+def _decision(kind: KeyClass, transitions: tuple) -> KeyDecision:
+    if not transitions:
+        return _DECISIONS[kind]
+    return KeyDecision(kind, transitions)
+
+
+def _transition(old: ChatState, new: ChatState, cause: str) -> tuple:
+    key = (old, new, cause)
+    tr = _TRANSITIONS.get(key)
+    if tr is None:
+        tr = _TRANSITIONS[key] = (Transition(old, new, cause),)
+    return tr
+
+
 # DISPROVEN (live Fedora validation, 2026-07-03): GRACE tap-deferral — bound
 # printable taps hold-confirmed for GRACE_DEFER=200ms during the post-close
 # window — as trailing-chat protection. With both toons on the Default
@@ -163,6 +185,47 @@ def _is_typeable(key: str) -> bool:
     return _is_printable_char(key) or key in _TYPEABLE_MULTICHAR
 
 
+# ── Compiled dispatch ────────────────────────────────────────────────────
+#
+# Every keydown used to walk the branch ladders of _keydown_in_capture /
+# _keydown_route_or_grace and allocate a fresh KeyDecision, although nearly
+# every keystroke (movement in ROUTE, typing in a capture) lands on a
+# constant answer. The ladders depend only on four facts: the state group
+# (capture or not), whether the key completes an open chord, whether it is
+# bound, and the key's static kind below. Those are compiled into two
+# tables (_ROUTE_TABLE / _CAPTURE_TABLE, built after ChatFsm) whose entries
+# are either a preallocated KeyDecision (returned as is) or the handler for
+# the few cases with bookkeeping. Results and transitions without payload
+# are shared immutable instances as well.
+
+_K_MOD, _K_ESCAPE, _K_BACKSPACE, _K_EDIT, _K_PRINT, _K_SPACE, _K_OTHER = range(7)
+
+_KEY_KINDS: dict = {}
+
+
+def _key_kind(key: str) -> int:
+    kind = _KEY_KINDS.get(key)
+    if kind is not None:
+        return kind
+    if key in MODIFIER_KEYS:
+        kind = _K_MOD
+    elif key == "Escape":
+        kind = _K_ESCAPE
+    elif key == "BackSpace":
+        kind = _K_BACKSPACE
+    elif key in CHAT_EDIT_KEYS:
+        kind = _K_EDIT
+    elif _is_printable_char(key):
+        kind = _K_PRINT
+    elif key in _TYPEABLE_MULTICHAR:
+        kind = _K_SPACE
+    else:
+        kind = _K_OTHER
+    if len(_KEY_KINDS) < 4096:       # keysyms are a small closed set
+        _KEY_KINDS[key] = kind
+    return kind
+
+
 class ChatFsm:
     def __init__(self, config: Optional[ChatFsmConfig] = None) -> None:
         self.config = config or ChatFsmConfig()
@@ -199,7 +262,7 @@ class ChatFsm:
 
     @property
     def in_capture(self) -> bool:
-        return self._state in (ChatState.CAPTURE, ChatState.CAPTURE_SOFT)
+        return self._state in _CAPTURE_STATES
 
     def context_active(self, now: float) -> bool:
         """Composition context, with lazy expiry. The expiry bound is the
@@ -215,96 +278,99 @@ class ChatFsm:
     # ── events ───────────────────────────────────────────────────────────
 
     def on_keydown(self, key: str, now: float, ctx: ChatCtx) -> KeyDecision:
-        if key in MODIFIER_KEYS:
-            name = _MOD_NAME.get(key)
-            if name:
-                self._mods_down[name] = self._mods_down.get(name, 0) + 1
-            return KeyDecision(KeyClass.MODIFIER)
+        kind = _KEY_KINDS.get(key)
+        if kind is None:
+            kind = _key_kind(key)
+        if kind == _K_MOD:
+            name = _MOD_NAME[key]
+            self._mods_down[name] = self._mods_down.get(name, 0) + 1
+            return _DECISIONS[KeyClass.MODIFIER]
 
         self._down[key] = now
         is_bound = key in ctx.bound_keys
-        if not is_bound and _is_printable_char(key):
+        if kind == _K_PRINT and not is_bound:
             self._unbound_printable_down.add(key)
 
-        is_chord = self._matches_chord(key, ctx)
+        table = _CAPTURE_TABLE if self._state in _CAPTURE_STATES else _ROUTE_TABLE
+        entry = table[self._matches_chord(key, ctx), is_bound, kind]
+        if entry.__class__ is KeyDecision:
+            return entry
+        return entry(self, key, now, ctx)
 
-        if self.in_capture:
-            return self._keydown_in_capture(key, now, ctx, is_bound, is_chord)
-        return self._keydown_route_or_grace(key, now, ctx, is_bound, is_chord)
-
-    def _keydown_in_capture(self, key, now, ctx, is_bound, is_chord) -> KeyDecision:
-        # State-dependent branch precedence: chord/Escape/BackSpace outrank
-        # movement classification while a capture is live, so a bound Escape
-        # (CC book) or a bound chord key can still CLOSE a stuck capture —
-        # the direction of the 45131ce shadowing bug that hurt.
-        if is_chord:
-            self._last_chord_at = now
-            cause = "send"
-            if self._state is ChatState.CAPTURE and not self._open_had_typing:
-                cause = "close_empty"
-            return KeyDecision(KeyClass.CHORD_CLOSE, self._go(ChatState.GRACE, cause, now))
-        if key == "Escape":
-            self._last_chord_at = now
-            return KeyDecision(KeyClass.CHORD_CLOSE, self._go(ChatState.GRACE, "escape", now))
-        if key == "BackSpace":
-            trs = self._note_typing_evidence(now)
-            self._open_had_typing = True
-            if self._state is ChatState.CAPTURE_SOFT:
-                return KeyDecision(KeyClass.SUPPRESS, trs)
-            return KeyDecision(KeyClass.EDIT, trs)
-        if key in CHAT_EDIT_KEYS:
-            # Editing refreshes the TTL even when the key is bound; the
-            # concurrent-hold demote rule still outranks it via on_tick.
-            self._last_chat_evidence = now
-            if self._state is ChatState.CAPTURE_SOFT:
-                return KeyDecision(KeyClass.SUPPRESS)
-            return KeyDecision(KeyClass.TYPING)
-        if is_bound and not _is_typeable(key):
-            # A bound action tap (F-key, Prior/Next, ...) is impossible as
-            # chat content: demote immediately, then route the key under the
-            # new state (the user is playing). space is exempt: it is typed
-            # at every word boundary (see _TYPEABLE_MULTICHAR).
-            return KeyDecision(KeyClass.MOVEMENT, self._go(ChatState.GRACE, "demote_tap", now))
-        if not is_bound and _is_printable_char(key):
-            self._note_typing_evidence(now)
+    # Capture handlers (CAPTURE / CAPTURE_SOFT). State-dependent precedence,
+    # encoded by _compile_tables: chord/Escape/BackSpace outrank movement
+    # classification while a capture is live, so a bound Escape (CC book)
+    # or a bound chord key can still CLOSE a stuck capture — the direction
+    # of the 45131ce shadowing bug that hurt.
+
+    def _capture_chord(self, key, now, ctx) -> KeyDecision:
+        self._last_chord_at = now
+        cause = "send"
+        if self._state is ChatState.CAPTURE and not self._open_had_typing:
+            cause = "close_empty"
+        return KeyDecision(KeyClass.CHORD_CLOSE, self._go(ChatState.GRACE, cause, now))
+
+    def _capture_escape(self, key, now, ctx) -> KeyDecision:
+        self._last_chord_at = now
+        return KeyDecision(KeyClass.CHORD_CLOSE, self._go(ChatState.GRACE, "escape", now))
+
+    def _capture_backspace(self, key, now, ctx) -> KeyDecision:
+        trs = self._note_typing_evidence(now)
         self._open_had_typing = True
         if self._state is ChatState.CAPTURE_SOFT:
-            return KeyDecision(KeyClass.SUPPRESS)
-        return KeyDecision(KeyClass.TYPING)
-
-    def _keydown_route_or_grace(self, key, now, ctx, is_bound, is_chord) -> KeyDecision:
-        if is_chord:
-            if is_bound:
-                # Open-chord key bound in a keyset: movement wins outside a
-                # capture (documented residual; chat capture is disabled for
-                # such configs and the keymap editor should flag it).
-                return KeyDecision(KeyClass.MOVEMENT)
-            return self._classify_chord(key, now)
-
-        if key == "Escape":
-            if is_bound:
-                return KeyDecision(KeyClass.MOVEMENT)  # CC book in play
-            self._context_active = False
-            return KeyDecision(KeyClass.ESCAPE_CLEAR)
+            return _decision(KeyClass.SUPPRESS, trs)
+        return _decision(KeyClass.EDIT, trs)
 
-        if key == "BackSpace":
-            return KeyDecision(KeyClass.EDIT, self._note_typing_evidence(now))
+    def _capture_edit(self, key, now, ctx) -> KeyDecision:
+        # Editing refreshes the TTL even when the key is bound; the
+        # concurrent-hold demote rule still outranks it via on_tick.
+        self._last_chat_evidence = now
+        if self._state is ChatState.CAPTURE_SOFT:
+            return _DECISIONS[KeyClass.SUPPRESS]
+        return _DECISIONS[KeyClass.TYPING]
 
-        if is_bound:
-            # GRACE included: bound keys route INSTANTLY after a close (the
-            # tap-deferral experiment is DISPROVEN — see the module note).
-            return KeyDecision(KeyClass.MOVEMENT)
+    def _capture_demote_tap(self, key, now, ctx) -> KeyDecision:
+        # A bound action tap (F-key, Prior/Next, ...) is impossible as chat
+        # content: demote immediately, then route the key under the new
+        # state (the user is playing). space is exempt: it is typed at every
+        # word boundary (see _TYPEABLE_MULTICHAR).
+        return KeyDecision(KeyClass.MOVEMENT, self._go(ChatState.GRACE, "demote_tap", now))
 
-        if _is_printable_char(key):
-            if ctx.mode_b:
-                # Deterministic: the game opens chat on this letter. The
-                # letter itself is the mirrored open key.
-                tr = self._go(ChatState.CAPTURE, "mode_b_letter", now)
-                self._open_had_typing = True
-                return KeyDecision(KeyClass.CHORD_OPEN, tr, open_key=key)
-            return KeyDecision(KeyClass.TYPING)
+    def _capture_typed_char(self, key, now, ctx) -> KeyDecision:
+        self._note_typing_evidence(now)
+        return self._capture_typing(key, now, ctx)
 
-        return KeyDecision(KeyClass.ACTION)
+    def _capture_typing(self, key, now, ctx) -> KeyDecision:
+        self._open_had_typing = True
+        if self._state is ChatState.CAPTURE_SOFT:
+            return _DECISIONS[KeyClass.SUPPRESS]
+        return _DECISIONS[KeyClass.TYPING]
+
+    # ROUTE / GRACE handlers. A bound open-chord key routes as movement
+    # outside a capture (documented residual; chat capture is disabled for
+    # such configs and the keymap editor should flag it), a bound Escape is
+    # CC's book in play, and bound keys route INSTANTLY in GRACE too (the
+    # tap-deferral experiment is DISPROVEN — see the module note). Those are
+    # constant table entries.
+
+    def _route_chord(self, key, now, ctx) -> KeyDecision:
+        return self._classify_chord(key, now)
+
+    def _route_escape(self, key, now, ctx) -> KeyDecision:
+        self._context_active = False
+        return _DECISIONS[KeyClass.ESCAPE_CLEAR]
+
+    def _route_backspace(self, key, now, ctx) -> KeyDecision:
+        return _decision(KeyClass.EDIT, self._note_typing_evidence(now))
+
+    def _route_char(self, key, now, ctx) -> KeyDecision:
+        if ctx.mode_b:
+            # Deterministic: the game opens chat on this letter. The letter
+            # itself is the mirrored open key.
+            tr = self._go(ChatState.CAPTURE, "mode_b_letter", now)
+            self._open_had_typing = True
+            return KeyDecision(KeyClass.CHORD_OPEN, tr, open_key=key)
+        return _DECISIONS[KeyClass.TYPING]
 
     def on_keyup(self, key: str, now: float, ctx: ChatCtx) -> UpResult:
         if key in MODIFIER_KEYS:
@@ -313,42 +379,42 @@ class ChatFsm:
                 self._mods_down[name] -= 1
                 if self._mods_down[name] <= 0:
                     del self._mods_down[name]
-            return UpResult()
+            return _NO_UP
 
         down_at = self._down.pop(key, None)
         self._unbound_printable_down.discard(key)
 
-        transitions: tuple = ()
         if (down_at is not None
                 and down_at > self._last_chord_at
                 and key not in ctx.bound_keys
                 and _is_printable_char(key)
                 and now - down_at < self.config.tap_max):
             transitions = self._note_typing_evidence(now)
-
-        return UpResult(transitions)
+            if transitions:
+                return UpResult(transitions)
+        return _NO_UP
 
     def on_tick(self, now: float, ctx: ChatCtx) -> TickResult:
         cfg = self.config
-        transitions: list = []
+        transitions: tuple = ()
 
-        if self.in_capture:
+        if self._state in _CAPTURE_STATES:
             demote = self._gameplay_demote_cause(now, ctx)
             if demote:
-                transitions.extend(self._go(ChatState.GRACE, demote, now))
+                transitions = self._go(ChatState.GRACE, demote, now)
             elif (self._last_chat_evidence
                     and now - self._last_chat_evidence > cfg.capture_ttl):
-                transitions.extend(self._go(ChatState.GRACE, "ttl", now))
+                transitions = self._go(ChatState.GRACE, "ttl", now)
         elif self._state is ChatState.GRACE:
             if now - self._state_entered >= cfg.grace_s:
-                transitions.extend(self._go(ChatState.ROUTE, "grace_end", now))
+                transitions = self._go(ChatState.ROUTE, "grace_end", now)
         elif self._state is ChatState.ROUTE and self._context_active:
             # Gameplay contradiction clears a lingering context so a much
             # later chord cannot misread as SEND.
             if self._gameplay_demote_cause(now, ctx):
                 self._context_active = False
 
-        return TickResult(tuple(transitions))
+        return TickResult(transitions) if transitions else _NO_TICK
 
     def on_focus_change_managed(self, now: float) -> tuple:
         """Focus moved between managed game windows. Mid-capture, the box
@@ -395,7 +461,7 @@ class ChatFsm:
         self._context_active = False
 
     def _matches_chord(self, key: str, ctx: ChatCtx) -> bool:
-        held = set(self._mods_down)
+        held = self._mods_down.keys()
         for mods, chord_key in ctx.open_chords:
             if key == chord_key and mods <= held:
                 return True
@@ -409,7 +475,7 @@ class ChatFsm:
             # as a fresh OPEN.
             self._context_active = False
             self._typing_events.clear()
-            return KeyDecision(KeyClass.CHORD_SEND)
+            return _DECISIONS[KeyClass.CHORD_SEND]
         tr = self._go(ChatState.CAPTURE, "chord_open", now)
         self._open_had_typing = False
         return KeyDecision(KeyClass.CHORD_OPEN, tr, open_key=key)
@@ -460,4 +526,51 @@ class ChatFsm:
         else:
             self._context_active = False
             self._typing_events.clear()
-        return (Transition(old, new, cause),)
+        return _transition(old, new, cause)
+
+
+_CAPTURE_STATES = frozenset({ChatState.CAPTURE, ChatState.CAPTURE_SOFT})
+
+
+def _compile_tables():
+    """(is_chord, is_bound, key kind) -> KeyDecision or handler, for the
+    capture states and for ROUTE/GRACE. The precedence of each ladder is
+    the order of the checks below."""
+    capture, route = {}, {}
+    movement = _DECISIONS[KeyClass.MOVEMENT]
+    for is_chord in (False, True):
+        for is_bound in (False, True):
+            for kind in (_K_ESCAPE, _K_BACKSPACE, _K_EDIT, _K_PRINT, _K_SPACE, _K_OTHER):
+                slot = (is_chord, is_bound, kind)
+
+                if is_chord:
+                    capture[slot] = ChatFsm._capture_chord
+                elif kind == _K_ESCAPE:
+                    capture[slot] = ChatFsm._capture_escape
+                elif kind == _K_BACKSPACE:
+                    capture[slot] = ChatFsm._capture_backspace
+                elif kind == _K_EDIT:
+                    capture[slot] = ChatFsm._capture_edit
+                elif is_bound and kind == _K_OTHER:
+                    capture[slot] = ChatFsm._capture_demote_tap
+                elif not is_bound and kind == _K_PRINT:
+                    capture[slot] = ChatFsm._capture_typed_char
+                else:
+                    capture[slot] = ChatFsm._capture_typing
+
+                if is_chord:
+                    route[slot] = movement if is_bound else ChatFsm._route_chord
+                elif kind == _K_ESCAPE:
+                    route[slot] = movement if is_bound else ChatFsm._route_escape
+                elif kind == _K_BACKSPACE:
+                    route[slot] = ChatFsm._route_backspace
+                elif is_bound:
+                    route[slot] = movement
+                elif kind == _K_PRINT:
+                    route[slot] = ChatFsm._route_char
+                else:
+                    route[slot] = _DECISIONS[KeyClass.ACTION]
+    return capture, route
+
+
+_CAPTURE_TABLE, _ROUTE_TABLE = _compile_tables()
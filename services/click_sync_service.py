@@ -49,7 +49,11 @@ class _MotionInjector:
     sampling law the ghost renderer follows, CP16). The RPC's pipe I/O
     releases the GIL, so this thread costs the app loop nothing while it
     waits. Failures are swallowed exactly like the synchronous path did
-    (a dying target is reclaimed by window re-detection within ~2s)."""
+    (a dying target is reclaimed by window re-detection within ~2s).
+
+    Each wake drains EVERY pending target at once; a backend with
+    send_motion_many gets them as one fan-out (one helper frame for all
+    windows), others get one send_motion per target."""
 
     def __init__(self, backend, note_send=None):
         self._backend = backend
@@ -78,21 +82,31 @@ class _MotionInjector:
                 with self._lock:
                     if not self._pending:
                         break
-                    wid = next(iter(self._pending))
-                    args, kwargs = self._pending.pop(wid)
-                t0 = monotonic()
-                try:
-                    self._backend.send_motion(*args, **kwargs)
-                except Exception:                      # noqa: BLE001
-                    pass
-                if self._note_send is not None:
-                    try:
-                        self._note_send(monotonic() - t0)
-                    except Exception:                  # noqa: BLE001
-                        pass
+                    batch, self._pending = list(self._pending.values()), {}
+                send_many = getattr(self._backend, "send_motion_many", None)
+                if callable(send_many):
+                    self._send(send_many, [(*args, kwargs.get("state", 0))
+                                           for args, kwargs in batch])
+                else:
+                    for args, kwargs in batch:
+                        self._send(self._backend.send_motion, *args, **kwargs)
+                        if self._stopping:
+                            return
                 if self._stopping:
                     return
 
+    def _send(self, fn, *args, **kwargs) -> None:
+        t0 = monotonic()
+        try:
+            fn(*args, **kwargs)
+        except Exception:                              # noqa: BLE001
+            pass
+        if self._note_send is not None:
+            try:
+                self._note_send(monotonic() - t0)
+            except Exception:                          # noqa: BLE001
+                pass
+
     def stop(self) -> None:
         self._stopping = True
         self._wake.set()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import os
 import queue
 import subprocess
@@ -87,6 +89,7 @@ class InputService(QObject):
     BACKSPACE_REPEAT_DELAY    = 0.4
     BACKSPACE_REPEAT_INTERVAL = 0.05
     AUTO_REPEAT_DEDUP_WINDOW  = 0.015
+    KEEP_ALIVE_HOLD           = 0.05
 
     def __init__(self, window_manager, get_enabled_toons, get_movement_modes, get_event_queue_func,
                  get_chat_enabled=None, settings_manager=None,
@@ -127,6 +130,19 @@ class InputService(QObject):
         self.thread = None
         self._stop_event = threading.Event()
         self.logging_enabled = False
+        # Timed synthetic events (keep-alive presses): a deadline heap of
+        # (deadline, seq, action, win_id, keysym, modifiers) owned by the run
+        # loop, which sends whatever is due at the top of every iteration and
+        # bounds its idle wait by the next deadline. _timed_open is True only
+        # while a run loop is servicing the heap; see send_keep_alive_batch.
+        self._timed_events: list = []
+        self._timed_seq = itertools.count()
+        self._timed_lock = threading.Lock()
+        self._timed_wake = threading.Event()
+        self._timed_open = False
+        self._timed_down: set = set()
+        # Clock for the heap's deadlines (tests swap in a manual one).
+        self._clock = time.monotonic
 
         # ── Chat gate FSM (DEFAULT ON; TTMT_CHAT_FSM=0 = legacy kill switch)
         # Redesign of the chat-open inference; see
@@ -975,6 +991,7 @@ class InputService(QObject):
     def stop(self, wait: bool = False):
         self.running = False
         self._stop_event.set()
+        self._timed_wake.set()
         if wait and self.thread is not None and self.thread.is_alive():
             self.thread.join(timeout=2.0)
 
@@ -1800,8 +1817,14 @@ class InputService(QObject):
             _itrace("chat", stamp)
             self.input_log.emit(stamp)
 
+        with self._timed_lock:
+            self._timed_open = True
         try:
             while self.running:
+                # Due keep-alive presses/releases go out first, in both
+                # branches below: keep-alive is for unfocused games, which is
+                # exactly when the cleanup branch runs.
+                next_timed = self._service_timed_events(self._clock())
                 if not self.should_send_input():
                     # Edge-triggered entry log only (this branch runs ~100Hz; never
                     # log per-iteration). Captures cached vs real X11 focus + the
@@ -1847,7 +1870,7 @@ class InputService(QObject):
                             self.chat_active.clear()
                     bs_press_time  = None
                     bs_last_repeat = 0.0
-                    self._stop_event.wait(0.01)
+                    self._wait_for_input(0.01, next_timed)
                     continue
 
                 if _ITRACE and cleanup_was_active:
@@ -2121,8 +2144,9 @@ class InputService(QObject):
                             self._send_backspace_to_background(enabled, assignments)
                             self._send_backspace_to_focused()
 
-                time.sleep(0.005)
+                self._wait_for_input(0.005, next_timed)
         finally:
+            self._close_timed_events()
             self.release_all_keys()
 
     def should_send_input(self):
@@ -2506,13 +2530,102 @@ class InputService(QObject):
 
     def send_keep_alive_to_window(self, win_id, key, modifiers=None):
         """Send a single keep-alive keypress to a specific window."""
-        keysym = self._resolve_keysym(key) or key
-        if modifiers:
-            self._send_via_backend("key", win_id, keysym, modifiers)
-        else:
-            self._send_via_backend("keydown", win_id, keysym)
-            time.sleep(0.05)
-            self._send_via_backend("keyup", win_id, keysym)
+        self.send_keep_alive_batch([(win_id, key)], modifiers)
+
+    def send_keep_alive_batch(self, presses, modifiers=None):
+        """Press every ``(win_id, key)`` in ``presses`` now and release them
+        all KEEP_ALIVE_HOLD later, without blocking the caller.
+
+        The presses used to go out one window at a time from the keep-alive
+        thread, each followed by a 50 ms sleep before its release, so a cycle
+        over N toons took N holds and raced the input thread for the display
+        connection. They are now timed events on the run loop's deadline heap:
+        one batch of keydowns, one batch of keyups when the shared deadline
+        expires, all sent by the input thread between its own events. With
+        ``modifiers`` each press is a single tap. When no run loop is
+        servicing the heap (service stopped), the keydowns go out on the
+        caller's thread and a timer thread sends the releases.
+        """
+        now = self._clock()
+        release = now + self.KEEP_ALIVE_HOLD
+        events = []
+        for win_id, key in presses:
+            keysym = self._resolve_keysym(key) or key
+            if modifiers:
+                events.append((now, "key", win_id, keysym, list(modifiers)))
+            else:
+                events.append((now, "keydown", win_id, keysym, None))
+                events.append((release, "keyup", win_id, keysym, None))
+        if not events or self._schedule_timed_events(events):
+            return
+        later = []
+        for deadline, action, win_id, keysym, mods in events:
+            if deadline > now:
+                later.append((action, win_id, keysym, mods))
+            else:
+                self._send_via_backend(action, win_id, keysym, mods)
+        if later:
+            def _release():
+                for ev in later:
+                    self._send_via_backend(*ev)
+            timer = threading.Timer(self.KEEP_ALIVE_HOLD, _release)
+            timer.daemon = True
+            timer.start()
+
+    def _schedule_timed_events(self, events) -> bool:
+        """Queue ``(deadline, action, win_id, keysym, modifiers)`` events for
+        the run loop. False when no run loop is servicing the heap."""
+        with self._timed_lock:
+            if not self._timed_open:
+                return False
+            for deadline, action, win_id, keysym, mods in events:
+                heapq.heappush(self._timed_events, (
+                    deadline, next(self._timed_seq), action, win_id, keysym, mods))
+        self._timed_wake.set()
+        return True
+
+    def _service_timed_events(self, now: float) -> float | None:
+        """Send every timed event due by ``now`` (input thread only). Returns
+        the next pending deadline, or None when the heap is empty."""
+        self._timed_wake.clear()
+        due = []
+        with self._timed_lock:
+            heap = self._timed_events
+            while heap and heap[0][0] <= now:
+                due.append(heapq.heappop(heap))
+            next_deadline = heap[0][0] if heap else None
+        for _deadline, _seq, action, win_id, keysym, mods in due:
+            try:
+                self._send_via_backend(action, win_id, keysym, mods)
+            except Exception as e:
+                print(f"[InputService] timed {action} to {win_id} failed: {e}")
+            if action == "keydown":
+                self._timed_down.add((win_id, keysym))
+            elif action == "keyup":
+                self._timed_down.discard((win_id, keysym))
+        return next_deadline
+
+    def _wait_for_input(self, timeout: float, next_deadline: float | None) -> None:
+        """Idle between loop iterations: at most ``timeout``, less when a
+        timed event falls due sooner; a newly scheduled event or stop()
+        wakes the loop at once."""
+        if next_deadline is not None:
+            timeout = min(timeout, max(0.0, next_deadline - self._clock()))
+        self._timed_wake.wait(timeout)
+
+    def _close_timed_events(self) -> None:
+        """Run loop exit: stop accepting timed events and release any
+        keep-alive key still down, dropping presses that never went out."""
+        with self._timed_lock:
+            self._timed_open = False
+            pending, self._timed_events = self._timed_events, []
+        for _deadline, _seq, action, win_id, keysym, mods in sorted(pending):
+            if action == "keyup" and (win_id, keysym) in self._timed_down:
+                try:
+                    self._send_via_backend(action, win_id, keysym, mods)
+                except Exception as e:
+                    print(f"[InputService] timed keyup to {win_id} failed: {e}")
+        self._timed_down.clear()
 
 
 def _passthrough_keysyms_for_canonical(canonical: str) -> tuple[str, ...]:
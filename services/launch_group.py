@@ -0,0 +1,86 @@
+"""Per-stage timing for a batch of account launches started together.
+
+``LaunchTab.launch_group`` starts every account's login at once, warms the
+shared game-file verify pass (services/_shared_pass.py) while the logins are
+in flight, and spawns each engine as soon as its own login and the verify
+are both done. This module only keeps the clock: it records when each
+account finishes each stage and formats the summary the debug tab shows, so
+time-to-all-in-game can be compared against the slowest single login.
+
+Stages, in order: ``login`` (credentials accepted, including any queue wait),
+``verify`` (game files confirmed; joins the shared pass), ``spawn`` (engine
+process started). ``fail`` ends an account early.
+"""
+
+from __future__ import annotations
+
+import time
+
+STAGES = ("login", "verify", "spawn")
+
+
+class LaunchGroup:
+    def __init__(self, game: str, account_ids, clock=time.monotonic):
+        self.game = game
+        self._clock = clock
+        self.started_at = clock()
+        self.account_ids = list(dict.fromkeys(account_ids))
+        # account_id -> {stage: seconds since group start}
+        self.marks: dict[str, dict[str, float]] = {a: {} for a in self.account_ids}
+        self.failed: dict[str, str] = {}
+        self.verify_ready_at: float | None = None
+
+    def __contains__(self, account_id) -> bool:
+        return account_id in self.marks
+
+    def mark(self, account_id: str, stage: str) -> None:
+        """Record ``stage`` for ``account_id`` (first mark wins)."""
+        stages = self.marks.get(account_id)
+        if stages is not None and account_id not in self.failed:
+            stages.setdefault(stage, self._clock() - self.started_at)
+
+    def mark_verify_ready(self) -> None:
+        """The warmed group-wide verify pass finished."""
+        if self.verify_ready_at is None:
+            self.verify_ready_at = self._clock() - self.started_at
+
+    def fail(self, account_id: str, reason: str) -> None:
+        """End ``account_id`` early; no-op once its engine has spawned."""
+        stages = self.marks.get(account_id)
+        if stages is not None and "spawn" not in stages:
+            self.failed.setdefault(account_id, reason)
+
+    def is_complete(self) -> bool:
+        return all(a in self.failed or "spawn" in self.marks[a]
+                   for a in self.account_ids)
+
+    def stage_durations(self, account_id: str) -> dict[str, float]:
+        """Seconds spent in each reached stage (each measured from the end of
+        the previous one; login from the group start)."""
+        out = {}
+        prev = 0.0
+        for stage in STAGES:
+            at = self.marks.get(account_id, {}).get(stage)
+            if at is None:
+                break
+            out[stage] = at - prev
+            prev = at
+        return out
+
+    def summary_lines(self, label=str) -> list[str]:
+        """Debug-tab lines: one per account plus the group total.
+        ``label(account_id)`` names an account (e.g. its slot position)."""
+        lines = []
+        for aid in self.account_ids:
+            if aid in self.failed:
+                lines.append(f"  {label(aid)}: failed ({self.failed[aid]})")
+                continue
+            parts = ", ".join(f"{s} {d:.1f}s"
+                              for s, d in self.stage_durations(aid).items())
+            lines.append(f"  {label(aid)}: {parts or 'no stages reached'}")
+        spawned = [m["spawn"] for m in self.marks.values() if "spawn" in m]
+        logins = [m["login"] for m in self.marks.values() if "login" in m]
+        total = f"{max(spawned):.1f}s" if spawned else "n/a"
+        slowest = f"{max(logins):.1f}s" if logins else "n/a"
+        lines.append(f"  all in game after {total} (slowest login {slowest})")
+        return lines
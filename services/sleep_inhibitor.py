@@ -1,16 +1,20 @@
 """System sleep + screen-lock inhibition for the Keep-Alive feature.
 
 Holds OS-level locks so the machine neither sleeps nor locks the screen while
-Keep-Alive runs. On Linux the primary, verified layer is a `systemd-inhibit
+Keep-Alive runs. On Linux the primary layer is native D-Bus over jeepney:
+logind's `Inhibit('sleep:idle', ..., 'block')` (the returned fd IS the lock,
+so a valid fd in the method reply is the confirmation) or, where the system
+bus is unreachable (Flatpak), the `org.freedesktop.portal.Inhibit` request
+handle. Without a usable bus it falls back to a `systemd-inhibit
 --what=sleep:idle --mode=block` holder subprocess released via pipe-EOF and
-verified by finding a per-acquire UUID token in `systemd-inhibit --list`, with
-a QtDBus login1 fallback and a best-effort QtDBus ScreenSaver cookie;
-SetThreadExecutionState on Windows.
+verified by finding a per-acquire UUID token in `systemd-inhibit --list`, then
+a QtDBus login1 fallback. The ScreenSaver cookie is best-effort (jeepney, then
+QtDBus); SetThreadExecutionState on Windows.
 
 OS access goes through module-level seams (`_is_windows`, `_kernel32`,
-`_uuid_token`, `_popen_holder`, `_close_write_fd`, `_reap`, `_run_list`, and
-the QtDBus seams) so tests can inject fakes without spawning a real holder or
-touching a real bus.
+`_uuid_token`, `_popen_holder`, `_close_write_fd`, `_reap`, `_run_list`, the
+jeepney seams and the QtDBus seams) so tests can inject fakes without
+spawning a real holder or touching a real bus.
 """
 
 import os
@@ -36,13 +40,17 @@ _LIST_CALL_TIMEOUT = 0.5      # seconds, each `systemd-inhibit --list`
 _VERIFY_DEADLINE = 1.5        # seconds, total poll budget (worker thread)
 _VERIFY_INTERVAL = 0.1        # seconds between polls
 _REAP_TIMEOUT = 1.0           # seconds to wait for holder/wrapper to die
+_DBUS_CALL_TIMEOUT = 3.0      # seconds, each native (jeepney) method call
+
+# org.freedesktop.portal.Inhibit flags: suspend (4) | idle (8).
+_PORTAL_INHIBIT_SUSPEND_IDLE = 4 | 8
 
 
 @dataclass
 class InhibitStatus:
     sleep_blocked: bool = False
     screen_lock_cookie_held: bool = False
-    method: str = ""    # "systemd" | "login1" | ""
+    method: str = ""    # "dbus" | "portal" | "systemd" | "login1" | ""
     detail: str = ""    # optional human-readable reason for logs/warning text
 
 
@@ -225,6 +233,103 @@ def _fd_open(fd):
         return False
 
 
+def _jeepney_call(conn, path, bus_name, interface, method, signature, body):
+    """One blocking method call on an open jeepney connection, bounded by
+    _DBUS_CALL_TIMEOUT. Returns the reply body; a D-Bus error reply raises."""
+    from jeepney import DBusAddress, new_method_call
+    addr = DBusAddress(path, bus_name=bus_name, interface=interface)
+    msg = new_method_call(addr, method, signature, body)
+    return conn.send_and_get_reply(msg, timeout=_DBUS_CALL_TIMEOUT,
+                                   unwrap=True)
+
+
+def _jeepney_login1_inhibit(who, why):
+    """Call login1.Manager.Inhibit('sleep:idle', who, why, 'block') over a
+    short-lived jeepney system-bus connection and return the lock fd as a
+    plain int (or None). logind holds the lock for exactly as long as that fd
+    stays open, so the reply itself is the confirmation: no --list polling."""
+    from jeepney.io.blocking import open_dbus_connection
+    with open_dbus_connection(bus="SYSTEM", enable_fds=True) as conn:
+        body = _jeepney_call(conn, "/org/freedesktop/login1",
+                             "org.freedesktop.login1",
+                             "org.freedesktop.login1.Manager", "Inhibit",
+                             "ssss", ("sleep:idle", who, why, "block"))
+    if not body:
+        return None
+    try:
+        return body[0].to_raw_fd()  # detach: the int now owns the lock
+    except AttributeError:
+        return None
+
+
+def _jeepney_portal_inhibit(why):
+    """Hold org.freedesktop.portal.Inhibit (suspend|idle) on a persistent
+    jeepney session-bus connection. Returns (handle, release_callable) or
+    None. The portal keeps the inhibition until the request handle is closed
+    or our connection drops, so the connection lives as long as the lock."""
+    from jeepney.io.blocking import open_dbus_connection
+    conn = open_dbus_connection(bus="SESSION")
+    try:
+        body = _jeepney_call(conn, "/org/freedesktop/portal/desktop",
+                             "org.freedesktop.portal.Desktop",
+                             "org.freedesktop.portal.Inhibit", "Inhibit",
+                             "sua{sv}",
+                             ("", _PORTAL_INHIBIT_SUSPEND_IDLE,
+                              {"reason": ("s", why)}))
+        handle = body[0] if body else None
+    except BaseException:
+        conn.close()
+        raise
+    if not handle:
+        conn.close()
+        return None
+
+    def _release(conn=conn, handle=handle):
+        try:
+            _jeepney_call(conn, handle, "org.freedesktop.portal.Desktop",
+                          "org.freedesktop.portal.Request", "Close", "", ())
+        except Exception:
+            pass
+        finally:
+            conn.close()
+
+    return handle, _release
+
+
+def _jeepney_screensaver_inhibit(who, why):
+    """org.freedesktop.ScreenSaver.Inhibit on a persistent jeepney session-bus
+    connection. Returns (cookie, uninhibit_callable) or None. Implementations
+    drop a cookie when its owner disconnects, so the connection is held until
+    UnInhibit, matching the QtDBus seam's application-lifetime bus."""
+    from jeepney.io.blocking import open_dbus_connection
+    conn = open_dbus_connection(bus="SESSION")
+    try:
+        body = _jeepney_call(conn, "/org/freedesktop/ScreenSaver",
+                             "org.freedesktop.ScreenSaver",
+                             "org.freedesktop.ScreenSaver", "Inhibit",
+                             "ss", (who, why))
+    except BaseException:
+        conn.close()
+        raise
+    if not body:
+        conn.close()
+        return None
+    cookie = body[0]
+
+    def _uninhibit(conn=conn, cookie=cookie):
+        try:
+            _jeepney_call(conn, "/org/freedesktop/ScreenSaver",
+                          "org.freedesktop.ScreenSaver",
+                          "org.freedesktop.ScreenSaver", "UnInhibit",
+                          "u", (cookie,))
+        except Exception:
+            pass
+        finally:
+            conn.close()
+
+    return cookie, _uninhibit
+
+
 def _qt_login1_inhibit(who, why):
     """Call login1.Manager.Inhibit('sleep:idle', who, why, 'block') over
     QtDBus on the application-lifetime system bus, dup the returned unix fd
@@ -371,7 +476,9 @@ class SleepInhibitor:
     def _acquire_linux(self):
         self.status = InhibitStatus()
         self._acquire_sleep_layer()                # sets release thunks + status
-        screensaver = self._acquire_screensaver_qtdbus()
+        screensaver = self._acquire_screensaver_native()
+        if screensaver is None:
+            screensaver = self._acquire_screensaver_qtdbus()
         if screensaver is not None:
             self._releases.append(("screensaver", screensaver))
             self.status.screen_lock_cookie_held = True
@@ -414,6 +521,9 @@ class SleepInhibitor:
 
     def _acquire_sleep_layer(self):
         token = self._token = _uuid_token()
+        native = self._acquire_sleep_native(token)
+        if native:
+            return native
         try:
             proc, w_fd = _popen_holder(token)
         except Exception:
@@ -441,6 +551,39 @@ class SleepInhibitor:
             return "login1"
         return ""
 
+    def _acquire_sleep_native(self, token):
+        """Native D-Bus sleep lock: logind fd first, then the desktop portal.
+        Both confirm synchronously from the method reply, so Keep-Alive start
+        spawns no processes. Returns the method name, or "" to fall through
+        to the systemd-inhibit holder. Never raises: a missing jeepney, an
+        absent bus or an error reply all simply mean "not held here"."""
+        why = f"{REASON} [{token}]"
+        try:
+            fd = _jeepney_login1_inhibit(APP_NAME, why)
+        except Exception:
+            fd = None
+        if fd is not None:
+            if _fd_open(fd):
+                self._releases.append(("dbus", lambda: _close_fd(fd)))
+                self.status.sleep_blocked = True
+                self.status.method = "dbus"
+                return "dbus"
+            _close_fd(fd)
+        try:
+            portal = _jeepney_portal_inhibit(why)
+        except Exception:
+            portal = None
+        if portal is not None:
+            try:
+                _handle, release = portal
+            except Exception:
+                return ""
+            self._releases.append(("portal", release))
+            self.status.sleep_blocked = True
+            self.status.method = "portal"
+            return "portal"
+        return ""
+
     def _verify_systemd(self, token):
         deadline = time.monotonic() + _VERIFY_DEADLINE
         while True:
@@ -494,6 +637,21 @@ class SleepInhibitor:
         _close_fd(fd)  # unverified, fd closed, or a QtDBus error -> not held
         return None
 
+    def _acquire_screensaver_native(self):
+        """Screen-lock inhibitor over jeepney. Same contract as the QtDBus
+        variant below: returns an UnInhibit thunk or None, never raises."""
+        try:
+            result = _jeepney_screensaver_inhibit(APP_NAME, REASON)
+        except Exception:
+            return None
+        if result is None:
+            return None
+        try:
+            _cookie, uninhibit = result
+        except Exception:
+            return None
+        return uninhibit
+
     def _acquire_screensaver_qtdbus(self):
         """Best-effort screen-lock inhibitor over QtDBus. Returns a release
         thunk (UnInhibit) or None. Exception-safe: a QtDBus error must not
@@ -12,8 +12,10 @@ from __future__ import annotations
 
 import os
 import re
+import threading
+import time
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Callable, Iterable
 
 
 # Known mapping from official Proton dir basename to the internal alias
@@ -70,7 +72,7 @@ class ProtonTool:
         Which Steam root this came from.
     version_key
         Tuple of integers extracted from the name, used for sort order.
-        See `_sort_key` in `enumerate_proton_tools` for the actual rules.
+        See `_sort_key` for the actual rules.
     """
 
     name: str
@@ -200,6 +202,25 @@ def _default_roots() -> list[str]:
     return [os.path.expanduser(p) for p in _STEAM_ROOTS]
 
 
+def _read_text(path: str) -> str | None:
+    """Contents of a small manifest, re-read only when its stat signature
+    changed (see _stat_sig). None if unreadable."""
+    sig = _stat_sig(path, time.time_ns())
+    with _cache_lock:
+        cached = _text_cache.get(path)
+    if cached is not None and sig is not None and cached[0] == sig:
+        return cached[1]
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            text = f.read()
+    except OSError:
+        return None
+    if sig is not None:
+        with _cache_lock:
+            _text_cache[path] = (sig, text)
+    return text
+
+
 def _read_require_tool_appid(proton_dir: str) -> str | None:
     """Read the `require_tool_appid` value from a Proton's toolmanifest.vdf.
 
@@ -207,11 +228,8 @@ def _read_require_tool_appid(proton_dir: str) -> str | None:
     declare an AppID for the Steam Linux Runtime they're built against.
     Returns the appid string or None if not present.
     """
-    manifest = os.path.join(proton_dir, "toolmanifest.vdf")
-    try:
-        with open(manifest, "r", encoding="utf-8", errors="replace") as f:
-            text = f.read()
-    except OSError:
+    text = _read_text(os.path.join(proton_dir, "toolmanifest.vdf"))
+    if text is None:
         return None
     m = re.search(r'"require_tool_appid"\s*"([^"]+)"', text)
     return m.group(1) if m else None
@@ -222,10 +240,8 @@ def _read_appmanifest_installdir(steam_root: str, appid: str) -> str | None:
     manifest = os.path.join(
         steam_root, "steamapps", "appmanifest_" + appid + ".acf"
     )
-    try:
-        with open(manifest, "r", encoding="utf-8", errors="replace") as f:
-            text = f.read()
-    except OSError:
+    text = _read_text(manifest)
+    if text is None:
         return None
     m = re.search(r'"installdir"\s*"([^"]+)"', text)
     return m.group(1) if m else None
@@ -369,6 +385,135 @@ def _read_proton_dir_entry(
     )
 
 
+def _stat_sig(path: str, now_ns: int) -> tuple | None:
+    """Cheap identity of a file or directory for cache validation.
+
+    None when the path is missing OR was modified too recently to trust:
+    filesystems with coarse timestamps can give a second write in the same
+    tick the same mtime, so (like git's "racily clean" index entries) a
+    signature younger than _RACY_WINDOW_NS never validates a cache hit and
+    the entry is simply re-read next time.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if now_ns - st.st_mtime_ns < _RACY_WINDOW_NS:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_mode, st.st_ino)
+
+
+def _proton_mtime(base: str) -> float:
+    try:
+        return os.path.getmtime(os.path.join(base, "proton"))
+    except OSError:
+        return 0.0
+
+
+@dataclass
+class _ToolEntry:
+    sig: tuple | None       # (proton sig, vdf sig); None = re-read next call
+    tool: ProtonTool | None
+    real: str               # realpath of the proton binary (dedup key)
+    mtime: float            # proton binary mtime (sort tiebreak)
+
+
+@dataclass
+class _DirListing:
+    sig: tuple | None
+    entries: list[str]
+
+
+# Per-Steam-root enumeration cache. Every call still stats the scanned
+# directories and each tool's `proton` binary and compatibilitytool.vdf,
+# but only re-lists a directory whose mtime moved and only re-parses a
+# tool whose files did. Guarded by _cache_lock: cc_launcher enumerates
+# from the launch worker while Settings enumerates on the GUI thread.
+_RACY_WINDOW_NS = 2_000_000_000
+_listings: dict[str, _DirListing] = {}
+_tools: dict[str, _ToolEntry] = {}
+_last_result: dict[tuple, list[ProtonTool]] = {}
+_text_cache: dict[str, tuple[tuple, str]] = {}     # manifest path -> (sig, text)
+_cache_lock = threading.Lock()
+_change_listeners: list[Callable[[list[ProtonTool]], None]] = []
+
+
+def _list_dir(path: str, now_ns: int, want) -> list[str]:
+    """Sorted entry names of `path` accepted by want(name, full_path),
+    re-listed only when the directory's own signature changed."""
+    sig = _stat_sig(path, now_ns)
+    cached = _listings.get(path)
+    if cached is not None and sig is not None and cached.sig == sig:
+        return cached.entries
+    try:
+        names = sorted(os.listdir(path))
+    except OSError:
+        _listings.pop(path, None)
+        return []
+    entries = [n for n in names if want(n, os.path.join(path, n))]
+    _listings[path] = _DirListing(sig, entries)
+    return entries
+
+
+def _tool_entry(base: str, source: str, steam_root: str,
+                now_ns: int) -> _ToolEntry:
+    """Cached _read_proton_dir_entry result for one candidate directory."""
+    proton_sig = _stat_sig(os.path.join(base, "proton"), now_ns)
+    vdf_sig = None
+    if source == "compatibilitytools.d":
+        vdf_sig = _stat_sig(os.path.join(base, "compatibilitytool.vdf"), now_ns)
+    sig = (proton_sig, vdf_sig) if proton_sig is not None else None
+    cached = _tools.get(base)
+    if cached is not None and sig is not None and cached.sig == sig:
+        return cached
+    if vdf_sig is None and source == "compatibilitytools.d" and sig is not None:
+        # No vdf (or a racy one): parse, but don't trust the result later.
+        sig = None
+    tool = _read_proton_dir_entry(base, source, steam_root)
+    real = (os.path.realpath(os.path.join(base, "proton"))
+            if tool is not None else "")
+    entry = _ToolEntry(sig, tool, real, _proton_mtime(base))
+    _tools[base] = entry
+    return entry
+
+
+def _scan_root(root: str, now_ns: int, scanned: set[str]) -> list[_ToolEntry]:
+    entries: list[_ToolEntry] = []
+    # User-installed tools.
+    ctd = os.path.join(root, "compatibilitytools.d")
+    for name in _list_dir(ctd, now_ns, lambda n, p: os.path.isdir(p)):
+        base = os.path.join(ctd, name)
+        scanned.add(base)
+        entries.append(_tool_entry(base, "compatibilitytools.d", root, now_ns))
+    # Official Protons.
+    common = os.path.join(root, "steamapps", "common")
+    for name in _list_dir(
+            common, now_ns,
+            lambda n, p: n.startswith("Proton") and os.path.isdir(p)):
+        base = os.path.join(common, name)
+        scanned.add(base)
+        entries.append(_tool_entry(base, "official", root, now_ns))
+    return entries
+
+
+def _sort_key(entry: _ToolEntry) -> tuple:
+    p = entry.tool
+    group_rank = 0 if p.source == "compatibilitytools.d" else 1
+    # Tools with no parseable version (e.g. "Proton - Experimental")
+    # have an empty version_key. Push them to the bottom of their
+    # group via has_version=1 so they tiebreak on mtime alone, not
+    # the (incorrect) "empty tuple sorts first" Python default.
+    has_version = 0 if p.version_key else 1
+    # Pad to a fixed length so longer tuples (more specific, e.g.
+    # date-suffixed builds like Proton-CachyOS-9.0-20251214) sort
+    # BEFORE shorter ones with the same prefix. Without padding,
+    # tuple lex-compare puts shorter tuples first, which is
+    # backwards from "newest first."
+    padded = (p.version_key + (0,) * 6)[:6]
+    neg_version = tuple(-n for n in padded)
+    return (group_rank, has_version, neg_version, -entry.mtime)
+
+
 def enumerate_proton_tools(
     steam_roots: Iterable[str] | None = None,
 ) -> list[ProtonTool]:
@@ -382,68 +527,106 @@ def enumerate_proton_tools(
         → flatpak). Sort: user-installed before official; within each
         group, newest first by version_key, then mtime descending.
 
+    Repeat calls are answered from an mtime-validated cache (see
+    _stat_sig): unchanged directories are not re-listed and unchanged
+    tools are not re-parsed. When the result differs from the previous
+    call for the same roots, change listeners are notified.
+
     Never raises. Roots that don't exist are skipped silently.
     """
     roots = list(steam_roots) if steam_roots is not None else _default_roots()
-    found: list[ProtonTool] = []
-    seen: set[str] = set()
-    for root in roots:
-        if not os.path.isdir(root):
-            continue
-        # User-installed tools.
-        ctd = os.path.join(root, "compatibilitytools.d")
-        if os.path.isdir(ctd):
-            for entry in sorted(os.listdir(ctd)):
-                base = os.path.join(ctd, entry)
-                if not os.path.isdir(base):
-                    continue
-                tool = _read_proton_dir_entry(base, "compatibilitytools.d", root)
-                if tool is None:
-                    continue
-                real = os.path.realpath(os.path.join(tool.proton_dir, "proton"))
-                if real in seen:
-                    continue
-                seen.add(real)
-                found.append(tool)
-        # Official Protons.
-        common = os.path.join(root, "steamapps", "common")
-        if os.path.isdir(common):
-            for entry in sorted(os.listdir(common)):
-                if not entry.startswith("Proton"):
-                    continue
-                base = os.path.join(common, entry)
-                if not os.path.isdir(base):
-                    continue
-                tool = _read_proton_dir_entry(base, "official", root)
-                if tool is None:
+    now_ns = time.time_ns()
+    with _cache_lock:
+        found: list[_ToolEntry] = []
+        seen: set[str] = set()
+        scanned: set[str] = set()
+        for root in roots:
+            if not os.path.isdir(root):
+                continue
+            for entry in _scan_root(root, now_ns, scanned):
+                if entry.tool is None:
                     continue
-                real = os.path.realpath(os.path.join(tool.proton_dir, "proton"))
-                if real in seen:
+                if entry.real in seen:
                     continue
-                seen.add(real)
-                found.append(tool)
+                seen.add(entry.real)
+                found.append(entry)
+        # Forget tools that vanished from these roots so a reinstall at the
+        # same path is parsed fresh.
+        prefixes = tuple(os.path.join(r, "") for r in roots)
+        for base in [b for b in _tools if b.startswith(prefixes)]:
+            if base not in scanned:
+                del _tools[base]
+        found.sort(key=_sort_key)
+        result = [e.tool for e in found]
+        key = tuple(roots)
+        previous = _last_result.get(key)
+        _last_result[key] = result
+        listeners = list(_change_listeners)
+    if previous is not None and previous != result:
+        for cb in listeners:
+            try:
+                cb(list(result))
+            except Exception as e:  # noqa: BLE001 - a listener must never break enumeration
+                print(f"[CCLauncher] proton tools listener raised "
+                      f"{type(e).__name__}: {e}")
+    return list(result)
+
+
+def watch_dirs(steam_roots: Iterable[str] | None = None) -> list[str]:
+    """Existing directories whose changes can alter enumerate_proton_tools'
+    result (for a file-system watcher). Adding or removing a tool touches
+    one of these; the caller re-enumerates and listeners fire if the list
+    actually changed."""
+    roots = list(steam_roots) if steam_roots is not None else _default_roots()
+    dirs = []
+    for root in roots:
+        for d in (root, os.path.join(root, "compatibilitytools.d"),
+                  os.path.join(root, "steamapps", "common")):
+            if os.path.isdir(d):
+                dirs.append(d)
+    return dirs
+
+
+def unresolved_dirs(steam_roots: Iterable[str] | None = None) -> list[str]:
+    """Tool directories the last enumeration could not settle: no `proton`
+    binary yet, or files still inside the racy window (cached with
+    sig=None). Their later writes land inside the tool directory, which
+    watch_dirs does not cover, so a watcher should follow these until a
+    re-enumeration resolves them."""
+    roots = list(steam_roots) if steam_roots is not None else _default_roots()
+    prefixes = tuple(os.path.join(r, "") for r in roots)
+    with _cache_lock:
+        bases = [b for b, e in _tools.items()
+                 if e.sig is None and b.startswith(prefixes)]
+    return sorted(b for b in bases if os.path.isdir(b))
+
 
-    def _mtime(p: ProtonTool) -> float:
+def settle_delay_ms() -> int:
+    """How long after a write a tool's files are trusted by the cache, in
+    ms (the racy window plus a margin): when to re-check an entry
+    unresolved_dirs reported so it can settle."""
+    return _RACY_WINDOW_NS // 1_000_000 + 250
+
+
+def add_change_listener(cb: Callable[[list[ProtonTool]], None]) -> None:
+    """Call cb(tools) whenever an enumeration returns a different list than
+    the previous one for the same roots. Runs on the enumerating thread."""
+    with _cache_lock:
+        if cb not in _change_listeners:
+            _change_listeners.append(cb)
+
+
+def remove_change_listener(cb: Callable[[list[ProtonTool]], None]) -> None:
+    with _cache_lock:
         try:
-            return os.path.getmtime(os.path.join(p.proton_dir, "proton"))
-        except OSError:
-            return 0.0
-
-    def _sort_key(p: ProtonTool) -> tuple:
-        group_rank = 0 if p.source == "compatibilitytools.d" else 1
-        # Tools with no parseable version (e.g. "Proton - Experimental")
-        # have an empty version_key. Push them to the bottom of their
-        # group via has_version=1 so they tiebreak on mtime alone, not
-        # the (incorrect) "empty tuple sorts first" Python default.
-        has_version = 0 if p.version_key else 1
-        # Pad to a fixed length so longer tuples (more specific, e.g.
-        # date-suffixed builds like Proton-CachyOS-9.0-20251214) sort
-        # BEFORE shorter ones with the same prefix. Without padding,
-        # tuple lex-compare puts shorter tuples first, which is
-        # backwards from "newest first."
-        padded = (p.version_key + (0,) * 6)[:6]
-        neg_version = tuple(-n for n in padded)
-        return (group_rank, has_version, neg_version, -_mtime(p))
-
-    found.sort(key=_sort_key)
-    return found
+            _change_listeners.remove(cb)
+        except ValueError:
+            pass
+
+
+def reset_cache() -> None:
+    with _cache_lock:
+        _listings.clear()
+        _tools.clear()
+        _last_result.clear()
+        _text_cache.clear()
@@ -208,7 +208,7 @@ class TTRLoginWorker(QObject):
             eta = self._parse_queue_int(data.get("eta", 60), 60)
             self._set_state(LoginState.QUEUED, f"In queue — position {position}, ~{eta}s")
             self.queue_update.emit(position, eta)
-            self._start_queue_polling()
+            self._start_queue_polling(position, eta)
 
         elif success == "true":
             gameserver = data.get("gameserver", "")
@@ -218,19 +218,33 @@ class TTRLoginWorker(QObject):
 
     # ── Queue Polling ──────────────────────────────────────────────────────
 
-    _MAX_QUEUE_POLLS = 60  # 60 × 10s = 10 minutes max queue wait
+    # TTR drops a queue token that goes unpolled for 30 s, and asks clients
+    # not to hammer the endpoint. Within those bounds, poll about twice per
+    # reported ETA: near the front of the queue that means every couple of
+    # seconds instead of sitting out a fixed 10 s after the slot opened.
+    _QUEUE_POLL_MIN_S = 2.0
+    _QUEUE_POLL_MAX_S = 20.0
+    _MAX_QUEUE_WAIT_S = 600.0  # 10 minutes max queue wait
+
+    @classmethod
+    def _queue_poll_delay(cls, position: int, eta: int) -> float:
+        if position <= 1 or eta <= 0:
+            return cls._QUEUE_POLL_MIN_S
+        return max(cls._QUEUE_POLL_MIN_S, min(cls._QUEUE_POLL_MAX_S, eta / 2.0))
+
+    def _start_queue_polling(self, position: int = 0, eta: int = 60):
+        first_delay = self._queue_poll_delay(position, eta)
 
-    def _start_queue_polling(self):
         def _poll():
-            polls = 0
+            deadline = time.monotonic() + self._MAX_QUEUE_WAIT_S
+            delay = first_delay
             retry_delay = 1.0
             consecutive_failures = 0
             while not self._stop_event.is_set() and self._state == LoginState.QUEUED:
-                time.sleep(10)  # Poll every 10 seconds (well within 30s limit)
-                if self._stop_event.is_set():
+                # Event wait rather than sleep so cancel() ends the poll at once.
+                if self._stop_event.wait(delay):
                     break
-                polls += 1
-                if polls > self._MAX_QUEUE_POLLS:
+                if time.monotonic() > deadline:
                     self._set_state(LoginState.FAILED, "Queue timed out after 10 minutes.")
                     self.login_failed.emit("Queue timed out after 10 minutes.")
                     break
@@ -252,6 +266,7 @@ class TTRLoginWorker(QObject):
                         eta = self._parse_queue_int(data.get("eta", 60), 60)
                         self._set_state(LoginState.QUEUED, f"In queue — position {position}, ~{eta}s")
                         self.queue_update.emit(position, eta)
+                        delay = self._queue_poll_delay(position, eta)
                     else:
                         self._handle_response(data)
                         break
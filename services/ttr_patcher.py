@@ -20,6 +20,7 @@ import urllib.parse
 import requests
 from PySide6.QtCore import QObject, Signal
 
+from services._shared_pass import SharedPasses
 from utils.host_spawn import host_run, host_visible_cache_dir, in_flatpak
 
 MANIFEST_URL = "https://cdn.toontownrewritten.com/content/patchmanifest.txt"
@@ -125,14 +126,18 @@ def fetch_verified(entry: dict, mirror: str) -> bytes:
 # still re-verifying if TTR pushes an update mid-session (manifest changes).
 _verified_manifests = {}
 
-# Serializes verify+patch across concurrent account launches so they don't
-# redundantly re-download and collide on the shared staging/temp paths in
-# place_file: the first thread patches and caches, later threads hit the cache.
-_patch_lock = threading.Lock()
+# One verify pass per engine dir at a time: concurrent account launches join
+# the pass already in flight (one manifest fetch, one hash walk) instead of
+# queueing behind a global lock and redoing it, and a clean result is reused
+# for a few seconds so a launch group's staggered logins share it too.
+# Different engine dirs verify in parallel.
+_PASS_REUSE_S = 15.0
+_passes = SharedPasses(reuse_s=_PASS_REUSE_S)
 
 
 def reset_verify_cache() -> None:
     _verified_manifests.clear()
+    _passes.clear()
 
 
 def _manifest_sha(manifest: dict) -> str:
@@ -148,45 +153,56 @@ class TTRPatcher(QObject):
     def verify_and_patch(self, engine_dir: str) -> None:
         """Verify the install against the manifest and repair stale files on a
         background thread. Emits exactly one terminal signal
-        (up_to_date | patched | failed)."""
+        (up_to_date | patched | failed). A call that joins another launch's
+        in-flight pass for the same engine dir gets that pass's outcome,
+        reported as up_to_date when the other launch did the patching."""
         engine_dir = os.path.realpath(engine_dir)
 
         def _run():
             self.progress.emit("Checking TTR game files…", 0)
-            with _patch_lock:
-                try:
-                    try:
-                        manifest = fetch_manifest()
-                    except requests.RequestException as e:
-                        # Offline / manifest unreachable: don't block the launch.
-                        print(f"[TTRPatcher] manifest unreachable, proceeding: {e}")
-                        self.up_to_date.emit()
-                        return
-                    msha = _manifest_sha(manifest)
-                    if _verified_manifests.get(engine_dir) == msha:
-                        self.up_to_date.emit()
-                        return
-                    stale = select_stale(manifest, engine_dir)
-                    if not stale:
-                        _verified_manifests[engine_dir] = msha
-                        self.up_to_date.emit()
-                        return
-                    mirror = resolve_mirror()
-                    updated = []
-                    total = len(stale)
-                    for i, (filename, entry) in enumerate(stale):
-                        self.progress.emit(f"Updating {filename}…", int(i / total * 100))
-                        data = fetch_verified(entry, mirror)
-                        place_file(data, os.path.join(engine_dir, filename))
-                        updated.append(filename)
-                    _verified_manifests[engine_dir] = msha
-                    self.progress.emit("TTR game files updated.", 100)
-                    self.patched.emit(updated)
-                except Exception as e:
-                    self.failed.emit(f"TTR game file update failed: {e}")
+            (kind, payload), owner = _passes.run(
+                engine_dir, lambda: self._verify(engine_dir),
+                reusable=lambda r: r[0] != "failed")
+            if kind == "failed":
+                self.failed.emit(payload)
+            elif kind == "patched" and owner:
+                self.progress.emit("TTR game files updated.", 100)
+                self.patched.emit(payload)
+            else:
+                self.up_to_date.emit()
 
         threading.Thread(target=_run, daemon=True).start()
 
+    def _verify(self, engine_dir: str) -> tuple[str, object]:
+        """The shared pass body: ("up_to_date", None) | ("patched", [files])
+        | ("failed", message). Never raises."""
+        try:
+            try:
+                manifest = fetch_manifest()
+            except requests.RequestException as e:
+                # Offline / manifest unreachable: don't block the launch.
+                print(f"[TTRPatcher] manifest unreachable, proceeding: {e}")
+                return "up_to_date", None
+            msha = _manifest_sha(manifest)
+            if _verified_manifests.get(engine_dir) == msha:
+                return "up_to_date", None
+            stale = select_stale(manifest, engine_dir)
+            if not stale:
+                _verified_manifests[engine_dir] = msha
+                return "up_to_date", None
+            mirror = resolve_mirror()
+            updated = []
+            total = len(stale)
+            for i, (filename, entry) in enumerate(stale):
+                self.progress.emit(f"Updating {filename}…", int(i / total * 100))
+                data = fetch_verified(entry, mirror)
+                place_file(data, os.path.join(engine_dir, filename))
+                updated.append(filename)
+            _verified_manifests[engine_dir] = msha
+            return "patched", updated
+        except Exception as e:
+            return "failed", f"TTR game file update failed: {e}"
+
 
 def place_file(data: bytes, dest_path: str) -> None:
     """Atomically install verified bytes at dest_path.
@@ -200,8 +216,11 @@ def place_file(data: bytes, dest_path: str) -> None:
     """
     name = os.path.basename(dest_path)
     if in_flatpak():
-        staged = os.path.join(host_visible_cache_dir("ttr-patch"), name)
-        with open(staged, "wb") as f:
+        # Unique staging name: installs verified in parallel may update the
+        # same filename at once.
+        fd, staged = tempfile.mkstemp(dir=host_visible_cache_dir("ttr-patch"),
+                                      prefix=name + ".")
+        with os.fdopen(fd, "wb") as f:
             f.write(data)
         tmp = dest_path + ".ttmt.tmp"
         try:
@@ -3,18 +3,27 @@ via AllocConsole(). The console shows CC's stdout (font loads, downloader
 status, ConfigVariable changes) and is useful for debugging but visual
 noise in the common-case successful launch.
 
-After CCLauncher emits `game_launched`, this module polls top-level X11
-windows every WATCH_INTERVAL_MS for up to WATCH_DURATION_MS, unmapping any
-window whose title (case- and slash-normalized) ends with the CC exe
-basename. The console process remains alive (CC's stdout keeps flowing);
-only its X11 surface vanishes.
-
-XUnmapWindow is called every tick the title matches, not just the first
-time. Under Proton, wineserver intermittently re-maps the console after
-our unmap (its internal mapped-state model isn't invalidated by external
-XUnmapWindow). A once-only unmap would let wine re-map and never recover;
-repeated unmap calls suppress the re-map loop. An X11 unmap on an
-already-unmapped window is a no-op, so this is cheap.
+After CCLauncher emits `game_launched`, the window whose title (case- and
+slash-normalized) ends with the CC exe basename is unmapped for up to
+WATCH_DURATION_MS. The console process remains alive (CC's stdout keeps
+flowing); only its X11 surface vanishes.
+
+On X11 one shared event-driven watcher (X11ConsoleWatcher) does this: a
+thread with its own Display selects SubstructureNotify on the root and
+StructureNotify|PropertyChange on every new toplevel, so a console is
+unmapped within one event of its CreateNotify/MapNotify/WM_NAME change.
+Each launch only extends the watch deadline; a burst of launches shares
+one thread and one initial tree walk.
+
+Where that watcher cannot run (no X display) the original polling path is
+used: top-level windows are enumerated every WATCH_INTERVAL_MS. Either way
+XUnmapWindow is issued every time the window shows up mapped again, not
+just the first time. Under Proton, wineserver intermittently re-maps the
+console after our unmap (its internal mapped-state model isn't invalidated
+by external XUnmapWindow). A once-only unmap would let wine re-map and
+never recover; the event watcher sees each re-map as a MapNotify and
+undoes it immediately. An X11 unmap on an already-unmapped window is a
+no-op, so this is cheap.
 
 Gated by the CC_HIDE_LAUNCH_CONSOLE setting (default True). See
 docs/superpowers/specs/2026-05-21-hide-cc-launch-console-design.md for
@@ -54,6 +63,9 @@ def _title_matches(title: str) -> bool:
     return normalized.endswith(_CONSOLE_TITLE_SUFFIX)
 
 
+import select
+import threading
+import time
 from typing import Callable, Iterable, Tuple
 
 from PySide6.QtCore import QObject, QTimer
@@ -133,6 +145,236 @@ def _real_unmapper(wid: int) -> None:
                 pass
 
 
+def _window_title(window) -> str:
+    """WM_NAME, falling back to _NET_WM_NAME. Empty string when unset or the
+    window is already gone."""
+    try:
+        name = window.get_wm_name()
+    except Exception:
+        name = None
+    if name:
+        return str(name)
+    try:
+        d = window.display
+        prop = window.get_full_property(d.get_atom("_NET_WM_NAME"),
+                                        d.get_atom("UTF8_STRING"))
+    except Exception:
+        prop = None
+    if prop is None or not prop.value:
+        return ""
+    value = prop.value
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+class _ConsoleEventHandler:
+    """Reacts to X events on one Display: tracks new toplevels and unmaps
+    any whose title matches. Split from the thread loop so it can be driven
+    with synthetic events in tests."""
+
+    def __init__(self, display, matcher=_title_matches):
+        from Xlib import X  # type: ignore
+        self._X = X
+        self._d = display
+        self._root = display.screen().root
+        self._matches = matcher
+        self._name_atoms = {display.get_atom("WM_NAME"),
+                            display.get_atom("_NET_WM_NAME")}
+        self.hidden: set[int] = set()
+        self.remaps: dict[int, int] = {}
+        self.tree_walks = 0
+
+    def start(self) -> None:
+        """Select root substructure events, then adopt every window that
+        already exists (one walk per watch, not one per poll tick). The walk
+        recurses like _walk_titles: under a reparenting WM an existing
+        console sits inside its frame, not directly under the root."""
+        X = self._X
+        self._root.change_attributes(event_mask=X.SubstructureNotifyMask)
+        self.tree_walks += 1
+        self._adopt_tree(self._root)
+        self._d.flush()
+
+    def _adopt_tree(self, window) -> None:
+        try:
+            children = window.query_tree().children
+        except Exception:
+            children = []
+        for child in children:
+            self._adopt(child)
+            self._adopt_tree(child)
+
+    def handle(self, ev) -> None:
+        X = self._X
+        kind = ev.type
+        if kind == X.CreateNotify:
+            if getattr(ev, "parent", None) is not None \
+                    and int(ev.parent.id) != int(self._root.id):
+                return
+            self._adopt(ev.window)
+        elif kind == X.MapNotify:
+            # Adopted windows report their own maps (StructureNotify); the
+            # root's SubstructureNotify copy of the same map is skipped so one
+            # map is one unmap, and re-map counts stay honest.
+            event_win = getattr(ev, "event", None)
+            if event_win is not None \
+                    and int(event_win.id) != int(ev.window.id):
+                return
+            self._check(ev.window)
+        elif kind == X.PropertyNotify:
+            if ev.atom in self._name_atoms:
+                self._check(ev.window)
+        elif kind == X.DestroyNotify:
+            wid = int(ev.window.id)
+            self.hidden.discard(wid)
+        else:
+            return
+        self._d.flush()
+
+    def _adopt(self, window) -> None:
+        X = self._X
+        try:
+            window.change_attributes(
+                event_mask=X.StructureNotifyMask | X.PropertyChangeMask)
+        except Exception:
+            return
+        # The title may already be set (and the window mapped) before our
+        # mask landed; check once now so that window is not missed.
+        self._check(window)
+
+    def _check(self, window) -> None:
+        title = _window_title(window)
+        if not self._matches(title):
+            return
+        wid = int(window.id)
+        try:
+            window.unmap()
+        except Exception as e:
+            print(f"[WineConsoleHider] unmap error wid={hex(wid)}: {e}")
+            return
+        if wid in self.hidden:
+            self.remaps[wid] = self.remaps.get(wid, 0) + 1
+        else:
+            self.hidden.add(wid)
+            print(f"[WineConsoleHider] hid console wid={hex(wid)} title={title!r}")
+
+
+class X11ConsoleWatcher:
+    """Process-wide event-driven console watcher. arm(duration_s) starts the
+    watcher thread (or just extends its deadline when already running); the
+    thread exits by itself once the deadline passes with no further launch.
+
+    The thread owns its own Display (Xlib connections are not shared across
+    threads in this codebase) and blocks in select() on the X socket, so it
+    costs nothing between events."""
+
+    # Upper bound on one select() wait, so stop()/deadline are honored
+    # promptly even on a silent X connection.
+    _MAX_WAIT_S = 0.5
+
+    def __init__(self, display_factory=None, matcher=_title_matches):
+        self._display_factory = display_factory or _open_x_display
+        self._matcher = matcher
+        self._lock = threading.Lock()
+        self._deadline = 0.0
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def arm(self, duration_s: float) -> bool:
+        """Watch for at least `duration_s` more seconds. Returns False when no
+        X display could be opened (caller falls back to polling)."""
+        with self._lock:
+            self._deadline = max(self._deadline, time.monotonic() + duration_s)
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            display = self._display_factory()
+            if display is None:
+                return False
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(display,),
+                name="WineConsoleWatcher", daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        t = self._thread
+        if t is not None and t is not threading.current_thread():
+            t.join(timeout=1.0)
+
+    def is_running(self) -> bool:
+        t = self._thread
+        return t is not None and t.is_alive()
+
+    def _remaining_or_retire(self) -> float:
+        """Time left on the deadline. At or past it the thread retires in the
+        same locked step (clears _thread), so a concurrent arm() either
+        extended a thread that keeps running or finds none and starts one."""
+        with self._lock:
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0 and self._thread is threading.current_thread():
+                self._thread = None
+            return remaining
+
+    def _run(self, display) -> None:
+        handler = None
+        try:
+            handler = _ConsoleEventHandler(display, self._matcher)
+            handler.start()
+            while not self._stop.is_set():
+                remaining = self._remaining_or_retire()
+                if remaining <= 0:
+                    break
+                while display.pending_events():
+                    handler.handle(display.next_event())
+                # Block on the X socket until the next event (or deadline);
+                # the loop head drains whatever arrived.
+                select.select([display], [], [],
+                              min(self._MAX_WAIT_S, remaining))
+        except Exception as e:
+            print(f"[WineConsoleHider] watcher error: {e}")
+        finally:
+            if handler is not None:
+                if not handler.hidden:
+                    print("[WineConsoleHider] no console seen in 15s; giving up")
+                else:
+                    print(
+                        f"[WineConsoleHider] summary "
+                        f"hidden_wids={len(handler.hidden)} "
+                        f"total_remaps={sum(handler.remaps.values())} "
+                        f"per_wid_remaps={ {hex(k): v for k, v in handler.remaps.items()} }"
+                    )
+            try:
+                display.close()
+            except Exception:
+                pass
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+
+def _open_x_display():
+    """A fresh Xlib Display for the watcher thread, or None off X11."""
+    try:
+        from Xlib import display as xdisplay  # type: ignore
+        return xdisplay.Display()
+    except Exception:
+        return None
+
+
+_shared_watcher: X11ConsoleWatcher | None = None
+
+
+def shared_watcher() -> X11ConsoleWatcher:
+    """The process-wide watcher every WineConsoleHider arms."""
+    global _shared_watcher
+    if _shared_watcher is None:
+        _shared_watcher = X11ConsoleWatcher()
+    return _shared_watcher
+
+
 class WineConsoleHider(QObject):
     """Listens for CCLauncher.game_launched and unmaps the spawned Wine
     console. See module docstring for the full rationale."""
@@ -144,12 +386,18 @@ class WineConsoleHider(QObject):
         enumerator: EnumeratorFn | None = None,
         unmapper: UnmapperFn | None = None,
         timer_factory=None,
+        watcher: X11ConsoleWatcher | None = None,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
         self._settings = settings_manager
         self._enumerate: EnumeratorFn = enumerator or _real_enumerator
         self._unmap: UnmapperFn = unmapper or _real_unmapper
+        # Event-driven by default; injected enumerator/unmapper seams select
+        # the polling path (which is also the fallback when arm() fails).
+        if watcher is None and enumerator is None and unmapper is None:
+            watcher = shared_watcher()
+        self._watcher = watcher
 
         if timer_factory is None:
             timer = QTimer(self)
@@ -181,9 +429,13 @@ class WineConsoleHider(QObject):
         cc_launcher.game_launched.connect(self.on_game_launched)
 
     def on_game_launched(self, pid: int) -> None:
-        """Slot: game spawned. (Re)start the polling timer if enabled."""
+        """Slot: game spawned. Arm the shared event watcher, or (re)start the
+        polling timer when no watcher is available, if enabled."""
         if not self._settings.get(CC_HIDE_LAUNCH_CONSOLE, True):
             return
+        if self._watcher is not None \
+                and self._watcher.arm(WATCH_DURATION_MS / 1000.0):
+            return
         # Reset per-launch state. A second launch arriving during a watch
         # window restarts the budget from zero, so multi-account launches
         # all get the full 15s coverage.
@@ -449,6 +449,11 @@ class LaunchTab(QWidget):
         self._probe_thread = None
         self._probe_worker = None
         self._pending_2fa: set = set()
+        # game -> LaunchGroup for an in-progress launch_group() batch, plus the
+        # warm-up patcher that starts its shared verify pass (strong ref
+        # through the background thread).
+        self._launch_groups: dict = {}
+        self._group_patchers: dict = {}
 
         # Loading-state orchestration. _loading[game] is a launch-ordered list
         # of account_ids (the timer itself lives on each slot.loading_timer);
@@ -618,6 +623,72 @@ class LaunchTab(QWidget):
         right-click menu). Forwards to the internal launch handler."""
         self._on_launch(game, account_id)
 
+    def launch_group(self, game: str, account_ids) -> None:
+        """Launch several accounts of one game together. Every login starts at
+        once; the game-file verify is warmed now (TTR) so it runs alongside
+        the logins, and each engine spawns as soon as its own login and that
+        shared verify are done. Per-stage timings go to the debug tab when
+        the last account is in game (or has failed)."""
+        from services.launch_group import LaunchGroup
+        ids = [a for a in account_ids
+               if a in self._slots.get(game, {}) and not self.is_account_running(game, a)]
+        if not ids:
+            return
+        group = LaunchGroup(game, ids)
+        self._launch_groups[game] = group
+        game_label = "TTR" if game == "ttr" else "CC"
+        self.log(f"[Launch] Launching {len(ids)} {game_label} accounts together…")
+        # CC's verify needs a launcher token from a login, so it starts with
+        # the first successful one (and the rest join it); TTR's only needs
+        # the engine dir and can overlap the logins from the start.
+        if game == "ttr":
+            self._warm_ttr_verify(group)
+        for account_id in ids:
+            self._on_launch(game, account_id)
+            slot = self._slots[game].get(account_id)
+            if slot is not None and slot.worker is None:
+                group.fail(account_id, slot.message or "not started")
+        self._group_check_complete(game)
+
+    def _warm_ttr_verify(self, group) -> None:
+        engine_dir = self._get_engine_dir("ttr")
+        if not engine_dir:
+            return
+        patcher = TTRPatcher(self)
+        self._group_patchers["ttr"] = patcher
+
+        def _ready(files=None):
+            group.mark_verify_ready()
+            if files:
+                self.log(f"[Launch] Updated TTR game files: {', '.join(files)}")
+            self.log(f"[Launch] TTR game files checked in {group.verify_ready_at:.1f}s")
+            if self._group_patchers.get("ttr") is patcher:
+                del self._group_patchers["ttr"]
+
+        patcher.up_to_date.connect(_ready)
+        patcher.patched.connect(_ready)
+        # A failed warm-up isn't cached; each account's own verify retries
+        # and reports the failure on its tile.
+        patcher.failed.connect(lambda _msg: _ready())
+        patcher.verify_and_patch(engine_dir)
+
+    def _group_mark(self, game: str, account_id: str, stage: str) -> None:
+        group = self._launch_groups.get(game)
+        if group is not None and account_id in group:
+            group.mark(account_id, stage)
+            self._group_check_complete(game)
+
+    def _group_check_complete(self, game: str) -> None:
+        group = self._launch_groups.get(game)
+        if group is None or not group.is_complete():
+            return
+        del self._launch_groups[game]
+        game_label = "TTR" if game == "ttr" else "CC"
+        self.log(f"[Launch] {game_label} launch group timings:")
+        for line in group.summary_lines(
+                lambda a: f"account {self._position_of(game, a)}"):
+            self.log(line)
+
     def capture_toon(self, pid: int, toon_name: str, dna: str = "", *,
                      laff=None, max_laff=None, species=None, accent=None) -> None:
         """Record the in-world toon for whatever account owns ``pid`` (no-op if unknown)."""
@@ -797,6 +868,7 @@ class LaunchTab(QWidget):
         # the module each click means monkeypatched tests can swap the
         # implementation between construction and the actual click.
         section.launcher_clicked.connect(lambda g=game: self._on_launcher_clicked(g))
+        section.launch_all_clicked.connect(lambda g=game: self._on_launch_all(g))
         section.add_account_clicked.connect(lambda g=game: self._on_add_account(g))
         section.tile_launch.connect(lambda a, g=game: self._on_launch(g, a))
         section.tile_quit.connect(lambda a, g=game: self._on_tile_quit(g, a))
@@ -834,6 +906,20 @@ class LaunchTab(QWidget):
         # so a populated sibling can take its natural taller height.
         self._sync_compact_section_heights()
 
+    def _on_launch_all(self, game: str) -> None:
+        """Section-header 'Launch all': every idle (or failed) account of the
+        game goes up as one launch group. Accounts already logging in, loading
+        or in game are left alone - _on_launch would cancel or kill them."""
+        ids = []
+        for acct in self._ordered_accounts(game):
+            slot = self._slots[game].get(acct.id)
+            if slot is None:
+                continue
+            state, _msg, _raw = self._effective_state(game, slot)
+            if state in (LoginState.IDLE, LoginState.FAILED):
+                ids.append(acct.id)
+        self.launch_group(game, ids)
+
     def _on_launcher_clicked(self, game: str) -> None:
         """Invoke the runner for the section-header 'Launch X Launcher' button.
         Resolved through the module namespace so tests can monkeypatch it.
@@ -1602,6 +1688,7 @@ class LaunchTab(QWidget):
         slot = self._slots[game].get(account_id)
         if slot is None or slot.worker is not worker:
             return  # stale signal from a superseded/cancelled attempt
+        self._group_mark(game, account_id, "login")
         game_label = "TTR" if game == "ttr" else "CC"
         print(f"[Launch] _on_login_success: game={game} account={account_id} "
               f"gameserver='{gameserver}' token_len={len(token) if token else 0}")
@@ -1648,6 +1735,7 @@ class LaunchTab(QWidget):
             slot = self._slots["ttr"].get(account_id)
             if slot is None or slot.launcher is not launcher:
                 return
+            self._group_mark("ttr", account_id, "verify")
             launcher.launch(gameserver, token, engine_dir)
 
         patcher.progress.connect(
@@ -1685,6 +1773,7 @@ class LaunchTab(QWidget):
             slot = self._slots["cc"].get(account_id)
             if slot is None or slot.launcher is not launcher:
                 return
+            self._group_mark("cc", account_id, "verify")
             launcher.launch(gameserver, token, install,
                             username=username, realm_slug=realm_slug)
 
@@ -1770,6 +1859,7 @@ class LaunchTab(QWidget):
         slot = self._slots[game].get(account_id)
         if slot is None or slot.launcher is not launcher:
             return  # stale signal from a superseded/cancelled attempt
+        self._group_mark(game, account_id, "spawn")
         # Record the successful launch for the emblem right-click MRU. Single
         # hook -> covers both Launch-tab and emblem-menu launches.
         self._recent_launches.record(account_id)
@@ -1922,6 +2012,11 @@ class LaunchTab(QWidget):
         if raw is None:
             raw = message if state == LoginState.FAILED else ""
         slot.state, slot.message, slot.raw_error = state, message or "", raw
+        group = self._launch_groups.get(game)
+        if (group is not None and account_id in group
+                and state in (LoginState.FAILED, LoginState.IDLE)):
+            group.fail(account_id, message or state)
+            self._group_check_complete(game)
         # AccountTile expects the same lowercase string used by LoginState's
         # class attributes (idle/logging_in/queued/launching/running/failed/
         # need_2fa).
@@ -277,9 +277,38 @@ def _scan_region_inputs(target_wid, snapshot, own_pid, to_logical):
     return None
 
 
+def _prune_stale_inputs(cache, snapshot):
+    """Drop {target: (snapshot, inputs)} entries scanned from any OTHER
+    snapshot. A fresh snapshot invalidates them anyway, and without this
+    every window id ever targeted would stay pinned (with its snapshot)
+    for the life of the process - unbounded under window churn."""
+    stale = [t for t, (snap, _) in cache.items() if snap is not snapshot]
+    for t in stale:
+        del cache[t]
+
+
+def _occlusion_index_for(cache, target, snapshot, own_pid, to_logical):
+    """The target's OcclusionIndex for this snapshot, from *cache*
+    ({target: (snapshot, index)}) or built now: one z-order scan and one
+    visible-surface decomposition per (target, snapshot identity), so every
+    glove render and sweep against the same snapshot is an indexed lookup.
+    Shared by GhostCursorController and the helper-process renderer."""
+    cached = cache.get(target)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+    from utils.occlusion_index import OcclusionIndex
+    index = OcclusionIndex(
+        _scan_region_inputs(target, snapshot, own_pid, to_logical))
+    _prune_stale_inputs(cache, snapshot)
+    cache[target] = (snapshot, index)
+    return index
+
+
 def _region_from_inputs(glove_rect, inputs):
     """(game_rect, occluders) + glove rect -> glove-LOCAL visible QRegion.
-    EMPTY region when nothing of the glove should show."""
+    EMPTY region when nothing of the glove should show. The one-shot form
+    (``_visible_glove_region``); the per-frame paths query a cached
+    OcclusionIndex instead, which must agree with this exactly."""
     if inputs is None:
         return QRegion()  # game not on screen: nothing to hover over
     game_rect, occluders = inputs
@@ -652,12 +681,13 @@ class GhostCursorController(QObject):
 
             ref.timeout.connect(_ref_tick)
             ref.start()
-        # Per-target (game_rect, occluders-above) derived from the CURRENT
-        # z-order snapshot, keyed by snapshot identity: the TTL-cached darwin
-        # snapshot is the same object across a cache window, so the scan of
-        # every on-screen window runs once per snapshot instead of once per
-        # rendered frame per glove. {target: (snap_id, inputs)}
-        self._region_inputs_cache: dict[int, tuple[int, object]] = {}
+        # Per-target OcclusionIndex (visible surface = game rect minus the
+        # occluders above it) derived from the CURRENT z-order snapshot, keyed
+        # by snapshot identity: the TTL-cached darwin snapshot is the same
+        # object across a cache window, so the scan of every on-screen window
+        # runs once per snapshot instead of once per rendered frame per
+        # glove. {target: (snapshot, index)}
+        self._region_inputs_cache: dict[int, tuple] = {}
         # Helper-process renderer (ledger CP17): the app's single Qt loop +
         # GIL floor in-process glove cadence at ~50-60Hz under live load (a
         # bare 4ms reference timer gapped 17-22ms, 1:1 with the frame
@@ -1001,12 +1031,13 @@ class GhostCursorController(QObject):
         window's surface minus foreign windows above it, in glove-local
         coords. None = fail open (no probe data / no resolver).
 
-        The snapshot scan is cached per (target, snapshot IDENTITY): the
-        TTL-cached darwin snapshot is the same object across a cache window,
-        so at frame cadence the full window-list walk runs once per snapshot
-        refresh, not once per rendered frame per glove. Identity is held by
-        strong reference (never id()) so a recycled allocation can never
-        false-hit."""
+        The snapshot scan AND the visible-surface decomposition are cached
+        per (target, snapshot IDENTITY) as an OcclusionIndex: the TTL-cached
+        darwin snapshot is the same object across a cache window, so at frame
+        cadence the full window-list walk and the occluder subtraction run
+        once per snapshot refresh, and each glove is an indexed query.
+        Identity is held by strong reference (never id()) so a recycled
+        allocation can never false-hit."""
         target = self._slot_wid_int(slot)
         if target is None:
             return None
@@ -1015,14 +1046,9 @@ class GhostCursorController(QObject):
             return None
         glove = QRect(int(lx) - HOTSPOT[0], int(ly) - HOTSPOT[1],
                       CURSOR_SIZE, CURSOR_SIZE)
-        cached = self._region_inputs_cache.get(target)
-        if cached is not None and cached[0] is snapshot:
-            inputs = cached[1]
-        else:
-            inputs = _scan_region_inputs(target, snapshot, self._own_pid,
-                                         self._to_logical)
-            self._region_inputs_cache[target] = (snapshot, inputs)
-        return _region_from_inputs(glove, inputs)
+        index = _occlusion_index_for(self._region_inputs_cache, target,
+                                     snapshot, self._own_pid, self._to_logical)
+        return index.visible_region(glove)
 
     def _start_occlusion_sweep(self) -> None:
         """Run the periodic re-mask while any glove is live: windows move
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import queue
+from functools import lru_cache
 import sys
 import threading
 import time
@@ -10,8 +11,8 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFrame, QGraphicsDropShadowEffect, QStackedWidget
 )
-from PySide6.QtCore import Qt, Signal, Slot, QTimer, QVariantAnimation, QEasingCurve, QRectF, QPointF, QSize
-from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen, QPainterPath, QPixmap
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QVariantAnimation, QEasingCurve, QRectF, QPointF, QSize, Property
+from PySide6.QtGui import QColor, QFont, QIcon, QImage, QLinearGradient, QPainter, QPen, QPainterPath, QPixmap
 from services.input_service import InputService
 from services.sleep_inhibitor import SleepInhibitor
 from utils.theme_manager import (
@@ -23,14 +24,20 @@ from utils.theme_manager import (
 )
 from utils.shared_widgets import PulsingDot, ElidingLabel
 from utils.symbols import S
-from utils.ttr_api import get_toon_names_by_slot, invalidate_port_to_wid_cache, clear_stale_names
+from utils.ttr_api import (
+    get_toon_names_by_slot, invalidate_port_to_wid_cache, clear_stale_names,
+    approved_ports, window_for_port,
+)
+from utils.ttr_live import TtrLiveFeed
 from utils import cc_api
 from utils.game_registry import GameRegistry
+from utils.toon_data_service import ToonDataService
 from utils import logical_actions
 from utils.toon_customizations_manager import ToonCustomizationsManager
 from utils.settings_keys import CLICK_SYNC_ENABLED
 from utils.color_math import lighten_rgb, with_alpha
 from utils.widgets.scale_press import ScalePushButton
+from utils.frame_clock import FrameTimer
 from tabs.multitoon._feature_pill import FeaturePill
 from tabs.multitoon._feature_popover import FeatureDiscoveryPopover, prefer_above
 from utils.card_dim import dim_color, dim_pixmap, lerp_color
@@ -776,8 +783,8 @@ class KeepAliveBtn(ScalePushButton):
         self._press_timer.setInterval(self._CHARGE_MS)
         self._press_timer.timeout.connect(self._on_long_press)
 
-        self._charge_tick = QTimer(self)
-        self._charge_tick.setInterval(16)  # ~60 fps
+        self._charge_tick = FrameTimer(self, name="toon_charge")
+        self._charge_tick.setInterval(16)  # every frame
         self._charge_tick.timeout.connect(self._tick_charge)
 
     def mousePressEvent(self, e):
@@ -874,6 +881,97 @@ class KeepAliveBtn(ScalePushButton):
         p.drawArc(rect, 90 * 16, int(-self._charge_progress * 360 * 16))
 
 
+class ChatPulseBtn(ScalePushButton):
+    """Chat-broadcast toggle that pulses while broadcast is live.
+
+    The pulse (0-1) is a Qt property driven by one looping QVariantAnimation:
+    it moves the bright stop of a diagonal gradient between 30% and 70% and
+    breathes the blue glow. Both are painted/updated in place, so a frame is
+    a plain repaint - the static QSS from _pin_toggle_qss is never re-parsed
+    and the drop-shadow effect is created once and reused. Not pulsing, the
+    button paints exactly like any other ScalePushButton.
+    """
+
+    # One full sin() cycle, matching the old 20 Hz timer's 0.05-rad/tick,
+    # sin(2 * phase) pulse.
+    PULSE_PERIOD_MS = 3142
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pulse = -1.0                 # < 0: not pulsing
+        self._pulse_border = QColor("#0077ff")
+        self._glow: QGraphicsDropShadowEffect | None = None
+        self._pulse_anim = QVariantAnimation(self)
+        self._pulse_anim.setStartValue(0.0)
+        self._pulse_anim.setEndValue(1.0)
+        self._pulse_anim.setDuration(self.PULSE_PERIOD_MS)
+        self._pulse_anim.setLoopCount(-1)
+        self._pulse_anim.valueChanged.connect(
+            lambda t: self._set_pulse((math.sin(t * 2.0 * math.pi) + 1.0) / 2.0)
+        )
+
+    def _get_pulse(self) -> float:
+        return self._pulse
+
+    def _set_pulse(self, value: float) -> None:
+        self._pulse = float(value)
+        if self._pulse >= 0.0:
+            glow = self._ensure_glow()
+            glow.setBlurRadius(8 + self._pulse * 14)                      # 8..22
+            glow.setColor(QColor(0, 119, 255, int(140 + self._pulse * 115)))  # 140..255
+        self.update()
+
+    pulse = Property(float, _get_pulse, _set_pulse)
+
+    def _ensure_glow(self) -> QGraphicsDropShadowEffect:
+        # Reinstall only if something else replaced/removed the effect (e.g.
+        # _set_widget_opacity); Qt deleted the old one in that case.
+        if self._glow is None or self.graphicsEffect() is not self._glow:
+            self._glow = QGraphicsDropShadowEffect(self)
+            self._glow.setOffset(0, 0)
+            self.setGraphicsEffect(self._glow)
+        self._glow.setEnabled(True)
+        return self._glow
+
+    def is_pulsing(self) -> bool:
+        return self._pulse >= 0.0
+
+    def start_pulse(self, border: str) -> None:
+        self._pulse_border = QColor(border)
+        if self._pulse_anim.state() != QVariantAnimation.Running:
+            self._pulse_anim.start()
+            self._set_pulse(0.5)
+
+    def stop_pulse(self) -> None:
+        if not self.is_pulsing():
+            return
+        self._pulse_anim.stop()
+        self._pulse = -1.0
+        if self._glow is not None and self.graphicsEffect() is self._glow:
+            self._glow.setEnabled(False)
+        self.update()
+
+    def paintEvent(self, event):
+        if not self.is_pulsing():
+            super().paintEvent(event)
+            return
+        p = self._begin_scaled_paint()
+        stop = 0.3 + self._pulse * 0.4       # bright spot travels 30%..70%
+        grad = QLinearGradient(0, 0, self.width(), self.height())
+        grad.setColorAt(0.0, QColor("#0077ff"))
+        grad.setColorAt(stop, QColor("#0384fc"))
+        grad.setColorAt(1.0, QColor("#0077ff"))
+        p.setBrush(grad)
+        p.setPen(QPen(self._pulse_border, 1))
+        p.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 9, 9)
+        size = self.iconSize()
+        icon_rect = QRectF((self.width() - size.width()) / 2,
+                           (self.height() - size.height()) / 2,
+                           size.width(), size.height()).toRect()
+        self.icon().paint(p, icon_rect, Qt.AlignCenter, QIcon.Normal, QIcon.On)
+        p.end()
+
+
 class SetSelectorWidget(QWidget):
     """Horizontal movement-set selector — custom-painted rounded rect with edge arrows."""
     index_changed = Signal(int)
@@ -1303,6 +1401,21 @@ KA_ORANGE = "#ff9500"
 KA_ORANGE_BORDER = "#ffb04d"
 
 
+# The _pin_*_qss builders below are pure functions of their (hashable)
+# arguments and run for all four cards on every state change; lru_cache hands
+# back the same preformatted string instead of re-running the f-strings and
+# lighten_rgb() each time.
+
+
+def _set_qss(widget, qss: str) -> None:
+    """setStyleSheet only when the sheet actually changes. Every call re-parses
+    the QSS and re-polishes the widget, and the per-control style writers run
+    for all four cards on each state change, usually with the same result."""
+    if widget.styleSheet() != qss:
+        widget.setStyleSheet(qss)
+
+
+@lru_cache(maxsize=256)
 def _pin_toggle_qss(accent: str, on: bool,
                     chip: "tuple[str, str, str, str] | None" = None) -> str:
     """QSS for a 34x36 pinwheel toggle button. Active fills with the toggle's
@@ -1329,6 +1442,7 @@ def _pin_toggle_qss(accent: str, on: bool,
     )
 
 
+@lru_cache(maxsize=256)
 def _pin_ka_off_qss(chip: "tuple[str, str, str, str] | None" = None) -> str:
     """QSS for the 28px keep-alive lightning toggle in its off state. `chip`
     injects the palette (bg, border, hover, disabled) so a light card gets a
@@ -1353,6 +1467,7 @@ def _pin_ka_off_qss(chip: "tuple[str, str, str, str] | None" = None) -> str:
     )
 
 
+@lru_cache(maxsize=256)
 def _pin_ka_on_qss(fill: str, border: str) -> str:
     """QSS for the keep-alive lightning toggle in its on state (orange/red),
     brightening on hover."""
@@ -1375,6 +1490,7 @@ def _ka_fill_border(is_rf: bool, progress: float) -> tuple[str, str]:
     return fill, border
 
 
+@lru_cache(maxsize=256)
 def _pin_cs_chip_qss(border: str,
                      chip: "tuple[str, str, str, str] | None" = None) -> str:
     """QSS for the mouse-sync button's chip states (armed/error): a recessed
@@ -1401,6 +1517,7 @@ class MultitoonTab(QWidget):
     _toon_beans_ready  = Signal(list)
     _toon_data_merge_ready = Signal(list, list, list, list, list, list, list)
     _cc_toon_info_ready = Signal(list, list)  # (window_ids, list[CCToonInfo | None])
+    _toon_fields_changed = Signal(object, dict)  # (window_id, {field: value}) from the live feed
     keep_alive_updated = Signal()
     dot_state_changed = Signal(int, str)
     features_settings_requested = Signal()
@@ -1466,8 +1583,22 @@ class MultitoonTab(QWidget):
         self.toon_laffs       = [None] * 4
         self.toon_max_laffs   = [None] * 4
         self.toon_beans       = [None] * 4
-        self._refresh_gen     = 0
-        self._toon_fetch_inflight_keys = set()
+        # Live laff/bean feed: one kept connection per authorized TTR port.
+        # A quiet port is polled at the periodic refresh's own rate, and the
+        # refresh reads streamed ports from the feed instead of fetching them
+        # again; after a battle hit the stream polls fast for a few seconds.
+        self._ttr_live = TtrLiveFeed(on_change=self._on_live_fields)
+        # One long-lived fetch worker for every refresh trigger: bursts
+        # coalesce, TTR and CC run side by side, and only windows whose data
+        # changed reach the GUI. Late-bound lambdas keep the module-level
+        # fetchers patchable.
+        self._toon_data = ToonDataService(
+            classify=lambda wid: GameRegistry.instance().get_game_for_window(wid),
+            fetch_ttr=lambda n, wids: get_toon_names_by_slot(n, wids, live=self._ttr_live.current),
+            fetch_cc=lambda n, wids: cc_api.get_toon_data(n, wids),
+            on_ttr=lambda *data: self._toon_data_merge_ready.emit(*(list(d) for d in data)),
+            on_cc=lambda wids, infos: self._cc_toon_info_ready.emit(list(wids), list(infos)),
+        )
         self._active_profile  = -1  # no profile active initially
         self._last_window_ids = []
         self.customizations = ToonCustomizationsManager()
@@ -1506,6 +1637,7 @@ class MultitoonTab(QWidget):
         self._click_sync_backend = None
         self._build_click_sync()
         self._chat_glow_active = False
+        self._pulse_visible = False     # chat pulse gate, set by _update_glow_timer
         self.window_manager.window_ids_updated.connect(self.update_toon_controls)
         if hasattr(self.window_manager, "cell_assignment_changed"):
             self.window_manager.cell_assignment_changed.connect(
@@ -1519,6 +1651,7 @@ class MultitoonTab(QWidget):
         self._toon_beans_ready.connect(self._apply_toon_beans)
         self._toon_data_merge_ready.connect(self._apply_merged_toon_data)
         self._cc_toon_info_ready.connect(self._apply_cc_toon_info)
+        self._toon_fields_changed.connect(self._apply_live_toon_fields)
 
         self._toon_capture_sink = None   # set by the coordinator: callable(pid, toon_name, dna)
         # Per-window dedup of the last captured (toon_name, dna) so an unchanged
@@ -1533,14 +1666,14 @@ class MultitoonTab(QWidget):
         self._toon_fetch_timer.setSingleShot(True)
         self._toon_fetch_timer.timeout.connect(self._run_scheduled_toon_fetch)
 
-        # Glow animation timer (shared by keep-alive buttons + service button)
-        self._glow_phase = 0.0
-        self._glow_timer = QTimer(self)
+        # Glow animation timer (keep-alive rings)
+        self._glow_timer = FrameTimer(self, name="multitoon_glow")
         self._glow_timer.setInterval(50)
         self._glow_timer.timeout.connect(self._tick_glow)
 
-        # Smooth progress bar timer (60fps, independent of glow)
-        self._bar_timer = QTimer(self)
+        # Smooth progress bar timer (every frame, independent of glow). Both
+        # ride the shared frame clock so their repaints land on one frame.
+        self._bar_timer = FrameTimer(self, name="multitoon_bars")
         self._bar_timer.setInterval(16)
         self._bar_timer.timeout.connect(self._tick_progress_bars)
 
@@ -1708,7 +1841,7 @@ class MultitoonTab(QWidget):
             ka_btn.rapid_fire_toggled.connect(lambda state, idx=i: self.toggle_rapid_fire(idx, state))
             self.keep_alive_buttons.append(ka_btn)
 
-            chat_btn = ScalePushButton()
+            chat_btn = ChatPulseBtn()
             chat_btn.setCheckable(True)
             chat_btn.setChecked(True)
             chat_btn.setFixedHeight(32)
@@ -2199,7 +2332,7 @@ class MultitoonTab(QWidget):
         else:
             ink = QColor(255, 255, 255, 209)
         btn.setIcon(make_nav_power(17, ink))
-        btn.setStyleSheet(_pin_toggle_qss(c['accent_green'], active, chip=chip))
+        _set_qss(btn, _pin_toggle_qss(c['accent_green'], active, chip=chip))
 
         self._apply_chat_btn_style(index, c)
         self._apply_keep_alive_btn_style(index, c)
@@ -2222,20 +2355,32 @@ class MultitoonTab(QWidget):
         chat_btn.setText("")
         chat_btn.setEnabled(usable)
         chat_btn.setIcon(make_chat_icon(17))
-        chat_btn.setStyleSheet(
-            _pin_toggle_qss(c['accent_blue_btn'], usable and self.chat_enabled[index],
-                            chip=self._chip_colors())
-        )
+        _set_qss(chat_btn,
+                 _pin_toggle_qss(c['accent_blue_btn'], usable and self.chat_enabled[index],
+                                 chip=self._chip_colors()))
+        self._sync_chat_pulse(index, c)
+
+    def _sync_chat_pulse(self, index, c=None):
+        """Pulse the chat button while chat broadcast is live for this toon
+        (window present, chat on) and the repaint timers are allowed to run
+        (visible page or overlay); otherwise stop it."""
+        if index >= len(self.chat_buttons):
+            return
+        btn = self.chat_buttons[index]
+        wids = self.window_manager.ttr_window_ids if hasattr(self, 'input_service') else []
+        want = (self._chat_glow_active and self._pulse_visible
+                and self.chat_enabled[index] and index < len(wids))
+        if want:
+            btn.start_pulse((c or self._c())['accent_blue_btn'])
+        else:
+            btn.stop_pulse()
 
     @Slot(bool)
     def _on_chat_state_changed(self, active):
         """Called from InputService when global chat state changes."""
         self._chat_glow_active = active
         if not active:
-            # Remove glow effects and restore proper visual state
-            for i in range(4):
-                if i < len(self.chat_buttons):
-                    self.chat_buttons[i].setGraphicsEffect(None)
+            # Restore proper visual state (this also stops the pulses).
             for i in range(4):
                 self.apply_visual_state(i)
         self._update_glow_timer()
@@ -2357,7 +2502,7 @@ class MultitoonTab(QWidget):
             chip = self._chip_colors()
             ka_ink = QColor(c['text_disabled']) if chip is not None else QColor(255, 255, 255, 90)
             ka_btn.setIcon(make_lightning_icon(13, ka_ink))
-            ka_btn.setStyleSheet(_pin_ka_off_qss(chip=chip))
+            _set_qss(ka_btn, _pin_ka_off_qss(chip=chip))
             if bar:
                 bar.set_fill_color(KA_ORANGE)
                 bar.set_progress(0.0)
@@ -2377,7 +2522,7 @@ class MultitoonTab(QWidget):
             chip = self._chip_colors()
             ka_ink = QColor(c['text_disabled']) if chip is not None else QColor(255, 255, 255, 128)
             ka_btn.setIcon(make_lightning_icon(13, ka_ink))
-            ka_btn.setStyleSheet(_pin_ka_off_qss(chip=chip))
+            _set_qss(ka_btn, _pin_ka_off_qss(chip=chip))
             # Fill width is 0 when keep-alive is off.
             if bar:
                 bar.set_fill_color(KA_ORANGE)
@@ -2397,7 +2542,7 @@ class MultitoonTab(QWidget):
         fill, border = _ka_fill_border(is_rf, progress)
         ink_a = round(255 + (170 - 255) * max(0.0, min(1.0, progress)))   # 255 -> 170
         ka_btn.setIcon(make_lightning_icon(13, QColor(255, 255, 255, ink_a)))
-        ka_btn.setStyleSheet(_pin_ka_on_qss(fill, border))
+        _set_qss(ka_btn, _pin_ka_on_qss(fill, border))
         if bar:
             bar.set_fill_color(fill)
         pal = self._compact.card_palette(index) if hasattr(self, "_compact") else None
@@ -2408,8 +2553,6 @@ class MultitoonTab(QWidget):
     # ── Glow animations ────────────────────────────────────────────────────
 
     def _tick_glow(self):
-        self._glow_phase += 0.05
-
         delay = self._get_keep_alive_delay()
         elapsed = time.monotonic() - self._ka_cycle_start if self._ka_cycle_start else 0
         normal_progress = min(1.0, elapsed / delay) if delay > 0 else 0.0
@@ -2426,40 +2569,6 @@ class MultitoonTab(QWidget):
                 is_rf = getattr(self, 'rapid_fire_enabled', [False] * 4)[i]
                 self.keep_alive_buttons[i].set_progress(rf_progress if is_rf else normal_progress)
 
-        # Chat button glow pulse when chat broadcast is active
-        if self._chat_glow_active:
-            pulse = (math.sin(self._glow_phase * 2.0) + 1.0) / 2.0  # 0..1
-            blur = 8 + pulse * 14  # 8..22
-            alpha = int(140 + pulse * 115)  # 140..255
-            c = self._c()
-            # Diagonal gradient: base #0077ff ↔ bright #0384fc
-            # Shift the gradient stop position to animate the bright spot
-            stop = 0.3 + pulse * 0.4  # bright spot travels 30%..70%
-            wids = self.window_manager.ttr_window_ids
-            for i in range(4):
-                has_window = i < len(wids)
-                if i < len(self.chat_buttons) and self.chat_enabled[i] and has_window:
-                    btn = self.chat_buttons[i]
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background: qlineargradient(
-                                x1:0, y1:0, x2:1, y2:1,
-                                stop:0 #0077ff,
-                                stop:{stop:.2f} #0384fc,
-                                stop:1 #0077ff
-                            );
-                            color: white;
-                            border: 1px solid {c['accent_blue_btn']};
-                            border-radius: 9px;
-                        }}
-                    """)
-                    glow = QGraphicsDropShadowEffect(btn)
-                    glow.setOffset(0, 0)
-                    glow.setBlurRadius(blur)
-                    glow.setColor(QColor(0, 119, 255, alpha))
-                    btn.setGraphicsEffect(glow)
-
-
     def _update_glow_timer(self):
         # service_running alone does NOT need the glow timer — it has no
         # animated visual tied to it. Including it here had the timer firing
@@ -2470,19 +2579,22 @@ class MultitoonTab(QWidget):
         # visible Multitoon page. Off-page or minimized, stop them. The
         # keep-alive cycle anchor (_ka_cycle_start) is untouched, so rings/bars
         # resume on their true monotonic schedule (phase preserved).
-        from tabs.multitoon._timer_gating import timers_should_run
+        #
+        # The chat pulse animates itself (ChatPulseBtn); it needs no timer
+        # here, only the same visibility gate.
+        from tabs.multitoon._timer_gating import repaint_visible, timers_should_run
         win = self.window()
-        needs_glow, needs_bars = timers_should_run(
+        gate = dict(
             is_current_page=self.isVisible(),       # False for a non-current stacked page
             window_visible=self.isVisible(),
             window_minimized=bool(win and win.isMinimized()),
-            keep_alive_active=any(self.keep_alive_enabled),
-            chat_glow_active=self._chat_glow_active,
             overlay_active=self._overlay_active,
         )
+        needs_glow, needs_bars = timers_should_run(
+            keep_alive_active=any(self.keep_alive_enabled), **gate)
+        self._pulse_visible = repaint_visible(**gate)
 
         if needs_glow and not self._glow_timer.isActive():
-            self._glow_phase = 0.0
             self._glow_timer.start()
         elif not needs_glow and self._glow_timer.isActive():
             self._glow_timer.stop()
@@ -2490,6 +2602,10 @@ class MultitoonTab(QWidget):
                 self.keep_alive_buttons[i].setGraphicsEffect(None)
                 self.keep_alive_buttons[i].set_progress(0.0)
 
+        c = self._c()
+        for i in range(min(4, len(self.chat_buttons))):
+            self._sync_chat_pulse(i, c)
+
         if needs_bars and not self._bar_timer.isActive():
             self._bar_timer.start()
         elif not needs_bars and self._bar_timer.isActive():
@@ -2638,34 +2754,7 @@ class MultitoonTab(QWidget):
         if not wids or not (ttr_enabled or cc_enabled):
             return
 
-        request_key = (tuple(wids), ttr_enabled, cc_enabled)
-        if request_key in self._toon_fetch_inflight_keys:
-            return
-
-        self._toon_fetch_inflight_keys.add(request_key)
-        self._refresh_gen += 1
-        gen = self._refresh_gen
-
-        def _run_fetch():
-            try:
-                registry = GameRegistry.instance()
-                ttr_wids = [wid for wid in wids if registry.get_game_for_window(wid) == "ttr"]
-                cc_wids = [wid for wid in wids if registry.get_game_for_window(wid) == "cc"]
-
-                if ttr_wids and ttr_enabled:
-                    names, styles, colors, laffs, max_laffs, beans = get_toon_names_by_slot(len(ttr_wids), ttr_wids)
-                    if gen == self._refresh_gen:
-                        self._toon_data_merge_ready.emit(list(ttr_wids), list(names), list(styles), list(colors), list(laffs), list(max_laffs), list(beans))
-
-                if cc_wids and cc_enabled:
-                    def _cc_data_callback(infos):
-                        if gen == self._refresh_gen:
-                            self._cc_toon_info_ready.emit(list(cc_wids), list(infos))
-                    cc_api.get_toon_data_threaded(len(cc_wids), cc_wids, _cc_data_callback)
-            finally:
-                self._toon_fetch_inflight_keys.discard(request_key)
-
-        threading.Thread(target=_run_fetch, daemon=True).start()
+        self._toon_data.request(wids, ttr_enabled, cc_enabled)
 
     def _set_card_brand_for_slot(
         self, index: int, game: str | None, enabled: bool = False
@@ -2747,6 +2836,7 @@ class MultitoonTab(QWidget):
             self.log("[Service] Refresh coalesced (within cooldown).")
             return
         self.log("[Service] Manual refresh triggered.")
+        self._toon_data.invalidate()
         invalidate_port_to_wid_cache()
         clear_stale_names([])
         self.toon_names = [None] * 4
@@ -2788,6 +2878,11 @@ class MultitoonTab(QWidget):
         # already runs assign_windows() every 2s in its own thread, so the
         # window list stays fresh without blocking compact↔full swaps.
         self._fetch_names_if_enabled(len(self.window_manager.ttr_window_ids))
+        self._sync_live_ports()
+        # Poll faster right after a login/zone change, slower while stable.
+        interval = self._toon_data.interval_ms()
+        if self.refresh_timer.interval() != interval:
+            self.refresh_timer.setInterval(interval)
 
     # ── Service lifecycle ──────────────────────────────────────────────────
 
@@ -2818,7 +2913,8 @@ class MultitoonTab(QWidget):
             self.input_service.stop()
             self.refresh_timer.stop()
             self._toon_fetch_timer.stop()
-            self._refresh_gen += 1
+            self._toon_data.cancel()
+            self._ttr_live.stop()
             self.input_service.window_manager.disable_detection()
             self.disable_all_toon_controls()
             self.log("[Service] Multitoon service stopped.")
@@ -2840,7 +2936,7 @@ class MultitoonTab(QWidget):
         if count:
             self.log(f"[Input] {count} toon window{'s' if count != 1 else ''} detected — input + chat enabled", level="ok")
         self.update_status_label()
-        self.refresh_timer.start()
+        self.refresh_timer.start(self._toon_data.interval_ms())
         self.schedule_toon_data_fetch(1200)
 
     def start_service(self):
@@ -3043,11 +3139,14 @@ class MultitoonTab(QWidget):
                 return None
 
             def _cs_capture_factory(on_event):
-                from utils.xrecord_capture import XRecordCapture
+                # A handle on the process-wide pointer stream (one XRecord
+                # capture shared with the overlay's hover peek and click-off
+                # watcher); same start/stop/is_running/on_died contract.
+                from utils.pointer_bus import SharedCapture
                 # on_died closes over its own instance so the service can
                 # identity-check stale generations.
                 holder = []
-                cap = XRecordCapture(
+                cap = SharedCapture(
                     on_event,
                     on_died=lambda: self.click_sync_service.notify_capture_died(
                         holder[0]))
@@ -3223,21 +3322,21 @@ class MultitoonTab(QWidget):
             btn.setEnabled(False)
             btn.setChecked(False)
             btn.setIcon(self._click_sync_icons["disabled"])
-            btn.setStyleSheet(_pin_toggle_qss(c['accent_pink'], False, chip=self._chip_colors()))
+            _set_qss(btn, _pin_toggle_qss(c['accent_pink'], False, chip=self._chip_colors()))
             btn.setToolTip("Click sync: no toon detected in this slot")
             return
         btn.setEnabled(True)
         btn.setIcon(self._click_sync_icons[state])
         btn.setChecked(state != "off")
         if state == "active":
-            btn.setStyleSheet(_pin_toggle_qss(c['accent_pink'], True))
+            _set_qss(btn, _pin_toggle_qss(c['accent_pink'], True))
         elif state == "armed":
             # Recessed chip with a pink ring: armed but not yet mirroring.
-            btn.setStyleSheet(_pin_cs_chip_qss(c['accent_pink_border'], chip=self._chip_colors()))
+            _set_qss(btn, _pin_cs_chip_qss(c['accent_pink_border'], chip=self._chip_colors()))
         elif state == "error":
-            btn.setStyleSheet(_pin_cs_chip_qss(c['accent_red_border'], chip=self._chip_colors()))
+            _set_qss(btn, _pin_cs_chip_qss(c['accent_red_border'], chip=self._chip_colors()))
         else:  # off (also the unknown-state fallback)
-            btn.setStyleSheet(_pin_toggle_qss(c['accent_pink'], False, chip=self._chip_colors()))
+            _set_qss(btn, _pin_toggle_qss(c['accent_pink'], False, chip=self._chip_colors()))
         tips = {
             "off": "Click sync: mirror clicks to this toon",
             "armed": "Click sync: waiting for a second toon",
@@ -3445,8 +3544,15 @@ class MultitoonTab(QWidget):
                     self.keep_alive_buttons[i].setChecked(self.keep_alive_enabled[i])
 
             self._last_window_ids = list(window_ids)
+            # Slot data was shifted/cleared above: deliver every window again.
+            self._toon_data.invalidate()
             invalidate_port_to_wid_cache()
             clear_stale_names(window_ids)
+            # Closed windows never come back under the same id: drop their
+            # capture dedup so window churn cannot grow it without bound.
+            live = {str(w) for w in window_ids}
+            self._last_captured_toon = {
+                k: v for k, v in self._last_captured_toon.items() if k in live}
             # Do not completely blow away toon_names, they are now correctly shifted above.
             self._refresh_toon_name_labels()
 
@@ -3550,10 +3656,47 @@ class MultitoonTab(QWidget):
                         self._set_chat_button_visible(global_idx, True)
         self._refresh_toon_name_labels()
         self._refresh_toon_stats_labels()
+        self._sync_live_ports()
         # Defer chrome refresh to the next event-loop tick so any in-progress
         # paint/style cascade triggered by the name change finishes first.
         QTimer.singleShot(0, self._refresh_chrome_after_name_change)
 
+    def _sync_live_ports(self):
+        """Stream exactly the authorized TTR ports while the service runs
+        with the companion app enabled."""
+        enabled = bool(self.settings_manager and self.settings_manager.get("enable_companion_app", True))
+        self._ttr_live.watch(approved_ports() if self.service_running and enabled else ())
+
+    def _on_live_fields(self, port, fields):
+        # Live-feed thread: map the port to its window and hop to the GUI.
+        wid = window_for_port(port)
+        if wid is not None:
+            self._toon_fields_changed.emit(wid, dict(fields))
+
+    @Slot(object, dict)
+    def _apply_live_toon_fields(self, wid, fields):
+        """Apply a live-feed change to its slot. Stats are patched in place;
+        an identity or colour change (login, toon switch) goes through the
+        full fetch so the capture, badge, accent and chrome paths run as
+        usual."""
+        wids = list(self.window_manager.ttr_window_ids) if self.window_manager else []
+        if wid not in wids or wids.index(wid) >= 4:
+            return
+        idx = wids.index(wid)
+        if "name" in fields or "style" in fields or (
+                "color" in fields and fields["color"] != self.toon_colors[idx]):
+            self.schedule_toon_data_fetch(0)
+            return
+        stats = (("laff", self.toon_laffs), ("max_laff", self.toon_max_laffs),
+                 ("beans", self.toon_beans))
+        changed = False
+        for key, column in stats:
+            if key in fields and column[idx] != fields[key]:
+                column[idx] = fields[key]
+                changed = True
+        if changed:
+            self._refresh_toon_stats_labels()
+
     @Slot(list, list)
     def _apply_cc_toon_info(self, target_wids, infos):
         """Fan out CCToonInfo per slot into name, portrait, chip row,
@@ -3914,8 +4057,9 @@ class MultitoonTab(QWidget):
         """Acquire the OS sleep/idle inhibitor off the GUI thread; surface the
         verified status to the UI when it completes.
 
-        acquire() can block up to ~1.5s (it shells out to systemd-inhibit and
-        polls), so it runs on a worker thread. A generation guard ensures a
+        acquire() is one D-Bus round trip on the native path but can block up
+        to ~1.5s on the systemd-inhibit fallback (it shells out and polls), so
+        it runs on a worker thread. A generation guard ensures a
         late result from a worker that was superseded by release/re-acquire can
         never flip the UI back."""
         from services._inhibit_worker import InhibitAcquireWorker
@@ -4249,6 +4393,8 @@ class MultitoonTab(QWidget):
         self._stop_keep_alive()
         self.refresh_timer.stop()
         self._toon_fetch_timer.stop()
+        self._toon_data.shutdown()
+        self._ttr_live.stop()
         self._glow_timer.stop()
         self._bar_timer.stop()
         # Rendition fetches now go through the shared RenditionPoseFetcher
@@ -4291,7 +4437,7 @@ def _dispatch_keep_alive_cycle(action, fire_toons, window_manager, keymap_manage
     # Fail-open via getattr so bare test stubs without the method keep the
     # historical behavior.
     chat_skip = getattr(input_service, "keep_alive_skip_window", None)
-    fired = 0
+    presses = []
     for i in fire_toons:
         if i >= len(window_ids):
             continue
@@ -4315,7 +4461,16 @@ def _dispatch_keep_alive_cycle(action, fire_toons, window_manager, keymap_manage
             key = keymap_manager.get_key_for_action(game, 0, logical)
         if not key:
             continue
-        input_service.send_keep_alive_to_window(wid, key)
-        fired += 1
-    return fired
+        presses.append((wid, key))
+    # One batch: every toon is pressed together and released together one
+    # hold later, instead of one hold per toon. Bare test stubs that only
+    # provide the per-window call keep working.
+    send_batch = getattr(input_service, "send_keep_alive_batch", None)
+    if send_batch is not None:
+        if presses:
+            send_batch(presses)
+    else:
+        for wid, key in presses:
+            input_service.send_keep_alive_to_window(wid, key)
+    return len(presses)
 
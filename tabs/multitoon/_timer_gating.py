@@ -1,26 +1,34 @@
-"""Pure predicate for whether the Multitoon glow/bar repaint timers should run.
-They only change pixels on the visible Multitoon page; off-page or minimized,
-nothing visible changes, so they should stop. Keep-alive timing is preserved by
-the monotonic _ka_cycle_start anchor, NOT by these repaint timers."""
+"""Pure predicates for whether the Multitoon glow/bar repaint timers and the
+chat pulse should run. They only change pixels on the visible Multitoon page;
+off-page or minimized, nothing visible changes, so they should stop.
+Keep-alive timing is preserved by the monotonic _ka_cycle_start anchor, NOT by
+these repaint timers."""
 from __future__ import annotations
 
 
-def timers_should_run(*, is_current_page: bool, window_visible: bool,
-                      window_minimized: bool, keep_alive_active: bool,
-                      chat_glow_active: bool,
-                      overlay_active: bool = False) -> tuple[bool, bool]:
-    """Return (glow_should_run, bars_should_run).
+def repaint_visible(*, is_current_page: bool, window_visible: bool,
+                    window_minimized: bool, overlay_active: bool = False) -> bool:
+    """True when Multitoon repaints can reach the screen.
 
     overlay_active: True while the transparent-mode cluster is up. The overlay
-    hides the main window, so the normal on-page test would stop the timers;
-    but the cluster is visible in its own surfaces, so overlay_active forces
-    on-page. Defaults False -> framed-mode behavior is unchanged.
+    hides the main window, so the normal on-page test would say no; but the
+    cluster is visible in its own surfaces, so overlay_active forces on-page.
     """
-    on_page = overlay_active or (
+    return overlay_active or (
         window_visible and not window_minimized and is_current_page
     )
+
+
+def timers_should_run(*, is_current_page: bool, window_visible: bool,
+                      window_minimized: bool, keep_alive_active: bool,
+                      overlay_active: bool = False) -> tuple[bool, bool]:
+    """Return (glow_should_run, bars_should_run). Both serve keep-alive only:
+    the chat pulse runs on each ChatPulseBtn's own animation, gated directly
+    on repaint_visible."""
+    on_page = repaint_visible(
+        is_current_page=is_current_page, window_visible=window_visible,
+        window_minimized=window_minimized, overlay_active=overlay_active,
+    )
     if not on_page:
         return (False, False)
-    glow = keep_alive_active or chat_glow_active
-    bars = keep_alive_active
-    return (glow, bars)
+    return (keep_alive_active, keep_alive_active)
@@ -4,7 +4,6 @@ import os
 import sys
 from pathlib import Path
 
-import psutil
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QApplication, QMessageBox, QFrame,
@@ -226,6 +225,9 @@ class SettingsTab(QWidget):
     input_backend_changed = Signal()
     clear_credentials_requested = Signal()
     chat_handling_mode_changed = Signal(str)
+    # Internal: steam_proton_tools change listeners run on whichever thread
+    # enumerated (the launch worker included); this hops them to the GUI.
+    _proton_tools_changed = Signal()
 
     CATEGORIES = [
         ("general", "General"),
@@ -539,6 +541,7 @@ class SettingsTab(QWidget):
             cc_card.add_row(compat_row)
             self._refresh_compat_runtime_row()
             self.settings_manager.on_change(self._on_setting_changed_compat)
+            self._watch_proton_tools()
 
         hide_row = self._v2_row(
             "Hide CC launch console",
@@ -829,6 +832,60 @@ class SettingsTab(QWidget):
                 return tool.nickname
         return os.path.basename(proton_dir.rstrip(os.sep))
 
+    def _watch_proton_tools(self):
+        """Refresh the compat row when a Proton is installed, removed or
+        updated, without polling: a file-system watcher on the Steam tool
+        directories re-enumerates (stat-only when nothing changed) and the
+        enumeration cache's change listener fires only if the list moved."""
+        from PySide6.QtCore import QFileSystemWatcher
+        from services import steam_proton_tools
+        self._proton_watcher = QFileSystemWatcher(self)
+        self._proton_recheck_pending = False
+        self._proton_watcher.directoryChanged.connect(self._on_proton_dir_changed)
+        self._rewatch_proton_dirs()
+        self._proton_tools_changed.connect(self._refresh_compat_runtime_row)
+        emit = self._proton_tools_changed.emit
+
+        def _listener(_tools):
+            emit()
+        steam_proton_tools.add_change_listener(_listener)
+        self.destroyed.connect(
+            lambda *_: steam_proton_tools.remove_change_listener(_listener))
+
+    def _rewatch_proton_dirs(self) -> bool:
+        """Watch the Steam tool directories plus any tool directory the
+        cache has not settled yet. Returns True if one is unsettled."""
+        from services.steam_proton_tools import unresolved_dirs, watch_dirs
+        pending = unresolved_dirs()
+        wanted = set(watch_dirs()) | set(pending)
+        current = set(self._proton_watcher.directories())
+        if current - wanted:
+            self._proton_watcher.removePaths(sorted(current - wanted))
+        if wanted - current:
+            self._proton_watcher.addPaths(sorted(wanted - current))
+        return bool(pending)
+
+    def _on_proton_dir_changed(self, _path):
+        from PySide6.QtCore import QTimer
+        from services.steam_proton_tools import (
+            enumerate_proton_tools, settle_delay_ms,
+        )
+        enumerate_proton_tools()
+        # A compatibilitytools.d created after startup needs watching too,
+        # and so does a tool directory whose files are still being written:
+        # those writes don't touch compatibilitytools.d. A tool cached while
+        # inside the racy window gets no further event at all, so re-check
+        # once after the window has passed.
+        if self._rewatch_proton_dirs() and not self._proton_recheck_pending:
+            self._proton_recheck_pending = True
+            QTimer.singleShot(settle_delay_ms(), self._on_proton_recheck)
+
+    def _on_proton_recheck(self):
+        from services.steam_proton_tools import enumerate_proton_tools
+        self._proton_recheck_pending = False
+        enumerate_proton_tools()
+        self._rewatch_proton_dirs()
+
     def _on_setting_changed_compat(self, key, _value):
         if key in ("cc_steam_proton_override", "cc_engine_dir"):
             self._refresh_compat_runtime_row()
@@ -894,16 +951,16 @@ class SettingsTab(QWidget):
         manual_raw = self.settings_manager.get(CC_EXTERNAL_LOG_DIR, "") or ""
         manual_dir = Path(manual_raw.strip()) if manual_raw.strip() else None
         results: list[str] = []
-        for proc in psutil.process_iter(attrs=["pid", "name"]):
-            name = (proc.info.get("name") or "").lower()
-            if "corporateclash" not in name:
-                continue
-            pid = proc.info["pid"]
-            try:
-                path = cc_log_discovery.find_log_for_pid(pid, manual_dir=manual_dir)
-            except Exception as exc:
-                results.append(f"pid {pid}: error {exc!r}")
-                continue
+        try:
+            index = cc_log_discovery.ProcessIndex()
+            pids = [pid for _create_time, pid in index.cc_procs]
+            found = cc_log_discovery.find_logs_for_pids(
+                pids, manual_dir=manual_dir, index=index)
+        except Exception as exc:
+            pids, found = [], {}
+            results.append(f"error {exc!r}")
+        for pid in pids:
+            path = found.get(pid)
             results.append(
                 f"pid {pid}: {'(found) ' + str(path) if path else '(not found)'}"
             )
@@ -36,6 +36,7 @@ def _isolate_layer2_from_host_filesystem(monkeypatch):
                         lambda pid: 0.0)
     monkeypatch.setattr(cc_log_discovery, "_read_proc_environ",
                         lambda pid: b"")
+    monkeypatch.setattr(cc_log_discovery, "_logs_dirs_cache", {})
 
 
 def test_layer1_returns_cc_log_path_when_psutil_finds_it():
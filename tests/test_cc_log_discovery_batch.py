@@ -0,0 +1,160 @@
+"""find_logs_for_pids against a fixture process table: four concurrent CC
+instances are resolved with ONE host process scan per pass and each window
+gets its own log whatever the iteration order: sandboxed windows through
+their CC process's NSpid, host-PID windows by create time."""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import psutil
+import pytest
+
+from utils import cc_api, cc_log_discovery
+
+T0 = 1_780_000_000.0
+LOGS = "/home/u/Bottles/cc/drive_c/users/steamuser/AppData/Local/Corporate Clash/logs"
+
+
+class FakeHost:
+    """psutil and /proc stand-in. `cc` are the real host CC processes;
+    `aliases` are the PIDs X11 reports for their windows (no open files).
+
+    sandboxed: each CC process runs in a nested PID namespace and its
+    innermost NSpid is its window's alias. The host processes that happen
+    to carry the alias numbers are unrelated, with create times running the
+    other way, so a create-time match would pick the wrong logs.
+    Otherwise the aliases are host processes (the Wine loader owning the
+    window), each started just before its CC instance."""
+
+    def __init__(self, n=4, order=(2, 0, 3, 1), sandboxed=True):
+        self.scans = 0
+        self.cc = {52000 + i: (T0 + 60 * i, f"{LOGS}/corporateclash-{i}.log")
+                   for i in range(n)}
+        if sandboxed:
+            self.aliases = {7000 + i: T0 + 60 * (n - 1 - i) - 0.4 for i in range(n)}
+            self.inner = {52000 + i: 7000 + i for i in range(n)}
+        else:
+            self.aliases = {7000 + i: T0 + 60 * i - 0.4 for i in range(n)}
+            self.inner = {}
+        self.order = [52000 + i for i in order]
+
+    def nspid(self, pid):
+        return self.inner.get(pid, pid)
+
+    def process_iter(self, attrs=None):
+        self.scans += 1
+        procs = [MagicMock(info={"pid": 1, "name": "systemd", "create_time": 1.0})]
+        for pid in self.order:
+            procs.append(MagicMock(info={"pid": pid, "name": "CorporateClash.exe",
+                                         "create_time": self.cc[pid][0]}))
+        return iter(procs)
+
+    def Process(self, pid):
+        proc = MagicMock()
+        if pid in self.cc:
+            proc.open_files.return_value = [MagicMock(path=self.cc[pid][1])]
+            proc.create_time.return_value = self.cc[pid][0]
+        elif pid in self.aliases:
+            proc.open_files.return_value = []
+            proc.create_time.return_value = self.aliases[pid]
+        else:
+            raise psutil.NoSuchProcess(pid)
+        return proc
+
+
+def _install(monkeypatch, h):
+    monkeypatch.setattr(psutil, "process_iter", h.process_iter)
+    monkeypatch.setattr(psutil, "Process", h.Process)
+    monkeypatch.setattr(cc_log_discovery, "_proc_nspid", h.nspid)
+    monkeypatch.setattr(cc_log_discovery, "_candidate_logs_dirs", lambda pid, manual_dir: [])
+    monkeypatch.setattr(cc_log_discovery, "_read_proc_environ", lambda pid: b"")
+    monkeypatch.setattr(cc_log_discovery, "_logs_dirs_cache", {})
+    return h
+
+
+@pytest.fixture
+def host(monkeypatch):
+    return _install(monkeypatch, FakeHost())
+
+
+def _expected(h):
+    return {7000 + i: Path(f"{LOGS}/corporateclash-{i}.log") for i in range(4)}
+
+
+def test_four_sandboxed_instances_one_scan_distinct_logs(host):
+    result = cc_log_discovery.find_logs_for_pids([7003, 7001, 7000, 7002])
+    assert host.scans == 1
+    assert result == _expected(host)
+
+
+@pytest.mark.parametrize("order", [(0, 1, 2, 3), (3, 2, 1, 0), (1, 3, 0, 2)])
+def test_assignment_is_independent_of_process_order(monkeypatch, order):
+    h = _install(monkeypatch, FakeHost(order=order))
+    assert cc_log_discovery.find_logs_for_pids([7000, 7001, 7002, 7003]) == _expected(h)
+
+
+@pytest.mark.parametrize("order", [(0, 1, 2, 3), (3, 2, 1, 0)])
+def test_host_pid_windows_are_matched_by_create_time(monkeypatch, order):
+    h = _install(monkeypatch, FakeHost(order=order, sandboxed=False))
+    assert cc_log_discovery.find_logs_for_pids([7002, 7000, 7003, 7001]) == _expected(h)
+
+
+def test_shared_inner_pid_is_not_guessed(monkeypatch):
+    # Two sandboxes both numbered their CC process 7000: neither log can be
+    # told apart by PID, and the alias is no host PID to match by time.
+    h = FakeHost(n=2, order=(0, 1))
+    h.inner = {52000: 7000, 52001: 7000}
+    _install(monkeypatch, h)
+    assert cc_log_discovery.find_logs_for_pids([7000]) == {7000: None}
+
+
+def test_direct_hits_are_not_reassigned_and_skip_the_scan(host):
+    pids = list(host.cc)
+    result = cc_log_discovery.find_logs_for_pids(pids)
+    assert host.scans == 0
+    assert result == {pid: Path(host.cc[pid][1]) for pid in pids}
+
+
+def test_refresh_of_four_windows_scans_once(host, monkeypatch):
+    from services import cc_launcher
+    registered = {}
+    monkeypatch.setattr(cc_api, "_resolve_pid_for_window", lambda wid: 7000 + int(wid))
+    monkeypatch.setattr(cc_api, "_get_cc_manual_log_dir", lambda: None)
+    monkeypatch.setattr(cc_launcher, "get_stdout_path_for_pid", lambda pid: registered.get(pid))
+    monkeypatch.setattr(cc_launcher, "_register_stdout_path", registered.__setitem__)
+    monkeypatch.setattr(cc_api, "_info_from_stdout", lambda path: path)
+    infos = cc_api.get_toon_data(4, ["3", "1", "0", "2"])
+    assert host.scans == 1
+    assert infos == [Path(f"{LOGS}/corporateclash-{i}.log") for i in (3, 1, 0, 2)]
+    # The next pass finds everything in the registry: no scan at all.
+    cc_api.get_toon_data(4, ["0", "1", "2", "3"])
+    assert host.scans == 1
+
+
+def test_prefix_glob_matches_logs_by_session_start_stamp(tmp_path, monkeypatch):
+    """No open-file access (Layer 1/1.5 blind): the logs in a shared prefix
+    are matched to instances by the start stamp in their file names."""
+    monkeypatch.setattr(psutil, "process_iter", lambda attrs=None: iter([]))
+    starts = {8000 + i: T0 + 3600 * i for i in range(4)}
+    proc = {pid: MagicMock(**{"open_files.side_effect": psutil.AccessDenied(pid),
+                              "create_time.return_value": ct})
+            for pid, ct in starts.items()}
+    monkeypatch.setattr(psutil, "Process", lambda pid: proc[pid])
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    expected = {}
+    for pid, ct in starts.items():
+        stamp = time.strftime("%m-%d-%Y-%H-%M-%S", time.localtime(ct + 2))
+        path = logs / f"corporateclash-{stamp}.log"
+        path.write_text("x")
+        expected[pid] = path
+    environ_reads = []
+    monkeypatch.setattr(cc_log_discovery, "_candidate_logs_dirs",
+                        lambda pid, manual_dir: environ_reads.append(pid) or [logs])
+    monkeypatch.setattr(cc_log_discovery, "_logs_dirs_cache", {})
+    for _ in range(2):
+        assert cc_log_discovery.find_logs_for_pids(list(reversed(starts))) == expected
+    # Log-dir resolution is cached per (pid, create_time) across passes.
+    assert sorted(environ_reads) == sorted(starts)
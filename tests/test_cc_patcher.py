@@ -263,3 +263,31 @@ def test_session_cache_skips_second_verify(monkeypatch):
     patcher.verify_and_patch("/game", "tok", "production")
     assert done.wait(2.0)
     assert seen.get("ok") and "fail" not in seen
+
+
+def test_concurrent_launches_share_one_pass(monkeypatch):
+    """Accounts that finish logging in together join one manifest fetch for
+    the install instead of each re-running it behind a lock."""
+    _qapp()
+    p.reset_verify_cache()
+    fetches = []
+    gate = threading.Event()
+
+    def manifests(realm, plat):
+        fetches.append(realm)
+        gate.wait(1.0)
+        return [{"filePath": "a.dll", "sha1": "h", "_platform": "windows"}]
+
+    monkeypatch.setattr(p, "fetch_all_manifests", manifests)
+    monkeypatch.setattr(p, "select_stale", lambda files, game_dir: [])
+    done = threading.Semaphore(0)
+    patchers = []
+    for tok in ("t1", "t2", "t3"):
+        patcher = p.CCPatcher()
+        patcher.up_to_date.connect(done.release, Qt.DirectConnection)
+        patchers.append(patcher)
+        patcher.verify_and_patch("/game", tok, "production")
+    threading.Timer(0.2, gate.set).start()
+    for _ in patchers:
+        assert done.acquire(timeout=2.0)
+    assert fetches == ["production"]
@@ -0,0 +1,255 @@
+"""The compiled ChatFsm dispatch (tables + shared immutable results) must
+decide exactly like the branching implementation it replaced.
+
+_BranchingFsm below is that implementation, kept verbatim minus comments as
+the oracle. Seeded random key / time / context streams are fed to both
+machines and every decision, keyup/tick result and state must match.
+"""
+from __future__ import annotations
+
+import random
+import sys
+
+import pytest
+
+from services import chat_fsm
+from services.chat_fsm import (
+    CHAT_EDIT_KEYS,
+    MODIFIER_KEYS,
+    ChatCtx,
+    ChatFsm,
+    ChatState,
+    KeyClass,
+    KeyDecision,
+    TickResult,
+    UpResult,
+    _MOD_NAME,
+    _is_printable_char,
+    _is_typeable,
+)
+
+
+class _BranchingFsm(ChatFsm):
+    def on_keydown(self, key, now, ctx):
+        if key in MODIFIER_KEYS:
+            name = _MOD_NAME.get(key)
+            if name:
+                self._mods_down[name] = self._mods_down.get(name, 0) + 1
+            return KeyDecision(KeyClass.MODIFIER)
+        self._down[key] = now
+        is_bound = key in ctx.bound_keys
+        if not is_bound and _is_printable_char(key):
+            self._unbound_printable_down.add(key)
+        is_chord = self._matches_chord(key, ctx)
+        if self.in_capture:
+            return self._keydown_in_capture(key, now, ctx, is_bound, is_chord)
+        return self._keydown_route_or_grace(key, now, ctx, is_bound, is_chord)
+
+    def _keydown_in_capture(self, key, now, ctx, is_bound, is_chord):
+        if is_chord:
+            self._last_chord_at = now
+            cause = "send"
+            if self._state is ChatState.CAPTURE and not self._open_had_typing:
+                cause = "close_empty"
+            return KeyDecision(KeyClass.CHORD_CLOSE, self._go(ChatState.GRACE, cause, now))
+        if key == "Escape":
+            self._last_chord_at = now
+            return KeyDecision(KeyClass.CHORD_CLOSE, self._go(ChatState.GRACE, "escape", now))
+        if key == "BackSpace":
+            trs = self._note_typing_evidence(now)
+            self._open_had_typing = True
+            if self._state is ChatState.CAPTURE_SOFT:
+                return KeyDecision(KeyClass.SUPPRESS, trs)
+            return KeyDecision(KeyClass.EDIT, trs)
+        if key in CHAT_EDIT_KEYS:
+            self._last_chat_evidence = now
+            if self._state is ChatState.CAPTURE_SOFT:
+                return KeyDecision(KeyClass.SUPPRESS)
+            return KeyDecision(KeyClass.TYPING)
+        if is_bound and not _is_typeable(key):
+            return KeyDecision(KeyClass.MOVEMENT, self._go(ChatState.GRACE, "demote_tap", now))
+        if not is_bound and _is_printable_char(key):
+            self._note_typing_evidence(now)
+        self._open_had_typing = True
+        if self._state is ChatState.CAPTURE_SOFT:
+            return KeyDecision(KeyClass.SUPPRESS)
+        return KeyDecision(KeyClass.TYPING)
+
+    def _keydown_route_or_grace(self, key, now, ctx, is_bound, is_chord):
+        if is_chord:
+            if is_bound:
+                return KeyDecision(KeyClass.MOVEMENT)
+            return self._classify_chord(key, now)
+        if key == "Escape":
+            if is_bound:
+                return KeyDecision(KeyClass.MOVEMENT)
+            self._context_active = False
+            return KeyDecision(KeyClass.ESCAPE_CLEAR)
+        if key == "BackSpace":
+            return KeyDecision(KeyClass.EDIT, self._note_typing_evidence(now))
+        if is_bound:
+            return KeyDecision(KeyClass.MOVEMENT)
+        if _is_printable_char(key):
+            if ctx.mode_b:
+                tr = self._go(ChatState.CAPTURE, "mode_b_letter", now)
+                self._open_had_typing = True
+                return KeyDecision(KeyClass.CHORD_OPEN, tr, open_key=key)
+            return KeyDecision(KeyClass.TYPING)
+        return KeyDecision(KeyClass.ACTION)
+
+    def on_keyup(self, key, now, ctx):
+        if key in MODIFIER_KEYS:
+            name = _MOD_NAME.get(key)
+            if name and self._mods_down.get(name):
+                self._mods_down[name] -= 1
+                if self._mods_down[name] <= 0:
+                    del self._mods_down[name]
+            return UpResult()
+        down_at = self._down.pop(key, None)
+        self._unbound_printable_down.discard(key)
+        transitions = ()
+        if (down_at is not None
+                and down_at > self._last_chord_at
+                and key not in ctx.bound_keys
+                and _is_printable_char(key)
+                and now - down_at < self.config.tap_max):
+            transitions = self._note_typing_evidence(now)
+        return UpResult(transitions)
+
+    def on_tick(self, now, ctx):
+        cfg = self.config
+        transitions = []
+        if self.in_capture:
+            demote = self._gameplay_demote_cause(now, ctx)
+            if demote:
+                transitions.extend(self._go(ChatState.GRACE, demote, now))
+            elif (self._last_chat_evidence
+                    and now - self._last_chat_evidence > cfg.capture_ttl):
+                transitions.extend(self._go(ChatState.GRACE, "ttl", now))
+        elif self._state is ChatState.GRACE:
+            if now - self._state_entered >= cfg.grace_s:
+                transitions.extend(self._go(ChatState.ROUTE, "grace_end", now))
+        elif self._state is ChatState.ROUTE and self._context_active:
+            if self._gameplay_demote_cause(now, ctx):
+                self._context_active = False
+        return TickResult(tuple(transitions))
+
+    def _matches_chord(self, key, ctx):
+        held = set(self._mods_down)
+        for mods, chord_key in ctx.open_chords:
+            if key == chord_key and mods <= held:
+                return True
+        return False
+
+    def _classify_chord(self, key, now):
+        self._last_chord_at = now
+        if self.context_active(now):
+            self._context_active = False
+            self._typing_events.clear()
+            return KeyDecision(KeyClass.CHORD_SEND)
+        tr = self._go(ChatState.CAPTURE, "chord_open", now)
+        self._open_had_typing = False
+        return KeyDecision(KeyClass.CHORD_OPEN, tr, open_key=key)
+
+
+KEYS = (["w", "a", "s", "d", "space", "g", "t", "h", "i", "q", "1", "?",
+         "Return", "Escape", "BackSpace", "Delete", "Up", "Left", "Home",
+         "F1", "Prior", "KP_Enter", "Tab"]
+        + sorted(MODIFIER_KEYS))
+BOUND_SETS = (
+    frozenset(),
+    frozenset({"w", "a", "s", "d", "space", "Alt_L", "g", "t", "Delete"}),
+    frozenset({"Up", "Down", "Left", "Right", "space", "F1", "Escape", "Return"}),
+    frozenset({"w", "a", "s", "d", "space", "Up", "Left", "Prior", "BackSpace", "h"}),
+)
+CHORD_SETS = (
+    ChatCtx.__dataclass_fields__["open_chords"].default,
+    ((frozenset(), "Return"),),
+    ((frozenset({"ctrl"}), "t"), (frozenset({"shift"}), "Return")),
+    ((frozenset(), "KP_Enter"), (frozenset({"alt"}), "Escape")),
+)
+
+
+def _snapshot(fsm, now):
+    return (fsm.state, fsm.context_active(now), dict(fsm._down),
+            dict(fsm._mods_down), fsm._open_had_typing)
+
+
+def _run_equivalence(seed, steps=400):
+    rng = random.Random(seed)
+    compiled, oracle = ChatFsm(), _BranchingFsm()
+    down: list = []
+    t = rng.random() * 5
+    for _ in range(steps):
+        t += rng.choice((0.0, 0.01, 0.05, 0.12, 0.3, 0.8, 2.0, 16.0)) * rng.random()
+        c = ChatCtx(bound_keys=rng.choice(BOUND_SETS),
+                    open_chords=rng.choice(CHORD_SETS),
+                    mode_b=rng.random() < 0.2)
+        r = rng.random()
+        if r < 0.5:
+            key = rng.choice(KEYS)
+            down.append(key)
+            got, want = compiled.on_keydown(key, t, c), oracle.on_keydown(key, t, c)
+        elif r < 0.85 and down:
+            key = down.pop(rng.randrange(len(down)))
+            got, want = compiled.on_keyup(key, t, c), oracle.on_keyup(key, t, c)
+        elif r < 0.98:
+            got, want = compiled.on_tick(t, c), oracle.on_tick(t, c)
+        elif r < 0.99:
+            got, want = compiled.force_route(t), oracle.force_route(t)
+        else:
+            got = compiled.on_focus_change_managed(t)
+            want = oracle.on_focus_change_managed(t)
+        assert got == want, f"seed {seed}: {got!r} != {want!r}"
+        assert _snapshot(compiled, t) == _snapshot(oracle, t), f"seed {seed}"
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_compiled_dispatch_matches_branching_fsm(seed):
+    _run_equivalence(seed)
+
+
+def test_every_state_is_reached_by_the_equivalence_streams():
+    seen = set()
+    for seed in range(20):
+        rng = random.Random(seed)
+        fsm = ChatFsm()
+        t = 0.0
+        for _ in range(400):
+            t += rng.random() * 0.3
+            c = ChatCtx(bound_keys=rng.choice(BOUND_SETS), mode_b=rng.random() < 0.2)
+            if rng.random() < 0.6:
+                fsm.on_keydown(rng.choice(KEYS), t, c)
+            else:
+                fsm.on_tick(t, c)
+            seen.add(fsm.state)
+    assert seen == set(ChatState)
+
+
+def test_common_keydowns_share_preallocated_decisions():
+    fsm = ChatFsm()
+    c = ChatCtx(bound_keys=BOUND_SETS[1])
+    first = fsm.on_keydown("w", 1.0, c)
+    fsm.on_keyup("w", 1.05, c)
+    assert fsm.on_keydown("w", 2.0, c) is first
+    assert fsm.on_keyup("w", 2.05, c) is fsm.on_keyup("a", 2.1, c)
+    assert fsm.on_tick(2.2, c) is fsm.on_tick(2.3, c)
+    assert first is chat_fsm._DECISIONS[KeyClass.MOVEMENT]
+
+
+def test_route_movement_keydown_retains_no_allocations():
+    fsm = ChatFsm()
+    c = ChatCtx(bound_keys=BOUND_SETS[1])
+    results = []
+    for i in range(200):                           # warm caches / dict sizes
+        fsm.on_keydown("w", i * 0.01, c)
+        fsm.on_keyup("w", i * 0.01 + 0.005, c)
+    times = [10.0 + i * 0.01 for i in range(2000)]
+    before = sys.getallocatedblocks()
+    for t in times:
+        results.append(fsm.on_keydown("w", t, c))
+        results.append(fsm.on_keyup("w", t, c))
+        results.append(fsm.on_tick(t, c))
+    grown = sys.getallocatedblocks() - before
+    # Only `results` itself grows; no per-key decision or result objects.
+    assert grown < 200
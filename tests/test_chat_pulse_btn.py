@@ -0,0 +1,100 @@
+"""Tests for the property-driven chat pulse (ChatPulseBtn) and the
+skip-if-unchanged stylesheet writer that replaced per-tick setStyleSheet."""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication, QPushButton
+
+from tabs.multitoon._tab import ChatPulseBtn, _set_qss
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def test_idle_button_has_no_effect(qapp):
+    btn = ChatPulseBtn()
+    assert not btn.is_pulsing()
+    assert btn.graphicsEffect() is None
+
+
+def test_pulse_frames_reuse_one_effect_and_never_touch_qss(qapp):
+    btn = ChatPulseBtn()
+    btn.setStyleSheet("QPushButton { border-radius: 9px; }")
+    sheet = btn.styleSheet()
+    btn.start_pulse("#0077ff")
+    effect = btn.graphicsEffect()
+    assert btn.is_pulsing() and effect is not None
+    blurs = set()
+    for v in (0.0, 0.25, 0.5, 0.75, 1.0):
+        btn.pulse = v
+        assert btn.graphicsEffect() is effect
+        blurs.add(effect.blurRadius())
+    assert len(blurs) == 5                     # the glow actually breathes
+    assert btn.styleSheet() == sheet
+    btn.stop_pulse()
+
+
+def test_stop_pulse_disables_effect_and_restart_reuses_it(qapp):
+    btn = ChatPulseBtn()
+    btn.start_pulse("#0077ff")
+    effect = btn.graphicsEffect()
+    btn.stop_pulse()
+    assert not btn.is_pulsing()
+    assert btn.graphicsEffect() is effect and not effect.isEnabled()
+    btn.start_pulse("#0077ff")
+    assert btn.graphicsEffect() is effect and effect.isEnabled()
+    btn.stop_pulse()
+
+
+def test_pulse_reinstalls_effect_replaced_elsewhere(qapp):
+    btn = ChatPulseBtn()
+    btn.start_pulse("#0077ff")
+    btn.setGraphicsEffect(None)                # e.g. _set_widget_opacity
+    btn.pulse = 0.5
+    assert btn.graphicsEffect() is not None and btn.graphicsEffect().isEnabled()
+    btn.stop_pulse()
+
+
+def test_pulsing_paint_does_not_crash(qapp):
+    btn = ChatPulseBtn()
+    btn.resize(34, 36)
+    btn.start_pulse("#0077ff")
+    btn.grab()
+    btn.stop_pulse()
+    btn.grab()
+
+
+def test_set_qss_skips_unchanged_sheet(qapp, monkeypatch):
+    btn = QPushButton()
+    calls = []
+    real = QPushButton.setStyleSheet
+    monkeypatch.setattr(btn, "setStyleSheet",
+                        lambda s: (calls.append(s), real(btn, s)))
+    _set_qss(btn, "QPushButton { color: red; }")
+    _set_qss(btn, "QPushButton { color: red; }")
+    _set_qss(btn, "QPushButton { color: blue; }")
+    assert calls == ["QPushButton { color: red; }", "QPushButton { color: blue; }"]
+
+
+from tests.test_layout_reparent import tab  # noqa: E402,F401 - fixture
+
+
+def test_chat_pulse_runs_without_an_idle_glow_timer(tab):
+    """Chat broadcast with no keep-alive: the buttons pulse on their own
+    animation and the keep-alive glow timer stays stopped."""
+    tab.window_manager.ttr_window_ids = [0x101]
+    tab.chat_enabled[0] = True
+    tab._overlay_active = True                # visible without showing a window
+    tab._on_chat_state_changed(True)
+    assert tab.chat_buttons[0].is_pulsing()
+    assert not tab._glow_timer.isActive()
+    tab._overlay_active = False               # off-page: the pulse stops too
+    tab._update_glow_timer()
+    assert not tab.chat_buttons[0].is_pulsing()
+    tab._on_chat_state_changed(False)
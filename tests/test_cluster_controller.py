@@ -4341,16 +4341,17 @@ class _AvailableBackend(NoOpOverlayBackend):
 
 
 class _MirrorAtOpacityBackend(_AvailableBackend):
-    """Also snapshots the rep's installed mirror object at every opacity write,
-    to pin the paint-before-opacity ordering of the unblank."""
+    """Also snapshots the mirror's written-tile count (``probe``) at every
+    opacity write, to pin the paint-before-opacity ordering of the unblank."""
 
     def __init__(self):
         super().__init__()
         self.mirror_at_opacity: list = []
+        self.probe = lambda: 0
 
     def set_window_opacity(self, window, opacity):
         super().set_window_opacity(window, opacity)
-        self.mirror_at_opacity.append((float(opacity), window._mirror))
+        self.mirror_at_opacity.append((float(opacity), self.probe()))
 
 
 class _FakeSpontaneousClose:
@@ -4478,10 +4479,10 @@ def test_rep_blanked_during_scale_gesture_and_restored_at_settle(qapp):
     ctrl._scaling_active = True
     ctrl._update_rep_blanking()
     assert rep.is_blanked() is True
-    before = rep._mirror
+    before = ctrl._mirror_buffer.tiles_written
     ctrl._settle_input()                           # clears the flag + updates
     assert rep.is_blanked() is False
-    assert rep._mirror is not before               # re-grabbed at settle
+    assert ctrl._mirror_buffer.tiles_written > before   # re-grabbed at settle
     ctrl.leave()
 
 
@@ -4494,12 +4495,14 @@ def test_unblank_aligns_and_regrabs_before_opacity_write(qapp):
     mirror must already be installed."""
     backend = _MirrorAtOpacityBackend()
     ctrl, provider, window, created = _make(backend=backend)
+    backend.probe = lambda: (ctrl._mirror_buffer.tiles_written
+                             if ctrl._mirror_buffer is not None else -1)
     ctrl.enter()
     rep = ctrl._taskbar_rep
     ctrl._scaling_active = True
     ctrl._update_rep_blanking()
     assert rep.is_blanked() is True
-    stale = rep._mirror
+    stale = ctrl._mirror_buffer.tiles_written
     ctrl._settle_input()                           # unblank terminal
     assert rep.is_blanked() is False
     # The unblank is STAGED through a paint pass (settle-time two-connection
@@ -4510,7 +4513,7 @@ def test_unblank_aligns_and_regrabs_before_opacity_write(qapp):
         if any(op == 1.0 for (op, _m) in backend.mirror_at_opacity):
             break
     ones = [m for (op, m) in backend.mirror_at_opacity if op == 1.0]
-    assert ones and ones[-1] is not stale          # fresh mirror BEFORE opacity 1
+    assert ones and ones[-1] > stale               # fresh mirror BEFORE opacity 1
     ctrl.leave()
 
 
@@ -4532,7 +4535,8 @@ def test_rep_blanked_while_peek_active(qapp):
 
 def test_rep_blanked_during_drag_and_restored_at_end(qapp, monkeypatch):
     """A drag moves the cluster out from over the mirror: drag start must blank
-    the rep, and drag end must unblank it with a fresh re-anchored mirror."""
+    the rep, and drag end must unblank it re-anchored. The content did not
+    change, so the persistent mirror is reused without a grab."""
     from PySide6.QtGui import QCursor
     backend = _AvailableBackend()
     ctrl, provider, window, created = _make(backend=backend, anchor=(400, 400))
@@ -4545,9 +4549,14 @@ def test_rep_blanked_during_drag_and_restored_at_end(qapp, monkeypatch):
     assert ctrl._drag_timer is not None and ctrl._drag_timer.isActive()
     assert rep.is_blanked() is True                # gesture live -> blanked
     before = rep._mirror
+    grabbed = ctrl._mirror_buffer.tiles_grabbed
     ctrl._end_drag()
     assert rep.is_blanked() is False               # drag over -> restored
-    assert rep._mirror is not before               # re-grabbed at drag end
+    assert rep._mirror is before                   # same persistent buffer
+    assert ctrl._mirror_buffer.tiles_grabbed == grabbed   # nothing re-grabbed
+    expected = ctrl._content_bbox_window_coords().translated(
+        ctrl._compute_window_rect().topLeft())
+    assert rep.geometry() == expected              # re-anchored
     ctrl.leave()
 
 
@@ -4598,10 +4607,103 @@ def test_opaque_only_strips_subopaque_pixels(qapp):
     """The on-screen rep may only paint pixels the cluster hides with identical
     fully-opaque ones: translucent pixels (shadows, AA edges) would
     double-composite and read darker inside the bbox."""
-    from PySide6.QtGui import QImage, QPixmap
+    from PySide6.QtGui import QImage
+    from utils.overlay.mirror_buffer import strip_sub_opaque
     img = QImage(2, 1, QImage.Format_ARGB32)
     img.setPixelColor(0, 0, QColor(255, 0, 170, 255))    # opaque: kept
     img.setPixelColor(1, 0, QColor(255, 0, 170, 128))    # translucent: stripped
-    out = ClusterOverlayController._opaque_only(QPixmap.fromImage(img)).toImage()
+    out, _buf = strip_sub_opaque(img)
     assert out.pixelColor(0, 0).alpha() == 255
     assert out.pixelColor(1, 0).alpha() == 0
+
+
+def test_rep_mirror_regrabs_only_damaged_tiles(qapp, monkeypatch):
+    """The rep's mirror is a persistent buffer: a settled peek fade re-grabs
+    only that card's tile and the rep repaints only that rect; the tick
+    re-grabs every tile but writes back none when nothing changed."""
+    backend = _AvailableBackend()
+    ctrl, provider, window, created = _make(backend=backend)
+    ctrl.enter()
+    rep = ctrl._taskbar_rep
+    buf = ctrl._mirror_buffer
+    grabs = []
+    real_grab = ctrl._surface.grab
+    monkeypatch.setattr(ctrl._surface, "grab",
+                        lambda rect: grabs.append(QRect(rect)) or real_grab(rect))
+    updates = []
+    monkeypatch.setattr(rep, "update", lambda *a: updates.append(a))
+    slot = sorted(ctrl._visible_cells)[0]
+    ctrl._peek_progress[slot] = ctrl._PEEK_FADE_STEP
+    ctrl._apply_peek_fade(slot, False)             # fade-back lands at opaque
+    cell = ctrl._cell_window_rect(slot)
+    assert grabs == [cell]
+    assert updates == [(cell.translated(-buf.bbox().topLeft()),)]
+
+    grabs.clear()
+    written = buf.tiles_written
+    ctrl._tick_taskbar_rep()
+    cards = [ctrl._cell_window_rect(i) for i in ctrl._visible_cells]
+    assert all(c in grabs for c in cards)          # per-card tiles, not the bbox
+    assert len(grabs) <= len(cards) + 1            # (+ the emblem, unless inside one)
+    assert buf.tiles_written == written            # identical -> nothing written
+    ctrl.leave()
+
+
+def test_peek_is_event_driven_on_the_pointer_bus(qapp, monkeypatch):
+    """With the shared pointer stream available the hover-peek pass no longer
+    polls for the whole session: it runs once on enter, parks when every fade
+    has settled, and restarts on a pointer-bus enter/move or a ghost event."""
+    from utils import pointer_bus
+
+    class _Cap:
+        def __init__(self, on_event, on_died):
+            self.on_event = on_event
+            self.running = False
+
+        def start(self):
+            self.running = True
+            return True
+
+        def stop(self):
+            self.running = False
+
+        def is_running(self):
+            return self.running
+
+    caps = []
+    bus = pointer_bus.PointerBus(
+        capture_factory=lambda ev, died: caps.append(_Cap(ev, died)) or caps[-1])
+    monkeypatch.setattr(pointer_bus, "shared_bus", lambda: bus)
+    monkeypatch.setattr(pointer_bus, "is_supported", lambda: True)
+    ctrl, provider, window, created = _make(
+        backend=_AvailableBackend(), anchor=_GHOST_ANCHOR, settings=_DictSettings())
+    kicks = []
+    real_kick = ctrl._kick_peek
+    monkeypatch.setattr(ctrl, "_kick_peek",
+                        lambda *a: (kicks.append(a), real_kick(*a)))
+    ctrl.enter()
+    assert ctrl._peek_watch is not None and bus.is_running()
+    assert ctrl._peek_timer.isActive()                  # initial pass
+    ctrl._on_peek_timer()
+    assert not ctrl._peek_timer.isActive()              # settled -> parked
+
+    ox, oy = _WIN_ORIGIN
+    ctrl.on_ghost_event(("motion", [(1, ox + 300, oy + 75)]))
+    assert ctrl._peek_timer.isActive()                  # ghost kicked it
+    for _ in range(5):
+        ctrl._on_peek_timer()
+    assert ctrl._peek_progress[1] == pytest.approx(1.0)
+    assert not ctrl._peek_timer.isActive()
+
+    r = ctrl._compute_window_rect()
+    kicks.clear()
+    caps[0].on_event("motion", r.x() + 5, r.y() + 5, 0, 0)
+    caps[0].on_event("motion", r.x() - 500, r.y() - 500, 0, 0)
+    qapp.processEvents()
+    assert kicks == []                                  # in-and-out coalesced away
+    caps[0].on_event("motion", r.x() + 5, r.y() + 5, 0, 0)
+    qapp.processEvents()
+    assert len(kicks) == 2                              # enter + move
+
+    ctrl.leave()
+    assert ctrl._peek_watch is None and not bus.is_running()
@@ -0,0 +1,152 @@
+"""Tests for the shared display-frame clock (utils/frame_clock.py): one tick
+batches every due subscriber, intervals are honoured on frame boundaries, the
+clock stops when idle or gated hidden, and per-frame budget stats."""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication, QWidget
+
+from utils import frame_clock as fc
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+class _Time:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        return self.t
+
+    def advance_ms(self, ms):
+        self.t += ms / 1000.0
+
+
+@pytest.fixture
+def clock(qapp, monkeypatch):
+    t = _Time()
+    c = fc.FrameClock(clock=t)
+    monkeypatch.setattr(c, "frame_interval_ms", lambda: 1000.0 / 60)
+    c.t = t
+    yield c
+    c._stop()
+
+
+def _frames(c, n):
+    for _ in range(n):
+        c.t.advance_ms(1000.0 / 60)
+        c._tick()
+
+
+def test_every_frame_subscribers_share_one_tick(clock):
+    calls = []
+    clock.subscribe(lambda: calls.append("a"))
+    clock.subscribe(lambda: calls.append("b"))
+    _frames(clock, 3)
+    assert calls == ["a", "b"] * 3
+    assert clock.stats()["frames"] == 3
+
+
+def test_interval_fires_on_nearest_frame(clock):
+    fast, glow = [], []
+    clock.subscribe(lambda: fast.append(1), 16)
+    clock.subscribe(lambda: glow.append(1), 50)
+    _frames(clock, 30)                      # 0.5 s at 60 Hz
+    assert len(fast) == 30
+    assert len(glow) == 10                  # every third frame, no drift
+
+
+def test_clock_stops_when_last_subscriber_leaves(clock):
+    tok = clock.subscribe(lambda: None)
+    assert clock.is_running()
+    clock.unsubscribe(tok)
+    assert not clock.is_running()
+
+
+def test_hidden_gate_stops_clock_and_skips_callbacks(clock):
+    gate = QWidget()                        # never shown
+    calls = []
+    clock.subscribe(lambda: calls.append(1), gate=gate)
+    assert not clock.is_running()
+    clock._tick()
+    assert calls == [] and not clock.is_running()
+
+
+def test_failing_subscriber_does_not_starve_others(clock, capsys):
+    calls = []
+
+    def boom():
+        raise ValueError("x")
+
+    clock.subscribe(boom, name="boom")
+    clock.subscribe(lambda: calls.append(1))
+    _frames(clock, 2)
+    assert calls == [1, 1]
+    assert "[FrameClock] boom failed" in capsys.readouterr().out
+
+
+def test_stats_count_overruns_per_subscriber(clock):
+    def slow():
+        clock.t.advance_ms(25)              # blows a 16.7 ms budget
+
+    clock.subscribe(slow, name="slow")
+    clock.subscribe(lambda: None, name="cheap")
+    _frames(clock, 4)
+    s = clock.stats()
+    assert s["frames"] == 4 and s["overruns"] == 4
+    assert s["worst_ms"] == pytest.approx(25)
+    assert s["subscribers"]["slow"]["calls"] == 4
+    assert s["subscribers"]["slow"]["mean_ms"] == pytest.approx(25)
+    assert s["subscribers"]["cheap"]["worst_ms"] == 0
+    clock.reset_stats()
+    assert clock.stats()["frames"] == 0
+
+
+def test_frame_timer_is_qtimer_shaped(clock):
+    owner = QObject()
+    t = fc.FrameTimer(owner, clock=clock)
+    fired = []
+    t.timeout.connect(lambda: fired.append(1))
+    t.setInterval(50)
+    assert not t.isActive() and t.interval() == 50
+    t.start()
+    assert t.isActive() and clock.is_running()
+    _frames(clock, 6)
+    assert len(fired) == 2
+    t.stop()
+    assert not t.isActive() and not clock.is_running()
+
+
+def test_frame_timer_deleted_while_running_unsubscribes(clock):
+    owner = QObject()
+    t = fc.FrameTimer(owner, clock=clock)
+    t.start()
+    assert clock._subs
+    t.deleteLater()
+    del t
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert not clock._subs and not clock.is_running()
+
+
+def test_frame_timer_ticks_on_event_loop(qapp):
+    from PySide6.QtTest import QTest
+    t = fc.FrameTimer()
+    fired = []
+    t.timeout.connect(lambda: fired.append(1))
+    t.start()
+    token = t._cell[0]
+    assert token in fc.shared_clock()._subs
+    QTest.qWait(120)
+    t.stop()
+    assert len(fired) >= 3
+    # Only this timer's own subscription: other modules' widgets may still
+    # hold theirs on the shared clock.
+    assert not t.isActive() and token not in fc.shared_clock()._subs
@@ -384,6 +384,18 @@ def test_core_inputs_cache_is_per_target(core, monkeypatch):
     assert len(scans) == 2      # one scan per target, reused across ticks
 
 
+def test_core_inputs_cache_drops_targets_from_stale_snapshots(core, monkeypatch):
+    """Window churn must not pin every target ever seen: a fresh snapshot
+    evicts entries scanned from older ones."""
+    from tabs.multitoon import _ghost_cursors as gc
+    snap = [(GAME, (0, 0, 800, 600), 777)]
+    monkeypatch.setattr(gc, "_darwin_zorder_snapshot", lambda: snap)
+    core._inputs_cache[424242] = (object(), None)   # closed window, old snap
+    core.feed_line(proto.encode_position(0, 100, 100, str(GAME)))
+    core.tick()
+    assert set(core._inputs_cache) == {GAME}
+
+
 # ── display smoothing: delivery jitter absorbed by construction ─────────────
 
 def test_sample_at_interpolates_between_straddling_samples():
@@ -0,0 +1,121 @@
+"""host_run / host_check_output over the long-lived host helper, against a
+local stand-in for flatpak-spawn (a Python script that drops its own flags,
+logs the launch and execs the command, standing in for the session-helper
+round trip). Like the real one it runs the command with the host session's
+environment, not the caller's. Results must match the per-command spawn
+path exactly."""
+import os
+import stat
+import subprocess
+import sys
+import time
+
+import pytest
+
+from utils import host_helper, host_spawn
+
+FAKE_SPAWN = """#!{python}
+import os, sys
+with open({log!r}, "a") as fh:
+    fh.write(" ".join(sys.argv[1:3]) + "\\n")
+args = sys.argv[1:]
+while args and args[0].startswith("--"):
+    args.pop(0)
+os.execvpe(args[0], args, {host_env!r})
+"""
+
+
+@pytest.fixture
+def sandbox(tmp_path, monkeypatch):
+    log = tmp_path / "spawns.log"
+    spawn = tmp_path / "flatpak-spawn"
+    host_env = {k: v for k, v in os.environ.items() if k != "TTMT_PROBE"}
+    spawn.write_text(FAKE_SPAWN.format(python=sys.executable, log=str(log),
+                                       host_env=host_env))
+    spawn.chmod(spawn.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(host_spawn, "in_flatpak", lambda: True)
+    monkeypatch.setattr(host_spawn.shutil, "which", lambda name: str(spawn))
+    monkeypatch.setattr(host_helper, "_HELPER_PYTHON", sys.executable)
+    host_helper.shutdown()
+    yield lambda: len(log.read_text().splitlines()) if log.exists() else 0
+    host_helper.shutdown()
+
+
+CASES = [
+    (["sh", "-c", "echo out; echo err >&2; exit 3"], {"capture_output": True}),
+    (["sh", "-c", "printf 'a\\r\\nb'"], {"capture_output": True, "text": True}),
+    (["cat"], {"input": b"\x00\xffbytes", "stdout": subprocess.PIPE}),
+    (["cat"], {"input": "text in", "capture_output": True, "text": True}),
+    (["sh", "-c", "echo x >&2"], {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT}),
+    (["sh", "-c", "echo quiet"], {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}),
+    (["pwd"], {"capture_output": True, "cwd": "/"}),
+]
+
+
+def _both(argv, kwargs):
+    via_helper = host_spawn.host_run(argv, **kwargs)
+    os.environ["TTMT_HOST_HELPER"] = "0"
+    try:
+        via_spawn = host_spawn.host_run(argv, **kwargs)
+    finally:
+        del os.environ["TTMT_HOST_HELPER"]
+    return via_helper, via_spawn
+
+
+@pytest.mark.parametrize("argv,kwargs", CASES)
+def test_results_match_the_spawn_path(sandbox, argv, kwargs):
+    via_helper, via_spawn = _both(argv, kwargs)
+    assert (via_helper.args, via_helper.returncode, via_helper.stdout, via_helper.stderr) \
+        == (via_spawn.args, via_spawn.returncode, via_spawn.stdout, via_spawn.stderr)
+
+
+def test_check_and_timeout_raise_like_subprocess(sandbox):
+    with pytest.raises(subprocess.CalledProcessError) as err:
+        host_spawn.host_run(["sh", "-c", "echo no >&2; exit 2"],
+                            capture_output=True, check=True)
+    assert err.value.returncode == 2 and err.value.stderr == b"no\n"
+    assert err.value.cmd[1] == "--host"
+    t0 = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        host_spawn.host_run(["sleep", "5"], timeout=0.3)
+    assert time.monotonic() - t0 < 3
+    assert host_spawn.host_check_output(["echo", "hi"], timeout=5) == b"hi\n"
+    with pytest.raises(subprocess.CalledProcessError):
+        host_spawn.host_check_output(["false"])
+
+
+def test_env_is_not_forwarded_same_as_flatpak_spawn(sandbox, monkeypatch):
+    monkeypatch.delenv("TTMT_PROBE", raising=False)
+    via_helper, via_spawn = _both(["sh", "-c", "echo ${TTMT_PROBE:-unset}"],
+                                  {"capture_output": True,
+                                   "env": {"TTMT_PROBE": "sandbox-only", "PATH": os.environ["PATH"]}})
+    assert via_helper.stdout == via_spawn.stdout
+
+
+def test_unsupported_arguments_spawn_as_before(sandbox, tmp_path):
+    with open(tmp_path / "out.txt", "wb") as fh:
+        host_spawn.host_run(["echo", "to file"], stdout=fh)
+    assert (tmp_path / "out.txt").read_bytes() == b"to file\n"
+    assert sandbox() == 1                       # plain flatpak-spawn, no helper
+
+
+def test_hundred_calls_share_one_spawn(sandbox):
+    # Per-call timings of the two paths: scripts/bench_host_helper.py.
+    host_spawn.host_run(["true"])               # start the helper
+    for _ in range(100):
+        assert host_spawn.host_run(["true"]).returncode == 0
+    assert sandbox() == 1
+    os.environ["TTMT_HOST_HELPER"] = "0"
+    try:
+        for _ in range(100):
+            assert host_spawn.host_run(["true"]).returncode == 0
+    finally:
+        del os.environ["TTMT_HOST_HELPER"]
+    assert sandbox() == 101
+
+
+def test_host_without_python_falls_back_for_the_session(sandbox, monkeypatch):
+    monkeypatch.setattr(host_helper, "_HELPER_PYTHON", "/nonexistent/python3")
+    assert host_spawn.host_check_output(["echo", "ok"]) == b"ok\n"
+    assert host_spawn.host_check_output(["echo", "ok"]) == b"ok\n"
+    assert sandbox() == 3                       # failed helper + two spawns
@@ -0,0 +1,201 @@
+"""Keep-alive presses are timed events on the input thread's deadline heap:
+one batch of keydowns, one batch of keyups a hold later, no sleeping thread.
+Driven through the real run loop with a recording fake backend."""
+import queue
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.input_service import InputService
+from tabs.multitoon._tab import _dispatch_keep_alive_cycle
+
+WIDS = [str(1001 + i) for i in range(8)]
+HOLD = InputService.KEEP_ALIVE_HOLD
+
+
+class _FakeWindowManager:
+    def __init__(self, window_ids, active=None):
+        self._ids = list(window_ids)
+        self._active = active
+
+    def get_active_window(self):
+        return self._active
+
+    def get_window_ids(self):
+        return list(self._ids)
+
+    def assign_windows(self):
+        pass
+
+
+class _RecordingBackend:
+    def __init__(self):
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def _record(self, action, wid, keysym):
+        with self._lock:
+            self.sent.append((time.monotonic(), action, wid, keysym))
+        return True
+
+    def send_keydown(self, wid, keysym):
+        return self._record("keydown", wid, keysym)
+
+    def send_keyup(self, wid, keysym):
+        return self._record("keyup", wid, keysym)
+
+    def send_key(self, wid, keysym, modifiers=None):
+        return self._record("key", wid, keysym)
+
+    def of(self, action, keysym):
+        with self._lock:
+            return [e for e in self.sent if e[1] == action and e[3] == keysym]
+
+
+@pytest.fixture(autouse=True)
+def _ttr_windows(monkeypatch):
+    from utils.game_registry import GameRegistry
+    monkeypatch.setattr(GameRegistry.instance(), "get_game_for_window",
+                        lambda wid: "ttr")
+
+
+def _make_service(active=None, window_ids=WIDS, keymap_manager=None):
+    settings = MagicMock()
+    settings.get.side_effect = lambda key, default=None: default
+    q = queue.Queue()
+    n = len(window_ids)
+    svc = InputService(
+        window_manager=_FakeWindowManager(window_ids, active),
+        get_enabled_toons=lambda: [True] * n,
+        get_movement_modes=lambda: ["WASD"] * n,
+        get_event_queue_func=lambda: q,
+        settings_manager=settings,
+        keymap_manager=keymap_manager,
+    )
+    svc._apply_backend_setting = lambda: None
+    svc._start_key_grabber = lambda: None
+    svc._start_uipi_refresh = lambda: None
+    backend = _RecordingBackend()
+    svc._xlib = backend
+    return svc, q, backend
+
+
+def _start(svc):
+    svc.start()
+    deadline = time.monotonic() + 1.0
+    while not svc._timed_open and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert svc._timed_open
+
+
+def _wait_for(pred, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(0.002)
+    return pred()
+
+
+class _ManualClock:
+    """Deadline clock for the heap that only moves when the test advances
+    it, so a hold period passes exactly when the test says so."""
+
+    def __init__(self, svc, start=1000.0):
+        self.now = start
+        self._svc = svc
+        svc._clock = self
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, dt):
+        self.now += dt
+        self._svc._timed_wake.set()
+
+
+def _pending(svc, action):
+    with svc._timed_lock:
+        return sorted((e[0], e[3]) for e in svc._timed_events if e[2] == action)
+
+
+def test_cycle_across_eight_windows_takes_one_hold_period():
+    svc, _q, backend = _make_service(active=None)   # games unfocused
+    clock = _ManualClock(svc)
+    keymap = SimpleNamespace(get_key_for_action=lambda game, s, action: "space")
+    _start(svc)
+    try:
+        fired = []
+        caller = threading.Thread(target=lambda: fired.append(_dispatch_keep_alive_cycle(
+            action="jump", fire_toons=list(range(8)),
+            window_manager=svc.window_manager, keymap_manager=keymap,
+            input_service=svc)))
+        caller.start()
+        # The hold never elapses on the frozen clock, so a caller that waited
+        # for it would still be blocked here.
+        caller.join(timeout=2.0)
+        assert not caller.is_alive() and fired == [8]
+        assert _wait_for(lambda: len(backend.of("keydown", "space")) == 8)
+        # One shared release deadline for the whole cycle, not one per window.
+        release = clock.now + HOLD
+        assert _pending(svc, "keyup") == sorted((release, w) for w in WIDS)
+        assert backend.of("keyup", "space") == []
+        clock.advance(HOLD)
+        assert _wait_for(lambda: len(backend.of("keyup", "space")) == 8)
+    finally:
+        svc.stop(wait=True)
+
+    downs = backend.of("keydown", "space")
+    ups = backend.of("keyup", "space")
+    assert [e[2] for e in downs] == WIDS and sorted(e[2] for e in ups) == WIDS
+    assert backend.sent.index(ups[0]) > backend.sent.index(downs[-1])
+
+
+def test_keep_alive_never_delays_concurrent_movement_key(monkeypatch, tmp_path):
+    monkeypatch.setenv("TTMT_CONFIG_DIR", str(tmp_path))
+    from utils.keymap_manager import KeymapManager
+    svc, q, backend = _make_service(active=WIDS[0], keymap_manager=KeymapManager())
+    clock = _ManualClock(svc)
+    _start(svc)
+    try:
+        svc.send_keep_alive_batch([(w, "space") for w in WIDS[1:]])
+        assert _wait_for(lambda: len(backend.of("keydown", "space")) == 7)
+        q.put(("keydown", "Up"))                    # mid-hold movement
+        # The clock is frozen inside the hold: the movement key must go out
+        # while the whole keep-alive batch is still waiting for release.
+        assert _wait_for(lambda: backend.of("keydown", "Up"))
+        assert backend.of("keyup", "space") == []
+        assert len(_pending(svc, "keyup")) == 7
+        clock.advance(HOLD)
+        assert _wait_for(lambda: len(backend.of("keyup", "space")) == 7)
+    finally:
+        svc.stop(wait=True)
+
+    moved = backend.sent.index(backend.of("keydown", "Up")[0])
+    released = min(backend.sent.index(e) for e in backend.of("keyup", "space"))
+    assert moved < released                         # not queued behind the hold
+
+
+def test_loop_exit_releases_keep_alive_keys_still_down():
+    svc, _q, backend = _make_service(active=None)
+    svc.KEEP_ALIVE_HOLD = 10.0
+    _start(svc)
+    svc.send_keep_alive_batch([(WIDS[0], "space")])
+    assert _wait_for(lambda: backend.of("keydown", "space"))
+    svc.stop(wait=True)
+    assert [e[2] for e in backend.of("keyup", "space")] == [WIDS[0]]
+    assert svc._timed_events == []
+
+
+def test_stopped_service_presses_inline_and_releases_on_timer():
+    svc, _q, backend = _make_service(active=None)
+    t0 = time.monotonic()
+    svc.send_keep_alive_batch([(w, "space") for w in WIDS[:3]])
+    assert time.monotonic() - t0 < HOLD / 2
+    assert len(backend.of("keydown", "space")) == 3
+    assert _wait_for(lambda: len(backend.of("keyup", "space")) == 3)
+    svc.send_keep_alive_to_window(WIDS[0], "f1", modifiers=["shift"])
+    assert [e[2] for e in backend.of("key", "f1")] == [WIDS[0]]
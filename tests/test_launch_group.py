@@ -0,0 +1,232 @@
+"""Launch groups: concurrent logins, one warmed verify, per-stage timings."""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QObject, Signal
+from PySide6.QtWidgets import QApplication
+
+from services.launch_group import LaunchGroup
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        return self.t
+
+
+def test_stage_durations_measure_from_previous_stage():
+    clock = _Clock()
+    g = LaunchGroup("ttr", ["a", "b"], clock=clock)
+    clock.t = 103.0; g.mark("a", "login")
+    clock.t = 103.5; g.mark("a", "verify")
+    clock.t = 104.0; g.mark("a", "spawn")
+    assert g.stage_durations("a") == {"login": 3.0, "verify": 0.5, "spawn": 0.5}
+    assert not g.is_complete()
+    clock.t = 106.0; g.mark("b", "login")
+    g.mark("b", "login")                     # first mark wins
+    assert g.stage_durations("b") == {"login": 6.0}
+
+
+def test_failed_accounts_complete_the_group_but_spawned_ones_stay_spawned():
+    clock = _Clock()
+    g = LaunchGroup("cc", ["a", "b"], clock=clock)
+    clock.t = 102.0
+    for stage in ("login", "verify", "spawn"):
+        g.mark("a", stage)
+    g.fail("a", "exited")                    # after spawn: ignored
+    g.fail("b", "Invalid password")
+    assert g.is_complete()
+    lines = g.summary_lines(lambda aid: f"acct-{aid}")
+    assert lines[0].startswith("  acct-a: login 2.0s")
+    assert lines[1] == "  acct-b: failed (Invalid password)"
+    assert lines[-1] == "  all in game after 2.0s (slowest login 2.0s)"
+
+
+class _SM:
+    def get(self, k, d=""): return d
+    def set(self, k, v): pass
+
+
+class _FakeWorker(QObject):
+    state_changed = Signal(str, str)
+    queue_update = Signal(int, int)
+    need_2fa = Signal(str)
+    login_success = Signal(str, str)
+    login_failed = Signal(str)
+    started = []
+
+    def login(self, username, password):
+        _FakeWorker.started.append((username, self))
+
+    def cancel(self):
+        pass
+
+
+class _FakeLauncher(QObject):
+    game_launched = Signal(int)
+    game_exited = Signal(int, str)
+    launch_failed = Signal(str)
+
+    def __init__(self, *a, **k):
+        super().__init__()
+        self.launched_with = None
+
+    def launch(self, *args, **kwargs):
+        self.launched_with = args
+
+    def is_running(self):
+        return False
+
+
+class _Patcher(QObject):
+    progress = Signal(str, int)
+    up_to_date = Signal()
+    patched = Signal(list)
+    failed = Signal(str)
+    verifies = []
+
+    def verify_and_patch(self, engine_dir):
+        _Patcher.verifies.append(engine_dir)
+        self.up_to_date.emit()
+
+
+def _wait(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        QCoreApplication.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_launch_group_starts_all_logins_and_reports_timings(qapp, monkeypatch, tmp_path, request):
+    from tabs import launch_tab
+    from utils.credentials_manager import CredentialsManager
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(launch_tab, "TTRLoginWorker", _FakeWorker)
+    monkeypatch.setattr(launch_tab, "TTRLauncher", _FakeLauncher)
+    monkeypatch.setattr(launch_tab, "TTRPatcher", _Patcher)
+    engine = tmp_path / "TTREngine"
+    engine.write_text("")
+    monkeypatch.setattr(launch_tab, "engine_binary_path", lambda d: str(engine))
+    _FakeWorker.started, _Patcher.verifies = [], []
+
+    cm = CredentialsManager()
+    cm._probe_complete = True
+    for i in range(4):
+        cm.add_account(label=f"T{i}", username=f"u{i}", password="pw", game="ttr")
+    tab = launch_tab.LaunchTab(credentials_manager=cm, settings_manager=_SM())
+    request.addfinalizer(tab.shutdown)
+    tab._on_keyring_probe_complete(True)
+    assert _wait(lambda: len(tab._slots["ttr"]) >= 4)
+    monkeypatch.setattr(tab, "_get_engine_dir", lambda game: str(tmp_path))
+    logs = []
+    monkeypatch.setattr(tab, "log", lambda msg, level=None: logs.append(msg))
+
+    ids = [a.id for a in tab._ordered_accounts("ttr")]
+    tab.launch_group("ttr", ids)
+
+    # Every login is in flight before any has finished; the verify was warmed
+    # up front, alongside them.
+    assert [u for u, _ in _FakeWorker.started] == ["u0", "u1", "u2", "u3"]
+    assert _Patcher.verifies == [str(tmp_path)]
+
+    for aid in reversed(ids):                # logins finish in any order
+        tab._slots["ttr"][aid].worker.login_success.emit("gs", f"ck-{aid}")
+    launchers = [tab._slots["ttr"][aid].launcher for aid in ids]
+    assert all(l.launched_with == ("gs", f"ck-{aid}", str(tmp_path))
+               for l, aid in zip(launchers, ids))
+    assert not any("launch group timings" in m for m in logs)
+
+    for pid, launcher in enumerate(launchers, start=100):
+        launcher.game_launched.emit(pid)
+    assert any("TTR launch group timings" in m for m in logs)
+    assert sum(1 for m in logs if "login " in m and "verify " in m and "spawn " in m) == 4
+    assert "ttr" not in tab._launch_groups
+
+
+def test_launch_group_failure_completes_group(qapp, monkeypatch, tmp_path, request):
+    from tabs import launch_tab
+    from utils.credentials_manager import CredentialsManager
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(launch_tab, "TTRLoginWorker", _FakeWorker)
+    monkeypatch.setattr(launch_tab, "TTRLauncher", _FakeLauncher)
+    monkeypatch.setattr(launch_tab, "TTRPatcher", _Patcher)
+    engine = tmp_path / "TTREngine"
+    engine.write_text("")
+    monkeypatch.setattr(launch_tab, "engine_binary_path", lambda d: str(engine))
+
+    cm = CredentialsManager()
+    cm._probe_complete = True
+    for i in range(2):
+        cm.add_account(label=f"T{i}", username=f"u{i}", password="pw", game="ttr")
+    tab = launch_tab.LaunchTab(credentials_manager=cm, settings_manager=_SM())
+    request.addfinalizer(tab.shutdown)
+    tab._on_keyring_probe_complete(True)
+    assert _wait(lambda: len(tab._slots["ttr"]) >= 2)
+    monkeypatch.setattr(tab, "_get_engine_dir", lambda game: str(tmp_path))
+    monkeypatch.setattr(tab, "_show_failure_dialog", lambda *a: None)
+    logs = []
+    monkeypatch.setattr(tab, "log", lambda msg, level=None: logs.append(msg))
+
+    a, b = [acct.id for acct in tab._ordered_accounts("ttr")]
+    tab.launch_group("ttr", [a, b])
+    tab._slots["ttr"][a].worker.login_failed.emit("Bad password")
+    slot_b = tab._slots["ttr"][b]
+    slot_b.worker.login_success.emit("gs", "ck")
+    slot_b.launcher.game_launched.emit(7)
+    assert any("failed (Bad password)" in m for m in logs)
+    assert "ttr" not in tab._launch_groups
+
+
+def test_launch_all_button_launches_idle_accounts_as_a_group(qapp, monkeypatch, tmp_path, request):
+    from tabs import launch_tab
+    from utils.credentials_manager import CredentialsManager
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(launch_tab, "TTRLoginWorker", _FakeWorker)
+    monkeypatch.setattr(launch_tab, "TTRLauncher", _FakeLauncher)
+    monkeypatch.setattr(launch_tab, "TTRPatcher", _Patcher)
+    engine = tmp_path / "TTREngine"
+    engine.write_text("")
+    monkeypatch.setattr(launch_tab, "engine_binary_path", lambda d: str(engine))
+    _FakeWorker.started, _Patcher.verifies = [], []
+
+    cm = CredentialsManager()
+    cm._probe_complete = True
+    for i in range(3):
+        cm.add_account(label=f"T{i}", username=f"u{i}", password="pw", game="ttr")
+    tab = launch_tab.LaunchTab(credentials_manager=cm, settings_manager=_SM())
+    request.addfinalizer(tab.shutdown)
+    tab._on_keyring_probe_complete(True)
+    assert _wait(lambda: len(tab._slots["ttr"]) >= 3)
+    monkeypatch.setattr(tab, "_get_engine_dir", lambda game: str(tmp_path))
+    monkeypatch.setattr(tab, "log", lambda msg, level=None: None)
+
+    # One account is already mid-login; Launch all must not restart it.
+    busy = tab._ordered_accounts("ttr")[1].id
+    tab._on_launch("ttr", busy)
+    busy_worker = tab._slots["ttr"][busy].worker
+    busy_worker.state_changed.emit("logging_in", "Logging in...")
+    _FakeWorker.started = []
+
+    section = tab._sections["ttr"]
+    assert not section.launch_all_btn.isHidden()
+    section.launch_all_btn.click()
+
+    assert [u for u, _ in _FakeWorker.started] == ["u0", "u2"]
+    assert tab._slots["ttr"][busy].worker is busy_worker
+    group = tab._launch_groups["ttr"]
+    assert busy not in group and len(_Patcher.verifies) == 1
@@ -249,3 +249,16 @@ def test_add_tile_apply_theme_swaps_palettes(qapp):
     qss = sec.pager.add_btn.styleSheet().lower()
     assert V2_ACCENTS["cc"]["c"].lower() in qss
     assert "#ffffff" in qss
+
+
+def test_launch_all_btn_shown_for_two_or_more_accounts_and_emits(qapp):
+    sec = LaunchSection(game="ttr", icon_path="assets/ttr.png")
+    sec.set_accounts([{"label": "A", "username": "a@x", "id": "a"}])
+    assert sec.launch_all_btn.isHidden()
+    sec.set_accounts([{"label": "A", "username": "a@x", "id": "a"},
+                      {"label": "B", "username": "b@x", "id": "b"}])
+    assert not sec.launch_all_btn.isHidden()
+    captured = []
+    sec.launch_all_clicked.connect(lambda: captured.append("x"))
+    sec.launch_all_btn.click()
+    assert captured == ["x"]
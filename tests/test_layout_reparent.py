@@ -7,6 +7,7 @@ under the visible layout. If populate is broken, Full UI renders empty.
 
 Run via pytest with QT_QPA_PLATFORM=offscreen (set in fixture if needed)."""
 
+import contextlib
 import os
 import threading
 import time
@@ -72,10 +73,18 @@ class _FakeWindowManager(QObject):
 def tab(qapp):
     """A fully-built MultitoonTab with fake managers — safe for offscreen."""
     from tabs.multitoon_tab import MultitoonTab
-    return MultitoonTab(
+    tab = MultitoonTab(
         settings_manager=_FakeSettingsManager(),
         window_manager=_FakeWindowManager(),
     )
+    yield tab
+    # Stop the refresh timer, fetch worker and live feed so a tab marked
+    # running here cannot keep refreshing into a later test's patches. Some
+    # tests swap bare stand-ins in for input_service; shutdown() stops the
+    # refresh machinery before it reaches those.
+    with contextlib.suppress(AttributeError):
+        tab.shutdown()
+    tab.deleteLater()
 
 
 def _is_descendant_of(widget, ancestor) -> bool:
@@ -210,7 +219,7 @@ def test_duplicate_toon_data_fetch_is_deduped(monkeypatch, tab):
     calls = []
     release = threading.Event()
 
-    def fake_get_toon_names_by_slot(num_slots, current_window_ids=None):
+    def fake_get_toon_names_by_slot(num_slots, current_window_ids=None, live=None):
         calls.append((num_slots, list(current_window_ids or [])))
         assert release.wait(timeout=2.0)
         return (
@@ -240,11 +249,10 @@ def test_duplicate_toon_data_fetch_is_deduped(monkeypatch, tab):
     assert len(calls) == 1
 
     release.set()
-    deadline = time.monotonic() + 1.0
-    while tab._toon_fetch_inflight_keys and time.monotonic() < deadline:
-        time.sleep(0.01)
+    assert tab._toon_data.wait_idle(timeout=1.0)
 
     tab._fetch_names_if_enabled(2)
+    assert tab._toon_data.wait_idle(timeout=1.0)
     assert len(calls) == 2
 
 
@@ -0,0 +1,61 @@
+"""Tests for the soak-harness memory sampler (utils/leak_watch.py)."""
+
+from __future__ import annotations
+
+from utils.leak_watch import LeakWatch, is_climbing
+
+
+def test_plateau_after_warmup_is_not_climbing():
+    # Startup fill, then flat with allocator noise.
+    values = [10, 50, 90, 100, 101, 100, 102, 101, 100]
+    assert not is_climbing(values, warmup=3)
+
+
+def test_steady_staircase_is_climbing():
+    values = [10, 50, 100, 110, 120, 130, 140, 150]
+    assert is_climbing(values, warmup=2)
+
+
+def test_tiny_monotonic_drift_below_growth_floor_is_ignored():
+    values = [1000, 1001, 1002, 1003, 1004, 1005]
+    assert not is_climbing(values, warmup=1)
+
+
+def test_too_few_points_after_warmup_is_never_a_verdict():
+    assert not is_climbing([1, 2, 3, 4], warmup=2)
+
+
+def test_warmup_growth_is_excluded():
+    values = [1, 100, 1000, 1000, 1000, 1000]
+    assert not is_climbing(values, warmup=2)
+
+
+def test_leak_watch_flags_a_growing_python_structure():
+    sink = []
+    watch = LeakWatch(warmup=1)
+    watch.start()
+    try:
+        for _ in range(6):
+            sink.extend(bytearray(2048) for _ in range(200))
+            watch.sample()
+        verdict = watch.verdict()
+        growers = watch.top_growers(limit=3)
+    finally:
+        watch.stop()
+    assert not verdict.ok
+    assert any("traced_bytes" in r for r in verdict.reasons)
+    assert growers and "test_leak_watch.py" in growers[0]
+
+
+def test_leak_watch_passes_a_bounded_workload():
+    watch = LeakWatch(warmup=1)
+    watch.start()
+    try:
+        for _ in range(6):
+            scratch = [bytearray(2048) for _ in range(200)]
+            del scratch
+            watch.sample()
+        verdict = watch.verdict()
+    finally:
+        watch.stop()
+    assert verdict.ok, verdict.reasons
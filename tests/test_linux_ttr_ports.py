@@ -0,0 +1,146 @@
+"""utils.linux_ttr_ports against fixture /proc trees: LISTEN sockets on the
+Local API ports are attributed to TTREngine PIDs exactly like the ss -tlnp
+parser in ttr_api, the inode cache skips the fd walk, and anything /proc
+cannot answer falls back to ss."""
+import os
+
+import pytest
+
+from utils import linux_ttr_ports as lp
+from utils import ttr_api
+
+TCP_HEADER = ("  sl  local_address rem_address   st tx_queue rx_queue tr tm->when "
+              "retrnsmt   uid  timeout inode\n")
+TCP6_LOCAL = {"127.0.0.1": "0100007F", "0.0.0.0": "00000000",
+              "::1": "00000000000000000000000001000000",
+              "::": "00000000000000000000000000000000"}
+
+
+def _row(i, addr, port, state, inode):
+    local = TCP6_LOCAL[addr]
+    return (f"   {i}: {local}:{port:04X} {'0' * len(local)}:0000 "
+            f"{state} 00000000:00000000 00:00000000 00000000  1000        0 {inode} 1 "
+            f"0000000000000000 100 0 0 10 0\n")
+
+
+class FakeProc:
+    """Writes a /proc subset: net/tcp{,6}, <pid>/comm, <pid>/fd/* links."""
+
+    def __init__(self, root):
+        self.root = root
+        self.sockets = []           # (addr, port, state, inode)
+        self.procs = {}             # pid -> (comm, [fd targets])
+        (root / "net").mkdir(parents=True)
+
+    def listen(self, pid, comm, port, inode, addr="127.0.0.1", extra_fds=3):
+        self.sockets.append((addr, port, "0A", inode))
+        fds = self.procs.setdefault(pid, (comm, []))[1]
+        fds.extend(f"/dev/null{n}" for n in range(extra_fds))
+        fds.append(f"socket:[{inode}]")
+
+    def write(self):
+        v4 = [s for s in self.sockets if ":" not in s[0]]
+        v6 = [s for s in self.sockets if ":" in s[0]]
+        for name, rows in (("tcp", v4), ("tcp6", v6)):
+            with open(self.root / "net" / name, "w") as fh:
+                fh.write(TCP_HEADER)
+                for i, (addr, port, state, inode) in enumerate(rows):
+                    fh.write(_row(i, addr, port, state, inode))
+        for pid, (comm, fds) in self.procs.items():
+            d = self.root / str(pid)
+            (d / "fd").mkdir(parents=True, exist_ok=True)
+            (d / "comm").write_text(comm + "\n")
+            for n, target in enumerate(fds):
+                link = d / "fd" / str(n)
+                if not os.path.islink(link):
+                    os.symlink(target, link)
+
+    def ss_output(self):
+        lines = ["State  Recv-Q Send-Q Local Address:Port Peer Address:Port Process"]
+        for addr, port, state, inode in self.sockets:
+            owner = next(p for p, (_c, fds) in self.procs.items()
+                         if f"socket:[{inode}]" in fds)
+            comm = self.procs[owner][0]
+            host = f"[{addr}]" if ":" in addr else addr
+            lines.append(f'LISTEN 0      4096   {host}:{port}  0.0.0.0:*    '
+                         f'users:(("{comm}",pid={owner},fd=7))')
+        return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def proc(tmp_path, monkeypatch):
+    monkeypatch.setattr(lp, "_PROC_ROOT", str(tmp_path / "proc"))
+    monkeypatch.setattr("utils.host_spawn.in_flatpak", lambda: False)
+    lp.reset_cache()
+    yield FakeProc(tmp_path / "proc")
+    lp.reset_cache()
+
+
+def _lookup():
+    return lp.port_to_host_pid(ttr_api.TTR_API_PORT_START, ttr_api.TTR_API_PORT_END)
+
+
+def test_matches_ss_parser_for_mixed_listeners(proc):
+    for i, port in enumerate(range(1547, 1553)):
+        proc.listen(4000 + i, "TTREngine", port, 90000 + i,
+                    addr=("127.0.0.1", "::1", "0.0.0.0", "::")[i % 4])
+    proc.listen(333, "python3", 8000, 555)                # out of range
+    proc.listen(4000, "TTREngine", 1600, 91000)           # engine, out of range
+    proc.write()
+    native = _lookup()
+    assert native == ttr_api._parse_ss_listeners(proc.ss_output())
+    assert native == {1547 + i: 4000 + i for i in range(6)}
+
+
+def test_non_engine_listener_in_range_is_skipped_like_ss(proc):
+    proc.listen(4000, "TTREngine", 1547, 1)
+    proc.listen(500, "nc", 1548, 2)
+    proc.write()
+    assert _lookup() == ttr_api._parse_ss_listeners(proc.ss_output()) == {1547: 4000}
+
+
+def test_non_listening_sockets_are_ignored(proc):
+    proc.listen(4000, "TTREngine", 1547, 10)
+    proc.sockets.append(("127.0.0.1", 1548, "01", 11))    # ESTABLISHED
+    proc.write()
+    assert _lookup() == {1547: 4000}
+
+
+def test_inode_cache_skips_the_fd_walk(proc, monkeypatch):
+    proc.listen(4000, "TTREngine", 1547, 10)
+    proc.write()
+    assert _lookup() == {1547: 4000}
+    walks = []
+    monkeypatch.setattr(lp, "_attribute", lambda *a: walks.append(a) or {})
+    assert _lookup() == {1547: 4000}
+    assert walks == []
+
+
+def test_new_socket_is_walked_and_closed_socket_is_dropped(proc):
+    proc.listen(4000, "TTREngine", 1547, 10)
+    proc.write()
+    assert _lookup() == {1547: 4000}
+    proc.sockets = []
+    proc.listen(4001, "TTREngine", 1548, 11)
+    proc.write()
+    assert _lookup() == {1548: 4001}
+    assert set(lp._inode_pid) == {11}
+
+
+def test_invisible_engine_falls_back_to_ss(proc):
+    proc.sockets.append(("127.0.0.1", 1547, "0A", 10))   # owner not in /proc
+    proc.write()
+    assert _lookup() is None
+
+
+def test_flatpak_and_missing_proc_fall_back_to_ss(proc, monkeypatch):
+    assert _lookup() is None                              # no net/tcp written
+    proc.listen(4000, "TTREngine", 1547, 10)
+    proc.write()
+    monkeypatch.setattr("utils.host_spawn.in_flatpak", lambda: True)
+    assert _lookup() is None
+
+
+def test_no_listeners_is_an_empty_answer(proc):
+    proc.write()
+    assert _lookup() == {}
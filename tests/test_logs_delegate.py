@@ -92,6 +92,18 @@ def test_sizehint_and_paint_share_the_wrap_width(rig, monkeypatch):
     assert len(set(seen)) == 1, f"sizeHint/paint widths diverged: {set(seen)}"
 
 
+def test_height_cache_stays_near_ring_buffer(rig):
+    """Cache keys pin their LogLine; rows the ring buffer already dropped
+    must not accumulate in it over a long session."""
+    from utils.widgets.logs_console.model import BUFFER_CAP
+    model, proxy, view, delegate = rig
+    for i in range(BUFFER_CAP * 3):
+        model.append(make_line(f"[Soak] line {i}",
+                               now=datetime(2026, 7, 9, 12, 0)))
+        delegate.sizeHint(_opt(view), proxy.index(proxy.rowCount() - 1, 0))
+    assert len(delegate._heights) <= 2 * BUFFER_CAP + 1
+
+
 def test_tag_only_line_is_single_height(rig):
     model, proxy, view, delegate = rig
     model.append(make_line("[Service]", now=datetime(2026, 7, 9, 12, 0)))
@@ -257,3 +257,59 @@ def test_drop_inprocess_engine_without_shutdown_is_safe():
     b._delivery = _NoShutdownEngine()
     b.set_echo_ledger(None)
     assert b._delivery is None
+
+
+class _FanoutEngine(_FakeEngine):
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+        self.forgotten = []
+
+    def post_fanout(self, op, targets):
+        self.frames.append((op, list(targets))); return True
+
+    def forget_windows(self, wids):
+        self.forgotten.extend(wids)
+
+
+def test_send_motion_many_is_one_fanout_frame(monkeypatch):
+    eng = _FanoutEngine()
+    b = _backend(monkeypatch, eng)
+    b.send_button_press("77", 1, 1, 1, 1)
+    assert b.send_motion_many([("77", 5, 6, 15, 16, 0x100),     # drag: frozen binding
+                               ("78", 7, 8, 17, 18, 0x100),     # drag, never pressed: dropped
+                               ("79", 9, 9, 19, 19, 0)]) is False   # hover: fresh
+    assert eng.frames == [("motion", [(4242, 77, b"PSN", (5, 6), (15, 16), True),
+                                      (4242, 79, b"PSN", (9, 9), (19, 19), False)])]
+    assert [c[0] for c in eng.calls] == ["press"]     # no per-window motion lines
+
+
+def test_send_motion_many_falls_back_per_window(monkeypatch):
+    eng = _FakeEngine()
+    b = _backend(monkeypatch, eng)
+    assert b.send_motion_many([("77", 1, 1, 2, 2, 0), ("78", 3, 3, 4, 4, 0)]) is True
+    assert [c[2] for c in eng.calls] == [77, 78]
+
+
+def test_window_churn_and_reuse_probe_forget_cached_resolution(monkeypatch):
+    from utils import macos_discovery
+
+    class _Win:
+        def __init__(self, wid, pid):
+            self.window_id, self.pid, self.bundle_id = wid, pid, "com.ttr"
+
+    wins = [_Win(1, 10), _Win(2, 20), _Win(3, 30)]
+    monkeypatch.setattr(macos_discovery, "_enumerate_game_windows", lambda: list(wins))
+    eng = _FanoutEngine()
+    b = MacOSBackend()
+    b._delivery = eng
+    b._refresh()
+    assert eng.forgotten == []
+    wins[:] = [_Win(1, 10), _Win(2, 21)]             # 2 changed owner, 3 closed
+    b._cache["t"] = -1.0
+    b._refresh()
+    assert sorted(eng.forgotten) == ["2", "3"]
+    eng.forgotten.clear()
+    monkeypatch.setattr(b, "_creation_identity", lambda pid: None)
+    b._reuse_detected(10, 1, None, 555)
+    assert eng.forgotten == [1]
@@ -0,0 +1,194 @@
+"""_RemoteDelivery's batched protocol against a stand-in helper on any platform.
+
+The stand-in runs the REAL scripts/macos_inject_helper.py request loop (serve()) with
+a fake delivery engine instead of SkyLight, spawned through the production
+_spawn/_handshake path. The tests count the parent's pipe writes per fanned-out
+motion, bound how much motion a deliberately slowed helper still posts after a burst
+(queued motion is newest-wins per window), and check the per-window psn/owner cache.
+"""
+import os
+import sys
+
+import pytest
+
+import utils.macos_inject_remote as rem
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_STAND_IN = r'''
+import sys, time
+sys.path.insert(0, {scripts!r})
+sys.path.insert(0, {repo!r})
+import macos_inject_helper as h
+
+
+class Engine:
+    available = True
+
+    def __init__(self):
+        self.log = []
+        self.resolves = 0
+
+    def resolve_psn(self, wid):
+        self.resolves += 1
+        return bytes([wid % 256]) * 8
+
+    def resolve_owner(self, wid):
+        return 5000 + wid
+
+    def _post(self, op, wid, win, delay=0.0):
+        if delay:
+            time.sleep(delay)
+        self.log.append([op, wid, win[0]])
+        return True
+
+    def press(self, pid, wid, psn, win, scr):
+        return self._post("press", wid, win)
+
+    def release(self, pid, wid, psn, win, scr):
+        return self._post("release", wid, win)
+
+    def motion(self, pid, wid, psn, win, scr, dragging):
+        return self._post("motion", wid, win, {delay!r})
+
+
+eng = Engine()
+_handle = h.handle
+
+
+def handle(req):
+    if req["op"] == "dump":
+        return {{"ok": True, "log": eng.log, "resolves": eng.resolves}}
+    return _handle(req)
+
+
+h.handle = handle
+h.REPLYING_OPS += ("dump",)
+h.serve(eng, hello=lambda: {{"protocol": h.PROTOCOL, "platform_binary": True,
+                            "objc_ok": True, "skylight_ok": True,
+                            "preflight_post_access": True}})
+'''
+
+
+class _CountingPipe:
+    """Parent-side stdin wrapper: counts write() calls (one per frame/line)."""
+
+    def __init__(self, pipe):
+        self._pipe = pipe
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return self._pipe.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+
+@pytest.fixture
+def helper(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(rem.macos_clt, "clt_state", lambda: (True, None, sys.executable))
+    made = []
+
+    def make(delay=0.0):
+        script = tmp_path / f"stand_in_{len(made)}.py"
+        script.write_text(_STAND_IN.format(scripts=os.path.join(_REPO, "scripts"),
+                                           repo=_REPO, delay=delay))
+        monkeypatch.setattr(rem, "_helper_path", lambda: str(script))
+        d = rem._RemoteDelivery()
+        made.append(d)
+        assert d.available, d.last_reason()
+        d._proc.stdin = _CountingPipe(d._proc.stdin)
+        return d
+
+    yield make
+    for d in made:
+        d.shutdown()
+
+
+def _targets(x, wids=(11, 12, 13, 14), dragging=False):
+    return [(4000 + w, w, bytes([w]) * 8, (float(x), 1.0), (float(x) + 100, 2.0), dragging)
+            for w in wids]
+
+
+def _dump(d):
+    return d._rpc("dump")
+
+
+def test_handshake_negotiates_protocol_2(helper):
+    assert helper()._protocol == 2
+
+
+def test_fanned_out_motion_is_one_write(helper):
+    d = helper()
+    assert d.post_fanout("motion", _targets(5)) is True
+    assert d._proc.stdin.writes == 1
+    assert _dump(d)["log"] == [["motion", w, 5.0] for w in (11, 12, 13, 14)]
+
+
+def test_per_window_motion_costs_one_write_each(helper):
+    d = helper()
+    for pid, wid, psn, win, scr, dragging in _targets(5):
+        d.motion(pid, wid, psn, win, scr, dragging)
+    assert d._proc.stdin.writes == 4
+
+
+def test_protocol_1_helper_gets_per_window_lines(helper):
+    d = helper()
+    d._protocol = 1
+    assert d.post_fanout("press", _targets(3)) is True
+    assert d._proc.stdin.writes == 4
+    assert _dump(d)["log"] == [["press", w, 3.0] for w in (11, 12, 13, 14)]
+
+
+def test_slow_helper_posts_only_newest_queued_motion(helper):
+    d = helper(delay=0.02)                  # every posted motion costs the helper 20 ms
+    frames = 100
+    for x in range(frames):
+        d.post_fanout("motion", _targets(x))
+    stats = d._rpc("ping")
+    sent = frames * 4
+    assert stats["posted"] + stats["coalesced"] == sent
+    # Without coalescing the backlog alone is 400 x 20 ms = 8 s of stale motion.
+    # (Drain times per helper speed: scripts/bench_macos_inject_fanout.py.)
+    assert stats["posted"] <= 40
+    last = {}
+    for op, wid, x in _dump(d)["log"]:
+        last[wid] = x
+    assert last == {w: float(frames - 1) for w in (11, 12, 13, 14)}
+
+
+def test_press_and_release_are_coalescing_barriers(helper):
+    d = helper(delay=0.05)
+    d.post_fanout("motion", _targets(0, wids=(99,)))     # keeps the helper busy...
+    for x in (1, 2):                                     # ...while these queue up
+        d.post_fanout("motion", _targets(x, wids=(11,)))
+    d.post_fanout("press", _targets(3, wids=(11,)))
+    d.post_fanout("motion", _targets(4, wids=(11,), dragging=True))
+    d.post_fanout("release", _targets(5, wids=(11,)))
+    log = [(op, x) for op, wid, x in _dump(d)["log"] if wid == 11]
+    # Motion 1 may be coalesced away; everything else keeps its order around the
+    # press / release barriers.
+    assert log[-4:] == [("motion", 2.0), ("press", 3.0), ("motion", 4.0), ("release", 5.0)]
+
+
+def test_resolution_is_cached_until_window_churn(helper):
+    d = helper()
+    assert d.resolve_psn(7) == bytes([7]) * 8
+    assert d.resolve_owner(7) == 5007
+    assert d.resolve_psn(7) == bytes([7]) * 8
+    assert d._proc.stdin.writes == 1                     # one `resolve` round trip
+    assert _dump(d)["resolves"] == 1
+    d.forget_windows(["7"])
+    assert d.resolve_owner(7) == 5007
+    assert _dump(d)["resolves"] == 2
+
+
+def test_teardown_drops_cached_resolutions(helper):
+    d = helper()
+    d.resolve_psn(7)
+    assert 7 in d._targets
+    with d._lock:
+        d._teardown_proc()
+    assert d._targets == {}
@@ -81,6 +81,8 @@ def _lifecycle_bare():
     d._ledger = None
     d._logf = None
     d._rbuf = b""
+    d._protocol = 1
+    d._targets = {}
     d._closed = False
     d._consec_failures = 0
     d._circuit_open_until = 0.0
@@ -0,0 +1,123 @@
+"""MirrorBuffer: the taskbar rep's persistent, damage-tracked opaque-only
+mirror (utils/overlay/mirror_buffer.py)."""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QImage, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from utils.overlay.mirror_buffer import MirrorBuffer, strip_sub_opaque
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+class _Scene:
+    """grab(rect) over a solid-colour window, recording what was grabbed."""
+
+    def __init__(self, dpr=1.0):
+        self.dpr = dpr
+        self.colors = {}                 # QRect -> QColor painted over the base
+        self.grabs = []
+
+    def grab(self, rect):
+        self.grabs.append(QRect(rect))
+        w, h = round(rect.width() * self.dpr), round(rect.height() * self.dpr)
+        img = QImage(w, h, QImage.Format_ARGB32)
+        img.fill(QColor(10, 20, 30, 255))
+        for area, color in self.colors.items():
+            part = area.intersected(rect)
+            if part.isEmpty():
+                continue
+            for y in range(round((part.y() - rect.y()) * self.dpr),
+                           round((part.bottom() + 1 - rect.y()) * self.dpr)):
+                for x in range(round((part.x() - rect.x()) * self.dpr),
+                               round((part.right() + 1 - rect.x()) * self.dpr)):
+                    img.setPixelColor(x, y, color)
+        pm = QPixmap.fromImage(img)
+        pm.setDevicePixelRatio(self.dpr)
+        return pm
+
+
+def test_strip_sub_opaque_thresholds_alpha(qapp):
+    img = QImage(3, 1, QImage.Format_ARGB32)
+    img.setPixelColor(0, 0, QColor(1, 2, 3, 255))
+    img.setPixelColor(1, 0, QColor(1, 2, 3, 250))
+    img.setPixelColor(2, 0, QColor(1, 2, 3, 249))
+    out, _buf = strip_sub_opaque(img)
+    assert [out.pixelColor(x, 0).alpha() for x in range(3)] == [255, 255, 0]
+
+
+def test_configure_allocates_once_and_keeps_pixels_on_move(qapp):
+    buf = MirrorBuffer()
+    assert buf.configure(QRect(10, 10, 40, 30), 2.0, key=1.0) is True
+    assert buf.image().size().width() == 80 and buf.is_dirty()
+    scene = _Scene(dpr=2.0)
+    buf.sync(scene.grab)
+    img = buf.image()
+    assert buf.configure(QRect(50, 60, 40, 30), 2.0, key=1.0) is False
+    assert buf.image() is img and not buf.is_dirty()      # a move: no damage
+    assert buf.configure(QRect(50, 60, 40, 30), 2.0, key=1.5) is True   # rescale
+
+
+def test_sync_regrabs_only_damaged_rect_and_reports_it(qapp):
+    buf = MirrorBuffer()
+    bbox = QRect(100, 100, 60, 40)
+    buf.configure(bbox, 1.0)
+    scene = _Scene()
+    buf.sync(scene.grab)
+    assert scene.grabs == [bbox]
+    scene.grabs.clear()
+    card = QRect(110, 105, 10, 10)
+    scene.colors[card] = QColor(200, 0, 0, 255)
+    buf.invalidate(card)
+    dirty = buf.sync(scene.grab)
+    assert scene.grabs == [card]
+    assert dirty == QRect(10, 5, 10, 10)                   # buffer-local
+    assert buf.image().pixelColor(15, 10) == QColor(200, 0, 0, 255)
+    assert buf.image().pixelColor(40, 30) == QColor(10, 20, 30, 255)
+
+
+def test_translucent_damage_is_stripped_in_the_tile(qapp):
+    buf = MirrorBuffer()
+    buf.configure(QRect(0, 0, 20, 20), 1.0)
+    scene = _Scene()
+    buf.sync(scene.grab)
+    scene.colors[QRect(0, 0, 5, 5)] = QColor(255, 255, 255, 128)
+    buf.invalidate(QRect(0, 0, 5, 5))
+    buf.sync(scene.grab)
+    assert buf.image().pixelColor(2, 2).alpha() == 0
+    assert buf.image().pixelColor(10, 10).alpha() == 255
+
+
+def test_verify_drops_identical_tiles(qapp):
+    buf = MirrorBuffer()
+    buf.configure(QRect(0, 0, 40, 20), 1.0)
+    scene = _Scene()
+    buf.sync(scene.grab)
+    left, right = QRect(0, 0, 20, 20), QRect(20, 0, 20, 20)
+    scene.colors[right] = QColor(0, 90, 0, 255)
+    buf.invalidate(left)
+    buf.invalidate(right)
+    written = buf.tiles_written
+    dirty = buf.sync(scene.grab, verify=True)
+    assert buf.tiles_written == written + 1
+    assert dirty == right
+
+
+def test_contained_damage_coalesces(qapp):
+    buf = MirrorBuffer()
+    buf.configure(QRect(0, 0, 100, 100), 1.0)
+    buf.sync(_Scene().grab)
+    buf.invalidate(QRect(10, 10, 5, 5))
+    buf.invalidate(QRect(0, 0, 50, 50))                    # swallows the first
+    buf.invalidate(QRect(20, 20, 5, 5))                    # already covered
+    scene = _Scene()
+    buf.sync(scene.grab)
+    assert scene.grabs == [QRect(0, 0, 50, 50)]
@@ -0,0 +1,63 @@
+"""Live TTR feed changes (utils/ttr_live.py) reach the Multitoon cards through
+_apply_live_toon_fields: stats are patched in place for the right slot, and an
+identity change defers to the full toon-data fetch. Tested without the heavy
+__init__."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from tabs.multitoon._tab import MultitoonTab
+
+
+def _tab():
+    tab = MultitoonTab.__new__(MultitoonTab)
+    tab.window_manager = SimpleNamespace(ttr_window_ids=["w1", "w2"])
+    tab.toon_laffs = [15, 20, None, None]
+    tab.toon_max_laffs = [15, 20, None, None]
+    tab.toon_beans = [40, 50, None, None]
+    tab.toon_colors = ["#ff0000", None, None, None]
+    tab.calls = []
+    tab._refresh_toon_stats_labels = lambda: tab.calls.append("stats")
+    tab.schedule_toon_data_fetch = lambda delay_ms=1200: tab.calls.append(("fetch", delay_ms))
+    return tab
+
+
+def test_stat_change_patches_only_its_slot():
+    tab = _tab()
+    tab._apply_live_toon_fields("w2", {"laff": 7})
+    assert tab.toon_laffs == [15, 7, None, None]
+    assert tab.calls == ["stats"]
+
+
+def test_same_value_does_not_repaint():
+    tab = _tab()
+    tab._apply_live_toon_fields("w1", {"beans": 40})
+    assert tab.calls == []
+
+
+def test_identity_change_schedules_full_fetch():
+    tab = _tab()
+    tab._apply_live_toon_fields("w1", {"name": "Sparky", "laff": 3})
+    assert tab.calls == [("fetch", 0)]
+    assert tab.toon_laffs[0] == 15
+
+
+def test_colour_change_goes_through_the_full_fetch():
+    tab = _tab()
+    tab._apply_live_toon_fields("w1", {"color": "#00ff00"})
+    assert tab.calls == [("fetch", 0)]
+    # Left for the fetch to apply with the accent/chrome repaint, so the
+    # cached value never disagrees with what is on screen.
+    assert tab.toon_colors[0] == "#ff0000"
+
+
+def test_unchanged_colour_with_a_stat_only_patches_stats():
+    tab = _tab()
+    tab._apply_live_toon_fields("w1", {"color": "#ff0000", "laff": 9})
+    assert tab.calls == ["stats"]
+
+
+def test_unknown_window_is_ignored():
+    tab = _tab()
+    tab._apply_live_toon_fields("gone", {"laff": 1})
+    assert tab.calls == []
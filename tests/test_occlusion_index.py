@@ -0,0 +1,63 @@
+"""OcclusionIndex: the per-snapshot visible-surface index behind ghost-glove
+confinement (utils/occlusion_index.py). Equivalence with the one-shot
+_region_from_inputs and the cache shared by both renderers. The speed
+comparison across snapshot sizes lives in scripts/bench_occlusion.py."""
+import random
+
+import pytest
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QRegion
+
+from tabs.multitoon._ghost_cursors import (
+    CURSOR_SIZE, _occlusion_index_for, _region_from_inputs,
+)
+from utils.occlusion_index import OcclusionIndex
+
+GAME_RECT = QRect(0, 0, 1920, 1080)
+
+
+def _random_inputs(rng, n):
+    occ = []
+    for _ in range(n):
+        w, h = rng.randint(40, 900), rng.randint(40, 700)
+        occ.append(QRect(rng.randint(-200, 1900), rng.randint(-200, 1000), w, h))
+    return GAME_RECT, occ
+
+
+def _gloves(rng, n):
+    return [QRect(rng.randint(-40, 1940), rng.randint(-40, 1100),
+                  CURSOR_SIZE, CURSOR_SIZE) for _ in range(n)]
+
+
+@pytest.mark.parametrize("n_occluders", [0, 1, 5, 30, 120])
+def test_index_matches_per_glove_subtraction(n_occluders):
+    rng = random.Random(n_occluders)
+    inputs = _random_inputs(rng, n_occluders)
+    index = OcclusionIndex(inputs)
+    for glove in _gloves(rng, 400):
+        assert index.visible_region(glove) == _region_from_inputs(glove, inputs), glove
+
+
+def test_game_absent_is_always_empty():
+    index = OcclusionIndex(None)
+    assert index.visible_region(QRect(10, 10, CURSOR_SIZE, CURSOR_SIZE)).isEmpty()
+    assert index.rect_count == 0
+
+
+def test_glove_straddling_a_carve_edge():
+    inputs = (QRect(0, 0, 800, 600), [QRect(116, 0, 900, 600)])
+    index = OcclusionIndex(inputs)
+    glove = QRect(100, 100, CURSOR_SIZE, CURSOR_SIZE)
+    assert index.visible_region(glove) == QRegion(QRect(0, 0, 16, CURSOR_SIZE))
+    assert index.visible_region(QRect(300, 100, CURSOR_SIZE, CURSOR_SIZE)).isEmpty()
+
+
+def test_index_built_once_per_target_and_snapshot():
+    snap = [(555, (100, 0, 300, 200), 9), (111, (0, 0, 800, 600), 7)]
+    ident = lambda a, b: (a, b)  # noqa: E731
+    cache = {}
+    a = _occlusion_index_for(cache, 111, snap, 42, ident)
+    assert _occlusion_index_for(cache, 111, snap, 42, ident) is a
+    fresh = list(snap)
+    b = _occlusion_index_for(cache, 111, fresh, 42, ident)
+    assert b is not a and set(cache) == {111} and cache[111][0] is fresh
@@ -0,0 +1,209 @@
+"""Tests for the shared pointer bus (utils/pointer_bus.py): one capture shared
+by every consumer, SharedCapture keeps the XRecordCapture contract, and
+region watches coalesce capture-thread events into GUI-thread enter/leave/move
+callbacks only when something relevant changed."""
+
+import os
+import sys
+import threading
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from utils import pointer_bus as pb
+from utils.screen_coords import logical_rect_to_native
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+class _FakeCapture:
+    def __init__(self, on_event, on_died, ok=True):
+        self.on_event = on_event
+        self.on_died = on_died
+        self.ok = ok
+        self.running = False
+        self.stops = 0
+
+    def start(self):
+        self.running = self.ok
+        return self.ok
+
+    def stop(self):
+        self.stops += 1
+        self.running = False
+
+    def is_running(self):
+        return self.running
+
+    def die(self):
+        self.running = False
+        self.on_died()
+
+
+class _Factory:
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.made = []
+
+    def __call__(self, on_event, on_died):
+        cap = _FakeCapture(on_event, on_died, self.ok)
+        self.made.append(cap)
+        return cap
+
+
+def test_consumers_share_one_capture_until_last_detach():
+    f = _Factory()
+    bus = pb.PointerBus(capture_factory=f)
+    got_a, got_b = [], []
+    a = bus.attach(lambda *ev: got_a.append(ev))
+    b = bus.attach(lambda *ev: got_b.append(ev))
+    assert len(f.made) == 1 and bus.is_running()
+    f.made[0].on_event("motion", 1, 2, 0, 10)
+    assert got_a == got_b == [("motion", 1, 2, 0, 10)]
+    bus.detach(a)
+    assert bus.is_running()
+    bus.detach(b)
+    assert not bus.is_running() and f.made[0].stops == 1
+
+
+def test_attach_reports_unavailable_capture():
+    bus = pb.PointerBus(capture_factory=_Factory(ok=False))
+    assert bus.attach(lambda *ev: None) is None
+    assert not bus.is_running()
+
+
+def test_raising_listener_does_not_starve_others():
+    f = _Factory()
+    bus = pb.PointerBus(capture_factory=f)
+    got = []
+
+    def boom(*ev):
+        raise RuntimeError("x")
+
+    bus.attach(boom)
+    bus.attach(lambda *ev: got.append(ev[0]))
+    f.made[0].on_event("press", 0, 0, 0, 0)
+    assert got == ["press"]
+
+
+def test_shared_capture_keeps_xrecord_contract_and_death_semantics():
+    f = _Factory()
+    bus = pb.PointerBus(capture_factory=f)
+    died = []
+    cs = pb.SharedCapture(lambda *ev: None, on_died=lambda: died.append("cs"), bus=bus)
+    other = pb.SharedCapture(lambda *ev: None, on_died=lambda: died.append("o"), bus=bus)
+    assert cs.start() and other.start()
+    assert cs.is_running() and other.is_running()
+    f.made[0].die()
+    assert sorted(died) == ["cs", "o"]
+    assert not cs.is_running() and not other.is_running()
+    assert f.made[0].stops >= 1                     # X connections reclaimed
+    cs.stop()                                       # idempotent after death
+    assert cs.start() and len(f.made) == 2          # fresh generation
+
+
+def test_stale_dead_capture_is_replaced_on_attach():
+    f = _Factory()
+    bus = pb.PointerBus(capture_factory=f)
+    bus.attach(lambda *ev: None)
+    f.made[0].running = False                       # died, on_died not yet run
+    assert bus.attach(lambda *ev: None) is not None
+    assert len(f.made) == 2 and f.made[0].stops == 1
+    f.made[0].on_died()                             # late notification: ignored
+    assert bus.is_running()
+
+
+def _watch(bus, **cbs):
+    log = []
+    w = pb.PointerWatch(bus=bus, **{k: (lambda x, y, k=k: log.append((k, x, y)))
+                                    for k in cbs})
+    return w, log
+
+
+def test_watch_delivers_enter_move_leave_on_gui_thread(qapp):
+    f = _Factory()
+    bus = pb.PointerBus(capture_factory=f)
+    w, log = _watch(bus, on_enter=1, on_leave=1, on_move=1)
+    w.set_region((100, 100, 50, 50))
+    assert w.start()
+    emit = f.made[0].on_event
+    emit("motion", 10, 10, 0, 0)                    # outside: nothing posted
+    qapp.processEvents()
+    assert log == []
+    emit("motion", 110, 110, 0, 0)
+    qapp.processEvents()
+    assert log == [("on_enter", 110, 110), ("on_move", 110, 110)]
+    log.clear()
+    emit("motion", 200, 200, 0, 0)
+    qapp.processEvents()
+    assert log == [("on_leave", 200, 200)]
+    w.stop()
+    assert not bus.is_running()
+
+
+def test_watch_coalesces_bursts_to_latest_point(qapp):
+    f = _Factory()
+    bus = pb.PointerBus(capture_factory=f)
+    w, log = _watch(bus, on_move=1)
+    assert w.start()                                # region None: whole screen
+    wakes = []
+    w._wake.connect(lambda: wakes.append(1))
+    t = threading.Thread(target=lambda: [f.made[0].on_event("motion", i, i, 0, 0)
+                                         for i in range(200)])
+    t.start()
+    t.join()
+    qapp.processEvents()
+    assert len(wakes) == 1
+    assert log == [("on_move", 199, 199)]
+    w.stop()
+
+
+def test_enter_leave_only_watch_ignores_motion_inside(qapp):
+    f = _Factory()
+    bus = pb.PointerBus(capture_factory=f)
+    w, log = _watch(bus, on_enter=1, on_leave=1)
+    w.set_region((0, 0, 100, 100))
+    w.start()
+    wakes = []
+    w._wake.connect(lambda: wakes.append(1))
+    for i in range(10, 60):
+        f.made[0].on_event("motion", i, i, 0, 0)
+        qapp.processEvents()
+    assert len(wakes) == 1 and log == [("on_enter", 10, 10)]
+    w.stop()
+
+
+def test_watch_reports_stream_loss(qapp):
+    f = _Factory()
+    bus = pb.PointerBus(capture_factory=f)
+    w, _log = _watch(bus, on_move=1)
+    lost = []
+    w.stream_lost.connect(lambda: lost.append(1))
+    w.start()
+    f.made[0].die()
+    qapp.processEvents()
+    assert lost == [1] and not w.is_running()
+
+
+class _Screen:
+    def __init__(self, x, y, w, h, dpr):
+        self._g = (x, y, w, h)
+        self._dpr = dpr
+
+    def geometry(self):
+        from PySide6.QtCore import QRect
+        return QRect(*self._g)
+
+    def devicePixelRatio(self):
+        return self._dpr
+
+
+def test_logical_rect_to_native_scales_around_screen_origin():
+    screens = [_Screen(0, 0, 1920, 1080, 1.0), _Screen(1920, 0, 1280, 720, 2.0)]
+    assert logical_rect_to_native((10, 20, 30, 40), screens) == (10, 20, 30, 40)
+    assert logical_rect_to_native((2000, 100, 50, 60), screens) == (2080, 200, 100, 120)
@@ -1,3 +1,4 @@
+from utils.history_store import HistoryStore, store_for
 from utils.recent_toons import RecentToonsStore, ToonRecord
 
 
@@ -14,8 +15,9 @@ def test_record_and_get_roundtrip():
     store.record("acct-1", "Sir Hopper", "ttr", dna="dna-string")
     rec = store.get("acct-1")
     assert rec == ToonRecord("Sir Hopper", "ttr", "dna-string")
-    assert "recent_toons" in sm.d
-    assert sm.d["recent_toons"]["accounts"]["acct-1"]["toons"][0]["game"] == "ttr"
+    # History lives in the SQLite store now, never in settings.json.
+    assert "recent_toons" not in sm.d and sm.set_calls == 0
+    assert store_for(sm).toons("acct-1")[0][:3] == ("Sir Hopper", "ttr", "dna-string")
 
 
 def test_record_overwrites_with_latest_toon():
@@ -51,14 +53,16 @@ def test_get_tolerates_corrupt_entry():
 def test_record_skips_write_when_unchanged():
     sm = _FakeSettings()
     store = RecentToonsStore(sm)
+    db = store_for(sm)
+    base = db.writes
     store.record("a", "Toon", "ttr", "d")
-    assert sm.set_calls == 1
-    # Identical data -> dirty-check short-circuits before the settings write.
+    assert db.writes == base + 1
+    # Identical data -> dirty-check short-circuits before the store write.
     store.record("a", "Toon", "ttr", "d")
-    assert sm.set_calls == 1
+    assert db.writes == base + 1
     # Changed data -> writes again.
     store.record("a", "Toon", "ttr", "d2")
-    assert sm.set_calls == 2
+    assert db.writes == base + 2
 
 
 class _FakeSM:
@@ -114,10 +118,94 @@ def test_v1_flat_shape_migrates_on_read():
     rec = s.get("a")
     assert rec.toon_name == "Moe"
     assert rec.species is not None      # backfilled from DNA (HORSE)
-    assert sm.data["recent_toons"]["_v"] == 2
-    assert sm.data["recent_toons"]["accounts"]["a"]["toons"][0]["toon_name"] == "Moe"
+    # Imported once into the history store; the legacy key is left as-is.
+    assert store_for(sm).imported("recent_toons")
+    assert "_v" not in sm.data["recent_toons"]
 
 def test_none_sm_is_noop():
     s = RecentToonsStore(None)
     s.record("a", "Moe", "ttr", "dna1")
     assert s.list("a") == [] and s.get("a") is None
+
+
+def test_v2_document_imports_with_order_metadata_and_primary():
+    sm = _FakeSM({"recent_toons": {"_v": 2, "accounts": {
+        "a": {"toons": [
+            {"toon_name": "Zed", "game": "ttr", "dna": "d2", "laff": 60, "max_laff": 60,
+             "species": "CAT", "accent": "#e05252"},
+            {"toon_name": "Moe", "game": "cc", "dna": ""},
+            {"toon_name": "", "game": "ttr"}]},
+        "b": "notadict"}}})
+    s = RecentToonsStore(sm)
+    assert [r.toon_name for r in s.list("a")] == ["Zed", "Moe"]
+    assert s.list("a")[0] == ToonRecord("Zed", "ttr", "d2", 60, 60, "CAT", "#e05252")
+    assert s.list("b") == []
+
+
+def test_import_runs_once_per_store():
+    sm = _FakeSM({"recent_toons": {"a": {"toon_name": "Moe", "game": "ttr"}}})
+    RecentToonsStore(sm).record("a", "Zed", "ttr")
+    sm.data["recent_toons"] = {"a": {"toon_name": "Late", "game": "ttr"}}
+    names = [r.toon_name for r in RecentToonsStore(sm).list("a")]
+    assert names == ["Zed", "Moe"]
+
+
+def test_reads_are_snapshot_served_and_scale_with_one_account(monkeypatch):
+    s = RecentToonsStore(_FakeSM())
+    for a in range(60):
+        for t in range(8):
+            s.record(f"acct{a}", f"T{t}", "ttr", f"dna{t}")
+    db = store_for(s._sm)
+
+    def no_sql(*_a, **_k):
+        raise AssertionError("read touched SQLite")
+
+    monkeypatch.setattr(db, "_conn", type("C", (), {"execute": no_sql})())
+    assert len(s.list("acct42")) == 8
+    assert s.get("acct7").toon_name == "T7"
+    assert s.primary_name("acct7") is None
+
+
+def test_history_persists_across_reopen(tmp_path):
+    path = str(tmp_path / "history.sqlite3")
+    db = HistoryStore(path)
+    db.record_toon("a", ("Moe", "ttr", "d", 10, 20, None, None), 8)
+    db.record_toon("a", ("Zed", "ttr", "d", None, None, None, None), 8)
+    db.set_primary("a", "Moe")
+    db.record_launch("a", 10)
+    db.close()
+    db2 = HistoryStore(path)
+    assert [r[0] for r in db2.toons("a")] == ["Zed", "Moe"]
+    assert db2.toons("a")[1][3:5] == (10, 20)
+    assert db2.primary("a") == "Moe" and db2.launches() == ("a",)
+    assert db2._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    db2.close()
+
+
+def test_cap_eviction_clears_dropped_primary():
+    s = RecentToonsStore(_FakeSM())
+    s.record("a", "First", "ttr")
+    s.set_primary("a", "First")
+    for i in range(8):
+        s.record("a", f"T{i}", "ttr")
+    assert s.primary_name("a") is None
+    assert "First" not in [r.toon_name for r in s.list("a")]
+
+
+def test_concurrent_records_for_one_account_keep_every_row():
+    import threading
+    db = HistoryStore()
+    start = threading.Barrier(8)
+
+    def _record(i):
+        start.wait()
+        for j in range(5):
+            db.record_toon("a", (f"T{i}-{j}", "ttr", "d", None, None, None, None), 100)
+
+    threads = [threading.Thread(target=_record, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(db.toons("a")) == 40
+    assert db._conn.execute("SELECT COUNT(*) FROM toons").fetchone()[0] == 40
@@ -96,9 +96,9 @@ def test_cached_pixmap_returns_none_for_stale_entry(qapp, isolated_cache):
     assert fetcher.cached_pixmap("dna123", "head") is None
 
 
-def test_request_emits_pose_ready_for_fresh_disk_entry(qapp, isolated_cache):
+def test_request_emits_pose_ready_for_fresh_disk_entry(qapp, isolated_cache, monkeypatch):
     """If the disk cache is fresh, request() should NOT hit the network -
-    it should emit pose_ready with the cached pixmap immediately."""
+    the pool job reads and decodes the disk entry and emits pose_ready."""
     from PySide6.QtTest import QSignalSpy
     from PySide6.QtGui import QImage, QColor
     from utils.rendition_poses import RenditionPoseFetcher
@@ -108,13 +108,13 @@ def test_request_emits_pose_ready_for_fresh_disk_entry(qapp, isolated_cache):
     img.fill(QColor("#0000ff"))
     img.save(path, "PNG")
 
+    import utils.rendition_poses as rp
+    monkeypatch.setattr(rp, "_http_get", lambda url: pytest.fail("network hit"))
     spy = QSignalSpy(fetcher.pose_ready)
     fetcher.request("dna123", "waving")
-    # Drain Qt events: the fetcher routes the synchronous cache hit
-    # through a 0 ms QTimer.singleShot so all consumers see the same
-    # GUI-thread signal pattern.
-    for _ in range(5):
-        qapp.processEvents()
+    # The disk read + decode run on the pool; the public signal still fires
+    # on the GUI thread.
+    _drain_until(qapp, lambda: spy.count() > 0)
     assert spy.count() == 1
     payload = spy.at(0)
     assert payload[0] == "dna123"
@@ -123,7 +123,7 @@ def test_request_emits_pose_ready_for_fresh_disk_entry(qapp, isolated_cache):
 
 
 def test_request_fetches_when_cache_miss(qapp, isolated_cache, monkeypatch):
-    """Cache miss -> urlopen() is invoked, bytes are written to disk,
+    """Cache miss -> _http_get() is invoked, bytes are written to disk,
     pose_ready emitted with a QPixmap on the GUI thread."""
     from PySide6.QtTest import QSignalSpy
     from PySide6.QtGui import QImage, QColor
@@ -140,23 +140,13 @@ def test_request_fetches_when_cache_miss(qapp, isolated_cache, monkeypatch):
     png_bytes = bytes(ba)
     buf.close()
 
-    class _FakeResponse:
-        def __init__(self, payload):
-            self._payload = payload
-        def __enter__(self):
-            return self
-        def __exit__(self, *args):
-            return False
-        def read(self):
-            return self._payload
-
     captured_urls = []
 
-    def _fake_urlopen(request, timeout=10):
-        captured_urls.append(request.full_url if hasattr(request, "full_url") else str(request))
-        return _FakeResponse(png_bytes)
+    def _fake_get(url):
+        captured_urls.append(url)
+        return png_bytes
 
-    monkeypatch.setattr("urllib.request.urlopen", _fake_urlopen)
+    monkeypatch.setattr("utils.rendition_poses._http_get", _fake_get)
 
     fetcher = RenditionPoseFetcher.instance()
     spy = QSignalSpy(fetcher.pose_ready)
@@ -175,7 +165,7 @@ def test_request_fetches_when_cache_miss(qapp, isolated_cache, monkeypatch):
     assert payload[0] == "dnaXYZ"
     assert payload[1] == "portrait-grin"
     assert payload[2] is not None and not payload[2].isNull()
-    # urlopen captured a URL containing the requested pose name.
+    # _http_get captured a URL containing the requested pose name.
     assert any("portrait-grin" in u for u in captured_urls)
     # Bytes landed on disk.
     expected_path = fetcher._path_for("dnaXYZ", "portrait-grin")
@@ -186,10 +176,10 @@ def test_request_emits_none_on_http_failure(qapp, isolated_cache, monkeypatch):
     from PySide6.QtTest import QSignalSpy
     from utils.rendition_poses import RenditionPoseFetcher
 
-    def _broken_urlopen(request, timeout=10):
+    def _broken_get(url):
         raise OSError("simulated network error")
 
-    monkeypatch.setattr("urllib.request.urlopen", _broken_urlopen)
+    monkeypatch.setattr("utils.rendition_poses._http_get", _broken_get)
 
     fetcher = RenditionPoseFetcher.instance()
     spy = QSignalSpy(fetcher.pose_ready)
@@ -241,51 +231,173 @@ def test_max_workers_is_three_or_fewer(qapp, isolated_cache):
     assert fetcher._executor._max_workers <= 3
 
 
-def test_worker_emits_bytes_not_qimage(qapp, isolated_cache, monkeypatch):
-    """Regression: the private _bytes_ready signal must carry `bytes`
-    (or None), NOT a QImage/QPixmap. Worker threads must do zero Qt
-    object construction - see docs/postmortem-py314-gc-paint-segv.md."""
-    from PySide6.QtTest import QSignalSpy
-    from utils.rendition_poses import RenditionPoseFetcher
-
-    # Provide a tiny PNG payload.
+def _png_bytes(w=1, h=1, color="#ffffff"):
     from PySide6.QtCore import QBuffer, QIODevice, QByteArray
     from PySide6.QtGui import QImage, QColor
-    img = QImage(1, 1, QImage.Format_ARGB32)
-    img.fill(QColor("#ffffff"))
+    img = QImage(w, h, QImage.Format_ARGB32)
+    img.fill(QColor(color))
     ba = QByteArray()
     buf = QBuffer(ba)
     buf.open(QIODevice.WriteOnly)
     img.save(buf, "PNG")
-    png_bytes = bytes(ba)
+    return bytes(ba)
 
-    class _FakeResponse:
-        def __enter__(self):
-            return self
-        def __exit__(self, *args):
-            return False
-        def read(self):
-            return png_bytes
-
-    monkeypatch.setattr(
-        "urllib.request.urlopen", lambda req, timeout=10: _FakeResponse()
-    )
-
-    fetcher = RenditionPoseFetcher.instance()
-    spy = QSignalSpy(fetcher._bytes_ready)
-    fetcher.request("dnaTEST", "portrait")
 
+def _drain_until(qapp, predicate, timeout=2.0):
     import time
-    deadline = time.time() + 2.0
-    while time.time() < deadline and spy.count() == 0:
+    deadline = time.time() + timeout
+    while time.time() < deadline and not predicate():
         qapp.processEvents()
         time.sleep(0.02)
 
+
+def test_worker_emits_decoded_qimage_never_qpixmap(qapp, isolated_cache, monkeypatch):
+    """Regression: the private _image_ready signal carries a QImage (decoded
+    on the pool thread) or None - never a QPixmap, which must only be built
+    on the GUI thread. See docs/postmortem-py314-gc-paint-segv.md."""
+    from PySide6.QtGui import QImage, QPixmap
+    from PySide6.QtTest import QSignalSpy
+    from utils.rendition_poses import RenditionPoseFetcher
+
+    png = _png_bytes()
+    monkeypatch.setattr("utils.rendition_poses._http_get", lambda url: png)
+    fetcher = RenditionPoseFetcher.instance()
+    spy = QSignalSpy(fetcher._image_ready)
+    fetcher.request("dnaTEST", "portrait")
+    _drain_until(qapp, lambda: spy.count() > 0)
+
     assert spy.count() == 1
     payload = spy.at(0)[2]
-    # Must be raw bytes or None, never a Qt object.
-    assert payload is None or isinstance(payload, (bytes, bytearray))
+    assert isinstance(payload, QImage) and not isinstance(payload, QPixmap)
+
+
+def test_concurrent_requests_share_one_fetch(qapp, isolated_cache, monkeypatch):
+    import threading
+    from PySide6.QtTest import QSignalSpy
+    from utils.rendition_poses import RenditionPoseFetcher
+
+    gate = threading.Event()
+    calls = []
+
+    def _slow_get(url):
+        calls.append(url)
+        gate.wait(1.0)
+        return _png_bytes()
+
+    monkeypatch.setattr("utils.rendition_poses._http_get", _slow_get)
+    fetcher = RenditionPoseFetcher.instance()
+    spy = QSignalSpy(fetcher.pose_ready)
+    for _ in range(4):                       # four toon cards, same pose
+        fetcher.request("dnaDUP", "portrait")
+    gate.set()
+    _drain_until(qapp, lambda: spy.count() > 0)
+    qapp.processEvents()
+
+    assert len(calls) == 1
+    assert spy.count() == 1                  # pose_ready is a broadcast
+
+
+def test_memory_hit_skips_disk_and_network(qapp, isolated_cache, monkeypatch):
+    from PySide6.QtTest import QSignalSpy
+    from utils.rendition_poses import RenditionPoseFetcher
+
+    monkeypatch.setattr("utils.rendition_poses._http_get", lambda url: _png_bytes(2, 2))
+    fetcher = RenditionPoseFetcher.instance()
+    spy = QSignalSpy(fetcher.pose_ready)
+    fetcher.request("dnaMEM", "head")
+    _drain_until(qapp, lambda: spy.count() > 0)
+
+    os.remove(fetcher._path_for("dnaMEM", "head"))
+    monkeypatch.setattr(fetcher, "_read_fresh",
+                        lambda *a: pytest.fail("GUI-thread disk read on a memory hit"))
+    monkeypatch.setattr(fetcher._executor, "submit",
+                        lambda *a: pytest.fail("memory hit queued a job"))
+    fetcher.request("dnaMEM", "head")
+    _drain_until(qapp, lambda: spy.count() > 1)
+    assert spy.count() == 2 and spy.at(1)[2].width() == 2
+    assert fetcher.cached_pixmap("dnaMEM", "head").width() == 2
+
+
+def test_memory_cache_is_lru_bounded(qapp, isolated_cache, monkeypatch):
+    from PySide6.QtGui import QImage
+    from utils import rendition_poses
+    monkeypatch.setattr(rendition_poses, "_MEM_CAP", 3)
+    fetcher = rendition_poses.RenditionPoseFetcher.instance()
+    img = QImage(1, 1, QImage.Format_ARGB32)
+    for pose in ("a", "b", "c"):
+        fetcher._remember(fetcher._key("d", pose), img)
+    assert fetcher._memory_pixmap(fetcher._key("d", "a")) is not None  # touch a
+    fetcher._remember(fetcher._key("d", "e"), img)
+    assert [k[1] for k in fetcher._images] == ["c", "a", "e"]
+
+
+def test_disk_cache_prunes_expired_then_oldest_to_cap(qapp, isolated_cache):
+    import time
+    from utils.rendition_poses import RenditionPoseFetcher, _TTL_SECONDS
+    fetcher = RenditionPoseFetcher.instance()
+    now = time.time()
+    ages = {"expired": _TTL_SECONDS + 60, "old": 300, "mid": 200, "new": 100}
+    for pose, age in ages.items():
+        path = fetcher._path_for("dnaDISK", pose)
+        with open(path, "wb") as f:
+            f.write(b"x" * 1000)
+        os.utime(path, (now - age, now - age))
+
+    fetcher._prune_disk(cap=2000)
 
+    left = sorted(os.listdir(fetcher.cache_dir()))
+    assert left == sorted(os.path.basename(fetcher._path_for("dnaDISK", p))
+                          for p in ("mid", "new"))
+
+
+def test_invalidate_dna_drops_memory_entries(qapp, isolated_cache):
+    from PySide6.QtGui import QImage
+    from utils.rendition_poses import RenditionPoseFetcher
+    fetcher = RenditionPoseFetcher.instance()
+    img = QImage(1, 1, QImage.Format_ARGB32)
+    fetcher._remember(fetcher._key("dnaX", "portrait"), img)
+    fetcher._remember(fetcher._key("dnaY", "portrait"), img)
+    fetcher._inflight.add(fetcher._key("dnaX", "head"))
+    fetcher.invalidate_dna("dnaX")
+    assert fetcher.cached_pixmap("dnaX", "portrait") is None
+    assert fetcher.cached_pixmap("dnaY", "portrait") is not None
+    assert fetcher._inflight == set()
+
+
+
+def test_fetch_in_flight_across_invalidate_is_not_recached(qapp, isolated_cache, monkeypatch):
+    import threading
+    from PySide6.QtTest import QSignalSpy
+    from utils.rendition_poses import RenditionPoseFetcher
+
+    old_started, old_gate = threading.Event(), threading.Event()
+    bodies = iter([("old", "#ff0000"), ("new", "#00ff00")])
+
+    def _get(url):
+        tag, color = next(bodies)
+        if tag == "old":
+            old_started.set()
+            old_gate.wait(2.0)
+        return _png_bytes(color=color)
+
+    monkeypatch.setattr("utils.rendition_poses._http_get", _get)
+    fetcher = RenditionPoseFetcher.instance()
+    spy = QSignalSpy(fetcher.pose_ready)
+    fetcher.request("dnaR", "portrait")
+    assert old_started.wait(2.0)
+    fetcher.invalidate_dna("dnaR")           # refresh lands mid-fetch
+    fetcher.request("dnaR", "portrait")
+    _drain_until(qapp, lambda: spy.count() > 0)
+    old_gate.set()
+    _drain_until(qapp, lambda: False, timeout=0.3)
+
+    assert spy.count() == 1                  # the stale result is dropped
+    pm = fetcher.cached_pixmap("dnaR", "portrait")
+    assert pm.toImage().pixelColor(0, 0).name() == "#00ff00"
+    assert os.listdir(fetcher.cache_dir()) == [
+        os.path.basename(fetcher._path_for("dnaR", "portrait"))
+    ]
+    assert fetcher._inflight == set()
 
 def test_cleanup_legacy_cache_removes_old_format_keeps_new(qapp, isolated_cache):
     from PySide6.QtGui import QImage
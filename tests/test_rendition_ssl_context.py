@@ -4,15 +4,15 @@ CA bundle, not OpenSSL's default cert paths.
 On macOS (python.org framework build, PyInstaller-frozen app) the default cert
 paths are frequently absent, so every HTTPS fetch died with
 CERTIFICATE_VERIFY_FAILED and portraits silently never loaded. The fetcher now
-passes a certifi-backed SSL context to urlopen.
+passes a certifi-backed SSL context to its keep-alive HTTPS connections.
 """
 
 from __future__ import annotations
 
 import os
+import http.client
 import ssl
 import sys
-import urllib.request
 
 import pytest
 
@@ -46,13 +46,19 @@ def test_fetch_worker_passes_verifying_context(qt_app, monkeypatch, tmp_path):
     fetcher = _make_fetcher(monkeypatch, tmp_path)
     captured = {}
 
-    def fake_urlopen(req, timeout=None, context=None):
-        captured["context"] = context
-        raise urllib.error.URLError("blocked in test")  # never touch the network
+    class _FakeConn:
+        def __init__(self, host, timeout=None, context=None):
+            captured["context"] = context
 
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+        def request(self, *a, **k):
+            raise OSError("blocked in test")  # never touch the network
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(http.client, "HTTPSConnection", _FakeConn)
     # _fetch_worker swallows the error and emits None; we only care about the
-    # context it handed to urlopen.
+    # context it handed to the connection.
     fetcher._fetch_worker("dna_for_test", "portrait")
 
     ctx = captured.get("context")
@@ -267,3 +267,53 @@ def test_change_click_cancel_does_not_persist(qapp, tmp_path, monkeypatch):
     tab._on_compat_change_clicked()
 
     assert sm.values["cc_steam_proton_override"] == "preexisting"
+
+
+def test_proton_tools_change_refreshes_row(qapp, tmp_path, monkeypatch):
+    """An enumeration whose result changed notifies the tab, which
+    rebuilds the compat row without any polling."""
+    from services import steam_proton_tools
+    from tabs.settings_tab import SettingsTab
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(steam_proton_tools, "_change_listeners", [])
+    refreshed = []
+    monkeypatch.setattr(SettingsTab, "_refresh_compat_runtime_row",
+                        lambda self: refreshed.append(self))
+    tab = _build_tab(_SM())
+    refreshed.clear()
+    (listener,) = steam_proton_tools._change_listeners
+    listener([])
+    qapp.processEvents()
+    assert refreshed == [tab]
+
+
+def test_half_written_tool_dir_is_watched_and_rechecked(qapp, tmp_path, monkeypatch):
+    """A tool directory that appears before its proton/vdf is watched
+    itself (its writes don't touch compatibilitytools.d) and re-checked
+    once after the racy window."""
+    from PySide6.QtCore import QTimer
+    from services import steam_proton_tools
+    from tests.test_steam_proton_tools import _make_proton
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(steam_proton_tools, "_change_listeners", [])
+    steam = tmp_path / "Steam"
+    _make_proton(steam, "compatibilitytools.d", "GE-Proton9-1", official=False)
+    monkeypatch.setattr(steam_proton_tools, "_default_roots", lambda: [str(steam)])
+    steam_proton_tools.reset_cache()
+    delays = []
+    monkeypatch.setattr(QTimer, "singleShot",
+                        lambda ms, cb: delays.append((ms, cb)))
+    tab = _build_tab(_SM())
+    half = steam / "compatibilitytools.d" / "GE-Proton10-1"
+    half.mkdir()
+
+    tab._on_proton_dir_changed(str(half.parent))
+    tab._on_proton_dir_changed(str(half.parent))
+
+    assert str(half) in tab._proton_watcher.directories()
+    assert [ms for ms, _cb in delays] == [steam_proton_tools.settle_delay_ms()]
+    half.rmdir()
+    delays[0][1]()
+    assert str(half) not in tab._proton_watcher.directories()
+    assert tab._proton_recheck_pending is False
+    steam_proton_tools.reset_cache()
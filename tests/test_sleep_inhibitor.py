@@ -13,6 +13,10 @@ import pytest
 
 import services.sleep_inhibitor as si
 
+# Real jeepney seams, captured before the autouse stub replaces them.
+_REAL_LOGIN1_SEAM = si._jeepney_login1_inhibit
+_REAL_SCREENSAVER_SEAM = si._jeepney_screensaver_inhibit
+
 
 @pytest.fixture(autouse=True)
 def _pin_not_macos(monkeypatch):
@@ -23,6 +27,16 @@ def _pin_not_macos(monkeypatch):
     monkeypatch.setattr(si, "_is_macos", lambda: False, raising=False)
 
 
+@pytest.fixture(autouse=True)
+def _no_native_dbus(monkeypatch):
+    """The subprocess/QtDBus tests below assert the fallback tiers; stub the
+    native jeepney seams to "no bus" so a developer box with a live logind
+    never takes a real inhibitor. Native-path tests re-patch them."""
+    monkeypatch.setattr(si, "_jeepney_login1_inhibit", lambda who, why: None)
+    monkeypatch.setattr(si, "_jeepney_portal_inhibit", lambda why: None)
+    monkeypatch.setattr(si, "_jeepney_screensaver_inhibit", lambda who, why: None)
+
+
 class FakeHolder:
     """Stand-in for the systemd-inhibit Popen handle."""
     def __init__(self):
@@ -668,3 +682,140 @@ def test_release_serializes_with_inflight_acquire_no_holder_leak(monkeypatch):
     inh.release()                     # blocks on the lock, then frees the holder
     t.join(2.0)
     assert freed["holder"] is True    # holder thunk ran -> no leak
+
+
+# ── Native jeepney backend ─────────────────────────────────────────────────
+
+def _forbid_subprocess_path(monkeypatch):
+    def no_spawn(token):
+        raise AssertionError("native path must not spawn systemd-inhibit")
+    monkeypatch.setattr(si, "_popen_holder", no_spawn)
+    monkeypatch.setattr(si, "_run_list", lambda timeout=None: pytest.fail("polled --list"))
+
+
+def test_native_logind_fd_confirms_from_reply_without_spawning(monkeypatch):
+    monkeypatch.setattr(si, "_is_windows", lambda: False)
+    monkeypatch.setattr(si, "_uuid_token", lambda: "TOK")
+    _forbid_subprocess_path(monkeypatch)
+    r_fd, w_fd = os.pipe()
+    os.close(w_fd)
+    seen = {}
+
+    def fake_inhibit(who, why):
+        seen["why"] = why
+        return r_fd
+    monkeypatch.setattr(si, "_jeepney_login1_inhibit", fake_inhibit)
+
+    inh = si.SleepInhibitor()
+    assert inh.acquire() == "dbus"
+    assert inh.status.sleep_blocked and inh.status.method == "dbus"
+    assert "[TOK]" in seen["why"]
+    inh.release()
+    assert not si._fd_open(r_fd)       # the lock fd was closed on release
+    assert inh.is_active() is False
+
+
+def test_native_portal_used_when_system_bus_unavailable(monkeypatch):
+    monkeypatch.setattr(si, "_is_windows", lambda: False)
+    _forbid_subprocess_path(monkeypatch)
+
+    def no_system_bus(who, why):
+        raise OSError("no such file: /run/dbus/system_bus_socket")
+    released = []
+    monkeypatch.setattr(si, "_jeepney_login1_inhibit", no_system_bus)
+    monkeypatch.setattr(si, "_jeepney_portal_inhibit",
+                        lambda why: ("/org/freedesktop/portal/desktop/request/1_1/t",
+                                     lambda: released.append(True)))
+    monkeypatch.setattr(si, "_jeepney_screensaver_inhibit",
+                        lambda who, why: (7, lambda: released.append("cookie")))
+
+    inh = si.SleepInhibitor()
+    assert inh.acquire() == "portal+screensaver"
+    inh.release()
+    assert sorted(map(str, released)) == ["True", "cookie"]
+
+
+def test_native_failure_falls_back_to_systemd_holder(monkeypatch):
+    monkeypatch.setattr(si, "_is_windows", lambda: False)
+    monkeypatch.setattr(si, "_uuid_token", lambda: "T")
+    monkeypatch.setattr(si, "_jeepney_login1_inhibit",
+                        lambda who, why: (_ for _ in ()).throw(ImportError("jeepney")))
+    monkeypatch.setattr(si, "_jeepney_portal_inhibit", lambda why: None)
+    monkeypatch.setattr(si, "_popen_holder", lambda token: (FakeHolder(), 99))
+    monkeypatch.setattr(si, "_run_list", lambda timeout=None: "row [T] block\n")
+    monkeypatch.setattr(si, "_close_write_fd", lambda fd: None)
+    monkeypatch.setattr(si.SleepInhibitor, "_acquire_screensaver_qtdbus", lambda self: None)
+
+    inh = si.SleepInhibitor()
+    assert inh.acquire() == "systemd"
+
+
+def test_native_closed_fd_is_not_trusted(monkeypatch):
+    monkeypatch.setattr(si, "_is_windows", lambda: False)
+    r_fd, w_fd = os.pipe()
+    os.close(r_fd)
+    os.close(w_fd)
+    monkeypatch.setattr(si, "_jeepney_login1_inhibit", lambda who, why: r_fd)
+    inh = si.SleepInhibitor()
+    assert inh._acquire_sleep_native("T") == ""
+    assert inh.status.sleep_blocked is False
+
+
+class _FakeJeepneyConn:
+    def __init__(self, replies):
+        self.replies = replies
+        self.calls = []
+        self.closed = False
+
+    def send_and_get_reply(self, msg, timeout=None, unwrap=None):
+        self.calls.append((msg.header.fields, msg.body, timeout))
+        return self.replies.pop(0)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _FakeFd:
+    def __init__(self, fd):
+        self.fd = fd
+
+    def to_raw_fd(self):
+        return self.fd
+
+
+def test_jeepney_login1_seam_detaches_reply_fd(monkeypatch):
+    pytest.importorskip("jeepney")
+    import jeepney.io.blocking as jb
+    monkeypatch.setattr(si, "_jeepney_login1_inhibit", _REAL_LOGIN1_SEAM)
+    conn = _FakeJeepneyConn([(_FakeFd(41),)])
+    opened = {}
+
+    def fake_open(bus, enable_fds=False):
+        opened.update(bus=bus, enable_fds=enable_fds)
+        return conn
+    monkeypatch.setattr(jb, "open_dbus_connection", fake_open)
+    assert si._jeepney_login1_inhibit("who", "why") == 41
+    assert opened == {"bus": "SYSTEM", "enable_fds": True}
+    assert conn.closed                     # fd outlives the connection
+    _fields, body, timeout = conn.calls[0]
+    assert body == ("sleep:idle", "who", "why", "block")
+    assert timeout == si._DBUS_CALL_TIMEOUT
+
+
+def test_jeepney_screensaver_seam_holds_connection_until_uninhibit(monkeypatch):
+    pytest.importorskip("jeepney")
+    import jeepney.io.blocking as jb
+    monkeypatch.setattr(si, "_jeepney_screensaver_inhibit", _REAL_SCREENSAVER_SEAM)
+    conn = _FakeJeepneyConn([(1234,), ()])
+    monkeypatch.setattr(jb, "open_dbus_connection", lambda bus: conn)
+    cookie, uninhibit = si._jeepney_screensaver_inhibit("who", "why")
+    assert cookie == 1234 and not conn.closed
+    uninhibit()
+    assert conn.closed
+    assert conn.calls[1][1] == (1234,)
@@ -0,0 +1,196 @@
+"""The mtime-validated enumeration cache in services/steam_proton_tools.py:
+a warm call over an unchanged Steam tree opens and lists nothing, a new or
+edited tool is the only one re-parsed, and change listeners fire only when
+the enumerated list actually moves."""
+import builtins
+import os
+import time
+
+import pytest
+
+from services import steam_proton_tools
+from services.steam_proton_tools import (
+    add_change_listener,
+    enumerate_proton_tools,
+    remove_change_listener,
+    unresolved_dirs,
+    watch_dirs,
+)
+from tests.test_steam_proton_tools import _make_proton
+
+_PAST = time.time() - 3600
+
+
+def _backdate(root):
+    """Push every mtime in the tree out of the racy window, as an install
+    that has been sitting there for a while would be."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (_PAST, _PAST))
+    os.utime(root, (_PAST, _PAST))
+
+
+@pytest.fixture
+def steam(tmp_path):
+    steam_proton_tools.reset_cache()
+    root = tmp_path / "Steam"
+    for i in range(45):
+        _make_proton(root, "compatibilitytools.d", f"GE-Proton9-{i}",
+                     official=False, manifest_internal=f"GE-Proton9-{i}")
+    for name in ("Proton 9.0", "Proton 8.0", "Proton 7.0", "Proton 6.3",
+                 "Proton - Experimental"):
+        _make_proton(root, "steamapps/common", name, official=True)
+    _backdate(root)
+    yield root
+    steam_proton_tools.reset_cache()
+
+
+class _Counter:
+    """Counts file opens, directory listings and vdf parses while active."""
+
+    def __init__(self, monkeypatch):
+        self.opens = []
+        self.listdirs = []
+        self.parsed = []
+        real_open, real_listdir = builtins.open, os.listdir
+        real_parse = steam_proton_tools._parse_user_tool_vdf
+
+        def _open(path, *a, **kw):
+            self.opens.append(str(path))
+            return real_open(path, *a, **kw)
+
+        def _listdir(path="."):
+            self.listdirs.append(str(path))
+            return real_listdir(path)
+
+        def _parse(path):
+            self.parsed.append(os.path.basename(os.path.dirname(path)))
+            return real_parse(path)
+
+        monkeypatch.setattr(builtins, "open", _open)
+        monkeypatch.setattr(os, "listdir", _listdir)
+        monkeypatch.setattr(steam_proton_tools, "_parse_user_tool_vdf", _parse)
+
+
+def test_warm_call_reads_no_files(steam, monkeypatch):
+    cold = enumerate_proton_tools(steam_roots=[str(steam)])
+    assert len(cold) == 50
+    counter = _Counter(monkeypatch)
+    warm = enumerate_proton_tools(steam_roots=[str(steam)])
+    assert warm == cold
+    assert counter.opens == [] and counter.listdirs == [] and counter.parsed == []
+
+
+def test_cold_call_parses_every_user_tool(steam, monkeypatch):
+    counter = _Counter(monkeypatch)
+    enumerate_proton_tools(steam_roots=[str(steam)])
+    assert len(counter.parsed) == 45
+
+
+def test_adding_a_tool_reparses_only_that_tool(steam, monkeypatch):
+    enumerate_proton_tools(steam_roots=[str(steam)])
+    _make_proton(steam, "compatibilitytools.d", "GE-Proton10-1",
+                 official=False, manifest_internal="GE-Proton10-1")
+    counter = _Counter(monkeypatch)
+    tools = enumerate_proton_tools(steam_roots=[str(steam)])
+    assert counter.parsed == ["GE-Proton10-1"]
+    assert len(tools) == 51 and tools[0].name == "GE-Proton10-1"
+
+
+def test_edited_vdf_reparses_only_that_tool(steam, monkeypatch):
+    enumerate_proton_tools(steam_roots=[str(steam)])
+    vdf = steam / "compatibilitytools.d" / "GE-Proton9-7" / "compatibilitytool.vdf"
+    vdf.write_text(vdf.read_text().replace('"GE-Proton9-7"\n', '"renamed"\n', 1))
+    counter = _Counter(monkeypatch)
+    tools = enumerate_proton_tools(steam_roots=[str(steam)])
+    assert counter.parsed == ["GE-Proton9-7"]
+    assert "renamed" in {t.name for t in tools}
+    assert counter.listdirs == []
+
+
+def test_removed_tool_drops_out(steam):
+    enumerate_proton_tools(steam_roots=[str(steam)])
+    base = steam / "compatibilitytools.d" / "GE-Proton9-3"
+    for name in os.listdir(base):
+        os.unlink(base / name)
+    os.rmdir(base)
+    tools = enumerate_proton_tools(steam_roots=[str(steam)])
+    assert len(tools) == 49
+    assert "GE-Proton9-3" not in {t.name for t in tools}
+    assert str(base) not in steam_proton_tools._tools
+
+
+def test_lost_exec_bit_invalidates_entry(steam):
+    enumerate_proton_tools(steam_roots=[str(steam)])
+    os.chmod(steam / "steamapps" / "common" / "Proton 8.0" / "proton", 0o644)
+    tools = enumerate_proton_tools(steam_roots=[str(steam)])
+    assert "proton_8" not in {t.name for t in tools}
+
+
+def test_listener_fires_only_when_list_changes(steam):
+    calls = []
+    cb = calls.append
+    add_change_listener(cb)
+    try:
+        enumerate_proton_tools(steam_roots=[str(steam)])
+        enumerate_proton_tools(steam_roots=[str(steam)])
+        assert calls == []
+        _make_proton(steam, "compatibilitytools.d", "GE-Proton10-1",
+                     official=False, manifest_internal="GE-Proton10-1")
+        tools = enumerate_proton_tools(steam_roots=[str(steam)])
+        assert calls == [tools]
+    finally:
+        remove_change_listener(cb)
+
+
+def test_raising_listener_does_not_break_enumeration(steam):
+    def boom(_tools):
+        raise RuntimeError("listener")
+    add_change_listener(boom)
+    try:
+        enumerate_proton_tools(steam_roots=[str(steam)])
+        os.chmod(steam / "steamapps" / "common" / "Proton 7.0" / "proton", 0o644)
+        assert len(enumerate_proton_tools(steam_roots=[str(steam)])) == 49
+    finally:
+        remove_change_listener(boom)
+
+
+def test_fresh_files_are_not_trusted_until_they_settle(tmp_path, monkeypatch):
+    steam_proton_tools.reset_cache()
+    root = tmp_path / "Steam"
+    _make_proton(root, "compatibilitytools.d", "GE-Proton9-1", official=False)
+    enumerate_proton_tools(steam_roots=[str(root)])
+    counter = _Counter(monkeypatch)
+    enumerate_proton_tools(steam_roots=[str(root)])
+    # Written within the racy window: a same-tick rewrite would keep the
+    # mtime, so the entry is re-read rather than trusted.
+    assert counter.parsed == ["GE-Proton9-1"]
+
+
+def test_watch_dirs_lists_existing_tool_directories(steam, tmp_path):
+    assert watch_dirs([str(steam), str(tmp_path / "missing")]) == [
+        str(steam),
+        str(steam / "compatibilitytools.d"),
+        str(steam / "steamapps" / "common"),
+    ]
+
+
+def test_unresolved_dirs_follow_a_tool_until_it_settles(steam):
+    enumerate_proton_tools(steam_roots=[str(steam)])
+    assert unresolved_dirs([str(steam)]) == []
+    # Steam creates the directory first and fills it in afterwards.
+    half = steam / "compatibilitytools.d" / "GE-Proton10-2"
+    half.mkdir()
+    enumerate_proton_tools(steam_roots=[str(steam)])
+    assert unresolved_dirs([str(steam)]) == [str(half)]
+    donor = steam / "compatibilitytools.d" / "GE-Proton9-0"
+    for name in ("proton", "compatibilitytool.vdf"):
+        (half / name).write_text((donor / name).read_text().replace(
+            "GE-Proton9-0", "GE-Proton10-2"))
+    os.chmod(half / "proton", 0o755)
+    enumerate_proton_tools(steam_roots=[str(steam)])
+    assert unresolved_dirs([str(steam)]) == [str(half)]    # still racy
+    _backdate(half)
+    tools = enumerate_proton_tools(steam_roots=[str(steam)])
+    assert unresolved_dirs([str(steam)]) == []
+    assert "GE-Proton10-2" in {t.name for t in tools}
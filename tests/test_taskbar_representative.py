@@ -11,7 +11,7 @@ def test_noop_backend_accepts_representative_hint_calls():
 
 
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QColor, QImage, QPixmap
+from PySide6.QtGui import QColor, QImage
 
 from utils.build_flavor import window_title
 from utils.overlay.taskbar_representative import TaskbarRepresentative
@@ -144,9 +144,9 @@ def test_unblank_after_resize_paints_before_opacity(qapp):
         events.append(("paint", rep.width(), rep.height()))
         orig_paint(ev)
     rep.paintEvent = paint_spy
-    pm = QPixmap(250, 250)
-    pm.fill(QColor("#123456"))
-    rep.set_mirror(pm)                       # resize 250x250 while blanked
+    img = QImage(250, 250, QImage.Format_ARGB32)
+    img.fill(QColor("#123456"))
+    rep.update_mirror(img, QSize(250, 250))  # resize 250x250 while blanked
     rep.show()                               # offscreen: paints need a shown widget
     rep.set_blanked(False)                   # staged unblank
     rep.repaint()
@@ -161,16 +161,21 @@ def test_unblank_after_resize_paints_before_opacity(qapp):
     rep.deleteLater()
 
 
-def test_set_mirror_resizes_and_paints(qapp):
+def test_update_mirror_paints_persistent_image_and_repaints_only_dirty(qapp, monkeypatch):
     rep = _make_rep()
-    pm = QPixmap(120, 80)
-    pm.fill(QColor("#ff00aa"))
-    rep.set_mirror(pm)
+    img = QImage(240, 160, QImage.Format_ARGB32)       # device pixels at DPR 2
+    img.fill(QColor("#ff00aa"))
+    rep.update_mirror(img, QSize(120, 80))
     assert rep.size() == QSize(120, 80)
-    img = QImage(rep.size(), QImage.Format_ARGB32)
-    img.fill(0)
-    rep.render(img)
-    assert img.pixelColor(60, 40) == QColor("#ff00aa")
+    out = QImage(rep.size(), QImage.Format_ARGB32)
+    out.fill(0)
+    rep.render(out)
+    assert out.pixelColor(60, 40) == QColor("#ff00aa")
+    updates = []
+    monkeypatch.setattr(rep, "update", lambda *a: updates.append(a))
+    from PySide6.QtCore import QRect
+    rep.update_mirror(img, QSize(120, 80), QRect(10, 10, 20, 20))
+    assert updates == [(QRect(10, 10, 20, 20),)]       # same buffer: dirty rect only
     rep.deleteLater()
 
 
@@ -241,9 +246,9 @@ def test_first_paint_lifts_opacity_stage_repaint_before_opacity(qapp):
 
     rep.prepare_initial_state()
     assert events == [("opacity", 0.0)]
-    pm = QPixmap(QSize(40, 30))
-    pm.fill(QColor("black"))
-    rep.set_mirror(pm)
+    img = QImage(QSize(40, 30), QImage.Format_ARGB32)
+    img.fill(QColor("black"))
+    rep.update_mirror(img, QSize(40, 30))
     rep.show()
     rep.repaint()                            # deterministic first paint
     for _ in range(10):                      # zero-timer fires next loop pass
@@ -263,9 +268,9 @@ def test_first_paint_lift_defers_to_engaged_blank(qapp):
     backend = _RecordingBackend()
     rep = _make_rep(backend=backend)
     rep.prepare_initial_state()
-    pm = QPixmap(QSize(40, 30))
-    pm.fill(QColor("black"))
-    rep.set_mirror(pm)
+    img = QImage(QSize(40, 30), QImage.Format_ARGB32)
+    img.fill(QColor("black"))
+    rep.update_mirror(img, QSize(40, 30))
     rep.show()
     rep.repaint()                            # first paint schedules the lift
     rep.set_blanked(True)                    # blank engages BEFORE the lift runs
@@ -164,3 +164,47 @@ def test_new_token_values_are_color_strings(is_dark):
         assert isinstance(v, str) and len(v) > 0, f"{k} is not a string"
         assert v.startswith("#") or v.startswith("rgba("), \
             f"{k}={v!r} must be #hex or rgba(...)"
+
+
+# ── Cached token tables / theme version ───────────────────────────────────
+
+@pytest.mark.parametrize("is_dark", [True, False])
+def test_token_tables_are_built_once_and_read_only(is_dark):
+    c = get_theme_colors(is_dark)
+    assert get_theme_colors(is_dark) is c
+    assert theme_manager.get_v2_tokens(is_dark) is theme_manager.get_v2_tokens(is_dark)
+    with pytest.raises(TypeError):
+        c["bg_app"] = "#000000"
+    copy = dict(c)
+    copy["bg_app"] = "#000000"              # an explicit copy stays mutable
+    assert get_theme_colors(is_dark)["bg_app"] != "#000000"
+
+
+def test_cached_tables_match_fresh_builds():
+    for is_dark in (True, False):
+        assert dict(get_theme_colors(is_dark)) == theme_manager._build_theme_colors(is_dark)
+        assert dict(theme_manager.get_v2_tokens(is_dark)) == theme_manager._build_v2_tokens(is_dark)
+    assert get_theme_colors(True) != get_theme_colors(False)
+
+
+def test_apply_theme_bumps_version_only_on_change(monkeypatch):
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(theme_manager, "_APPLIED_THEME", theme_manager._APPLIED_THEME)
+    monkeypatch.setattr(theme_manager, "_THEME_VERSION", theme_manager._THEME_VERSION)
+    before_palette = app.palette()
+    before_sheet = app.styleSheet()
+    try:
+        v1 = theme_manager.apply_theme(app, "dark")
+        assert theme_manager.apply_theme(app, "dark") == v1          # no-op re-apply
+        v2 = theme_manager.apply_theme(app, "light")
+        assert v2 == v1 + 1 == theme_manager.theme_version()
+    finally:
+        app.setStyleSheet(before_sheet)
+        app.setPalette(before_palette)
+
+
+def test_overflow_qss_is_preformatted_once():
+    a = theme_manager.get_overflow_trigger_qss(True)
+    assert theme_manager.get_overflow_trigger_qss(True) is a
+    assert a != theme_manager.get_overflow_trigger_qss(False)
@@ -0,0 +1,163 @@
+"""Tests for the long-lived toon-data service (utils/toon_data_service.py):
+bursts coalesce into one fetch, TTR and CC run side by side, only changed
+windows are delivered, and the poll interval adapts to change."""
+
+import threading
+
+from utils.cc_toon_info import CCToonInfo
+from utils.toon_data_service import ToonDataService
+
+
+def _ttr_rows(names, laffs=None):
+    n = len(names)
+    return (list(names), [f"dna-{x}" for x in names], [None] * n,
+            list(laffs or [None] * n), [None] * n, [None] * n)
+
+
+class _Harness:
+    def __init__(self, games, ttr=None, cc=None):
+        self.games = dict(games)
+        self.ttr = ttr or {}
+        self.cc = cc or {}
+        self.ttr_calls = []
+        self.cc_calls = []
+        self.classified = []
+        self.got_ttr = []
+        self.got_cc = []
+        self.gate = None
+        self.svc = ToonDataService(
+            classify=self._classify, fetch_ttr=self._fetch_ttr,
+            fetch_cc=self._fetch_cc,
+            on_ttr=lambda wids, *cols: self.got_ttr.append((list(wids), cols)),
+            on_cc=lambda wids, infos: self.got_cc.append((list(wids), list(infos))))
+
+    def _classify(self, wid):
+        self.classified.append(wid)
+        return self.games.get(wid)
+
+    def _fetch_ttr(self, n, wids):
+        self.ttr_calls.append(list(wids))
+        if self.gate is not None:
+            assert self.gate.wait(timeout=2.0)
+        names = [self.ttr.get(w, (None, None))[0] for w in wids]
+        laffs = [self.ttr.get(w, (None, None))[1] for w in wids]
+        return _ttr_rows(names, laffs)
+
+    def _fetch_cc(self, n, wids):
+        self.cc_calls.append(list(wids))
+        return [self.cc.get(w) for w in wids]
+
+    def fetch(self, wids, ttr=True, cc=True):
+        self.svc.request(wids, ttr, cc)
+        assert self.svc.wait_idle(timeout=2.0)
+
+
+def test_burst_of_requests_collapses_to_one_fetch():
+    h = _Harness({"a": "ttr"}, ttr={"a": ("Flippy", 15)})
+    h.gate = threading.Event()
+    h.svc.request(["a"], True, True)
+    while not h.ttr_calls:
+        pass
+    for _ in range(20):
+        h.svc.request(["a"], True, True)
+    h.svc.request(["a", "b"], True, True)       # the newest pending wins
+    for _ in range(5):
+        h.svc.request(["a", "b"], True, True)
+    h.gate.set()
+    assert h.svc.wait_idle(timeout=2.0)
+    assert h.ttr_calls == [["a"], ["a"]]
+    assert h.svc.fetches == 2
+    assert h.svc.coalesced == 25
+
+
+def test_request_identical_to_inflight_is_dropped():
+    h = _Harness({"a": "ttr"}, ttr={"a": ("Flippy", 15)})
+    h.gate = threading.Event()
+    assert h.svc.request(["a"], True, True)
+    while not h.ttr_calls:
+        pass
+    assert not h.svc.request(["a"], True, True)
+    h.gate.set()
+    assert h.svc.wait_idle(timeout=2.0)
+    assert h.svc.fetches == 1
+
+
+def test_ttr_and_cc_fetch_concurrently_with_one_classification_per_window():
+    both = threading.Barrier(2, timeout=2.0)
+    h = _Harness({"t": "ttr", "c": "cc"}, ttr={"t": ("Flippy", 15)},
+                 cc={"c": CCToonInfo(name="Sparky")})
+    fetch_ttr, fetch_cc = h._fetch_ttr, h._fetch_cc
+    h.svc._fetch_ttr = lambda n, w: (both.wait(), fetch_ttr(n, w))[1]
+    h.svc._fetch_cc = lambda n, w: (both.wait(), fetch_cc(n, w))[1]
+    h.fetch(["t", "c"])
+    assert h.ttr_calls == [["t"]] and h.cc_calls == [["c"]]
+    assert sorted(h.classified) == ["c", "t"]
+    assert h.got_ttr[0][0] == ["t"]
+    assert h.got_cc == [(["c"], [CCToonInfo(name="Sparky")])]
+
+
+def test_only_changed_windows_are_delivered():
+    h = _Harness({"a": "ttr", "b": "ttr", "c": "cc"},
+                 ttr={"a": ("Flippy", 15), "b": ("Sparky", 20)},
+                 cc={"c": CCToonInfo(name="Clash")})
+    h.fetch(["a", "b", "c"])
+    assert h.got_ttr[-1][0] == ["a", "b"] and len(h.got_cc) == 1
+
+    h.fetch(["a", "b", "c"])                    # nothing changed
+    assert len(h.got_ttr) == 1 and len(h.got_cc) == 1
+
+    h.ttr["b"] = ("Sparky", 12)                 # laff hit on one toon
+    h.fetch(["a", "b", "c"])
+    wids, cols = h.got_ttr[-1]
+    assert wids == ["b"] and cols[0] == ["Sparky"] and cols[3] == [12]
+    assert len(h.got_cc) == 1
+
+
+def test_window_switching_game_is_redelivered():
+    h = _Harness({"a": "ttr"}, ttr={"a": (None, None)}, cc={"a": None})
+    h.fetch(["a"])
+    h.games["a"] = "cc"
+    h.fetch(["a"])
+    assert h.got_cc == [(["a"], [None])]
+
+
+def test_invalidate_and_cancel_force_full_redelivery():
+    h = _Harness({"a": "ttr"}, ttr={"a": ("Flippy", 15)})
+    h.fetch(["a"])
+    h.svc.invalidate()
+    h.fetch(["a"])
+    assert len(h.got_ttr) == 2
+
+    h.gate = threading.Event()
+    h.svc.request(["a"], True, False)
+    while len(h.ttr_calls) < 3:
+        pass
+    h.svc.cancel()                              # service stopped mid-fetch
+    h.gate.set()
+    assert h.svc.wait_idle(timeout=2.0)
+    assert len(h.got_ttr) == 2                  # stale result discarded
+    h.gate = None
+    h.fetch(["a"])
+    assert len(h.got_ttr) == 3
+
+
+def test_interval_is_fast_after_change_and_backs_off_when_stable():
+    h = _Harness({"a": "ttr"}, ttr={"a": ("Flippy", 15)})
+    h.fetch(["a"])
+    fast = h.svc.interval_ms()
+    seen = [fast]
+    for _ in range(8):
+        h.fetch(["a"])
+        seen.append(h.svc.interval_ms())
+    assert seen == sorted(seen) and seen[-1] > fast
+    h.ttr["a"] = ("Flippy", 14)
+    h.fetch(["a"])
+    assert h.svc.interval_ms() == fast
+
+
+def test_shutdown_stops_accepting_requests():
+    h = _Harness({"a": "ttr"}, ttr={"a": ("Flippy", 15)})
+    h.fetch(["a"])
+    h.svc.shutdown()
+    assert not h.svc.request(["a"], True, True)
+    assert not h.svc.busy()
@@ -49,6 +49,20 @@ def test_cache_differentiates_by_color_and_size(qapp):
     assert a is not c
 
 
+def test_cache_is_lru_capped(qapp):
+    """A color-picker drag mints one key per shade: the cache must stay
+    bounded, evicting the least recently used tile first."""
+    from utils import toon_pattern_assets as tpa
+    tpa._cache.clear()
+    keep = tpa.tinted_pattern_pixmap("dots", QColor("#000001"), tile_size=8)
+    for i in range(tpa._CACHE_CAP * 2):
+        tpa.tinted_pattern_pixmap("dots", QColor(f"#{i + 2:06x}"), tile_size=8)
+        tpa.tinted_pattern_pixmap("dots", QColor("#000001"), tile_size=8)
+    assert len(tpa._cache) == tpa._CACHE_CAP
+    assert tpa.tinted_pattern_pixmap("dots", QColor("#000001"), tile_size=8) is keep
+    assert ("dots", "#000002", 8) not in tpa._cache
+
+
 def test_known_pattern_names():
     from utils.toon_pattern_assets import PATTERN_NAMES
     assert PATTERN_NAMES == (
@@ -0,0 +1,263 @@
+"""Tests for the live TTR Local API feed (utils/ttr_live.py) against a local
+stand-in companion server: one kept connection per port, conditional
+requests, per-field change delivery, and host fallback."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils import ttr_live
+
+
+def _doc(name="Flippy", laff=15, max_laff=15, beans=40):
+    return {
+        "toon": {"name": name, "style": "dna-x", "headColor": "#ffffff"},
+        "laff": {"current": laff, "max": max_laff},
+        "beans": {"bank": {"current": beans}},
+    }
+
+
+class _Companion:
+    """Stand-in for one game's Local API port."""
+
+    def __init__(self):
+        self.doc = _doc()
+        self.use_etag = False
+        self.requests = 0
+        self.bodies = 0
+        self.connections = set()
+        self.auth = []
+        companion = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                companion.requests += 1
+                companion.connections.add(self.client_address)
+                companion.auth.append(self.headers.get("Authorization"))
+                body = json.dumps(companion.doc, sort_keys=True).encode()
+                etag = f'"{hash(body) & 0xffffffff:x}"'
+                if companion.use_etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                companion.bodies += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if companion.use_etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def companion():
+    c = _Companion()
+    yield c
+    c.close()
+
+
+def _wait_for(pred, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(0.005)
+    return pred()
+
+
+def _stream(port, changes, hosts=("127.0.0.1",), **kw):
+    opts = dict(fast_ms=10, idle_ms=10, settle_s=10.0, retry_ms=10, timeout=1.0)
+    opts.update(kw)
+    return ttr_live._PortStream(port, lambda p, f: changes.append((p, f)), hosts,
+                                opts["fast_ms"], opts["idle_ms"], opts["settle_s"],
+                                opts["retry_ms"], opts["timeout"])
+
+
+def test_first_answer_is_baseline_then_only_changed_fields(companion):
+    changes = []
+    s = _stream(companion.port, changes)
+    assert s.poll_once() is False                   # baseline, not delivered
+    assert s.fields()["laff"] == 15 and changes == []
+    companion.doc = _doc(laff=9)
+    assert s.poll_once() is True
+    assert changes == [(companion.port, {"laff": 9})]
+    companion.doc = _doc(laff=9, beans=41)
+    s.poll_once()
+    assert changes[-1] == (companion.port, {"beans": 41})
+
+
+def test_polls_reuse_one_connection(companion):
+    s = _stream(companion.port, [])
+    for _ in range(25):
+        s.poll_once()
+    assert companion.requests == 25
+    assert len(companion.connections) == 1 and s.connects == 1
+    assert all(a for a in companion.auth)
+
+
+def test_unchanged_body_is_detected_without_etag(companion):
+    changes = []
+    s = _stream(companion.port, changes)
+    for _ in range(5):
+        s.poll_once()
+    assert s.unchanged == 4 and changes == []
+
+
+def test_etag_makes_requests_conditional(companion):
+    companion.use_etag = True
+    changes = []
+    s = _stream(companion.port, changes)
+    for _ in range(5):
+        s.poll_once()
+    assert companion.bodies == 1 and s.unchanged == 4
+    companion.doc = _doc(laff=3)
+    assert s.poll_once() is True
+    assert companion.bodies == 2 and changes[-1][1] == {"laff": 3}
+
+
+def test_refused_host_falls_back_within_one_poll(companion):
+    s = _stream(companion.port, [], hosts=("127.0.0.2", "127.0.0.1"))
+    assert s.poll_once() is False
+    assert companion.requests == 1
+
+
+def test_unreachable_port_reports_no_answer(companion):
+    port = companion.port
+    companion.close()
+    s = _stream(port, [])
+    assert s.poll_once() is None
+
+
+def test_feed_delivers_battle_change_within_a_few_hundred_ms(companion):
+    changes = []
+    feed = ttr_live.TtrLiveFeed(lambda p, f: changes.append((p, f)),
+                                hosts=["127.0.0.1"])
+    feed.watch({companion.port})
+    try:
+        assert _wait_for(lambda: feed.stream(companion.port).fields())
+        t0 = time.monotonic()
+        companion.doc = _doc(laff=4)
+        assert _wait_for(lambda: changes, timeout=1.0)
+        assert time.monotonic() - t0 < 0.4
+        assert changes == [(companion.port, {"laff": 4})]
+        assert len(companion.connections) == 1
+    finally:
+        feed.stop()
+
+
+def test_watch_starts_and_stops_streams(companion):
+    feed = ttr_live.TtrLiveFeed(lambda p, f: None, hosts=["127.0.0.1"],
+                                fast_ms=10, idle_ms=10)
+    feed.watch({companion.port})
+    stream = feed.stream(companion.port)
+    assert feed.ports() == {companion.port}
+    feed.watch({companion.port})                    # unchanged set: same stream
+    assert feed.stream(companion.port) is stream
+    feed.watch(())
+    stream.join(timeout=1.0)
+    assert feed.ports() == set() and not stream._thread.is_alive()
+
+
+def test_extract_fields_tolerates_missing_sections():
+    assert ttr_live.extract_fields({}) == dict.fromkeys(
+        ("name", "style", "color", "laff", "max_laff", "beans"))
+
+
+def _run_for(stream, companion, window_s, changes_at=()):
+    """Drive ``stream._run`` on a fake clock for ``window_s`` seconds. Each
+    ``(t, doc)`` in ``changes_at`` swaps the companion's answer at time t."""
+    clock = [1000.0]
+    start = clock[0]
+    pending = sorted(changes_at, key=lambda c: c[0])
+
+    def fake_wait(seconds):
+        clock[0] += seconds
+        while pending and start + pending[0][0] <= clock[0]:
+            companion.doc = pending.pop(0)[1]
+        if clock[0] - start >= window_s:
+            threading.Event.set(stream._stop)
+        return stream._stop.is_set()
+
+    stream._clock = lambda: clock[0]
+    stream._stop.wait = fake_wait
+    stream._run()
+
+
+def _default_stream(port, changes):
+    opts = ttr_live.TtrLiveFeed(lambda p, f: None, hosts=["127.0.0.1"])._opts
+    return ttr_live._PortStream(port, lambda p, f: changes.append((p, f)),
+                                ["127.0.0.1"], *opts)
+
+
+def test_idle_port_polls_sub_second_without_fetching_bodies(companion):
+    # Request volume is bodies transferred: a quiet port polled every few
+    # hundred ms costs one baseline body, every later poll is a bare 304.
+    companion.use_etag = True
+    window = 60
+    stream = _default_stream(companion.port, [])
+    assert stream._idle < 0.5
+    _run_for(stream, companion, window)
+    assert companion.requests >= window / stream._idle
+    assert companion.bodies == 1 and stream.bodies == 1
+    assert stream.body_bytes == len(json.dumps(companion.doc, sort_keys=True))
+    assert stream.unchanged == companion.requests - 1
+
+
+def test_idle_port_without_etag_parses_only_the_baseline(companion):
+    window = 5
+    stream = _default_stream(companion.port, [])
+    _run_for(stream, companion, window)
+    # Bodies still arrive, but the digest drops every one after the first.
+    assert stream.bodies == companion.requests > 1
+    assert stream.unchanged == stream.bodies - 1
+
+
+def test_fast_polling_is_limited_to_the_settle_window(companion):
+    companion.use_etag = True
+    changes = []
+    window = 60
+    stream = _default_stream(companion.port, changes)
+    _run_for(stream, companion, window, changes_at=[(30, _doc(laff=9))])
+    fast, idle, settle = stream._fast, stream._idle, stream._settle
+    assert changes == [(companion.port, {"laff": 9})]
+    assert companion.bodies == 2
+    assert companion.requests <= window / idle + settle / fast + 2
+    assert stream._last_change is not None
+
+
+def test_periodic_refresh_skips_ports_the_stream_covers(monkeypatch):
+    from utils import ttr_api
+    fetched = []
+    monkeypatch.setattr(ttr_api, "_fetch_toon",
+                        lambda port, timeout=5.0: fetched.append(port) or None)
+    monkeypatch.setattr(ttr_api, "_should_full_scan", lambda wids: False)
+    monkeypatch.setattr(ttr_api, "_approved_ports", {1547, 1548})
+    monkeypatch.setattr(ttr_api, "_build_port_to_window_id",
+                        lambda wids, ports: {1547: "w1"})
+    live = {1547: ttr_live.extract_fields(_doc(name="Flippy", laff=7))}
+
+    names, _styles, _colors, laffs, _max, beans = ttr_api.get_toon_names_by_slot(
+        2, ["w1", "w2"], live=live.get)
+    assert fetched == [1548]
+    assert names[0] == "Flippy" and laffs[0] == 7 and beans[0] == 40
@@ -0,0 +1,97 @@
+"""TTR login queue polling: the poll cadence follows the server's reported
+eta/position instead of a fixed 10 s, and cancel() ends the poll at once."""
+
+import threading
+import time
+
+from services import ttr_login_service as svc
+from services.ttr_login_service import LoginState, TTRLoginWorker
+
+
+def test_poll_delay_tracks_eta_within_bounds():
+    d = TTRLoginWorker._queue_poll_delay
+    assert d(1, 90) == TTRLoginWorker._QUEUE_POLL_MIN_S       # front of the queue
+    assert d(5, 0) == TTRLoginWorker._QUEUE_POLL_MIN_S
+    assert d(5, 6) == 3.0                                      # half the eta
+    assert d(40, 600) == TTRLoginWorker._QUEUE_POLL_MAX_S      # never near the 30 s expiry
+    assert TTRLoginWorker._QUEUE_POLL_MAX_S < 30
+
+
+class _Resp:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class _RecordingStop:
+    """Stands in for the worker's stop event: records each poll wait."""
+
+    def __init__(self):
+        self.waits = []
+        self._set = False
+
+    def wait(self, timeout):
+        self.waits.append(timeout)
+        return self._set
+
+    def is_set(self):
+        return self._set
+
+    def set(self):
+        self._set = True
+
+    def clear(self):
+        self._set = False
+
+
+def test_queue_polls_at_eta_derived_cadence(qapp, monkeypatch):
+    replies = iter([
+        {"success": "delayed", "queueToken": "q", "position": 2, "eta": 8},
+        {"success": "delayed", "queueToken": "q", "position": 1, "eta": 2},
+        {"success": "true", "gameserver": "gs", "cookie": "ck"},
+    ])
+    monkeypatch.setattr(svc.requests, "post", lambda *a, **k: _Resp(next(replies)))
+    worker = TTRLoginWorker()
+    stop = _RecordingStop()
+    worker._stop_event = stop
+    done = threading.Event()
+    got = []
+    worker.login_success.connect(lambda gs, ck: (got.append((gs, ck)), done.set()))
+
+    worker._handle_response({"success": "delayed", "queueToken": "q",
+                             "position": 12, "eta": 30})
+    for _ in range(200):
+        qapp.processEvents()
+        if done.is_set():
+            break
+        time.sleep(0.01)
+
+    assert got == [("gs", "ck")]
+    assert stop.waits == [15.0, 4.0, TTRLoginWorker._QUEUE_POLL_MIN_S]
+
+
+def test_cancel_ends_queue_wait_immediately(monkeypatch):
+    polls = []
+    monkeypatch.setattr(svc.requests, "post", lambda *a, **k: polls.append(1))
+    worker = TTRLoginWorker()
+    worker._state = LoginState.QUEUED
+    started, woke = threading.Event(), threading.Event()
+    real_wait = worker._stop_event.wait
+
+    def wait(timeout):
+        started.set()
+        result = real_wait(timeout)
+        woke.set()
+        return result
+
+    monkeypatch.setattr(worker._stop_event, "wait", wait)
+    worker._start_queue_polling(position=50, eta=600)     # 20 s poll delay
+    assert started.wait(1.0)
+    worker.cancel()
+    assert woke.wait(1.0)
+    time.sleep(0.05)
+    assert polls == []
@@ -325,3 +325,108 @@ def test_session_cache_skips_after_patched_run(monkeypatch):
     patcher2.verify_and_patch("/engine")
     assert done2.wait(2.0)
     assert res2.get("ok") and "fail" not in res2
+
+
+def _start_patchers(n, engine_dir="/engine"):
+    results, lock, done = [], threading.Lock(), threading.Semaphore(0)
+
+    def record(kind):
+        with lock:
+            results.append(kind)
+        done.release()
+
+    patchers = []
+    for _ in range(n):
+        patcher = p.TTRPatcher()
+        patcher.up_to_date.connect(lambda: record("up_to_date"), Qt.DirectConnection)
+        patcher.patched.connect(lambda files: record("patched"), Qt.DirectConnection)
+        patcher.failed.connect(lambda msg: record("failed"), Qt.DirectConnection)
+        patchers.append(patcher)
+        patcher.verify_and_patch(engine_dir)
+    for _ in range(n):
+        assert done.acquire(timeout=2.0), "no terminal signal"
+    return sorted(results), patchers
+
+
+def test_concurrent_launches_share_one_manifest_fetch_and_patch(monkeypatch):
+    """Four accounts verifying the same install at once: one manifest fetch,
+    one stale scan, one download; the patching launch reports patched and
+    the joiners up_to_date."""
+    _qapp()
+    p.reset_verify_cache()
+    entry = {"dl": "p.bz2", "hash": "x", "compHash": "y"}
+    calls = {"manifest": 0, "stale": 0, "fetch": 0}
+    gate = threading.Event()
+
+    def slow_manifest():
+        calls["manifest"] += 1
+        gate.wait(1.0)          # hold the pass open until all four have joined
+        return {"phase_14.mf": entry}
+
+    def stale(m, d):
+        calls["stale"] += 1
+        return [("phase_14.mf", entry)]
+
+    def fetch(e, mirror):
+        calls["fetch"] += 1
+        return b"data"
+
+    monkeypatch.setattr(p, "fetch_manifest", slow_manifest)
+    monkeypatch.setattr(p, "select_stale", stale)
+    monkeypatch.setattr(p, "resolve_mirror", lambda: "https://m/patches/")
+    monkeypatch.setattr(p, "fetch_verified", fetch)
+    monkeypatch.setattr(p, "place_file", lambda data, dest: None)
+    threading.Timer(0.2, gate.set).start()
+
+    results, _ = _start_patchers(4)
+
+    assert results == ["patched", "up_to_date", "up_to_date", "up_to_date"]
+    assert calls == {"manifest": 1, "stale": 1, "fetch": 1}
+
+
+def test_recent_clean_pass_is_reused_without_refetching(monkeypatch):
+    _qapp()
+    p.reset_verify_cache()
+    fetches = []
+    monkeypatch.setattr(p, "fetch_manifest", lambda: fetches.append(1) or {})
+    monkeypatch.setattr(p, "select_stale", lambda m, d: [])
+    assert _start_patchers(1)[0] == ["up_to_date"]
+    assert _start_patchers(1)[0] == ["up_to_date"]
+    assert len(fetches) == 1
+
+
+def test_failed_pass_is_not_reused(monkeypatch):
+    _qapp()
+    p.reset_verify_cache()
+    entry = {"dl": "p.bz2", "hash": "x", "compHash": "y"}
+    monkeypatch.setattr(p, "fetch_manifest", lambda: {"phase_14.mf": entry})
+    monkeypatch.setattr(p, "select_stale", lambda m, d: [("phase_14.mf", entry)])
+    monkeypatch.setattr(p, "resolve_mirror", lambda: "https://m/patches/")
+    monkeypatch.setattr(p, "fetch_verified", lambda e, mirror: (_ for _ in ()).throw(ValueError("bad")))
+    assert _start_patchers(1)[0] == ["failed"]
+    monkeypatch.setattr(p, "fetch_verified", lambda e, mirror: b"ok")
+    monkeypatch.setattr(p, "place_file", lambda data, dest: None)
+    assert _start_patchers(1)[0] == ["patched"]
+
+
+def test_different_engine_dirs_verify_in_parallel(monkeypatch):
+    _qapp()
+    p.reset_verify_cache()
+    both_inside = threading.Barrier(2, timeout=1.0)
+
+    def manifest():
+        both_inside.wait()      # deadlocks (BrokenBarrierError) if serialized
+        return {}
+
+    monkeypatch.setattr(p, "fetch_manifest", manifest)
+    monkeypatch.setattr(p, "select_stale", lambda m, d: [])
+    results, done = [], threading.Semaphore(0)
+    patchers = []
+    for d in ("/engine-a", "/engine-b"):
+        patcher = p.TTRPatcher()
+        patcher.up_to_date.connect(lambda: (results.append("ok"), done.release()), Qt.DirectConnection)
+        patcher.failed.connect(lambda m: (results.append(m), done.release()), Qt.DirectConnection)
+        patchers.append(patcher)
+        patcher.verify_and_patch(d)
+    assert done.acquire(timeout=2.0) and done.acquire(timeout=2.0)
+    assert results == ["ok", "ok"]
@@ -0,0 +1,152 @@
+"""Conditional GitHub API requests in utils/update_checker.py against a local
+fake API server: validators are stored per url, repeated checks come back
+304 with no body, and a rate-limited API answers from the last good
+response."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils import update_checker
+from utils.settings_keys import UPDATE_HTTP_CACHE
+
+TAG_REF = {"object": {"type": "commit", "sha": "c" * 40}}
+
+
+def _release(tag, build):
+    return {"tag_name": tag, "body": f"Build: {build}", "draft": False,
+            "html_url": f"https://example/{tag}", "assets": []}
+
+
+class FakeSettings:
+    def __init__(self):
+        self.d = {}
+
+    def get(self, k, default=None):
+        return self.d.get(k, default)
+
+    def set(self, k, v):
+        self.d[k] = v
+
+
+class _FakeApi:
+    """GitHub API stand-in with ETag / If-None-Match support and a switch
+    that makes every request answer 403 rate-limited."""
+
+    def __init__(self):
+        self.releases = [_release("v9.0.0", 900), _release("v8.0.0", 800)]
+        self.rate_limited = False
+        self.bodies = 0
+        self.statuses = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b"", headers=()):
+                api.statuses.append(status)
+                self.send_response(status)
+                for k, v in headers:
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    api.bodies += 1
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                if api.rate_limited:
+                    self._send(403, b'{"message": "API rate limit exceeded"}',
+                               [("X-RateLimit-Remaining", "0")])
+                    return
+                if self.path.startswith("/releases"):
+                    doc = api.releases
+                elif self.path.startswith("/git/ref/tags/"):
+                    doc = TAG_REF
+                else:
+                    self._send(404)
+                    return
+                body = json.dumps(doc).encode()
+                etag = f'W/"{hash(body) & 0xffffffff:x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, headers=[("ETag", etag)])
+                    return
+                self._send(200, body, [("ETag", etag),
+                                       ("Content-Type", "application/json")])
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.root = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def api(monkeypatch):
+    a = _FakeApi()
+    monkeypatch.setattr(update_checker, "GITHUB_API_ROOT", a.root)
+    monkeypatch.setattr(update_checker, "GITHUB_API", f"{a.root}/releases")
+    monkeypatch.setattr("utils.version.APP_VERSION", "2.3.0")
+    monkeypatch.setattr("utils.build_info.build_number", lambda: 458)
+    monkeypatch.setattr("utils.build_info.is_source_run", lambda: False)
+    yield a
+    a.close()
+
+
+def _check(sm):
+    # manual=True bypasses the 6h result cache, so every call reaches the API.
+    return update_checker._perform_check(sm, manual=True)
+
+
+def test_repeated_checks_transfer_no_release_bodies(api):
+    sm = FakeSettings()
+    first = _check(sm)
+    assert first["kind"] == "update" and first["info"]["tag_name"] == "v9.0.0"
+    for _ in range(5):
+        assert _check(sm) == first
+    assert api.bodies == 1
+    assert api.statuses == [200] + [304] * 5
+
+
+def test_changed_release_list_is_fetched_again(api):
+    sm = FakeSettings()
+    _check(sm)
+    api.releases = [_release("v9.1.0", 910)] + api.releases
+    assert _check(sm)["info"]["tag_name"] == "v9.1.0"
+    assert api.bodies == 2
+
+
+def test_rate_limited_check_answers_from_last_good_response(api):
+    sm = FakeSettings()
+    first = _check(sm)
+    api.rate_limited = True
+    assert _check(sm) == first
+    assert api.statuses[-1] == 403
+
+
+def test_rate_limited_without_cache_still_fails(api):
+    api.rate_limited = True
+    assert _check(FakeSettings())["kind"] == "failed"
+
+
+def test_tag_ref_lookup_survives_rate_limit(api):
+    sm = FakeSettings()
+    assert update_checker._api_get("/git/ref/tags/v9.0.0", sm) == TAG_REF
+    api.rate_limited = True
+    assert update_checker._api_get("/git/ref/tags/v9.0.0", sm) == TAG_REF
+    assert update_checker._api_get("/git/ref/tags/v9.9.9", sm) is None
+
+
+def test_cache_stores_the_selected_release_not_the_list(api):
+    sm = FakeSettings()
+    _check(sm)
+    cache = json.loads(sm.d[UPDATE_HTTP_CACHE])
+    (entry,) = cache.values()
+    assert entry["etag"] and entry["value"]["tag_name"] == "v9.0.0"
@@ -0,0 +1,196 @@
+"""UpdateRunner._download_asset against a local stand-in release host:
+dropped connections resume with Range requests, the SHA-256 published by
+the release API is checked while streaming, and a corrupted file never
+reaches the installer."""
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils import update_runner
+from utils.update_runner import UpdateRunner, asset_sha256
+
+PAYLOAD = bytes(range(256)) * 4096          # 1 MiB
+
+
+class _ReleaseHost:
+    """Serves PAYLOAD with Range support. `cut_after` makes the next full or
+    ranged response stop after that many body bytes and drop the
+    connection; `corrupt_at` flips one byte of every body served. Every
+    response carries `etag` (None = no validator), and a Range whose
+    If-Range doesn't match it gets the whole body, as RFC 9110 says."""
+
+    def __init__(self):
+        self.cut_after: list[int] = []
+        self.corrupt_at = None
+        self.ignore_range = False
+        self.etag = '"build-1"'
+        self.if_range = []                  # If-Range header of each request
+        self.requests = []                  # (Range header, bytes sent)
+        host = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                data = bytearray(PAYLOAD)
+                if host.corrupt_at is not None:
+                    data[host.corrupt_at] ^= 0xFF
+                start = 0
+                rng = self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                host.if_range.append(if_range)
+                stale = if_range is not None and if_range != host.etag
+                if rng and not host.ignore_range and not stale:
+                    start = int(rng.split("=")[1].split("-")[0])
+                    if start >= len(data):
+                        self.send_response(416)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        host.requests.append((rng, 0))
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range",
+                                     f"bytes {start}-{len(data) - 1}/{len(data)}")
+                else:
+                    self.send_response(200)
+                body = bytes(data[start:])
+                if host.etag:
+                    self.send_header("ETag", host.etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if host.cut_after:
+                    body = body[:host.cut_after.pop(0)]
+                    self.close_connection = True
+                # Recorded before the body goes out: the client may finish
+                # reading (and the test inspect requests) before write returns.
+                host.requests.append((rng, len(body)))
+                self.wfile.write(body)
+                self.wfile.flush()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/asset.AppImage"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def host(monkeypatch):
+    monkeypatch.setattr(update_runner, "_DOWNLOAD_BACKOFF_S", (0.0,))
+    h = _ReleaseHost()
+    yield h
+    h.close()
+
+
+def _asset(host, digest=True):
+    asset = {"name": "ToonTownMultiTool-v9.9.9.AppImage",
+             "browser_download_url": host.url, "size": len(PAYLOAD)}
+    if digest:
+        asset["digest"] = "sha256:" + hashlib.sha256(PAYLOAD).hexdigest()
+    return asset
+
+
+@pytest.fixture
+def out_dir(tmp_path):
+    d = tmp_path / "dl"
+    d.mkdir()
+    return d
+
+
+def _resumed_from(rng):
+    return int(rng.split("=")[1].rstrip("-"))
+
+
+def test_dropped_connection_resumes_with_only_the_missing_bytes(host, out_dir):
+    cut = int(len(PAYLOAD) * 0.9)
+    host.cut_after = [cut]
+    path = UpdateRunner()._download_asset(_asset(host), out_dir=str(out_dir))
+    assert path == str(out_dir / "ToonTownMultiTool-v9.9.9.AppImage")
+    with open(path, "rb") as fh:
+        assert fh.read() == PAYLOAD
+    (first, sent), (rng, rest) = host.requests
+    assert first is None and sent == cut
+    # At most the chunk in flight when the connection dropped is fetched twice.
+    resumed = _resumed_from(rng)
+    assert cut - update_runner._DOWNLOAD_CHUNK <= resumed <= cut
+    assert rest == len(PAYLOAD) - resumed
+    assert not os.path.exists(path + ".part")
+
+
+def test_partial_from_an_earlier_attempt_is_resumed(host, out_dir, monkeypatch):
+    monkeypatch.setattr(update_runner, "_DOWNLOAD_ATTEMPTS", 1)
+    host.cut_after = [300_000]
+    runner = UpdateRunner()
+    assert runner._download_asset(_asset(host), out_dir=str(out_dir)) is None
+    kept = (out_dir / "ToonTownMultiTool-v9.9.9.AppImage.part").stat().st_size
+    assert kept > 0                                 # kept for the next attempt
+    path = runner._download_asset(_asset(host), out_dir=str(out_dir))
+    with open(path, "rb") as fh:
+        assert fh.read() == PAYLOAD
+    assert host.requests[-1] == (f"bytes={kept}-", len(PAYLOAD) - kept)
+    assert host.if_range[-1] == '"build-1"'
+    assert not os.path.exists(path + ".part.validator")
+
+
+def test_partial_of_a_rebuilt_asset_is_restarted(host, out_dir, monkeypatch):
+    monkeypatch.setattr(update_runner, "_DOWNLOAD_ATTEMPTS", 1)
+    host.cut_after = [300_000]
+    runner = UpdateRunner()
+    assert runner._download_asset(_asset(host), out_dir=str(out_dir)) is None
+    kept = (out_dir / "ToonTownMultiTool-v9.9.9.AppImage.part").stat().st_size
+    host.etag = '"build-2"'                         # same name, new build
+    path = runner._download_asset(_asset(host), out_dir=str(out_dir))
+    with open(path, "rb") as fh:
+        assert fh.read() == PAYLOAD
+    # If-Range did not match: the server sent the whole body, not the tail.
+    assert host.if_range[-1] == '"build-1"'
+    assert host.requests[-1] == (f"bytes={kept}-", len(PAYLOAD))
+
+
+def test_unverifiable_partial_without_validator_is_discarded(host, out_dir):
+    host.etag = None
+    name = "ToonTownMultiTool-v9.9.9.AppImage"
+    (out_dir / (name + ".part")).write_bytes(b"\xee" * 5000)  # some other build
+    path = UpdateRunner()._download_asset(_asset(host, digest=False),
+                                          out_dir=str(out_dir))
+    with open(path, "rb") as fh:
+        assert fh.read() == PAYLOAD
+    assert host.requests == [(None, len(PAYLOAD))]
+
+
+def test_server_ignoring_range_restarts_cleanly(host, out_dir):
+    host.cut_after = [100_000]
+    host.ignore_range = True
+    path = UpdateRunner()._download_asset(_asset(host), out_dir=str(out_dir))
+    with open(path, "rb") as fh:
+        assert fh.read() == PAYLOAD
+
+
+def test_corrupted_byte_is_rejected_and_discarded(host, out_dir):
+    host.corrupt_at = 12345
+    path = UpdateRunner()._download_asset(_asset(host), out_dir=str(out_dir))
+    assert path is None
+    assert list(out_dir.iterdir()) == []
+
+
+def test_download_that_never_completes_is_not_handed_over(host, out_dir, monkeypatch):
+    monkeypatch.setattr(update_runner, "_DOWNLOAD_ATTEMPTS", 2)
+    host.cut_after = [5000, 5000]
+    path = UpdateRunner()._download_asset(_asset(host, digest=False), out_dir=str(out_dir))
+    assert path is None
+    assert not (out_dir / "ToonTownMultiTool-v9.9.9.AppImage").exists()
+
+
+def test_asset_sha256_parses_release_digest():
+    assert asset_sha256({"digest": "sha256:" + "AB" * 32}) == "ab" * 32
+    assert asset_sha256({"digest": "md5:abc"}) is None
+    assert asset_sha256({}) is None
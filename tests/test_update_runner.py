@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -87,7 +89,18 @@ _FLATPAK_ASSET = {
 }
 
 
-def test_runner_dispatches_flatpak_downloads_and_installs(monkeypatch):
+def _finish_download(runner, timeout=2.0):
+    """The asset download runs on a worker QThread; wait for it and let its
+    result reach the install step on this (GUI) thread."""
+    from PySide6.QtCore import QCoreApplication
+    deadline = time.monotonic() + timeout
+    while runner.download_in_progress() and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+    assert not runner.download_in_progress()
+
+
+def test_runner_dispatches_flatpak_downloads_and_installs(qapp, monkeypatch):
     # A bundle-distributed Flatpak has no live remote, so `flatpak update`
     # no-ops. The handler must instead download the .flatpak asset and reinstall
     # it (the same download-and-install shape the .deb/.exe handlers use).
@@ -105,6 +118,7 @@ def test_runner_dispatches_flatpak_downloads_and_installs(monkeypatch):
     )
     runner.run_update({"tag_name": "v2.4.0-a", "html_url": "https://example/r",
                        "assets": [_FLATPAK_ASSET]})
+    _finish_download(runner)
     assert spawned == [["flatpak", "install", "--system", "--reinstall", "-y",
                         "/tmp/TTMultiTool.flatpak"]]
 
@@ -120,7 +134,7 @@ def test_flatpak_no_asset_opens_release(monkeypatch):
     assert opened == ["https://example/release"]
 
 
-def test_flatpak_stages_to_host_visible_dir_in_sandbox(monkeypatch):
+def test_flatpak_stages_to_host_visible_dir_in_sandbox(qapp, monkeypatch):
     # Inside the sandbox the bundle must be downloaded to a host-visible path,
     # because the `flatpak install` runs as a host process that cannot see the
     # sandbox's private /tmp.
@@ -137,10 +151,11 @@ def test_flatpak_stages_to_host_visible_dir_in_sandbox(monkeypatch):
     monkeypatch.setattr(runner, "_download_asset", fake_download)
     monkeypatch.setattr("utils.update_runner.run_in_terminal", lambda cmd, on_exit: True)
     runner.run_update({"assets": [_FLATPAK_ASSET]})
+    _finish_download(runner)
     assert captured["out_dir"] == "/host/cache/update"
 
 
-def test_flatpak_payload_not_prewrapped_in_sandbox(monkeypatch):
+def test_flatpak_payload_not_prewrapped_in_sandbox(qapp, monkeypatch):
     # Regression guard for the double-wrap hazard: even inside the sandbox the
     # command handed to the terminal launcher must stay raw. run_in_terminal
     # applies the flatpak-spawn --host wrap once around the whole terminal argv.
@@ -159,6 +174,7 @@ def test_flatpak_payload_not_prewrapped_in_sandbox(monkeypatch):
         lambda cmd, on_exit: spawned.append(cmd) or True,
     )
     runner.run_update({"assets": [_FLATPAK_ASSET]})
+    _finish_download(runner)
     assert spawned == [["flatpak", "install", "--system", "--reinstall", "-y",
                         "/host/cache/update/b.flatpak"]]
     assert "flatpak-spawn" not in spawned[0]
@@ -209,6 +225,7 @@ def test_windows_installer_launched_silent_with_relaunch_flag(monkeypatch):
     runner.run_update({"tag_name": "v2.4.0", "html_url": "https://example/r",
                        "assets": [{"name": "ToonTownMultiTool-Setup-v2.4.0.exe",
                                    "browser_download_url": "https://x/s.exe", "size": 1}]})
+    _finish_download(runner)
     assert popened, "installer was not launched"
     argv = popened[0]
     assert argv[0].endswith("ttmt-setup.exe")
@@ -234,3 +251,47 @@ def test_restart_app_flatpak_relaunches_via_flatpak_run_not_execv(monkeypatch):
     assert popened == [["flatpak", "run", "io.github.flossbud.ToonTownMultiTool"]]
     assert execv_called == []
     assert quit_called == [True]
+
+
+def test_download_runs_off_the_gui_thread(qapp, monkeypatch):
+    # The download (with its retry backoff) must not block run_update: the
+    # GUI thread returns at once and the install step follows on completion.
+    runner = UpdateRunner(MagicMock())
+    monkeypatch.setattr("utils.install_method.detect", lambda: InstallMethod.DEB)
+    release = threading.Event()
+    download_threads = []
+
+    def slow_download(asset, out_dir=None):
+        download_threads.append(threading.current_thread())
+        assert release.wait(timeout=2.0)
+        return "/tmp/ttmt.deb"
+
+    monkeypatch.setattr(runner, "_download_asset", slow_download)
+    spawned = []
+    monkeypatch.setattr("utils.update_runner.run_in_terminal",
+                        lambda cmd, on_exit: spawned.append(cmd) or True)
+    failures = []
+    runner.failed.connect(failures.append)
+    deb = {"assets": [{"name": "ttmt.deb", "browser_download_url": "https://x/d", "size": 1}]}
+
+    runner.run_update(deb)
+    assert runner.download_in_progress() and spawned == []
+    runner.run_update(deb)                  # second click while downloading
+    assert failures == ["An update download is already in progress."]
+
+    release.set()
+    _finish_download(runner)
+    assert download_threads and download_threads[0] is not threading.main_thread()
+    assert spawned == [["pkexec", "dpkg", "-i", "/tmp/ttmt.deb"]]
+
+
+def test_failed_download_is_reported_after_the_worker_finishes(qapp, monkeypatch):
+    runner = UpdateRunner(MagicMock())
+    monkeypatch.setattr("utils.install_method.detect", lambda: InstallMethod.FLATPAK)
+    monkeypatch.setattr("utils.host_spawn.in_flatpak", lambda: False)
+    monkeypatch.setattr(runner, "_download_asset", lambda asset, out_dir=None: None)
+    failures = []
+    runner.failed.connect(failures.append)
+    runner.run_update({"assets": [_FLATPAK_ASSET]})
+    _finish_download(runner)
+    assert failures == ["Failed to download the Flatpak bundle"]
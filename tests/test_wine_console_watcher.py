@@ -0,0 +1,216 @@
+"""Tests for the event-driven Wine console watcher (X11ConsoleWatcher and its
+event handler), driven with synthetic X events against a fake display."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("Xlib")
+from Xlib import X  # noqa: E402
+
+from services import wine_console_hider as wch  # noqa: E402
+
+CONSOLE = r"C:\users\steamuser\CorporateClash\CorporateClash.exe"
+
+
+class _FakeWindow:
+    def __init__(self, display, wid, title="", children=()):
+        self.display = display
+        self.id = wid
+        self.title = title
+        self.children = list(children)
+        self.event_mask = 0
+        self.unmaps = 0
+
+    def get_wm_name(self):
+        return self.title or None
+
+    def get_full_property(self, atom, type_):
+        return None
+
+    def change_attributes(self, event_mask=0):
+        self.event_mask = event_mask
+
+    def query_tree(self):
+        self.display.tree_walks += 1
+        return SimpleNamespace(children=self.children)
+
+    def unmap(self):
+        self.unmaps += 1
+
+
+class _FakeDisplay:
+    def __init__(self, toplevels=()):
+        self.tree_walks = 0
+        self.flushes = 0
+        self.root = _FakeWindow(self, 1, children=toplevels)
+
+    def screen(self):
+        return SimpleNamespace(root=self.root)
+
+    def get_atom(self, name):
+        return {"WM_NAME": 39, "_NET_WM_NAME": 300, "UTF8_STRING": 301}[name]
+
+    def flush(self):
+        self.flushes += 1
+
+
+def _handler(toplevels=()):
+    d = _FakeDisplay()
+    wins = [_FakeWindow(d, wid, title) for wid, title in toplevels]
+    d.root.children = wins
+    h = wch._ConsoleEventHandler(d)
+    h.start()
+    return h, d, wins
+
+
+def test_start_selects_root_substructure_and_hides_existing_console():
+    h, d, (game, console) = _handler([(0x10, "Corporate Clash"),
+                                      (0x20, CONSOLE)])
+    assert d.root.event_mask == X.SubstructureNotifyMask
+    assert game.event_mask == X.StructureNotifyMask | X.PropertyChangeMask
+    assert console.unmaps == 1 and game.unmaps == 0
+    assert h.hidden == {0x20}
+    assert h.tree_walks == 1
+
+
+def test_create_then_title_property_unmaps_within_one_event():
+    h, d, _ = _handler()
+    win = _FakeWindow(d, 0x30)
+    h.handle(SimpleNamespace(type=X.CreateNotify, parent=d.root, window=win))
+    assert win.event_mask & X.PropertyChangeMask
+    assert win.unmaps == 0                    # no title yet
+    win.title = CONSOLE
+    h.handle(SimpleNamespace(type=X.PropertyNotify, window=win, atom=39))
+    assert win.unmaps == 1
+    assert h.hidden == {0x30}
+
+
+def test_proton_remap_is_undone_on_its_map_notify_and_counted():
+    h, d, (console,) = _handler([(0x40, CONSOLE)])
+    for _ in range(3):
+        h.handle(SimpleNamespace(type=X.MapNotify, event=console, window=console))
+    assert console.unmaps == 4
+    assert h.remaps == {0x40: 3}
+
+
+def test_root_copy_of_map_notify_is_ignored():
+    h, d, (console,) = _handler([(0x50, CONSOLE)])
+    h.handle(SimpleNamespace(type=X.MapNotify, event=d.root, window=console))
+    assert console.unmaps == 1                # only the adoption check
+    assert h.remaps == {}
+
+
+def test_non_matching_windows_and_unrelated_properties_are_left_alone():
+    h, d, (game,) = _handler([(0x60, "Corporate Clash [Toon]")])
+    h.handle(SimpleNamespace(type=X.PropertyNotify, window=game, atom=999))
+    h.handle(SimpleNamespace(type=X.MapNotify, event=game, window=game))
+    assert game.unmaps == 0
+
+
+def test_start_adopts_a_console_already_reparented_into_a_frame():
+    d = _FakeDisplay()
+    console = _FakeWindow(d, 0x22, CONSOLE)
+    frame = _FakeWindow(d, 0x21, children=[console])
+    d.root.children = [frame]
+    h = wch._ConsoleEventHandler(d)
+    h.start()
+    assert console.unmaps == 1 and frame.unmaps == 0
+    assert console.event_mask == X.StructureNotifyMask | X.PropertyChangeMask
+    assert h.hidden == {0x22}
+    h.handle(SimpleNamespace(type=X.MapNotify, event=console, window=console))
+    assert h.remaps == {0x22: 1}
+
+
+def test_events_never_walk_the_tree():
+    h, d, _ = _handler()
+    walks = d.tree_walks                      # the single adoption walk
+    for wid in range(0x100, 0x140):
+        win = _FakeWindow(d, wid, CONSOLE if wid % 8 == 0 else "other")
+        h.handle(SimpleNamespace(type=X.CreateNotify, parent=d.root, window=win))
+        h.handle(SimpleNamespace(type=X.MapNotify, event=win, window=win))
+    assert d.tree_walks == walks and h.tree_walks == 1
+
+
+class _ArmRecorder:
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.armed = []
+
+    def arm(self, duration_s):
+        self.armed.append(duration_s)
+        return self.ok
+
+
+class _Settings:
+    def get(self, key, default=None):
+        return True
+
+
+def test_hider_arms_shared_watcher_instead_of_polling(qapp):
+    watcher = _ArmRecorder()
+    hider = wch.WineConsoleHider(_Settings(), watcher=watcher)
+    for pid in (1, 2, 3, 4):
+        hider.on_game_launched(pid)
+    assert watcher.armed == [wch.WATCH_DURATION_MS / 1000.0] * 4
+    assert not hider._timer.isActive()
+
+
+def test_hider_falls_back_to_polling_when_no_display(qapp):
+    hider = wch.WineConsoleHider(_Settings(), watcher=_ArmRecorder(ok=False))
+    hider.on_game_launched(1)
+    assert hider._timer.isActive()
+    hider._timer.stop()
+
+
+def test_watcher_arm_without_display_reports_failure():
+    w = wch.X11ConsoleWatcher(display_factory=lambda: None)
+    assert w.arm(1.0) is False
+    assert not w.is_running()
+
+
+def test_default_hider_uses_the_process_wide_watcher(qapp):
+    a = wch.WineConsoleHider(_Settings())
+    b = wch.WineConsoleHider(_Settings())
+    assert a._watcher is b._watcher is wch.shared_watcher()
+
+
+def test_arm_during_deadline_exit_starts_a_new_watcher():
+    """An arm() that lands after the thread decided to exit (while it is still
+    closing its display) must start a fresh watcher, not extend the dying one."""
+    import os
+    import threading
+
+    closing = threading.Event()
+    release = threading.Event()
+    opened = []
+    r, w = os.pipe()
+
+    class _Display(_FakeDisplay):
+        def fileno(self):
+            return r
+
+        def pending_events(self):
+            return 0
+
+        def close(self):
+            if len(opened) == 1:
+                closing.set()
+                release.wait(5.0)
+
+    def factory():
+        opened.append(_Display())
+        return opened[-1]
+
+    watcher = wch.X11ConsoleWatcher(display_factory=factory)
+    try:
+        assert watcher.arm(0.01)
+        assert closing.wait(5.0)             # first thread is past its deadline
+        assert watcher.arm(5.0)
+        assert len(opened) == 2              # a new watcher covers this launch
+        assert watcher.is_running()
+    finally:
+        release.set()
+        watcher.stop()
+        os.close(r)
+        os.close(w)
@@ -1066,3 +1066,132 @@ def test_needs_focused_passthrough_is_true():
     # without checking sys.platform.
     from utils.x11_movement_grabber import MovementKeyGrabber
     assert MovementKeyGrabber.needs_focused_passthrough is True
+
+
+# ── Diffed, pipelined passive grabs on the CC path ─────────────────────────────
+
+class _RequestLog:
+    """Fake display + root that count X protocol requests. Void requests
+    (XGrabKey/XUngrabKey) only queue; sync() is the round trip that flushes
+    them and delivers async errors to each request's onerror, like
+    python-xlib. Pairs in `owned_elsewhere` answer BadAccess."""
+
+    def __init__(self):
+        self.requests = []
+        self.queued_errors = []
+        self.owned_elsewhere = set()
+        self.keyboard_status = X.GrabSuccess
+
+    def keysym_to_keycode(self, ks):
+        return 100 + (ks % 50)
+
+    def grab_key(self, keycode, mod, owner_events, pointer_mode, keyboard_mode,
+                 onerror=None):
+        self.requests.append("GrabKey")
+        if (keycode, mod) in self.owned_elsewhere and onerror is not None:
+            self.queued_errors.append(onerror)
+
+    def ungrab_key(self, keycode, mod, onerror=None):
+        self.requests.append("UngrabKey")
+
+    def grab_keyboard(self, *args):
+        self.requests.append("GrabKeyboard")
+        return self.keyboard_status
+
+    def ungrab_keyboard(self, time):
+        self.requests.append("UngrabKeyboard")
+
+    def sync(self):
+        self.requests.append("sync")
+        errors, self.queued_errors = self.queued_errors, []
+        for onerror in errors:
+            onerror(MagicMock(), None)
+
+    def count(self, name):
+        return self.requests.count(name)
+
+
+def _inline_grabber():
+    """A grabber driven inline (no event thread) against _RequestLog."""
+    log = _RequestLog()
+    g = grabber_mod.MovementKeyGrabber()
+    g._display = log
+    g._root = log
+    return g, log
+
+
+def test_ttr_cc_focus_flip_sends_no_key_grab_requests():
+    """CC (legacy) -> TTR (route_all) -> CC used to uninstall and reinstall
+    every conflicting (keycode, modifier) pair: 4 keys x 64 combos ungrabbed
+    plus 4 x 64 grabbed again, each flip. The CC grabs now stay parked under
+    the keyboard grab, so the flip costs only the keyboard grab/ungrab."""
+    g, log = _inline_grabber()
+    per_set = 4 * len(grabber_mod._LOCK_MODIFIERS)
+    g._install_grabs_inline("wasd", [])
+    assert log.count("GrabKey") == per_set and log.count("sync") == 1
+    log.requests.clear()
+
+    for _ in range(5):
+        g._install_grabs_inline("wasd", [], route_all=True)
+        assert g._grab_ok and g._current_canonical == "wasd"
+        g._install_grabs_inline("wasd", [])
+        assert not g._route_all and g._current_canonical == "wasd"
+    assert log.count("GrabKey") == 0 and log.count("UngrabKey") == 0
+    assert log.count("GrabKeyboard") == 5 and log.count("UngrabKeyboard") == 5
+    assert len(g._grabbed) == per_set
+
+
+def test_canonical_change_sends_only_the_changed_pairs_in_one_round_trip():
+    g, log = _inline_grabber()
+    per_set = 4 * len(grabber_mod._LOCK_MODIFIERS)
+    g._install_grabs_inline("wasd", [])
+    log.requests.clear()
+    g._install_grabs_inline("arrows", [])
+    assert log.count("UngrabKey") == per_set and log.count("GrabKey") == per_set
+    assert log.count("sync") == 1                 # pipelined, not per request
+    # Unchanged pairs are never re-sent: reinstalling the same set is free.
+    log.requests.clear()
+    g._grabbed.discard(next(iter(g._grabbed)))
+    g._current_canonical = None
+    g._install_grabs_inline("arrows", [])
+    assert log.requests == ["GrabKey", "sync"]
+
+
+def test_refused_grabs_are_collected_asynchronously():
+    from Xlib import XK
+    g, log = _inline_grabber()
+    up = log.keysym_to_keycode(XK.string_to_keysym("Up"))
+    log.owned_elsewhere = {(up, mod) for mod in grabber_mod._LOCK_MODIFIERS[:10]}
+    g._install_grabs_inline("wasd", [])
+    assert log.count("sync") == 1
+    assert not (log.owned_elsewhere & g._grabbed)
+    assert len(g._grabbed) == 4 * len(grabber_mod._LOCK_MODIFIERS) - 10
+    # Refused pairs are not ours, so uninstall never ungrabs them.
+    log.requests.clear()
+    g._uninstall_grabs_inline()
+    assert log.count("UngrabKey") == 4 * len(grabber_mod._LOCK_MODIFIERS) - 10
+    assert g._grabbed == set()
+
+
+def test_denied_keyboard_grab_releases_parked_cc_grabs():
+    """Parked GrabModeSync grabs are only safe under the keyboard grab; when
+    it is denied they would freeze the keyboard with nobody to AllowEvents."""
+    g, log = _inline_grabber()
+    g._install_grabs_inline("wasd", [])
+    log.keyboard_status = X.AlreadyGrabbed
+    log.requests.clear()
+    g._install_grabs_inline("wasd", [], route_all=True)
+    assert not g._grab_ok and g._current_canonical is None
+    assert log.count("UngrabKey") == 4 * len(grabber_mod._LOCK_MODIFIERS)
+    assert g._grabbed == set()
+
+
+def test_uninstall_from_route_all_releases_parked_grabs():
+    g, log = _inline_grabber()
+    g._install_grabs_inline("arrows", [])
+    g._install_grabs_inline("arrows", [], route_all=True)
+    log.requests.clear()
+    g._uninstall_grabs_inline()
+    assert log.count("UngrabKeyboard") == 1
+    assert log.count("UngrabKey") == 4 * len(grabber_mod._LOCK_MODIFIERS)
+    assert g._grabbed == set() and g._current_canonical is None
@@ -24,6 +24,25 @@ logger = logging.getLogger(__name__)
 # -- Public API ----------------------------------------------------------------
 
 
+def get_toon_data(num_slots: int, window_ids: list) -> list[Optional[CCToonInfo]]:
+    """Resolve CC toon data for the given windows synchronously: a
+    list[CCToonInfo | None] padded to num_slots (matches the TTR API's
+    fixed-length lists). Blocks on file I/O; call it off the GUI thread."""
+    try:
+        pids = [_resolve_pid_for_window(wid) for wid in window_ids]
+        paths = _get_stdout_paths_for_pids(pids)
+        infos: list[Optional[CCToonInfo]] = [
+            _info_from_stdout(paths.get(pid)) if pid is not None else CCToonInfo()
+            for pid in pids
+        ]
+    except Exception:
+        logger.exception("[cc_api] toon data fetch crashed; returning empty infos")
+        return [None] * num_slots
+    while len(infos) < num_slots:
+        infos.append(None)
+    return infos
+
+
 def get_toon_data_threaded(
     num_slots: int,
     window_ids: list,
@@ -37,19 +56,7 @@ def get_toon_data_threaded(
     Signal.emit to marshal back to the GUI thread.
     """
     def _worker():
-        try:
-            infos: list[Optional[CCToonInfo]] = []
-            for wid in window_ids:
-                info = _resolve_one(wid)
-                infos.append(info)
-            # Pad out to num_slots so the callback always sees a fixed-
-            # length list. Matches the TTR API's behavior.
-            while len(infos) < num_slots:
-                infos.append(None)
-            callback(infos)
-        except Exception:
-            logger.exception("[cc_api] worker crashed; firing empty callback")
-            callback([None] * num_slots)
+        callback(get_toon_data(num_slots, window_ids))
 
     threading.Thread(target=_worker, daemon=True).start()
 
@@ -126,14 +133,32 @@ def _get_stdout_path_for_pid(pid: int) -> Optional[Path]:
     return path
 
 
-def _resolve_one(window_id) -> CCToonInfo:
-    """Build a CCToonInfo for one window. Returns an all-None info when
-    any step degrades (no PID, no stdout file, no avatar record yet)."""
-    pid = _resolve_pid_for_window(window_id)
-    if pid is None:
-        return CCToonInfo()
+def _get_stdout_paths_for_pids(pids: list) -> dict:
+    """{pid: stdout/log path or None} for every window of a refresh.
+
+    Two or more PIDs missing from the TTMT-spawned registry are discovered
+    together (one host process scan, distinct logs per instance) instead of
+    one find_log_for_pid each, which rescanned every process per window
+    and could hand two sandboxed instances the same log."""
+    unique = [pid for pid in dict.fromkeys(pids) if pid is not None]
+    missing = [pid for pid in unique if cc_launcher.get_stdout_path_for_pid(pid) is None]
+    if len(missing) < 2:
+        return {pid: _get_stdout_path_for_pid(pid) for pid in unique}
+    from utils import cc_log_discovery
+    found = cc_log_discovery.find_logs_for_pids(
+        missing, manual_dir=_get_cc_manual_log_dir())
+    paths = {}
+    for pid in unique:
+        if pid in found:
+            paths[pid] = found[pid]
+            if found[pid] is not None:
+                cc_launcher._register_stdout_path(pid, found[pid])
+        else:
+            paths[pid] = _get_stdout_path_for_pid(pid)
+    return paths
+
 
-    path = _get_stdout_path_for_pid(pid)
+def _info_from_stdout(path: Optional[Path]) -> CCToonInfo:
     if path is None:
         return CCToonInfo()
 
@@ -15,6 +15,12 @@ Three layers, tried in order:
 If manual_dir is set, it applies as a scope filter (Layers 1, 2) or
 scan target (Layer 3) so the user's "search only here" intent is
 honored uniformly.
+
+find_logs_for_pids resolves several windows in one pass: the host
+process table is scanned once into a ProcessIndex. A sandboxed window's
+PID is tied to its host CC process through that process's innermost
+NSpid; host-PID windows found only by scanning or by prefix glob are
+matched to distinct logs by create-time correlation.
 """
 
 from __future__ import annotations
@@ -23,8 +29,10 @@ import logging
 import os
 import re
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import psutil
 
@@ -75,27 +83,71 @@ def _layer1_psutil(pid: int, manual_dir: Optional[Path]) -> Optional[Path]:
 _CC_PROCESS_NAME_NEEDLE = "corporateclash"
 
 
-def _layer1_5_process_scan(manual_dir: Optional[Path]) -> Optional[Path]:
+class ProcessIndex:
+    """The CC processes on the host, found with ONE process_iter scan and
+    shared by every lookup of a discovery pass (previously each unresolved
+    window re-walked the whole process table). Short-lived by design: build
+    one per pass, never keep it across passes."""
+
+    def __init__(self) -> None:
+        self.cc_procs: list[tuple[float, int]] = []   # (create_time, pid)
+        # host pid -> the pid its own (sandbox) namespace sees, for CC
+        # processes that live in a nested PID namespace.
+        self.ns_pids: dict[int, int] = {}
+        self._open_logs: dict[int, list[str]] = {}
+        for proc in psutil.process_iter(attrs=["pid", "name", "create_time"]):
+            try:
+                info = proc.info
+                name = (info.get("name") or "").lower()
+                if _CC_PROCESS_NAME_NEEDLE not in name:
+                    continue
+                pid = info["pid"]
+                create_time = info.get("create_time") or _proc_create_time(pid)
+                self.cc_procs.append((float(create_time or 0.0), pid))
+            except psutil.Error as exc:
+                logger.debug("[cc_log_discovery] L1.5 skipping pid: %s", exc)
+                continue
+        self.cc_procs.sort()
+        for _create_time, pid in self.cc_procs:
+            ns_pid = _proc_nspid(pid)
+            if ns_pid is not None and ns_pid != pid:
+                self.ns_pids[pid] = ns_pid
+
+    def open_log(self, pid: int, manual_dir: Optional[Path]) -> Optional[Path]:
+        """Layer 1 for an indexed CC process, open_files() read once per pass."""
+        paths = self._open_logs.get(pid)
+        if paths is None:
+            try:
+                files = psutil.Process(pid).open_files()
+            except psutil.Error as exc:
+                logger.debug("[cc_log_discovery] L1.5 open_files failed for pid=%d: %s",
+                             pid, exc)
+                files = []
+            paths = [f.path for f in files if _is_cc_log_path(f.path)]
+            self._open_logs[pid] = paths
+        for path_str in paths:
+            candidate = Path(path_str)
+            if manual_dir is not None and not _is_inside(candidate, manual_dir):
+                continue
+            return candidate
+        return None
+
+
+def _layer1_5_process_scan(manual_dir: Optional[Path],
+                           index: Optional[ProcessIndex] = None) -> Optional[Path]:
     """When the input PID doesn't yield a CC log (typical of sandboxed
     launchers like Faugus/Bottles/Proton, where the X11 _NET_WM_PID points
     into a different PID namespace than the host), scan host processes for
     one whose name matches CorporateClash.exe and run Layer 1 against it.
 
-    Returns the first matching log path. Multi-instance external CC is
-    best-effort and may return the wrong instance's log; documented in the
-    spec.
+    Returns the first matching log path. For a single window only; several
+    windows go through find_logs_for_pids, which assigns distinct logs.
     """
-    for proc in psutil.process_iter(attrs=["pid", "name"]):
-        try:
-            name = (proc.info.get("name") or "").lower()
-            if _CC_PROCESS_NAME_NEEDLE not in name:
-                continue
-            path = _layer1_psutil(proc.info["pid"], manual_dir)
-            if path is not None:
-                return path
-        except psutil.Error as exc:
-            logger.debug("[cc_log_discovery] L1.5 skipping pid: %s", exc)
-            continue
+    index = index if index is not None else ProcessIndex()
+    for _create_time, pid in index.cc_procs:
+        path = index.open_log(pid, manual_dir)
+        if path is not None:
+            return path
     return None
 
 
@@ -109,6 +161,23 @@ def _read_proc_environ(pid: int) -> bytes:
         return b""
 
 
+def _proc_nspid(pid: int) -> Optional[int]:
+    """Innermost PID of a host process: the last value of the NSpid: line
+    in /proc/$PID/status, which is the PID a sandboxed process sees for
+    itself (and reports as _NET_WM_PID). None off Linux or on failure."""
+    if sys.platform != "linux":
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("NSpid:"):
+                    values = line.split()[1:]
+                    return int(values[-1]) if values else None
+    except (OSError, ValueError):
+        return None
+    return None
+
+
 def _proc_create_time(pid: int) -> float:
     """Return the process create time, or 0.0 on failure."""
     try:
@@ -155,11 +224,36 @@ def _candidate_logs_dirs(pid: int, manual_dir: Optional[Path]) -> list[Path]:
     return expanded
 
 
+# (pid, create_time) -> candidate logs dirs (WINEPREFIX from environ + the
+# per-user expansion). A process's environment cannot change, and the create
+# time makes a reused PID a different key. Unknown create times (0.0) are not
+# cached since they cannot tell a reused PID apart.
+_logs_dirs_cache: dict[tuple[int, float], list[Path]] = {}
+_logs_dirs_cache_lock = threading.Lock()
+_LOGS_DIRS_CACHE_MAX = 64
+
+
+def _cached_logs_dirs(pid: int, create_time: float,
+                      manual_dir: Optional[Path]) -> list[Path]:
+    if manual_dir is not None or not create_time:
+        return _candidate_logs_dirs(pid, manual_dir)
+    key = (pid, create_time)
+    with _logs_dirs_cache_lock:
+        dirs = _logs_dirs_cache.get(key)
+    if dirs is None:
+        dirs = _candidate_logs_dirs(pid, manual_dir)
+        with _logs_dirs_cache_lock:
+            if len(_logs_dirs_cache) >= _LOGS_DIRS_CACHE_MAX:
+                _logs_dirs_cache.clear()
+            _logs_dirs_cache[key] = dirs
+    return dirs
+
+
 def _layer2_prefix(pid: int, manual_dir: Optional[Path]) -> Optional[Path]:
     create_time = _proc_create_time(pid)
     best: Optional[Path] = None
     best_mtime = 0.0
-    for logs_dir in _candidate_logs_dirs(pid, manual_dir):
+    for logs_dir in _cached_logs_dirs(pid, create_time, manual_dir):
         for log_path in logs_dir.glob("*.log"):
             try:
                 mtime = log_path.stat().st_mtime
@@ -220,3 +314,114 @@ def find_log_for_pid(
     if path is not None:
         return path
     return None
+
+
+# CC names its log after the session start: corporateclash-MM-DD-YYYY-HH-MM-SS.log
+# (local time). The closest stamp to a process create time is its own log.
+_LOG_STAMP_RE = re.compile(r"(\d{2})-(\d{2})-(\d{4})-(\d{2})-(\d{2})-(\d{2})\.log$")
+
+
+def _log_start_time(path: Path, mtime: float) -> float:
+    m = _LOG_STAMP_RE.search(path.name)
+    if m is None:
+        return mtime
+    month, day, year, hour, minute, second = (int(g) for g in m.groups())
+    try:
+        return time.mktime((year, month, day, hour, minute, second, 0, 0, -1))
+    except (OverflowError, ValueError):
+        return mtime
+
+
+def _assign_closest(pairs: list[tuple[float, int, Path]],
+                    result: dict, claimed: set) -> None:
+    """Greedy one-to-one assignment over (distance, pid, path) candidate
+    pairs: the closest pair wins, ties break on pid then path, so the
+    outcome never depends on process or directory iteration order."""
+    for _distance, pid, path in sorted(pairs):
+        if result.get(pid) is None and path not in claimed:
+            result[pid] = path
+            claimed.add(path)
+
+
+def find_logs_for_pids(
+    pids: Iterable[int],
+    manual_dir: Optional[Path] = None,
+    index: Optional[ProcessIndex] = None,
+) -> dict[int, Optional[Path]]:
+    """Resolve CC log paths for several windows' PIDs in one pass.
+
+    Same layers as find_log_for_pid, but the host process table is scanned
+    at most once (a shared ProcessIndex, built lazily on the first PID
+    Layer 1 cannot resolve), and Layers 1.5 and 2 hand out DISTINCT logs.
+
+    A sandboxed launcher runs CC in its own PID namespace, so the window
+    reports the PID the sandbox sees: an alias, unrelated to any host
+    process's create time. Layer 1.5 first pairs such a PID with the
+    scanned CC process whose innermost NSpid equals it. Only window PIDs
+    that are host PIDs are then matched to the remaining CC processes / log
+    files by how close their create times are. Layer 3 (manual_dir newest
+    log) stays a shared last resort.
+    """
+    pids = list(dict.fromkeys(pids))
+    result: dict[int, Optional[Path]] = {pid: None for pid in pids}
+    claimed: set = set()
+    for pid in pids:
+        path = _layer1_psutil(pid, manual_dir)
+        if path is not None and path not in claimed:
+            result[pid] = path
+            claimed.add(path)
+    unresolved = [pid for pid in pids if result[pid] is None]
+    if not unresolved:
+        return result
+
+    index = index if index is not None else ProcessIndex()
+    ns_owners: dict[int, list[int]] = {}
+    for cc_pid, ns_pid in index.ns_pids.items():
+        ns_owners.setdefault(ns_pid, []).append(cc_pid)
+    for pid in unresolved:
+        owners = ns_owners.get(pid, [])
+        # Two sandboxes can hand out the same inner PID; that window stays
+        # for the later layers rather than taking a guess.
+        if len(owners) != 1:
+            continue
+        path = index.open_log(owners[0], manual_dir)
+        if path is not None and path not in claimed:
+            result[pid] = path
+            claimed.add(path)
+
+    create_times = {pid: _proc_create_time(pid) for pid in unresolved}
+    host_pids = [pid for pid in unresolved
+                 if result[pid] is None and pid not in ns_owners and create_times[pid]]
+    pairs = []
+    for cc_create_time, cc_pid in index.cc_procs:
+        path = index.open_log(cc_pid, manual_dir)
+        if path is None or path in claimed:
+            continue
+        for pid in host_pids:
+            pairs.append((abs(cc_create_time - create_times[pid]), pid, path))
+    _assign_closest(pairs, result, claimed)
+
+    pairs = []
+    for pid in unresolved:
+        if result[pid] is not None:
+            continue
+        create_time = create_times[pid]
+        for logs_dir in _cached_logs_dirs(pid, create_time, manual_dir):
+            for log_path in logs_dir.glob("*.log"):
+                try:
+                    mtime = log_path.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime < create_time or log_path in claimed:
+                    continue
+                started = _log_start_time(log_path, mtime)
+                pairs.append((abs(started - create_time), pid, log_path))
+    _assign_closest(pairs, result, claimed)
+
+    if any(path is None for path in result.values()):
+        fallback = _layer3_manual_dir(manual_dir)
+        if fallback is not None:
+            for pid, path in result.items():
+                if path is None:
+                    result[pid] = fallback
+    return result
@@ -0,0 +1,338 @@
+"""One display-frame clock for every UI animation.
+
+Each animated surface used to own a QTimer at its own cadence (16 ms bars
+and drags, 30 ms peek, 40 ms shimmer, 50 ms glow, 70 ms spinner). Those
+timers woke the event loop independently, and because their periods don't
+divide each other the repaints they caused landed on different frames:
+a 50 ms glow next to a 16 ms bar judders at the beat frequency.
+
+``FrameClock`` replaces them with a single tick per display frame. When an
+exposed top-level window exists, the tick is paced by ``QWindow.requestUpdate``
+(vsync/frame-callback aligned on platforms that support it). Otherwise a
+PreciseTimer at the screen's refresh interval drives it. Every subscriber
+due on a frame runs inside that one tick, so their ``update()`` calls
+coalesce into one paint pass. The clock stops itself when nothing is
+subscribed or when every subscriber is gated on a hidden widget, so an
+idle app has no animation wakeups at all.
+
+Subscribers normally use ``FrameTimer``, a QTimer-shaped adapter
+(``timeout``/``start``/``stop``/``isActive``/``setInterval``) so a call site
+swaps ``QTimer(self)`` for ``FrameTimer(self)`` and keeps its logic. An
+interval is still honoured: a 50 ms timer fires on the frame nearest each
+50 ms step instead of on its own wakeup, so the per-tick math (phase steps
+and the like) is unchanged.
+
+``shared_clock().stats()`` reports frame-budget instrumentation: frames
+ticked, how many overran the frame interval, and mean/worst tick cost per
+subscriber name. Overruns are also recorded through perf_trace when
+TTMT_PERF_TRACE=1.
+
+Not for input-latency timers (the 4 ms ghost-cursor followers) or plain
+polls that aren't animations; those keep their own QTimers.
+"""
+
+from __future__ import annotations
+
+import time
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QGuiApplication, QWindow
+
+from utils import perf_trace
+
+_DEFAULT_HZ = 60.0
+# An UpdateRequest that lands earlier than this fraction of a frame after the
+# previous tick is a platform without frame pacing (the 5 ms requestUpdate
+# fallback); wait out the rest of the frame on the timer instead.
+_EARLY_FRACTION = 0.75
+
+
+class _Subscription:
+    __slots__ = ("callback", "interval_ms", "name", "gate", "last_fire")
+
+    def __init__(self, callback, interval_ms, name, gate):
+        self.callback = callback
+        self.interval_ms = float(interval_ms)
+        self.name = name
+        self.gate = gate
+        self.last_fire: float | None = None
+
+    def runnable(self) -> bool:
+        try:
+            return self.gate is None or self.gate.isVisible()
+        except RuntimeError:      # gate widget already deleted
+            return False
+
+
+class FrameClock(QObject):
+    """Shared per-frame tick. Use ``shared_clock()`` rather than constructing
+    one; tests build their own with an injected ``clock``."""
+
+    def __init__(self, parent=None, clock=time.perf_counter):
+        super().__init__(parent)
+        self._clock = clock
+        self._subs: dict[int, _Subscription] = {}
+        self._next_token = 1
+        self._ticking = False
+        self._last_tick: float | None = None
+        self._host = None                  # QWindow pacing the frames
+        self._awaiting_update = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timer)
+        self.reset_stats()
+
+    # -- Subscriptions -------------------------------------------------------
+
+    def subscribe(self, callback, interval_ms: float = 0.0, *, name: str = "",
+                  gate=None) -> int:
+        """Run ``callback()`` on every frame at least ``interval_ms`` after its
+        previous run (0 = every frame). With ``gate`` (a QWidget), frames are
+        skipped while the gate is hidden. Returns a token for unsubscribe()."""
+        token = self._next_token
+        self._next_token += 1
+        self._subs[token] = _Subscription(
+            callback, interval_ms, name or getattr(callback, "__qualname__", "?"), gate)
+        self.wake()
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        if self._subs.pop(token, None) is not None and not self._subs:
+            self._stop()
+
+    def is_running(self) -> bool:
+        return self._timer.isActive() or self._awaiting_update
+
+    def frame_interval_ms(self) -> float:
+        screen = None
+        if self._host is not None:
+            try:
+                screen = self._host.screen()
+            except RuntimeError:
+                screen = None
+        if screen is None:
+            screen = QGuiApplication.primaryScreen()
+        hz = screen.refreshRate() if screen is not None else 0.0
+        return 1000.0 / (hz if hz and hz > 1.0 else _DEFAULT_HZ)
+
+    def wake(self) -> None:
+        """(Re)start ticking if something is runnable. Cheap when running."""
+        if self._ticking or self.is_running():
+            return
+        self._schedule()
+
+    # -- Instrumentation -----------------------------------------------------
+
+    def reset_stats(self) -> None:
+        self._frames = 0
+        self._overruns = 0
+        self._total_ms = 0.0
+        self._worst_ms = 0.0
+        self._by_name: dict[str, list[float]] = {}   # name -> [calls, total, worst]
+
+    def stats(self) -> dict:
+        """Frame-budget snapshot for the debug tab / soak harness."""
+        return {
+            "frames": self._frames,
+            "overruns": self._overruns,
+            "budget_ms": self.frame_interval_ms(),
+            "mean_ms": self._total_ms / self._frames if self._frames else 0.0,
+            "worst_ms": self._worst_ms,
+            "subscribers": {
+                name: {"calls": int(c), "mean_ms": t / c if c else 0.0, "worst_ms": w}
+                for name, (c, t, w) in self._by_name.items()
+            },
+        }
+
+    # -- Tick ----------------------------------------------------------------
+
+    def _runnable(self) -> bool:
+        return any(s.runnable() for s in self._subs.values())
+
+    def _stop(self) -> None:
+        self._timer.stop()
+        self._awaiting_update = False
+        self._last_tick = None
+
+    def _pick_host(self):
+        host = self._host
+        try:
+            if host is not None and host.isExposed():
+                return host
+        except RuntimeError:
+            pass
+        focus = QGuiApplication.focusWindow()
+        candidates = ([focus] if focus is not None else []) + list(
+            QGuiApplication.topLevelWindows())
+        for win in candidates:
+            # Shiboken can hand back a miscached wrapper (e.g. a QWidgetItem)
+            # for a window torn down mid-iteration; see shared_widgets.repolish.
+            if not isinstance(win, QWindow):
+                continue
+            try:
+                if win.isExposed():
+                    return win
+            except RuntimeError:
+                continue
+        return None
+
+    def _set_host(self, win) -> None:
+        if win is self._host:
+            return
+        if self._host is not None:
+            try:
+                self._host.removeEventFilter(self)
+            except RuntimeError:
+                pass
+        self._host = win
+        if win is not None:
+            win.installEventFilter(self)
+
+    def _schedule(self) -> None:
+        if not self._subs or not self._runnable():
+            self._stop()
+            return
+        frame = self.frame_interval_ms()
+        self._set_host(self._pick_host())
+        if self._host is not None:
+            self._awaiting_update = True
+            self._host.requestUpdate()
+            # Watchdog: a compositor can withhold frame callbacks for an
+            # occluded window; don't stall the animations on it.
+            self._timer.start(int(frame * 2) + 1)
+        else:
+            self._awaiting_update = False
+            self._timer.start(max(1, round(frame)))
+
+    def eventFilter(self, obj, event):
+        if (obj is self._host and self._awaiting_update
+                and event.type() == QEvent.UpdateRequest):
+            self._awaiting_update = False
+            frame = self.frame_interval_ms()
+            since = (self._clock() - self._last_tick) * 1000.0 \
+                if self._last_tick is not None else frame
+            if since < frame * _EARLY_FRACTION:
+                self._timer.start(max(1, round(frame - since)))
+            else:
+                self._timer.stop()
+                self._tick()
+        return False            # the window still handles its own repaint
+
+    def _on_timer(self) -> None:
+        self._awaiting_update = False
+        self._tick()
+
+    def _tick(self) -> None:
+        now = self._clock()
+        frame = self.frame_interval_ms()
+        self._ticking = True
+        start = now
+        try:
+            for sub in list(self._subs.values()):
+                if not sub.runnable():
+                    continue
+                if (sub.last_fire is not None and
+                        (now - sub.last_fire) * 1000.0 < sub.interval_ms - frame / 2):
+                    continue
+                sub.last_fire = now
+                t0 = self._clock()
+                try:
+                    sub.callback()
+                except Exception as e:
+                    print(f"[FrameClock] {sub.name} failed: {e}")
+                ms = (self._clock() - t0) * 1000.0
+                entry = self._by_name.setdefault(sub.name, [0, 0.0, 0.0])
+                entry[0] += 1
+                entry[1] += ms
+                entry[2] = max(entry[2], ms)
+        finally:
+            self._ticking = False
+        spent = (self._clock() - start) * 1000.0
+        self._frames += 1
+        self._total_ms += spent
+        self._worst_ms = max(self._worst_ms, spent)
+        if spent > frame:
+            self._overruns += 1
+            perf_trace.mark("frame_overrun", value=spent)
+        self._last_tick = now
+        self._schedule()
+
+
+_shared: FrameClock | None = None
+
+
+def shared_clock() -> FrameClock:
+    global _shared
+    if _shared is None:
+        _shared = FrameClock()
+    return _shared
+
+
+def _drop_subscription(frame_clock, cell) -> None:
+    if cell[0] is None:
+        return
+    try:
+        frame_clock.unsubscribe(cell[0])
+    except RuntimeError:
+        pass        # the clock itself is already gone (app teardown)
+
+
+class FrameTimer(QObject):
+    """QTimer-shaped subscription to the shared frame clock.
+
+    ``timeout`` fires on display frames at least ``interval()`` ms apart while
+    started. ``gate`` (a QWidget) pauses it while that widget is hidden,
+    without changing isActive(); the clock resumes on the gate's next show.
+    """
+
+    timeout = Signal()
+
+    def __init__(self, parent=None, *, name: str = "", gate=None, clock=None):
+        super().__init__(parent)
+        self._interval = 0
+        self._name = name
+        self._gate = gate
+        self._clock = clock
+        # Token lives in a cell the destroyed-handler can reach without the
+        # (by then dead) wrapper, so a timer deleted with its parent while
+        # started doesn't leave a subscription emitting into a freed object.
+        self._cell: list[int | None] = [None]
+        frame_clock = self._frame_clock()
+        cell = self._cell
+        self.destroyed.connect(lambda *_: _drop_subscription(frame_clock, cell))
+        if gate is not None:
+            gate.installEventFilter(self)
+
+    def _frame_clock(self) -> FrameClock:
+        return self._clock if self._clock is not None else shared_clock()
+
+    def setInterval(self, ms: int) -> None:
+        self._interval = int(ms)
+        if self._cell[0] is not None:
+            self.start()
+
+    def interval(self) -> int:
+        return self._interval
+
+    def isActive(self) -> bool:
+        return self._cell[0] is not None
+
+    def start(self, ms: int | None = None) -> None:
+        if ms is not None:
+            self._interval = int(ms)
+        self.stop()
+        name = self._name or (self.parent().__class__.__name__
+                              if self.parent() is not None else "FrameTimer")
+        self._cell[0] = self._frame_clock().subscribe(
+            self.timeout.emit, self._interval, name=name, gate=self._gate)
+
+    def stop(self) -> None:
+        token, self._cell[0] = self._cell[0], None
+        if token is not None:
+            self._frame_clock().unsubscribe(token)
+
+    def eventFilter(self, obj, event):
+        if obj is self._gate and event.type() == QEvent.Show and self._cell[0] is not None:
+            self._frame_clock().wake()
+        return False
@@ -225,8 +225,8 @@ class GhostRendererCore:
         self._exempt_pids = frozenset(
             exempt_pids if exempt_pids is not None
             else (os.getpid(), os.getppid()))
-        # Per-target region inputs, valid for one snapshot identity:
-        # {target: (snapshot, inputs)} - multiple gloves alternate targets
+        # Per-target OcclusionIndex, valid for one snapshot identity:
+        # {target: (snapshot, index)} - multiple gloves alternate targets
         # every tick, so a single-entry cache would thrash.
         self._inputs_cache: dict[int, tuple] = {}
         # Sprite-canvas mode: one static window per screen (lazy-built at
@@ -424,8 +424,7 @@ class GhostRendererCore:
             return None
         from PySide6.QtCore import QRect
         from tabs.multitoon._ghost_cursors import (
-            CURSOR_SIZE, HOTSPOT, _darwin_zorder_snapshot,
-            _region_from_inputs, _scan_region_inputs,
+            CURSOR_SIZE, HOTSPOT, _darwin_zorder_snapshot, _occlusion_index_for,
         )
         snapshot = _darwin_zorder_snapshot()
         if snapshot is None:
@@ -436,14 +435,9 @@ class GhostRendererCore:
             return None
         glove = QRect(int(x) - HOTSPOT[0], int(y) - HOTSPOT[1],
                       CURSOR_SIZE, CURSOR_SIZE)
-        cached = self._inputs_cache.get(target)
-        if cached is not None and cached[0] is snapshot:
-            inputs = cached[1]
-        else:
-            inputs = _scan_region_inputs(target, snapshot, self._exempt_pids,
-                                         lambda a, b: (a, b))
-            self._inputs_cache[target] = (snapshot, inputs)
-        return _region_from_inputs(glove, inputs)
+        index = _occlusion_index_for(self._inputs_cache, target, snapshot,
+                                     self._exempt_pids, lambda a, b: (a, b))
+        return index.visible_region(glove)
 
     def _sweep(self, now: float) -> None:
         """Idle fades + occlusion refresh for stationary gloves (the same
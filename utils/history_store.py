@@ -0,0 +1,285 @@
+"""Embedded SQLite store for per-account history (recent toons, recent launches).
+
+The recent-toon and recent-launch stores used to keep their whole documents
+inside settings.json: every read deep-copied the full document and every
+record() rewrote the whole settings file, so radial-menu open and launch-page
+paint scaled with total history size.
+
+``HistoryStore`` keeps them in ``<config_dir>/history.sqlite3`` (WAL journal)
+as typed tables:
+
+  toons      (account_id, toon_name) PK
+  primaries  account_id PK -> toon_name
+  launches   account_id PK, ordered by a monotonic ``seen`` stamp
+  meta       one-time import markers
+
+Reads never touch SQLite: they are served from an immutable in-memory
+snapshot (tuples in a read-only mapping) loaded once at open. A write upserts
+only the affected rows and swaps in a new snapshot entry for that one
+account, so a read costs O(that account's rows) no matter how many accounts
+exist.
+
+The legacy settings.json keys are imported once (tracked in ``meta``) and
+then left in place untouched, so a downgrade still finds its old history.
+
+Toon rows are plain tuples in ``ToonRecord`` field order (toon_name, game,
+dna, laff, max_laff, species, accent); utils/recent_toons.py wraps them.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import weakref
+from types import MappingProxyType
+
+_FILENAME = "history.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS toons (
+    account_id TEXT NOT NULL,
+    toon_name  TEXT NOT NULL,
+    game       TEXT NOT NULL,
+    dna        TEXT NOT NULL DEFAULT '',
+    laff       INTEGER,
+    max_laff   INTEGER,
+    species    TEXT,
+    accent     TEXT,
+    seen       INTEGER NOT NULL,
+    PRIMARY KEY (account_id, toon_name)
+);
+CREATE TABLE IF NOT EXISTS primaries (
+    account_id TEXT PRIMARY KEY,
+    toon_name  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS launches (
+    account_id TEXT PRIMARY KEY,
+    seen       INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_TOON_COLS = "toon_name, game, dna, laff, max_laff, species, accent"
+
+_EMPTY = MappingProxyType({})
+
+
+class HistoryStore:
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = self._open(path)
+        self._seq = 0
+        self.writes = 0            # committed write transactions (tests/diagnostics)
+        self._load_snapshot()
+
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(path, check_same_thread=False)
+            if path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                try:
+                    os.chmod(path, 0o600)
+                except OSError:
+                    pass
+            conn.executescript(_SCHEMA)
+            return conn
+        except sqlite3.Error as e:
+            # A locked/corrupt file must not take the launcher down: run on an
+            # in-memory store for this session (history just won't persist).
+            print(f"[HistoryStore] Failed to open {path}: {e}; using memory store")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _load_snapshot(self) -> None:
+        c = self._conn
+        toons: dict[str, list] = {}
+        for row in c.execute(
+                f"SELECT account_id, {_TOON_COLS} FROM toons "
+                f"ORDER BY account_id, seen DESC"):
+            toons.setdefault(row[0], []).append(tuple(row[1:]))
+        self._toons = MappingProxyType({a: tuple(r) for a, r in toons.items()})
+        self._primaries = MappingProxyType(dict(c.execute(
+            "SELECT account_id, toon_name FROM primaries")))
+        self._launches = tuple(a for (a,) in c.execute(
+            "SELECT account_id FROM launches ORDER BY seen DESC"))
+        self._seq = max(
+            c.execute("SELECT COALESCE(MAX(seen), 0) FROM toons").fetchone()[0],
+            c.execute("SELECT COALESCE(MAX(seen), 0) FROM launches").fetchone()[0])
+
+    def _next_seen(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    # -- Reads (snapshot only) ------------------------------------------------
+
+    def toons(self, account_id: str) -> tuple:
+        """Toon rows for one account, most recent first."""
+        return self._toons.get(account_id, ())
+
+    def primary(self, account_id: str) -> str | None:
+        return self._primaries.get(account_id)
+
+    def launches(self) -> tuple:
+        """Launched account IDs, most recent first."""
+        return self._launches
+
+    # -- Writes (row upserts) -------------------------------------------------
+    # Each write reads the current snapshot, merges and commits under _lock:
+    # two threads recording for the same account must not both merge against
+    # the same snapshot and drop each other's row.
+
+    def record_toon(self, account_id: str, row: tuple, cap: int) -> bool:
+        """Upsert one toon row at the front of ``account_id``'s history.
+        ``row`` is in ToonRecord order; None in the laff/max_laff/species/
+        accent slots keeps the stored value. Rows past ``cap`` are dropped
+        (and a primary pointing at one is cleared). Returns False without
+        touching the file when the result would be identical."""
+        name = row[0]
+        with self._lock:
+            current = self.toons(account_id)
+            existing = next((r for r in current if r[0] == name), None)
+            merged = tuple(row[:3]) + tuple(
+                new if new is not None else (old if existing is not None else None)
+                for new, old in zip(row[3:], existing[3:] if existing else (None,) * 4))
+            if current and current[0] == merged:
+                return False
+            rows = (merged,) + tuple(r for r in current if r[0] != name)
+            kept, dropped = rows[:cap], rows[cap:]
+            primary = self._primaries.get(account_id)
+            clear_primary = primary is not None and all(r[0] != primary for r in kept)
+            with self._conn:
+                self._conn.execute(
+                    f"INSERT INTO toons (account_id, {_TOON_COLS}, seen) "
+                    f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    f"ON CONFLICT (account_id, toon_name) DO UPDATE SET "
+                    f"game = excluded.game, dna = excluded.dna, "
+                    f"laff = excluded.laff, max_laff = excluded.max_laff, "
+                    f"species = excluded.species, accent = excluded.accent, "
+                    f"seen = excluded.seen",
+                    (account_id, *merged, self._next_seen()))
+                self._conn.executemany(
+                    "DELETE FROM toons WHERE account_id = ? AND toon_name = ?",
+                    [(account_id, r[0]) for r in dropped])
+                if clear_primary:
+                    self._conn.execute(
+                        "DELETE FROM primaries WHERE account_id = ?", (account_id,))
+            self.writes += 1
+            self._toons = MappingProxyType({**self._toons, account_id: kept})
+            if clear_primary:
+                self._primaries = MappingProxyType(
+                    {a: n for a, n in self._primaries.items() if a != account_id})
+        return True
+
+    def set_primary(self, account_id: str, toon_name: str) -> bool:
+        with self._lock:
+            if all(r[0] != toon_name for r in self.toons(account_id)):
+                return False
+            if self._primaries.get(account_id) == toon_name:
+                return False
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO primaries (account_id, toon_name) VALUES (?, ?) "
+                    "ON CONFLICT (account_id) DO UPDATE SET toon_name = excluded.toon_name",
+                    (account_id, toon_name))
+            self.writes += 1
+            self._primaries = MappingProxyType({**self._primaries, account_id: toon_name})
+        return True
+
+    def record_launch(self, account_id: str, cap: int) -> bool:
+        with self._lock:
+            current = self._launches
+            if current and current[0] == account_id:
+                return False
+            ids = (account_id,) + tuple(a for a in current if a != account_id)
+            kept, dropped = ids[:cap], ids[cap:]
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO launches (account_id, seen) VALUES (?, ?) "
+                    "ON CONFLICT (account_id) DO UPDATE SET seen = excluded.seen",
+                    (account_id, self._next_seen()))
+                self._conn.executemany(
+                    "DELETE FROM launches WHERE account_id = ?",
+                    [(a,) for a in dropped])
+            self.writes += 1
+            self._launches = kept
+        return True
+
+    # -- One-time legacy import ---------------------------------------------
+
+    def imported(self, name: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM meta WHERE key = ?", (f"import:{name}",)).fetchone() is not None
+
+    def import_legacy(self, name: str, toons=None, primaries=None, launches=None) -> None:
+        """Bulk-load legacy history once. ``toons`` maps account_id to rows
+        (most recent first); ``launches`` is account IDs, most recent first.
+        A second call for the same ``name`` is a no-op."""
+        if self.imported(name):
+            return
+        with self._lock:
+            with self._conn:
+                for aid, rows in (toons or {}).items():
+                    for row in reversed(rows):      # oldest gets the lowest stamp
+                        self._conn.execute(
+                            f"INSERT OR IGNORE INTO toons (account_id, {_TOON_COLS}, seen) "
+                            f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (aid, *row, self._next_seen()))
+                for aid, tname in (primaries or {}).items():
+                    self._conn.execute(
+                        "INSERT OR IGNORE INTO primaries (account_id, toon_name) VALUES (?, ?)",
+                        (aid, tname))
+                for aid in reversed(list(launches or ())):
+                    self._conn.execute(
+                        "INSERT OR IGNORE INTO launches (account_id, seen) VALUES (?, ?)",
+                        (aid, self._next_seen()))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, '1')",
+                    (f"import:{name}",))
+            self._load_snapshot()
+
+
+# One store per settings manager: the real SettingsManager maps to the file
+# beside settings.json; a settings stand-in without a settings_path (tests,
+# tooling) gets a private in-memory store. Weak keys so a discarded stand-in
+# takes its store with it.
+_by_settings: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_by_path: dict[str, HistoryStore] = {}
+_registry_lock = threading.Lock()
+
+
+def store_for(settings_manager) -> HistoryStore | None:
+    if settings_manager is None:
+        return None
+    with _registry_lock:
+        try:
+            store = _by_settings.get(settings_manager)
+        except TypeError:          # not weak-referenceable
+            store = None
+        if store is not None:
+            return store
+        settings_path = getattr(settings_manager, "settings_path", None)
+        if isinstance(settings_path, str) and settings_path:
+            path = os.path.join(os.path.dirname(settings_path), _FILENAME)
+            store = _by_path.get(path)
+            if store is None:
+                store = _by_path[path] = HistoryStore(path)
+        else:
+            store = HistoryStore()
+        try:
+            _by_settings[settings_manager] = store
+        except TypeError:
+            pass
+        return store
@@ -0,0 +1,299 @@
+"""Long-lived host-side command runner for the Flatpak build.
+
+Every host_run / host_check_output under Flatpak used to launch a fresh
+`flatpak-spawn --host` (a D-Bus round trip to flatpak-session-helper plus a
+process launch), including the periodic probes. This module starts ONE
+`flatpak-spawn --host python3 -c <_HELPER_SOURCE>` per session and sends it
+short commands as JSON lines over its stdin/stdout; the helper runs each on
+the host and answers with exit code, stdout and stderr. Requests carry an
+id, so concurrent callers share the one channel.
+
+Behaviour mirrors the flatpak-spawn path: the command runs with the host
+session environment (flatpak-spawn never forwarded the caller's `env`
+either), in the caller's cwd, and timeouts / check / text mode raise and
+return exactly what subprocess.run would. Anything the channel cannot
+express (stdin handles, pass_fds, file objects as stdout...) returns None
+from run() and the caller spawns as before. So does a host without python3,
+a helper that died, or TTMT_HOST_HELPER=0.
+"""
+
+from __future__ import annotations
+
+import base64
+import itertools
+import json
+import locale
+import os
+import subprocess
+import threading
+
+_HELPER_PYTHON = "python3"
+_READY_TIMEOUT_S = 5.0
+# Added to a request's own timeout before the channel itself is presumed dead.
+_RESPONSE_GRACE_S = 10.0
+
+_HELPER_SOURCE = r'''
+import base64, json, os, subprocess, sys, threading
+
+out = os.fdopen(1, "wb", 0)
+out_lock = threading.Lock()
+sys.stdout = sys.stderr
+
+
+def send(msg):
+    line = (json.dumps(msg) + "\n").encode()
+    with out_lock:
+        out.write(line)
+
+
+def b64(data):
+    return base64.b64encode(data or b"").decode()
+
+
+def handle(req):
+    rid = req["id"]
+    streams = {"pipe": subprocess.PIPE, "devnull": subprocess.DEVNULL,
+               "stdout": subprocess.STDOUT}
+    data = req.get("input")
+    try:
+        proc = subprocess.Popen(
+            req["argv"], cwd=req.get("cwd"),
+            stdin=subprocess.PIPE if data is not None else subprocess.DEVNULL,
+            stdout=streams[req["stdout"]], stderr=streams[req["stderr"]])
+    except OSError as exc:
+        send({"id": rid, "rc": 1, "stdout": "", "timed_out": False,
+              "stderr": b64(("Portal call failed: Failed to start command: %s\n"
+                             % exc).encode())})
+        return
+    timed_out = False
+    try:
+        so, se = proc.communicate(
+            base64.b64decode(data) if data is not None else None,
+            timeout=req.get("timeout"))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        so, se = proc.communicate()
+        timed_out = True
+    send({"id": rid, "rc": proc.returncode, "stdout": b64(so),
+          "stderr": b64(se), "timed_out": timed_out})
+
+
+send({"ready": True, "pid": os.getpid()})
+for raw in sys.stdin.buffer:
+    try:
+        req = json.loads(raw)
+    except ValueError:
+        continue
+    threading.Thread(target=handle, args=(req,), daemon=True).start()
+'''
+
+_ALLOWED_KWARGS = frozenset({
+    "capture_output", "stdout", "stderr", "input", "text", "universal_newlines",
+    "encoding", "errors", "timeout", "check", "env", "cwd",
+})
+
+
+class _HelperDied(Exception):
+    pass
+
+
+def _stream_mode(value, allow_stdout: bool):
+    """Channel name for a subprocess stdout/stderr argument, or None if the
+    channel cannot express it. Inherited streams are captured and replayed
+    to this process's own fd afterwards."""
+    if value is None:
+        return "inherit"
+    if value == subprocess.PIPE:
+        return "pipe"
+    if value == subprocess.DEVNULL:
+        return "devnull"
+    if allow_stdout and value == subprocess.STDOUT:
+        return "stdout"
+    return None
+
+
+class HostHelper:
+    """Client end of the helper channel. One per process (see run())."""
+
+    def __init__(self, argv: list):
+        self._proc = subprocess.Popen(
+            argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            env=_helper_env())
+        self._write_lock = threading.Lock()
+        self._pending: dict[int, list] = {}   # id -> [Event, response]
+        self._pending_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._ready = threading.Event()
+        self.alive = True
+        threading.Thread(target=self._read_loop, daemon=True,
+                         name="HostHelperReader").start()
+        if not self._ready.wait(_READY_TIMEOUT_S) or not self.alive:
+            self.close()
+            raise _HelperDied("host helper did not start")
+
+    def _read_loop(self) -> None:
+        try:
+            for raw in self._proc.stdout:
+                try:
+                    msg = json.loads(raw)
+                except ValueError:
+                    continue
+                if msg.get("ready"):
+                    self._ready.set()
+                    continue
+                with self._pending_lock:
+                    slot = self._pending.pop(msg.get("id"), None)
+                if slot is not None:
+                    slot[1] = msg
+                    slot[0].set()
+        except (OSError, ValueError):
+            pass
+        self.alive = False
+        self._ready.set()
+        with self._pending_lock:
+            slots, self._pending = list(self._pending.values()), {}
+        for slot in slots:
+            slot[0].set()
+
+    def request(self, argv, stdout: str, stderr: str, data: bytes | None,
+                cwd, timeout) -> dict:
+        rid = next(self._ids)
+        slot = [threading.Event(), None]
+        with self._pending_lock:
+            if not self.alive:
+                raise _HelperDied("host helper exited")
+            self._pending[rid] = slot
+        msg = {"id": rid, "argv": [os.fspath(a) for a in argv],
+               "stdout": stdout, "stderr": stderr, "timeout": timeout,
+               "cwd": os.fspath(cwd) if cwd is not None else os.getcwd(),
+               "input": base64.b64encode(data).decode() if data is not None else None}
+        line = (json.dumps(msg) + "\n").encode()
+        try:
+            with self._write_lock:
+                self._proc.stdin.write(line)
+                self._proc.stdin.flush()
+        except (OSError, ValueError) as exc:
+            self.alive = False
+            raise _HelperDied(str(exc)) from exc
+        wait = None if timeout is None else timeout + _RESPONSE_GRACE_S
+        if not slot[0].wait(wait) or slot[1] is None:
+            with self._pending_lock:
+                self._pending.pop(rid, None)
+            raise _HelperDied("no response from host helper")
+        return slot[1]
+
+    def close(self) -> None:
+        self.alive = False
+        try:
+            self._proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
+def _helper_env() -> dict:
+    from utils.host_spawn import _clean_host_env
+    return _clean_host_env()
+
+
+_helper: HostHelper | None = None
+_helper_lock = threading.Lock()
+_helper_disabled = False
+
+
+def enabled() -> bool:
+    return (not _helper_disabled
+            and os.environ.get("TTMT_HOST_HELPER", "1").strip().lower()
+            not in ("0", "false", "no", "off"))
+
+
+def _get_helper() -> HostHelper | None:
+    global _helper, _helper_disabled
+    with _helper_lock:
+        if _helper is not None and _helper.alive:
+            return _helper
+        if _helper_disabled:
+            return None
+        from utils.host_spawn import host_argv
+        try:
+            spawn, host_flag, *cmd = host_argv([_HELPER_PYTHON, "-u", "-c", _HELPER_SOURCE])
+            # --watch-bus: the host side exits with us even if the pipe lingers.
+            _helper = HostHelper([spawn, host_flag, "--watch-bus", *cmd])
+        except (OSError, _HelperDied) as exc:
+            print(f"[host_helper] unavailable, spawning per command: {exc}")
+            _helper = None
+            _helper_disabled = True
+        return _helper
+
+
+def shutdown() -> None:
+    """Stop the helper (tests, app exit). The next run() starts a new one."""
+    global _helper, _helper_disabled
+    with _helper_lock:
+        if _helper is not None:
+            _helper.close()
+        _helper = None
+        _helper_disabled = False
+
+
+def _decode(data: bytes, encoding, errors):
+    text = data.decode(encoding or locale.getpreferredencoding(False), errors or "strict")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def run(argv, cmd, kwargs: dict):
+    """subprocess.run(cmd, **kwargs) semantics for host command `argv`, sent
+    over the helper channel. `cmd` is the flatpak-spawn argv the caller
+    would have spawned; it is what CompletedProcess.args and raised errors
+    report, as before. Returns None when the call must be spawned instead."""
+    if not enabled() or not _ALLOWED_KWARGS.issuperset(kwargs):
+        return None
+    if kwargs.get("capture_output"):
+        if kwargs.get("stdout") is not None or kwargs.get("stderr") is not None:
+            return None   # subprocess.run raises ValueError; let it.
+        out_mode = err_mode = "pipe"
+    else:
+        out_mode = _stream_mode(kwargs.get("stdout"), allow_stdout=False)
+        err_mode = _stream_mode(kwargs.get("stderr"), allow_stdout=True)
+    if out_mode is None or err_mode is None:
+        return None
+    text = bool(kwargs.get("text") or kwargs.get("universal_newlines")
+                or kwargs.get("encoding") or kwargs.get("errors"))
+    data = kwargs.get("input")
+    if isinstance(data, str):
+        data = data.encode(kwargs.get("encoding") or locale.getpreferredencoding(False),
+                           kwargs.get("errors") or "strict")
+    helper = _get_helper()
+    if helper is None:
+        return None
+    timeout = kwargs.get("timeout")
+    try:
+        resp = helper.request(
+            argv,
+            "pipe" if out_mode == "inherit" else out_mode,
+            "pipe" if err_mode == "inherit" else err_mode,
+            data, kwargs.get("cwd"), timeout)
+    except _HelperDied as exc:
+        print(f"[host_helper] {exc}; spawning instead")
+        return None
+    stdout = base64.b64decode(resp["stdout"])
+    stderr = base64.b64decode(resp["stderr"])
+    if out_mode == "inherit" and stdout:
+        os.write(1, stdout)
+    if err_mode == "inherit" and stderr:
+        os.write(2, stderr)
+    out = stdout if out_mode == "pipe" else None
+    err = stderr if err_mode == "pipe" else None
+    if text:
+        enc, errs = kwargs.get("encoding"), kwargs.get("errors")
+        out = _decode(out, enc, errs) if out is not None else None
+        err = _decode(err, enc, errs) if err is not None else None
+    if resp.get("timed_out"):
+        raise subprocess.TimeoutExpired(cmd, timeout, output=out, stderr=err)
+    result = subprocess.CompletedProcess(cmd, resp["rc"], out, err)
+    if kwargs.get("check"):
+        result.check_returncode()
+    return result
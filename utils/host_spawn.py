@@ -63,13 +63,28 @@ def _clean_host_env() -> dict:
 def host_run(argv, **kwargs):
     if "env" not in kwargs:
         kwargs["env"] = _clean_host_env()
-    return subprocess.run(host_argv(argv), **kwargs)
+    cmd = host_argv(argv)
+    if in_flatpak():
+        # Short commands ride the long-lived host helper instead of paying a
+        # flatpak-spawn launch each; None means "spawn as before".
+        from utils import host_helper
+        result = host_helper.run(argv, cmd, kwargs)
+        if result is not None:
+            return result
+    return subprocess.run(cmd, **kwargs)
 
 
 def host_check_output(argv, **kwargs):
     if "env" not in kwargs:
         kwargs["env"] = _clean_host_env()
-    return subprocess.check_output(host_argv(argv), **kwargs)
+    cmd = host_argv(argv)
+    if in_flatpak() and "stdout" not in kwargs:
+        from utils import host_helper
+        result = host_helper.run(
+            argv, cmd, dict(kwargs, stdout=subprocess.PIPE, check=True))
+        if result is not None:
+            return result.stdout
+    return subprocess.check_output(cmd, **kwargs)
 
 
 # Env vars whose values are meaningful only inside the Flatpak sandbox.
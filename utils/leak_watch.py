@@ -0,0 +1,156 @@
+"""Long-session memory sampler for the soak harness (scripts/soak_memory.py).
+
+Each ``sample()`` records process RSS, live Qt object counts and a
+``tracemalloc`` snapshot. ``top_growers()`` diffs the newest snapshot against
+the post-warm-up baseline (allocation sites, largest growth first) and
+``verdict()`` fails when a tracked series keeps climbing after warm-up - a
+plateau after startup is fine, a steady staircase is a leak.
+
+Qt-optional: with no QApplication the Qt counts are simply zero, so the
+sampler also works for pure-Python soak loops and unit tests.
+"""
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+
+# Fraction of post-warm-up steps that must rise for a series to count as
+# climbing, and the minimum net relative growth across them. Together they
+# tolerate allocator noise and one-off cache fills.
+CLIMB_STEP_FRACTION = 0.8
+CLIMB_MIN_GROWTH = 0.05
+# Absolute growth below which a series is noise regardless of its shape (the
+# sampler's own bookkeeping grows traced bytes by a few KiB per sample).
+_ABS_FLOOR = {"rss": 1 << 20, "traced_bytes": 64 << 10,
+              "qt_objects": 1, "qt_widgets": 1}
+
+
+@dataclass(frozen=True)
+class LeakSample:
+    step: int
+    rss: int
+    qt_objects: int
+    qt_widgets: int
+    traced_bytes: int
+
+
+@dataclass
+class LeakVerdict:
+    ok: bool
+    reasons: list[str] = field(default_factory=list)
+
+
+def is_climbing(values, warmup: int,
+                step_fraction: float = CLIMB_STEP_FRACTION,
+                min_growth: float = CLIMB_MIN_GROWTH,
+                min_abs: float = 0) -> bool:
+    """True when ``values`` (after the first ``warmup`` points) rises in at
+    least ``step_fraction`` of its steps AND grows by ``min_growth`` (relative)
+    and ``min_abs`` (absolute) overall. Fewer than three post-warm-up points
+    is never a verdict."""
+    tail = list(values)[warmup:]
+    if len(tail) < 3:
+        return False
+    if tail[-1] - tail[0] < min_abs:
+        return False
+    rises = sum(1 for a, b in zip(tail, tail[1:]) if b > a)
+    if rises < step_fraction * (len(tail) - 1):
+        return False
+    base = tail[0]
+    if base <= 0:
+        return tail[-1] > 0
+    return (tail[-1] - base) / base >= min_growth
+
+
+def _rss() -> int:
+    try:
+        import psutil
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        return 0
+
+
+def _qt_counts() -> tuple[int, int]:
+    """(live Python-wrapped QObjects, QApplication.allWidgets())."""
+    try:
+        from PySide6.QtCore import QObject
+        from PySide6.QtWidgets import QApplication
+    except ImportError:
+        return 0, 0
+    app = QApplication.instance()
+    widgets = len(app.allWidgets()) if app is not None else 0
+    objects = sum(1 for o in gc.get_objects() if isinstance(o, QObject))
+    return objects, widgets
+
+
+class LeakWatch:
+    """Periodic sampler. Call ``start()`` once, ``sample()`` at a fixed
+    cadence of synthetic work, then read ``top_growers()`` / ``verdict()``."""
+
+    def __init__(self, warmup: int = 3, frames: int = 8):
+        self.warmup = max(0, int(warmup))
+        self._frames = frames
+        self.samples: list[LeakSample] = []
+        self._baseline = None
+        self._latest = None
+        self._started_tracing = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def sample(self) -> LeakSample:
+        gc.collect()
+        snap = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        objects, widgets = _qt_counts()
+        traced = tracemalloc.get_traced_memory()[0] if snap is not None else 0
+        s = LeakSample(step=len(self.samples), rss=_rss(), qt_objects=objects,
+                       qt_widgets=widgets, traced_bytes=traced)
+        self.samples.append(s)
+        if snap is not None:
+            if len(self.samples) == self.warmup + 1 or self._baseline is None:
+                self._baseline = snap
+            self._latest = snap
+        return s
+
+    def top_growers(self, limit: int = 10) -> list[str]:
+        """Allocation sites that grew most since the post-warm-up baseline,
+        formatted ``"file:line +N KiB (+M blocks)"``."""
+        if self._baseline is None or self._latest is None \
+                or self._latest is self._baseline:
+            return []
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, "<frozen importlib._bootstrap>")]
+        base = self._baseline.filter_traces(filters)
+        latest = self._latest.filter_traces(filters)
+        out = []
+        for stat in latest.compare_to(base, "lineno")[:limit]:
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            out.append(f"{frame.filename}:{frame.lineno} "
+                       f"+{stat.size_diff / 1024:.1f} KiB "
+                       f"(+{stat.count_diff} blocks)")
+        return out
+
+    def verdict(self) -> LeakVerdict:
+        reasons = []
+        series = {
+            "rss": [s.rss for s in self.samples],
+            "traced_bytes": [s.traced_bytes for s in self.samples],
+            "qt_objects": [s.qt_objects for s in self.samples],
+            "qt_widgets": [s.qt_widgets for s in self.samples],
+        }
+        for name, values in series.items():
+            if is_climbing(values, self.warmup, min_abs=_ABS_FLOOR[name]):
+                tail = values[self.warmup:]
+                reasons.append(f"{name} kept climbing after warm-up: "
+                               f"{tail[0]} -> {tail[-1]}")
+        return LeakVerdict(ok=not reasons, reasons=reasons)
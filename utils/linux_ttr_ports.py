@@ -0,0 +1,129 @@
+"""Linux port->host-PID mapping for ttr_api, read straight from /proc.
+
+Replaces spawning `ss -tlnp` on every full scan (a flatpak-spawn round trip
+under Flatpak, 5 s timeout). LISTEN sockets come from /proc/net/tcp{,6};
+each socket inode is attributed to a PID by walking /proc/<pid>/fd of the
+TTREngine processes only, and the inode->pid result is cached for as long
+as the socket keeps listening.
+
+Returns None whenever the answer cannot be trusted (inside a Flatpak
+sandbox /proc shows sandbox PIDs, not host PIDs; no /proc; no visible
+TTREngine process owning a listener) so the caller falls back to ss."""
+from __future__ import annotations
+
+import os
+import threading
+
+_PROC_ROOT = "/proc"
+_ENGINE_COMM = "TTREngine"
+_TCP_LISTEN = "0A"
+
+# socket inode -> owning pid, or None for a listener owned by something that
+# is not a visible TTREngine (kept so it is not re-walked every scan). Pruned
+# to the inodes still listening on each call.
+_inode_pid: dict[int, int | None] = {}
+_inode_pid_lock = threading.Lock()
+
+
+def _listen_inodes(lo: int, hi: int) -> dict:
+    """{inode: port} for TCP/TCP6 LISTEN sockets whose local port is in
+    [lo, hi]. Missing tables are skipped; raises OSError only if neither is
+    readable."""
+    found = {}
+    readable = False
+    for table in ("tcp", "tcp6"):
+        try:
+            with open(f"{_PROC_ROOT}/net/{table}") as fh:
+                lines = fh.read().splitlines()[1:]
+        except OSError:
+            continue
+        readable = True
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 10 or fields[3] != _TCP_LISTEN:
+                continue
+            port = int(fields[1].rsplit(":", 1)[1], 16)
+            if lo <= port <= hi:
+                inode = int(fields[9])
+                if inode:
+                    found[inode] = port
+    if not readable:
+        raise OSError(f"{_PROC_ROOT}/net/tcp unreadable")
+    return found
+
+
+def _engine_pids() -> list:
+    """PIDs whose comm is the TTR engine, in ascending order (ss reports the
+    same process name from the same field)."""
+    pids = []
+    for name in os.listdir(_PROC_ROOT):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"{_PROC_ROOT}/{name}/comm") as fh:
+                if _ENGINE_COMM in fh.read():
+                    pids.append(int(name))
+        except OSError:
+            continue
+    pids.sort()
+    return pids
+
+
+def _attribute(inodes, pids) -> dict:
+    """{inode: pid} for the wanted socket inodes found among pids' fds."""
+    wanted = {f"socket:[{inode}]": inode for inode in inodes}
+    owners = {}
+    for pid in pids:
+        fd_dir = f"{_PROC_ROOT}/{pid}/fd"
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(f"{fd_dir}/{fd}")
+            except OSError:
+                continue
+            inode = wanted.get(target)
+            if inode is not None and inode not in owners:
+                owners[inode] = pid
+                if len(owners) == len(wanted):
+                    return owners
+    return owners
+
+
+def port_to_host_pid(lo: int, hi: int) -> dict | None:
+    """{port: pid} for TTREngine LISTEN sockets on ports [lo, hi], or None
+    when /proc cannot answer for the host and the caller should use ss."""
+    from utils.host_spawn import in_flatpak
+    if in_flatpak():
+        return None
+    try:
+        listening = _listen_inodes(lo, hi)
+    except OSError:
+        return None
+    with _inode_pid_lock:
+        for inode in list(_inode_pid):
+            if inode not in listening:
+                del _inode_pid[inode]
+        unknown = [inode for inode in listening if inode not in _inode_pid]
+        if unknown:
+            try:
+                pids = _engine_pids()
+            except OSError:
+                return None
+            if not pids:
+                # A game listener with no visible engine process (another PID
+                # namespace, hidepid=...): /proc cannot attribute it.
+                return None
+            owners = _attribute(unknown, pids)
+            for inode in unknown:
+                _inode_pid[inode] = owners.get(inode)
+        return {port: _inode_pid[inode]
+                for inode, port in listening.items()
+                if _inode_pid[inode] is not None}
+
+
+def reset_cache() -> None:
+    with _inode_pid_lock:
+        _inode_pid.clear()
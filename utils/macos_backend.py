@@ -108,6 +108,7 @@ class MacOSBackend:
         from utils import macos_discovery
         now = time.time()
         if now - self._cache["t"] > _CACHE_TTL:
+            old = self._cache["valid"]
             try:
                 self._cache["valid"] = {
                     str(r.window_id): (r.pid, r.bundle_id)
@@ -118,6 +119,16 @@ class MacOSBackend:
                 # treat as "no valid targets" until the next refresh succeeds.
                 self._cache["valid"] = {}
             self._cache["t"] = now
+            new = self._cache["valid"]
+            churned = [wid for wid, entry in old.items() if new.get(wid) != entry]
+            # A helper-backed engine caches per-window psn/owner; a window that closed
+            # or changed owner must be re-resolved, never served from that cache.
+            forget = getattr(self._delivery, "forget_windows", None)
+            if churned and callable(forget):
+                try:
+                    forget(churned)
+                except Exception:
+                    pass
         return self._cache["valid"]
 
     def _resolve_pid(self, win_id_str: str):
@@ -321,7 +332,12 @@ class MacOSBackend:
         if bound_creation is not None and cur_creation is not None and cur_creation != bound_creation:
             return True
         try:
-            cur_owner = self._engine().resolve_owner(wid)
+            eng = self._engine()
+            # The reuse probe must see the LIVE owner, not a cached resolution.
+            forget = getattr(eng, "forget_windows", None)
+            if callable(forget):
+                forget((wid,))
+            cur_owner = eng.resolve_owner(wid)
         except Exception:
             cur_owner = None
         if bound_owner is not None and cur_owner is not None and cur_owner != bound_owner:
@@ -372,18 +388,46 @@ class MacOSBackend:
             return False
         return self._engine().release(pid, wid, psn, (x, y), (root_x, root_y))
 
-    def send_motion(self, win_id_str, x, y, root_x, root_y,
-                    state=0, time=0) -> bool:
+    def _motion_target(self, win_id_str, state):
+        """(pid, wid, psn, dragging) a motion to this window posts to, or None."""
         dragging = bool(state & _BUTTON1_MASK)   # left-button held = the drag we mirror
         if dragging:
             bound = self._bindings.get(str(win_id_str))
             if bound is None:
-                return False   # a drag with NO press binding is DROPPED, never fresh-resolved (spec §3.2)
+                return None   # a drag with NO press binding is DROPPED, never fresh-resolved (spec §3.2)
             pid, wid, psn, _owner, _creation = bound       # frozen press binding
-            return self._engine().motion(pid, wid, psn, (x, y), (root_x, root_y), dragging=True)
+            return (pid, wid, psn, True)
         # HOVER (no button held): fresh-resolve (no gesture binding exists for hover)
         target = self._resolve_target(win_id_str)
         if target is None:
-            return False
+            return None
         pid, wid, psn, _owner, _creation = target
-        return self._engine().motion(pid, wid, psn, (x, y), (root_x, root_y), dragging=False)
+        return (pid, wid, psn, False)
+
+    def send_motion(self, win_id_str, x, y, root_x, root_y,
+                    state=0, time=0) -> bool:
+        target = self._motion_target(win_id_str, state)
+        if target is None:
+            return False
+        pid, wid, psn, dragging = target
+        return self._engine().motion(pid, wid, psn, (x, y), (root_x, root_y), dragging=dragging)
+
+    def send_motion_many(self, motions) -> bool:
+        """One motion fan-out: `motions` is [(win_id_str, x, y, root_x, root_y, state)].
+        Each window resolves exactly as send_motion would; an engine with post_fanout
+        (the helper) receives the lot as ONE frame instead of one RPC line per window.
+        True iff every window was posted to."""
+        eng = self._engine()
+        fanout = getattr(eng, "post_fanout", None)
+        if not callable(fanout):
+            return all([self.send_motion(w, x, y, rx, ry, state=st)
+                        for w, x, y, rx, ry, st in motions])
+        targets = []
+        for w, x, y, rx, ry, st in motions:
+            target = self._motion_target(w, st)
+            if target is not None:
+                pid, wid, psn, dragging = target
+                targets.append((pid, wid, psn, (x, y), (rx, ry), dragging))
+        if not targets:
+            return False
+        return fanout("motion", targets) and len(targets) == len(motions)
@@ -19,6 +19,13 @@ synchronous RPC that times out (the reader is deadline-bounded) treats the helpe
 as wedged: it latches `helper-timeout`, kills+reaps the child, and a short backoff
 defers the respawn to the next op. Every kill is followed by a wait() (reap), and a
 respawn reaps the prior child first, so no zombie accumulates.
+
+Fan-out: a gesture mirrored to N windows goes out as ONE `fanout` frame (one encode,
+one write) via post_fanout(), and the helper coalesces motion that queued in the
+pipe behind a slow post (newest-wins per window). Window -> (psn, owner) resolution
+is cached per window id (one `resolve` round trip on a miss) and dropped on window
+churn (forget_windows) and on every helper teardown. Helpers older than protocol 2
+get the per-window ops instead.
 """
 from __future__ import annotations
 
@@ -152,6 +159,10 @@ class _RemoteDelivery:
         self._ledger = ledger
         self._logf = None
         self._rbuf = b""   # byte buffer for the deadline-bounded line reader
+        self._protocol = 1   # helper protocol from the handshake (2: resolve + fanout)
+        # wid -> (psn, owner) for windows fully resolved by the CURRENT helper. Read
+        # lock-free on the hover path; written/cleared under _lock.
+        self._targets: dict[int, tuple] = {}
         # ---- lifecycle / circuit-breaker state (all guarded by _lock) ----
         self._closed = False             # shutdown() latches this; gates all respawns
         self._consec_failures = 0        # consecutive spawn/handshake failures
@@ -261,9 +272,13 @@ class _RemoteDelivery:
         if reply.get("preflight_post_access") is False:
             self._reason = "tcc-denied"
             return False
+        try:
+            self._protocol = int(reply.get("protocol") or 1)
+        except (TypeError, ValueError):
+            self._protocol = 1
         self._reason = None
         self._available = True
-        self._diag("handshake validated; helper available")
+        self._diag(f"handshake validated; helper available (protocol {self._protocol})")
         return True
 
     # ---- respawn lifecycle ----------------------------------------------------
@@ -419,19 +434,49 @@ class _RemoteDelivery:
         return self._reason
 
     def resolve_psn(self, wid):
-        if not self._ensure_alive():
-            return None
-        r = self._rpc("resolve_psn", wid=int(wid))
-        if not (r and r.get("ok")):
-            return None
-        h = r.get("psn") or ""
-        return bytes.fromhex(h) if h else None
+        return self._resolve(wid)[0]
 
     def resolve_owner(self, wid):
+        return self._resolve(wid)[1]
+
+    def _resolve(self, wid) -> tuple:
+        """(psn, owner) for a window, from the per-window cache when the current helper
+        already resolved it. A miss is ONE `resolve` round trip (two on a protocol-1
+        helper); only a fully resolved pair is cached, so a transient failure is retried
+        on the next op rather than remembered."""
         if not self._ensure_alive():
-            return None
-        r = self._rpc("resolve_owner", wid=int(wid))
-        return (r or {}).get("owner")
+            return (None, None)
+        wid = int(wid)
+        hit = self._targets.get(wid)
+        if hit is not None:
+            return hit
+        proc = self._proc
+        if self._protocol >= 2:
+            r = self._rpc("resolve", wid=wid)
+            if not (r and r.get("ok")):
+                return (None, None)
+            h = r.get("psn") or ""
+            found = (bytes.fromhex(h) if h else None, r.get("owner"))
+        else:
+            r = self._rpc("resolve_psn", wid=wid)
+            h = (r.get("psn") or "") if (r and r.get("ok")) else ""
+            owner = (self._rpc("resolve_owner", wid=wid) or {}).get("owner")
+            found = (bytes.fromhex(h) if h else None, owner)
+        if found[0] is not None and found[1] is not None:
+            with self._lock:
+                if self._proc is proc and proc is not None:   # not torn down meanwhile
+                    self._targets[wid] = found
+        return found
+
+    def forget_windows(self, wids) -> None:
+        """Drop cached resolutions for windows that closed or changed owner (the backend
+        calls this when its window enumeration churns), so a recycled id is re-resolved."""
+        with self._lock:
+            for wid in wids:
+                try:
+                    self._targets.pop(int(wid), None)
+                except (TypeError, ValueError):
+                    pass
 
     def _req(self, op, pid, wid, psn, win_xy, screen_xy, dragging=False):
         req = {
@@ -483,6 +528,23 @@ class _RemoteDelivery:
             return False
         return self._send_noreply(self._req("motion", pid, wid, psn, win_xy, screen_xy, dragging))
 
+    def post_fanout(self, op, targets) -> bool:
+        """Post one gesture op to several windows as a single `fanout` frame (one encode,
+        one write+flush) instead of one line per window. `targets` is a list of
+        (pid, wid, psn, win_xy, screen_xy, dragging); dragging only matters for motion.
+        Same fire-and-forget contract as press/release/motion."""
+        if not targets:
+            return True
+        if not self._ensure_alive():
+            return False
+        reqs = [self._req(op, pid, wid, psn, win_xy, screen_xy, dragging)
+                for pid, wid, psn, win_xy, screen_xy, dragging in targets]
+        if self._protocol < 2:
+            return all([self._send_noreply(r) for r in reqs])
+        for r in reqs:
+            del r["op"]
+        return self._send_noreply({"op": "fanout", "kind": op, "targets": reqs})
+
     # ---- teardown -------------------------------------------------------------
 
     def shutdown(self) -> None:
@@ -503,6 +565,7 @@ class _RemoteDelivery:
         self._proc = None
         self._available = False
         self._rbuf = b""   # discard any partial bytes from the dead child
+        self._targets = {}   # resolutions belong to the helper that made them
         if proc is not None:
             try:
                 if proc.stdin:
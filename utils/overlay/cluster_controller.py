@@ -119,6 +119,9 @@ class ClusterOverlayController:
         # default would fire if anything closed the remaining overlay windows.
         self._quit_prev: bool = True
         self._taskbar_rep = None   # TaskbarRepresentative while active (or None)
+        # Persistent opaque-only mirror the rep paints (MirrorBuffer while the
+        # rep is up): composition changes re-grab only their damaged rects.
+        self._mirror_buffer = None
         # Peek-active latch for the rep's blanking rule (set by _peek_tick): a
         # faded card under an opaque mirror copy would visibly cancel the fade.
         self._rep_peek_active = False
@@ -254,12 +257,16 @@ class ClusterOverlayController:
         #
         # Ghost points (click-sync ghost cursors) accumulate in the store, fed by
         # on_ghost_event/on_ghost_clear (caller wiring is a LATER task). A ~30ms
-        # QCursor poll (_peek_timer) unions the real cursor with the ghost points
+        # QCursor pass (_peek_timer) unions the real cursor with the ghost points
         # and fades the hovered card via the provider's SAFE paint-time
         # set_shell_extra_opacity (never windowOpacity, never a QGraphicsEffect).
         # Per-slot (0-3) fade progress 0.0 (opaque) -> 1.0 (peeked).
+        # On X11 the pass is event-driven: a pointer-bus watch over the cluster
+        # window (_peek_watch) kicks it on enter/leave/motion and it parks once
+        # every fade settles. Elsewhere (or without a capture) it polls.
         self._peek_store = GhostPointStore()
         self._peek_timer = None
+        self._peek_watch = None
         self._peek_progress = [0.0, 0.0, 0.0, 0.0]
         # Emblem-drag poll: move_requested fires ONCE at drag-start with no delta,
         # so the controller tracks the global cursor itself (a ~16ms poll) and
@@ -1093,6 +1100,7 @@ class ClusterOverlayController:
         self._gesture_active = False
         self._settle_input()
         self._schedule_save()
+        self._kick_peek()
 
     def cursor_over_chrome(self, global_pos) -> bool:
         """True when the GLOBAL (logical screen) point sits on float-UI
@@ -1266,6 +1274,8 @@ class ClusterOverlayController:
         self._reposition_panel()
         # Persist the new (reconciled) anchor (debounced).
         self._schedule_save()
+        # The cards moved under a possibly still pointer: re-run the peek.
+        self._kick_peek()
         return True
 
     # ------------------------------------------------------------------
@@ -1575,6 +1585,7 @@ class ClusterOverlayController:
         try:
             payload = self._ghost_payload_to_logical(payload)
             self._peek_store.ingest(payload)
+            self._kick_peek()
             if not self._ghost_click_enabled():
                 return
             try:
@@ -1594,6 +1605,7 @@ class ClusterOverlayController:
         card back to fully opaque."""
         self._peek_store.clear()
         self._settle_peek()
+        self._kick_peek()
 
     def _ghost_payload_to_logical(self, payload):
         """Convert a ghost payload's native points to logical coords (fetching the
@@ -1984,6 +1996,11 @@ class ClusterOverlayController:
                 provider.set_shell_extra_opacity(slot, bg, portrait)
             except Exception:
                 pass
+        self._invalidate_mirror_cell(slot)
+        if cur == 0.0:
+            # Fully opaque again: refresh just this card's tile (the rep
+            # unblanks at the first un-peeked tick, mid fade-back).
+            self._refresh_taskbar_rep()
 
     def _peek_tick(self, real_point) -> None:
         """One hover-peek detection pass: union the real cursor with the ghost points
@@ -2028,6 +2045,7 @@ class ClusterOverlayController:
                 provider.set_shell_extra_opacity(slot, 1.0, 1.0)
             except Exception:
                 pass
+        self._invalidate_mirror_cell(slot)
 
     def _settle_peek(self) -> None:
         """Restore every faded card to fully opaque (both tiers) and reset progress,
@@ -2044,17 +2062,76 @@ class ClusterOverlayController:
         except Exception:
             point = None
         self._peek_tick(point)
+        if self._peek_watch is not None:
+            # Event-driven mode: re-aim the watch at wherever the cluster is now
+            # (drag/scale kick a pass), and park the pass once no card is mid
+            # fade. After a pass every visible card is either at its target or
+            # still stepping, so all-0/1 means settled.
+            self._peek_watch.set_logical_region(self._peek_region())
+            if all(p in (0.0, 1.0) for p in self._peek_progress):
+                self._peek_timer.stop()
+
+    def _peek_region(self):
+        r = self._compute_window_rect()
+        return (r.x(), r.y(), r.width(), r.height())
+
+    def _kick_peek(self, *_args) -> None:
+        """Run the hover-peek pass until the fades settle again (event-driven
+        mode). In poll mode the timer is already running and this is a no-op."""
+        if self._active and self._peek_timer is not None and not self._peek_timer.isActive():
+            self._peek_timer.start()
+
+    def _start_peek_watch(self) -> bool:
+        """Subscribe to the shared X11 pointer stream for the cluster window.
+        Gated like the click-off watcher: offscreen/NoOp backends never open X
+        connections. False -> the caller polls instead."""
+        from utils import pointer_bus
+        if not pointer_bus.is_supported() or not self._backend.is_available():
+            return False
+        try:
+            watch = pointer_bus.PointerWatch(
+                on_enter=self._kick_peek, on_leave=self._kick_peek,
+                on_move=self._kick_peek)
+            watch.set_logical_region(self._peek_region())
+            if not watch.start():
+                return False
+        except Exception:
+            from utils.overlay.backend import overlay_trace
+            import traceback
+            overlay_trace("peek pointer watch start FAILED (polling instead):\n"
+                          + traceback.format_exc())
+            return False
+        watch.stream_lost.connect(self._on_peek_stream_lost)
+        self._peek_watch = watch
+        return True
+
+    def _stop_peek_watch(self) -> None:
+        watch, self._peek_watch = self._peek_watch, None
+        if watch is not None:
+            watch.stop()
+            watch.deleteLater()
+
+    def _on_peek_stream_lost(self) -> None:
+        """The shared capture died mid-session: fall back to polling."""
+        self._stop_peek_watch()
+        if self._active and self._peek_timer is not None:
+            self._peek_timer.start()
 
     def _start_peek_timer(self) -> None:
-        from PySide6.QtCore import QTimer
+        from utils.frame_clock import FrameTimer
         if self._peek_timer is None:
-            self._peek_timer = QTimer()
+            self._peek_timer = FrameTimer(name="cluster_peek")
             self._peek_timer.setInterval(30)  # ~33Hz, light
             self._peek_timer.timeout.connect(self._on_peek_timer)
-        self._peek_timer.start()
+        if self._peek_watch is None and not self._start_peek_watch():
+            self._peek_timer.start()
+        else:
+            self._kick_peek()   # one pass for wherever the pointer already is
 
     def _stop_peek_timer(self) -> None:
-        """Stop the poll, drop the ghost points, and settle every card opaque."""
+        """Stop the pass (and its pointer watch), drop the ghost points, and
+        settle every card opaque."""
+        self._stop_peek_watch()
         if self._peek_timer is not None:
             self._peek_timer.stop()
         self._peek_store.clear()
@@ -2163,10 +2240,10 @@ class ClusterOverlayController:
         if self.is_radial_open:
             self.dismiss_radial_menu()
         from PySide6.QtGui import QCursor
-        from PySide6.QtCore import QTimer
+        from utils.frame_clock import FrameTimer
         self._drag_last = QCursor.pos()
         if self._drag_timer is None:
-            self._drag_timer = QTimer()
+            self._drag_timer = FrameTimer(name="cluster_drag")
             self._drag_timer.setInterval(16)
             self._drag_timer.timeout.connect(self._drag_step)
         self._drag_timer.start()
@@ -2550,6 +2627,10 @@ class ClusterOverlayController:
         for slot in prev_visible - self._visible_cells:
             self._settle_peek_slot(slot)
         self._apply_cell_visibility()
+        # Only the cells that appeared/disappeared changed on the mirror (a
+        # bbox resize reallocates it anyway).
+        for slot in prev_visible ^ self._visible_cells:
+            self._invalidate_mirror_cell(slot)
         # Keep the representative aligned with the new composition: the bbox
         # ORIGIN can move when the visible set changes (not just its size), so
         # a bare mirror refresh would leave every pixel offset - a persistent
@@ -3149,12 +3230,14 @@ class ClusterOverlayController:
                           "carries the taskbar identity)")
             return
         try:
+            from utils.overlay.mirror_buffer import MirrorBuffer
             from utils.overlay.taskbar_representative import TaskbarRepresentative
             rep = TaskbarRepresentative(
                 on_close_requested=self._request_app_quit,
-                on_tick=self._refresh_taskbar_rep,
+                on_tick=self._tick_taskbar_rep,
                 backend=self._backend)
             self._taskbar_rep = rep
+            self._mirror_buffer = MirrorBuffer()
             self._position_taskbar_rep()    # geometry BEFORE map (program-specified)
             self._refresh_taskbar_rep()     # first mirror BEFORE map (no blank preview)
             rep.prepare_initial_state()     # pre-map hints (below + click-through)
@@ -3168,6 +3251,7 @@ class ClusterOverlayController:
         """Destroy the representative (idempotent; never raises)."""
         rep = self._taskbar_rep
         self._taskbar_rep = None
+        self._mirror_buffer = None
         if rep is None:
             return
         try:
@@ -3195,38 +3279,64 @@ class ClusterOverlayController:
             bbox = bbox.united(screen_rect.translated(-ox, -oy))
         return bbox
 
-    @staticmethod
-    def _opaque_only(pixmap):
-        """Strip sub-opaque pixels (alpha < 250 -> fully transparent).
-
-        The on-screen rep may only paint pixels the cluster hides with
-        IDENTICAL fully-opaque ones; translucent pixels (card shadows, glow,
-        AA edges) would double-composite and read darker/stronger inside the
-        bbox. Byte-level translate keeps this C-speed. ARGB32 little-endian
-        memory layout is BGRA, so the alpha byte sits at offset 3. The wrapping
-        QImage references the mutated bytearray WITHOUT copying; the single
-        defensive ``out.copy()`` detaches the result from that scope-local
-        buffer before it leaves the function."""
-        from PySide6.QtGui import QImage, QPixmap
-        img = pixmap.toImage().convertToFormat(QImage.Format_ARGB32)
-        buf = bytearray(img.constBits())
-        tbl = bytes(255 if a >= 250 else 0 for a in range(256))
-        buf[3::4] = buf[3::4].translate(tbl)
-        out = QImage(buf, img.width(), img.height(),
-                     img.bytesPerLine(), QImage.Format_ARGB32)
-        out.setDevicePixelRatio(img.devicePixelRatio())
-        return QPixmap.fromImage(out.copy())
-
-    def _refresh_taskbar_rep(self, force: bool = False) -> None:
-        """Re-grab the cropped, opaque-only float-UI mirror into the
-        representative. Best-effort and cheap enough for the slow tick; no-op
-        when inactive or blanked (a blanked rep is invisible everywhere, so a
-        grab mid-gesture would be wasted work on frozen pixels). *force*
+    def _invalidate_mirror(self, rect=None) -> None:
+        """Record window-local damage on the rep's mirror (None = all). The
+        next _refresh_taskbar_rep re-grabs only the damaged rects."""
+        buf = self._mirror_buffer
+        if buf is not None:
+            buf.invalidate(rect)
+
+    def _invalidate_mirror_cell(self, slot) -> None:
+        rect = self._cell_window_rect(slot)
+        self._invalidate_mirror(rect if rect is not None else None)
+
+    def _cell_window_rect(self, slot):
+        """Cell *slot*'s window-local rect through the cluster transform,
+        visible or not (None when the provider can't say)."""
+        provider = self._card_provider
+        slots = getattr(provider, "_card_slots", None) if provider is not None else None
+        if slots is None or not (0 <= slot < len(slots)):
+            return None
+        root = slots[slot].get("cell") if isinstance(slots[slot], dict) else None
+        if root is None:
+            return None
+        try:
+            from PySide6.QtCore import QRect
+            origin = self._cell_origin(root, getattr(provider, "_grid_host", None))
+            return self._map_host_rect(QRect(origin, root.size()))
+        except Exception:
+            return None
+
+    def _tick_taskbar_rep(self) -> None:
+        """Safety-net tick (rep's MIRROR_TICK_MS): in-card text changes are
+        not reported to the controller, so every card tile and the emblem are
+        re-grabbed and only tiles that actually differ are written back and
+        repainted."""
+        buf = self._mirror_buffer
+        if buf is not None:
+            win = self._compute_window_rect()
+            buf.invalidate(self._emblem_rect())
+            for _idx, screen_rect, _controls, _cutout in self._visible_card_geoms():
+                buf.invalidate(screen_rect.translated(-win.x(), -win.y()))
+        self._refresh_taskbar_rep(verify=True)
+
+    def _refresh_taskbar_rep(self, force: bool = False, verify: bool = False) -> None:
+        """Bring the representative's opaque-only float-UI mirror up to date.
+
+        The mirror is a persistent buffer (utils/overlay/mirror_buffer.py):
+        only damaged rects are re-grabbed, alpha-stripped and blitted, and the
+        rep repaints only the rect that changed. A bbox resize, DPR change or
+        new cluster scale reallocates it (everything damaged). No damage = no
+        grab at all (a drag end only re-aligns). No-op when inactive or
+        blanked (a blanked rep is invisible everywhere, so a grab mid-gesture
+        would be wasted work on frozen pixels; the damage is kept). *force*
         bypasses ONLY the blanked early-return: the unblank sequence must grab
         the fresh mirror while the rep is still blanked (paint-before-opacity,
-        see _update_rep_blanking)."""
+        see _update_rep_blanking). *verify* drops tiles that are unchanged
+        (the tick, whose damage is unknown)."""
         rep = self._taskbar_rep
-        if rep is None or not self._active or self._surface is None:
+        buf = self._mirror_buffer
+        if rep is None or buf is None or not self._active or self._surface is None:
             return
         if rep.is_blanked() and not force:
             return
@@ -3237,7 +3347,16 @@ class ClusterOverlayController:
             grab = getattr(self._surface, "grab", None)
             if grab is None:
                 return
-            rep.set_mirror(self._opaque_only(grab(bbox)))
+            dpr_fn = getattr(self._surface, "devicePixelRatioF", None)
+            dpr = dpr_fn() if dpr_fn is not None else 1.0
+            fresh = buf.configure(bbox, dpr, key=round(float(self._scale), 4))
+            if not buf.is_dirty():
+                return
+            dirty = buf.sync(grab, verify=verify and not fresh)
+            if fresh:
+                rep.update_mirror(buf.image(), buf.logical_size())
+            elif not dirty.isEmpty():
+                rep.update_mirror(buf.image(), buf.logical_size(), dirty)
         except Exception:
             pass
 
@@ -3278,6 +3397,12 @@ class ClusterOverlayController:
         obstructed = (self._scaling_active or self.drag_in_progress
                       or self._rep_peek_active or self.is_radial_open)
         if obstructed:
+            # Damage what the gesture can change: a zoom re-renders every
+            # pixel, the radial dims the whole cluster. A drag only moves the
+            # window (the mirror rides along) and peek fades report their own
+            # cells (_apply_peek_fade).
+            if self._scaling_active or self.is_radial_open:
+                self._invalidate_mirror()
             rep.set_blanked(True)
             return
         self._position_taskbar_rep()
@@ -3664,8 +3789,11 @@ class ClusterOverlayController:
                 from utils.win32_mouse_capture import Win32MouseCapture
                 factory = Win32MouseCapture
             elif sys.platform.startswith("linux"):
-                from utils.xrecord_capture import XRecordCapture
-                factory = XRecordCapture
+                # Attach to the process-wide pointer stream (the capture
+                # click sync and the hover peek already hold) instead of
+                # opening a second XRecord context.
+                from utils.pointer_bus import SharedCapture
+                factory = SharedCapture
             elif sys.platform == "darwin":
                 # Same contract again: listen-only CGEventTap, gated on the
                 # Input Monitoring TCC grant (start() returns False without
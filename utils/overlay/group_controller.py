@@ -908,9 +908,9 @@ class OverlayGroupController:
         self._peek_tick(point)
 
     def _start_peek_timer(self) -> None:
-        from PySide6.QtCore import QTimer
+        from utils.frame_clock import FrameTimer
         if self._peek_timer is None:
-            self._peek_timer = QTimer()
+            self._peek_timer = FrameTimer(name="group_peek")
             self._peek_timer.setInterval(30)  # ~33Hz, light
             self._peek_timer.timeout.connect(self._on_peek_timer)
         self._peek_timer.start()
@@ -1763,10 +1763,10 @@ class OverlayGroupController:
         if not self._active:
             return
         from PySide6.QtGui import QCursor
-        from PySide6.QtCore import QTimer
+        from utils.frame_clock import FrameTimer
         self._drag_last = QCursor.pos()
         if self._drag_timer is None:
-            self._drag_timer = QTimer()
+            self._drag_timer = FrameTimer(name="group_drag")
             self._drag_timer.setInterval(16)
             self._drag_timer.timeout.connect(self._drag_step)
         self._drag_timer.start()
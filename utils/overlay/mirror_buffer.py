@@ -0,0 +1,168 @@
+"""Persistent, damage-tracked opaque-only mirror for the taskbar representative.
+
+The representative (utils/overlay/taskbar_representative.py) paints an
+opaque-only copy of the float UI's content bbox. Re-grabbing that whole bbox
+on every composition change walks the full cluster paint path (2x2 cards at
+full DPR through the QGraphicsScene proxy), then converts, alpha-strips and
+copies the result several times - even when nothing but a drag moved the
+window, or one card's fade settled.
+
+``MirrorBuffer`` keeps ONE ARGB32 image of the bbox in device pixels and
+updates it in place:
+
+* ``configure(bbox, dpr, key)`` keeps the buffer while the bbox size, device
+  pixel ratio and ``key`` (the cluster scale) are unchanged; any change
+  reallocates it and damages everything.
+* ``invalidate(rect)`` records window-local damage (a card, the emblem, or
+  everything with no argument).
+* ``sync(grab)`` re-grabs only the damaged rects (``QWidget.grab(rect)``
+  renders only the children intersecting the rect), strips sub-opaque pixels
+  on that tile alone and copies its rows into the buffer's bits. It returns the
+  buffer-local rect that changed, so the representative repaints only that.
+  With ``verify=True`` (the safety-net tick, whose damage is unknown) a tile
+  identical to what the buffer already holds is dropped instead of written.
+
+Coordinates: ``bbox`` and damage are window-local logical pixels (the
+controller's ``_content_bbox_window_coords`` space); the image is device
+pixels with no devicePixelRatio set, and tiles are copied byte-for-byte
+(no QPainter, so no premultiply round trip): a verified tile compares
+exactly against what an earlier write stored.
+"""
+from __future__ import annotations
+
+from PySide6.QtCore import QRect, QSize
+from PySide6.QtGui import QImage
+
+# alpha < 250 -> fully transparent, else fully opaque (see strip_sub_opaque).
+_ALPHA_TABLE = bytes(255 if a >= 250 else 0 for a in range(256))
+
+# More pending rects than this collapse to their bounding rect: a handful of
+# card-sized tiles is the normal case; a burst of tiny ones is cheaper as one.
+_MAX_RECTS = 8
+
+
+def strip_sub_opaque(image: QImage) -> tuple[QImage, bytearray]:
+    """ARGB32 copy of *image* with sub-opaque pixels cleared to transparent.
+
+    The on-screen rep may only paint pixels the cluster hides with IDENTICAL
+    fully-opaque ones; translucent pixels (card shadows, glow, AA edges) would
+    double-composite and read darker/stronger inside the bbox. Byte-level
+    translate keeps this C-speed. ARGB32 little-endian memory layout is BGRA,
+    so the alpha byte sits at offset 3. The returned QImage wraps the returned
+    bytearray WITHOUT copying: keep the bytearray alive while the image is in
+    use (or ``copy()`` the image to detach it)."""
+    img = image.convertToFormat(QImage.Format_ARGB32)
+    buf = bytearray(img.constBits())
+    buf[3::4] = buf[3::4].translate(_ALPHA_TABLE)
+    out = QImage(buf, img.width(), img.height(), img.bytesPerLine(),
+                 QImage.Format_ARGB32)
+    out.setDevicePixelRatio(img.devicePixelRatio())
+    return out, buf
+
+
+class MirrorBuffer:
+    """See the module docstring."""
+
+    def __init__(self) -> None:
+        self._image: QImage | None = None
+        self._bbox = QRect()
+        self._dpr = 1.0
+        self._key = None
+        self._damage: list[QRect] = []
+        self.tiles_grabbed = 0      # grab() calls made (tests/diagnostics)
+        self.tiles_written = 0      # tiles actually written into the buffer
+
+    def image(self) -> QImage | None:
+        return self._image
+
+    def bbox(self) -> QRect:
+        return QRect(self._bbox)
+
+    def logical_size(self) -> QSize:
+        return self._bbox.size()
+
+    def configure(self, bbox: QRect, dpr: float, key=None) -> bool:
+        """Point the buffer at *bbox* (window-local). Returns True when the
+        buffer was (re)allocated, i.e. everything is damaged and the caller
+        must install the new image. A moved bbox of the same size keeps its
+        pixels (the content rides along with the window)."""
+        dpr = float(dpr) if dpr and dpr > 0 else 1.0
+        same = (self._image is not None and bbox.size() == self._bbox.size()
+                and dpr == self._dpr and key == self._key)
+        if same:
+            if bbox.topLeft() != self._bbox.topLeft():
+                delta = bbox.topLeft() - self._bbox.topLeft()
+                self._damage = [r.translated(delta) for r in self._damage]
+                self._bbox = QRect(bbox)
+            return False
+        self._bbox = QRect(bbox)
+        self._dpr = dpr
+        self._key = key
+        size = QSize(round(bbox.width() * dpr), round(bbox.height() * dpr))
+        self._image = QImage(size, QImage.Format_ARGB32)
+        self._image.fill(0)
+        self._damage = [QRect(bbox)]
+        return True
+
+    def invalidate(self, rect: QRect | None = None) -> None:
+        """Record window-local damage; None damages the whole bbox."""
+        if rect is None:
+            if not self._bbox.isEmpty():
+                self._damage = [QRect(self._bbox)]
+            return
+        rect = QRect(rect)
+        if rect.isEmpty():
+            return
+        if any(r.contains(rect) for r in self._damage):
+            return
+        self._damage = [r for r in self._damage if not rect.contains(r)]
+        self._damage.append(rect)
+
+    def is_dirty(self) -> bool:
+        return bool(self._damage)
+
+    def sync(self, grab, verify: bool = False) -> QRect:
+        """Re-grab the damaged rects through ``grab(window_rect) -> QPixmap``
+        and blit them into the buffer. Returns the changed area in
+        buffer-local LOGICAL coords (empty when nothing changed)."""
+        img = self._image
+        if img is None:
+            return QRect()
+        rects = [r.intersected(self._bbox) for r in self._damage]
+        self._damage = []
+        rects = [r for r in rects if not r.isEmpty()]
+        if len(rects) > _MAX_RECTS:
+            bound = QRect()
+            for r in rects:
+                bound = bound.united(r)
+            rects = [bound]
+        changed = QRect()
+        dpr = self._dpr
+        ox, oy = self._bbox.x(), self._bbox.y()
+        dst = img.bits()
+        dst_bpl = img.bytesPerLine()
+        for rect in rects:
+            pm = grab(rect)
+            self.tiles_grabbed += 1
+            if pm is None or pm.isNull():
+                continue
+            tile, buf = strip_sub_opaque(pm.toImage())
+            x = round((rect.x() - ox) * dpr)
+            y = round((rect.y() - oy) * dpr)
+            target = QRect(x, y, tile.width(), tile.height()).intersected(img.rect())
+            if target.isEmpty():
+                continue
+            src_bpl = tile.bytesPerLine()
+            sx, sy = target.x() - x, target.y() - y
+            row_bytes = target.width() * 4
+            rows = [(sy + r) * src_bpl + sx * 4 for r in range(target.height())]
+            dests = [(target.y() + r) * dst_bpl + target.x() * 4
+                     for r in range(target.height())]
+            if verify and all(dst[d:d + row_bytes] == buf[s:s + row_bytes]
+                              for s, d in zip(rows, dests)):
+                continue
+            for s, d in zip(rows, dests):
+                dst[d:d + row_bytes] = buf[s:s + row_bytes]
+            self.tiles_written += 1
+            changed = changed.united(rect.translated(-ox, -oy))
+        return changed
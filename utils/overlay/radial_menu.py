@@ -24,6 +24,7 @@ from PySide6.QtGui import (QPainter, QColor, QBrush, QPen, QLinearGradient,
                            QRadialGradient, QPainterPath, QFont, QPolygonF)
 from PySide6.QtWidgets import QWidget
 
+from utils.frame_clock import FrameTimer
 from utils.radial_menu_layout import (MAIN_RING_ANGLES, WINDOWED_RING_ANGLES,
                                        account_ring_angles, polar_point)
 
@@ -576,8 +577,8 @@ class RadialMenuWidget(QWidget):
         self._press_rt = 0.0           # spring-back progress on release
         self._press_scale_val = 1.0
         self._elapsed = QElapsedTimer()
-        self._clock = QTimer(self)
-        self._clock.setInterval(16)    # ~60fps
+        self._clock = FrameTimer(self, name="radial_menu", gate=self)
+        self._clock.setInterval(16)    # every frame
         self._clock.timeout.connect(self._on_clock)
         self._idle_timer = QTimer(self)
         self._idle_timer.setSingleShot(True)
@@ -29,17 +29,19 @@ NORMAL-type top-level takes the app's place in the taskbar and Alt-Tab:
   (probe C proved minimize caches the composited image); a WM-initiated
   minimize is restored immediately.
 
-The controller feeds the mirror via ``set_mirror``: immediately on every
-composition change (the preview is composition-accurate), plus a RARE
-safety-net tick (``on_tick``) so long-lived in-card text (timers) does not
-freeze entirely - preview text may lag up to the tick interval, an accepted
-trade in this judder-sensitive codebase. Mapped-window repaints are invisible
-on screen (covered) and free of any compositor animation.
+The controller feeds the mirror via ``update_mirror``: a persistent image it
+keeps current incrementally (utils/overlay/mirror_buffer.py), refreshed on
+every composition change for just the damaged area (the preview is
+composition-accurate), plus a RARE safety-net tick (``on_tick``) so
+long-lived in-card text (timers) does not freeze entirely - preview text may
+lag up to the tick interval, an accepted trade in this judder-sensitive
+codebase. Only the changed rect is repainted. Mapped-window repaints are
+invisible on screen (covered) and free of any compositor animation.
 """
 from __future__ import annotations
 
-from PySide6.QtCore import QEvent, Qt, QTimer
-from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtCore import QEvent, QRectF, Qt, QTimer
+from PySide6.QtGui import QImage, QPainter
 from PySide6.QtWidgets import QWidget
 
 from utils.overlay.backend import get_overlay_backend, overlay_trace
@@ -47,8 +49,9 @@ from utils.overlay.backend import get_overlay_backend, overlay_trace
 # RARE safety-net mirror refresh. Composition changes re-grab immediately via
 # the controller; this tick only keeps long-lived in-card text (timers) from
 # freezing entirely, so preview text may lag up to 10s - accepted. Kept rare
-# on purpose: every grab walks the whole cluster paint path (judder-sensitive
-# codebase, the taskbar preview is decorative).
+# on purpose: the tick cannot know what changed, so it re-grabs every card
+# tile (writing back only the ones that differ) - judder-sensitive codebase,
+# the taskbar preview is decorative.
 MIRROR_TICK_MS = 10_000
 
 
@@ -62,7 +65,10 @@ class TaskbarRepresentative(QWidget):
         self._backend = backend if backend is not None else get_overlay_backend()
         self._on_close_requested = on_close_requested
         self._on_tick = on_tick
-        self._mirror: QPixmap | None = None
+        # The controller's persistent device-pixel QImage (update_mirror),
+        # with _mirror_dpr its device pixel ratio.
+        self._mirror: QImage | None = None
+        self._mirror_dpr = 1.0
         self._blanked = False
         self._awaiting_first_paint = False  # opacity-staged until the first buffer
         self._awaiting_unblank = False      # unblank staged through a paint pass
@@ -156,15 +162,23 @@ class TaskbarRepresentative(QWidget):
     # ------------------------------------------------------------------
     # Mirror content (what the taskbar thumbnail renders)
     # ------------------------------------------------------------------
-    def set_mirror(self, pixmap: QPixmap | None) -> None:
-        """Install a new cropped mirror of the float UI. Resizes to the mirror's
-        device-independent size so the thumbnail aspect equals the content bbox."""
-        self._mirror = pixmap
-        if pixmap is not None and not pixmap.isNull():
-            size = pixmap.deviceIndependentSize().toSize()
-            if size.isValid() and not size.isEmpty() and size != self.size():
+    def update_mirror(self, image: QImage, size, dirty=None) -> None:
+        """Show the controller's persistent mirror *image* (device pixels, no
+        DPR set) at logical *size*. Resizes to *size* so the thumbnail aspect
+        equals the content bbox. *dirty* is the logical rect that changed
+        since the last call; None means the whole mirror (a new buffer).
+        The image is updated in place by its owner, so only *dirty* is
+        repainted."""
+        if image is None or image.isNull() or size.isEmpty():
+            return
+        self._mirror_dpr = image.width() / size.width()
+        if image is not self._mirror or dirty is None:
+            self._mirror = image
+            if size != self.size():
                 self.resize(size)
-        self.update()
+            self.update()
+            return
+        self.update(dirty)
 
     def paintEvent(self, ev) -> None:
         if self._awaiting_first_paint:
@@ -180,8 +194,12 @@ class TaskbarRepresentative(QWidget):
             QTimer.singleShot(0, self, self._lift_first_paint_stage)
         if self._mirror is None or self._mirror.isNull():
             return
+        # Only the exposed rect: a dirty-rect update() costs that area.
+        r = ev.rect()
+        d = self._mirror_dpr
         p = QPainter(self)
-        p.drawPixmap(self.rect(), self._mirror)
+        p.drawImage(QRectF(r), self._mirror,
+                    QRectF(r.x() * d, r.y() * d, r.width() * d, r.height() * d))
         p.end()
 
     # ------------------------------------------------------------------
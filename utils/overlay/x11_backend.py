@@ -2,21 +2,80 @@
 
 Region is pushed as ShapeInput rectangles so the pointer falls through everything
 NOT in the region to the window behind. Bounding/clip shape is left untouched
-(rendering is unaffected; translucency handles the visuals)."""
+(rendering is unaffected; translucency handles the visuals).
+
+Input-shape updates are incremental: the backend remembers the last region it
+applied per window and diffs against it (``plan_shape_update``), so an
+identical region is skipped and a small change goes out as ShapeUnion /
+ShapeSubtract deltas instead of a full ShapeSet. Updates are also rate-limited
+per window: the first in a frame applies immediately (pre-map shapes still land
+before the map), later ones in the same frame coalesce into one trailing
+request. Scale-wheel bursts and radial reshapes used to send a full replacement
+per notch/hover. Counts go to ``shape_stats`` and, with TTMT_PERF_TRACE=1,
+perf_trace marks."""
 from __future__ import annotations
 
+import time
+import weakref
+
 from PySide6.QtGui import QRegion
+from utils import perf_trace
 from utils.overlay.backend import OverlayBackend, overlay_trace
 
+# Minimum spacing of input-shape requests per window; updates arriving sooner
+# coalesce into one trailing request (one display frame).
+_SHAPE_FRAME_MS = 16
+
 
 def region_to_rects(region: QRegion) -> list[tuple[int, int, int, int]]:
     return [(r.x(), r.y(), r.width(), r.height()) for r in region]  # PySide6 6.10: QRegion is iterable; no .rects()
 
 
+def plan_shape_update(old: QRegion | None, new: QRegion) -> list[tuple[str, list]]:
+    """The Shape requests that turn the applied *old* region into *new*:
+    ``[]`` for a no-op, ``[("set", rects)]`` for a full replacement, or
+    ``("union", added)`` / ``("subtract", removed)`` deltas when those carry
+    fewer rectangles than the full set (each extra request is counted as one
+    rectangle of overhead). *old* None = unknown server state: always Set."""
+    if old is not None and old == new:
+        return []
+    full = region_to_rects(new)
+    if old is None:
+        return [("set", full)]
+    added = region_to_rects(new - old)
+    removed = region_to_rects(old - new)
+    ops = []
+    if added:
+        ops.append(("union", added))
+    if removed:
+        ops.append(("subtract", removed))
+    if len(added) + len(removed) + len(ops) - 1 < len(full):
+        return ops
+    return [("set", full)]
+
+
+class _ShapeEntry:
+    """Per-window input-shape bookkeeping (keyed by native window id; the
+    weakref guards against a recycled id on a different widget)."""
+
+    __slots__ = ("window", "applied", "pending", "sent_at")
+
+    def __init__(self, window):
+        self.window = weakref.ref(window)
+        self.applied: QRegion | None = None   # what the server holds, if known
+        self.pending: QRegion | None = None   # coalesced trailing update
+        self.sent_at = float("-inf")
+
+
 class X11OverlayBackend(OverlayBackend):
     def __init__(self):
         self._display = None
         self._shape = None
+        self._shapes: dict[int, _ShapeEntry] = {}
+        self._flush_scheduled = False
+        # requests: Shape requests sent; rects: rectangles in them; skipped:
+        # no-op updates; coalesced: updates folded into a later request.
+        self.shape_stats = {"requests": 0, "rects": 0, "skipped": 0, "coalesced": 0}
         from utils.overlay.backend import overlay_trace
         try:
             from Xlib import display as xdisplay
@@ -329,18 +388,74 @@ class X11OverlayBackend(OverlayBackend):
     def apply_input_region(self, window, region) -> None:
         if not self.is_available() or region is None:
             return
+        try:
+            wid = int(window.winId())
+        except Exception:
+            return
+        entry = self._shapes.get(wid)
+        if entry is None or entry.window() is not window:
+            entry = self._shapes[wid] = _ShapeEntry(window)
+        region = QRegion(region)
+        elapsed_ms = (time.monotonic() - entry.sent_at) * 1000.0
+        if entry.pending is None and elapsed_ms >= _SHAPE_FRAME_MS:
+            self._send_shape(wid, entry, region)
+            return
+        if entry.pending is not None:
+            self.shape_stats["coalesced"] += 1
+        entry.pending = region
+        self._schedule_shape_flush(max(0, _SHAPE_FRAME_MS - int(elapsed_ms)))
+
+    def _schedule_shape_flush(self, delay_ms: int) -> None:
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        from PySide6.QtCore import QTimer
+        QTimer.singleShot(delay_ms, self.flush_input_regions)
+
+    def flush_input_regions(self) -> None:
+        """Send every coalesced trailing update now (also the timer slot)."""
+        self._flush_scheduled = False
+        for wid, entry in list(self._shapes.items()):
+            if entry.window() is None:
+                del self._shapes[wid]           # widget gone: forget its shape
+                continue
+            if entry.pending is not None:
+                region, entry.pending = entry.pending, None
+                self._send_shape(wid, entry, region)
+
+    def _send_shape(self, wid: int, entry: _ShapeEntry, region: QRegion) -> None:
+        ops = plan_shape_update(entry.applied, region)
+        if not ops:
+            self.shape_stats["skipped"] += 1
+            perf_trace.mark("x11_shape_skipped")
+            return
         from Xlib import X
-        rects = region_to_rects(region)
+        so = self._shape.SO
+        kinds = {"set": so.Set, "union": so.Union, "subtract": so.Subtract}
+        n_rects = sum(len(rects) for _op, rects in ops)
         try:
-            xwin = self._display.create_resource_object("window", int(window.winId()))
-            xwin.shape_rectangles(self._shape.SO.Set, self._shape.SK.Input, X.Unsorted, 0, 0, rects)
+            xwin = self._display.create_resource_object("window", wid)
+            for op, rects in ops:
+                xwin.shape_rectangles(kinds[op], self._shape.SK.Input, X.Unsorted, 0, 0, rects)
             self._display.flush()
+            entry.applied = region
         except Exception:
-            pass  # never crash the UI on a shape failure; caller surfaces readiness
+            entry.applied = None  # server state unknown: next update is a full Set
+            return  # never crash the UI on a shape failure; caller surfaces readiness
+        finally:
+            entry.sent_at = time.monotonic()
+        self.shape_stats["requests"] += len(ops)
+        self.shape_stats["rects"] += n_rects
+        perf_trace.mark("x11_shape_requests", value=len(ops))
+        perf_trace.mark("x11_shape_rects", value=n_rects)
 
     def clear_input_region(self, window) -> None:
         if not self.is_available():
             return
+        try:
+            self._shapes.pop(int(window.winId()), None)  # back to the default shape
+        except Exception:
+            pass
         try:
             xwin = self._display.create_resource_object("window", int(window.winId()))
             xwin.shape_mask(self._shape.SO.Set, self._shape.SK.Input, 0, 0, None)
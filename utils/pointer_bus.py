@@ -0,0 +1,280 @@
+"""Process-wide global pointer stream, shared by every consumer on X11.
+
+Click sync, the radial-menu click-off watcher and the float overlay's hover
+peek each used to observe the pointer separately: two of them opened their own
+XRecord capture (two X connections and a thread each), and the peek polled
+QCursor.pos() every 30 ms for the whole float session, awake or not.
+
+``PointerBus`` owns ONE capture (utils/xrecord_capture.py; the portal-safe
+contract - device events only, never XTEST) and fans its events out:
+
+* Raw listeners get every event on the capture thread, exactly the
+  XRecordCapture ``on_event(kind, root_x, root_y, state, time)`` contract.
+  ``SharedCapture`` wraps a listener in the capture's own start()/stop()/
+  is_running() shape so existing capture factories switch over unchanged.
+* Watches (``PointerWatch``) register a region of interest and get
+  enter/leave/move callbacks on the GUI thread. The capture thread only
+  records the latest point and posts at most one queued wake per GUI turn,
+  and only when something the watch cares about changed (a region crossing,
+  or motion inside the region for a watch with ``on_move``), so a mouse
+  moving elsewhere on screen costs the GUI thread nothing.
+
+The capture runs while anything is attached and stops with the last detach.
+Nothing here constructs a QObject or touches Qt off the GUI thread: the
+capture thread only emits a signal on a GUI-thread-owned bridge (the queued
+marshalling pattern the click-off watcher already uses).
+
+Coordinates are native (physical) root pixels, as XRecord reports them;
+``PointerWatch.set_logical_region`` converts a Qt rect on the way in.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+
+from PySide6.QtCore import QObject, Qt, Signal
+
+
+class PointerBus:
+    def __init__(self, capture_factory=None):
+        # capture_factory(on_event, on_died) -> XRecordCapture-shaped object.
+        self._factory = capture_factory
+        self._lock = threading.RLock()
+        self._capture = None
+        self._next_token = 1
+        # Copy-on-write tuples: the capture thread iterates a snapshot
+        # without taking the lock on every motion event.
+        self._listeners: tuple = ()       # (token, on_event, on_died)
+
+    # -- Raw listeners (capture thread) --------------------------------------
+
+    def attach(self, on_event, on_died=None):
+        """Start delivering raw events to ``on_event`` (capture thread).
+        Returns a token, or None when no capture can run (no X display, no
+        RECORD extension)."""
+        with self._lock:
+            # A capture that died but whose on_died hasn't run yet is
+            # replaced here. Its stop() joins the capture thread, which may
+            # be waiting on this lock in _on_capture_died, so it runs
+            # outside the lock.
+            stale = self._capture
+            if stale is not None and not stale.is_running():
+                self._capture = None
+            else:
+                stale = None
+        if stale is not None:
+            stale.stop()
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._listeners += ((token, on_event, on_died),)
+            if self._capture is None and not self._start_capture():
+                self._listeners = tuple(l for l in self._listeners if l[0] != token)
+                return None
+            return token
+
+    def detach(self, token) -> None:
+        cap = None
+        with self._lock:
+            self._listeners = tuple(l for l in self._listeners if l[0] != token)
+            if not self._listeners and self._capture is not None:
+                cap, self._capture = self._capture, None
+        if cap is not None:
+            cap.stop()
+
+    def is_attached(self, token) -> bool:
+        return any(l[0] == token for l in self._listeners)
+
+    def is_running(self) -> bool:
+        cap = self._capture
+        return cap is not None and cap.is_running()
+
+    def _start_capture(self) -> bool:
+        factory = self._factory
+        if factory is None:
+            from utils.xrecord_capture import XRecordCapture
+            factory = lambda on_event, on_died: XRecordCapture(on_event, on_died=on_died)
+        holder = []
+        cap = factory(self._dispatch, lambda: self._on_capture_died(holder[0]))
+        holder.append(cap)
+        if not (cap.start() and cap.is_running()):
+            cap.stop()
+            return False
+        self._capture = cap
+        return True
+
+    def _dispatch(self, kind, root_x, root_y, state, time):
+        for _token, on_event, _died in self._listeners:
+            try:
+                on_event(kind, root_x, root_y, state, time)
+            except Exception:
+                # One consumer must not starve the others (or kill the
+                # stream; see XRecordCapture._reply_callback).
+                pass
+
+    def _on_capture_died(self, cap) -> None:
+        """Capture thread: the shared stream ended unexpectedly. Every
+        attached listener is detached and told, then the dead capture's X
+        connections are reclaimed. The next attach() starts a fresh one."""
+        with self._lock:
+            if cap is not self._capture:
+                return            # a stopped generation; its owner reclaimed it
+            self._capture = None
+            dying, self._listeners = self._listeners, ()
+        for _token, _on_event, on_died in dying:
+            if on_died is not None:
+                try:
+                    on_died()
+                except Exception:
+                    pass
+        cap.stop()
+
+
+_shared: PointerBus | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_bus() -> PointerBus:
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = PointerBus()
+        return _shared
+
+
+def is_supported() -> bool:
+    """The bus is X11-only; other platforms keep their own captures/polls."""
+    return sys.platform.startswith("linux")
+
+
+class SharedCapture:
+    """XRecordCapture-contract handle on the shared bus: ``start()`` attaches
+    ``on_event``, ``stop()`` detaches, ``is_running()`` is False once stopped
+    or after the shared stream died (``on_died`` is called once, from the
+    capture thread, exactly like a private capture's)."""
+
+    def __init__(self, on_event, on_died=None, bus=None):
+        self._on_event = on_event
+        self._on_died = on_died
+        self._bus = bus
+        self._token = None
+
+    def _shared(self) -> PointerBus:
+        return self._bus if self._bus is not None else shared_bus()
+
+    def start(self) -> bool:
+        if self.is_running():
+            return True
+        self._token = self._shared().attach(self._on_event, self._on_died)
+        return self._token is not None
+
+    def stop(self) -> None:
+        token, self._token = self._token, None
+        if token is not None:
+            self._shared().detach(token)
+
+    def is_running(self) -> bool:
+        bus = self._shared()
+        return (self._token is not None and bus.is_attached(self._token)
+                and bus.is_running())
+
+
+class PointerWatch(QObject):
+    """Region-of-interest subscription delivered on the GUI thread.
+
+    ``on_enter(x, y)`` / ``on_leave(x, y)`` fire when the pointer crosses the
+    region; ``on_move(x, y)`` fires for motion inside it (coalesced: only the
+    latest point since the previous delivery). A region of None is the whole
+    screen. Construct on the GUI thread; ``start()`` returns False when the
+    bus has no capture (callers keep their fallback). ``stream_lost`` fires
+    (GUI thread) if the shared capture dies while the watch is running.
+    """
+
+    _wake = Signal()
+    stream_lost = Signal()
+
+    def __init__(self, on_enter=None, on_leave=None, on_move=None, bus=None,
+                 parent=None):
+        super().__init__(parent)
+        self._on_enter = on_enter
+        self._on_leave = on_leave
+        self._on_move = on_move
+        self._bus = bus
+        self._handle = None
+        self._lock = threading.Lock()
+        self._region = None               # (x, y, w, h) native, or None
+        self._latest = None               # latest relevant point (capture thread)
+        self._latest_inside = False
+        self._posted = False
+        self._delivered_inside = False    # GUI-thread view
+        self._wake.connect(self._deliver, Qt.QueuedConnection)
+
+    def start(self) -> bool:
+        if self._handle is None:
+            # on_died runs on the capture thread: the signal queues it over.
+            self._handle = SharedCapture(self._on_event, on_died=self.stream_lost.emit,
+                                         bus=self._bus)
+        return self._handle.start()
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.stop()
+        with self._lock:
+            self._latest = None
+            self._posted = False
+            self._latest_inside = self._delivered_inside = False
+
+    def is_running(self) -> bool:
+        return self._handle is not None and self._handle.is_running()
+
+    def set_region(self, rect) -> None:
+        """Native (x, y, w, h), or None for the whole screen."""
+        with self._lock:
+            self._region = tuple(int(v) for v in rect) if rect is not None else None
+
+    def set_logical_region(self, rect) -> None:
+        """Qt logical (x, y, w, h), converted to native on the GUI thread."""
+        from utils.screen_coords import logical_rect_to_native
+        self.set_region(logical_rect_to_native(rect) if rect is not None else None)
+
+    def _inside(self, x, y) -> bool:
+        r = self._region
+        return r is None or (r[0] <= x < r[0] + r[2] and r[1] <= y < r[1] + r[3])
+
+    def _on_event(self, kind, root_x, root_y, _state, _time):
+        # Capture thread: decide relevance cheaply, post at most one wake.
+        with self._lock:
+            inside = self._inside(root_x, root_y)
+            relevant = (inside != self._latest_inside
+                        or (inside and self._on_move is not None))
+            if not relevant:
+                return
+            self._latest = (int(root_x), int(root_y))
+            self._latest_inside = inside
+            if self._posted:
+                return
+            self._posted = True
+        self._wake.emit()
+
+    def _deliver(self) -> None:
+        with self._lock:
+            self._posted = False
+            point, inside = self._latest, self._latest_inside
+        if point is None:
+            return
+        x, y = point
+        try:
+            if inside and not self._delivered_inside:
+                self._delivered_inside = True
+                if self._on_enter is not None:
+                    self._on_enter(x, y)
+            elif not inside and self._delivered_inside:
+                self._delivered_inside = False
+                if self._on_leave is not None:
+                    self._on_leave(x, y)
+            if inside and self._on_move is not None:
+                self._on_move(x, y)
+        except Exception as e:
+            # Queued Qt slot: never raise into dispatch.
+            print(f"[PointerBus] watch callback failed: {e}")
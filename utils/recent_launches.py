@@ -1,18 +1,22 @@
 """Recent-launch MRU store for the emblem launch menus.
 
-Qt-free and unit-testable. Persists an ordered list of account IDs (front = most
-recent) via a settings_manager. Display/eligibility data for the menus is resolved
-elsewhere at build time because it is volatile (running state, renamed labels,
-deleted accounts).
+Qt-free and unit-testable. Keeps an ordered list of account IDs (front = most
+recent) in the shared SQLite history store (utils/history_store.py); the legacy
+settings key "recent_launches" is imported once. Display/eligibility data for
+the menus is resolved elsewhere at build time because it is volatile (running
+state, renamed labels, deleted accounts).
 """
 from __future__ import annotations
 
+from utils.history_store import store_for
+
 
 class RecentLaunchesStore:
-    """Ordered MRU of account IDs, persisted via a settings_manager.
+    """Ordered MRU of account IDs, persisted in the history store.
 
-    ``settings_manager`` must expose ``get(key, default)`` and ``set(key, value)``;
-    pass ``None`` to degrade to a no-op (no persistence, always empty).
+    ``settings_manager`` must expose ``get(key, default)`` (read once, for the
+    legacy import); pass ``None`` to degrade to a no-op (no persistence,
+    always empty).
     """
 
     _KEY = "recent_launches"
@@ -20,11 +24,12 @@ class RecentLaunchesStore:
 
     def __init__(self, settings_manager):
         self._sm = settings_manager
+        self._db = store_for(settings_manager)
+        if self._db is not None and not self._db.imported(self._KEY):
+            self._db.import_legacy(
+                self._KEY, launches=self._legacy_ids(settings_manager.get(self._KEY, [])))
 
-    def ordered_ids(self) -> list[str]:
-        if self._sm is None:
-            return []
-        raw = self._sm.get(self._KEY, [])
+    def _legacy_ids(self, raw) -> list[str]:
         if not isinstance(raw, list):
             return []
         # Defensive read: drop non-strings, de-dupe (keep first), and enforce the
@@ -38,12 +43,14 @@ class RecentLaunchesStore:
                 out.append(x)
         return out[:self._CAP]
 
+    def ordered_ids(self) -> list[str]:
+        if self._db is None:
+            return []
+        return list(self._db.launches()[:self._CAP])
+
     def record(self, account_id: str) -> None:
         # Type-check first so a non-string never reaches the truthiness test.
         if not isinstance(account_id, str) or not account_id:
             return
-        ids = [x for x in self.ordered_ids() if x != account_id]
-        ids.insert(0, account_id)
-        ids = ids[:self._CAP]
-        if self._sm is not None:
-            self._sm.set(self._KEY, ids)
+        if self._db is not None:
+            self._db.record_launch(account_id, self._CAP)
@@ -4,8 +4,16 @@ Verified pose names sourced from the TTR community wiki and probed
 against rendition.toontownrewritten.com (HTTP 500 with invalid DNA
 confirms the endpoint exists).
 
-Cache: <config_dir>/rendition_cache/<dna>__<pose>__<size>.png
-TTL:   24 hours (mtime-based). Expired entries refetch on access.
+Two cache levels:
+  Memory: LRU of decoded QImages keyed by (dna, pose, size), capped at
+          _MEM_CAP entries (four toons x every pose fits).
+  Disk:   <config_dir>/rendition_cache/<dna>__<pose>__<size>.png
+          TTL 24 hours (mtime-based), expired entries refetch on access.
+          Capped at _DISK_CAP_BYTES; the oldest-fetched files go first.
+
+request() never touches the disk on the GUI thread: a memory hit emits
+at once, anything else (disk read, HTTPS fetch, PNG decode) runs on the
+pool. Concurrent requests for one (dna, pose) share a single job.
 
 THREADING / PAINT-RACE NOTE
 ---------------------------
@@ -16,17 +24,24 @@ cascade. Mitigations in this module:
 
   * Bounded concurrency: max 3 worker threads via shared
     ThreadPoolExecutor.
-  * Worker threads do HTTP + bytes only - NO QImage / QPixmap
-    construction. Bytes are passed to the GUI thread via a private
-    signal; decoding happens on the GUI thread.
+  * Workers build exactly one QImage per job (QImage is a plain value
+    type, safe off the GUI thread) and nothing else Qt: no QObject, no
+    QPixmap. The GUI thread only runs QPixmap.fromImage, which is a
+    cheap upload compared with the PNG decode it used to do.
+  * One keep-alive HTTPS connection per worker thread instead of a
+    fresh TLS handshake per pose.
   * No polling. Purely request-driven.
 """
 
 from __future__ import annotations
 
+import http.client
 import os
 import ssl
 import threading
+import time
+import urllib.parse
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from typing import Final, Optional
 
@@ -85,18 +100,56 @@ _URL = (
     "https://rendition.toontownrewritten.com/render/{dna}/{pose}/"
     f"{_REQUEST_SIZE}x{_REQUEST_SIZE}.png"
 )
+_HTTP_TIMEOUT = 10
+_MEM_CAP = 64
+_DISK_CAP_BYTES = 48 * 1024 * 1024
+
+# One persistent HTTPS connection per pool thread (http.client connections
+# are not thread-safe, and there are at most _MAX_WORKERS of these).
+_conn_local = threading.local()
+
+
+def _http_get(url: str) -> bytes:
+    """GET ``url`` over this thread's keep-alive connection. A connection the
+    server has since closed is retried once on a fresh one; errors on a
+    fresh connection propagate."""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    while True:
+        conn = getattr(_conn_local, "conn", None)
+        reused = conn is not None and getattr(_conn_local, "host", None) == parts.netloc
+        if not reused:
+            if conn is not None:
+                conn.close()
+            conn = http.client.HTTPSConnection(
+                parts.netloc, timeout=_HTTP_TIMEOUT, context=_ssl_context())
+            _conn_local.conn, _conn_local.host = conn, parts.netloc
+        try:
+            conn.request("GET", path, headers={"User-Agent": "ToonTown MultiTool"})
+            resp = conn.getresponse()
+            data = resp.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            _conn_local.conn = None
+            if reused:
+                continue
+            raise
+        if resp.status != 200:
+            raise OSError(f"HTTP {resp.status} for {path}")
+        return data
 
 
 class RenditionPoseFetcher(QObject):
-    """Singleton: shared disk cache + bounded thread pool across all callers."""
+    """Singleton: shared memory + disk cache and bounded thread pool across
+    all callers."""
 
     # Public signal: GUI-thread payload, ready-to-use QPixmap (or None on
-    # failure). Internal _bytes_ready private signal stays inside this class.
+    # failure). Internal _image_ready private signal stays inside this class.
     pose_ready = Signal(str, str, object)  # (dna, pose, QPixmap | None)
-    # Private signal: worker thread emits bytes (no Qt object construction
-    # on the worker side - see paint-race postmortem). The GUI-thread slot
-    # decodes to QPixmap then re-emits the public pose_ready.
-    _bytes_ready = Signal(str, str, object)  # (dna, pose, bytes | None)
+    # Private signal: the pool thread emits the decoded QImage (never a
+    # QPixmap - see paint-race note). The GUI-thread slot caches it, converts
+    # to QPixmap and re-emits the public pose_ready.
+    _image_ready = Signal(str, str, object, int)  # (dna, pose, QImage | None, gen)
 
     _instance: Optional["RenditionPoseFetcher"] = None
     _instance_lock = threading.Lock()
@@ -121,7 +174,15 @@ class RenditionPoseFetcher(QObject):
         except OSError:
             pass
         self._cleanup_legacy_cache()
-        self._bytes_ready.connect(self._on_bytes_ready)
+        # GUI-thread only: decoded images and the keys with a job queued.
+        self._images: "OrderedDict[tuple, QImage]" = OrderedDict()
+        self._inflight: set = set()
+        # Bumped by invalidate_dna; a job carries the value it was queued
+        # under so a fetch that was already running when the refresh landed
+        # can't put the old image back.
+        self._generation: dict = {}
+        self._disk_lock = threading.Lock()
+        self._image_ready.connect(self._on_image_ready)
 
     def cache_dir(self) -> str:
         return self._cache_dir
@@ -145,6 +206,25 @@ class RenditionPoseFetcher(QObject):
                 except OSError:
                     pass
 
+    # -- Memory cache --------------------------------------------------------
+
+    @staticmethod
+    def _key(dna: str, pose: str) -> tuple:
+        return (dna, pose, _REQUEST_SIZE)
+
+    def _remember(self, key: tuple, img: QImage) -> None:
+        self._images[key] = img
+        self._images.move_to_end(key)
+        while len(self._images) > _MEM_CAP:
+            self._images.popitem(last=False)
+
+    def _memory_pixmap(self, key: tuple) -> Optional[QPixmap]:
+        img = self._images.get(key)
+        if img is None:
+            return None
+        self._images.move_to_end(key)
+        return QPixmap.fromImage(img)
+
     # -- Disk cache ----------------------------------------------------------
 
     def _path_for(self, dna: str, pose: str) -> str:
@@ -152,75 +232,136 @@ class RenditionPoseFetcher(QObject):
             self._cache_dir, f"{dna}__{pose}__{_REQUEST_SIZE}.png"
         )
 
-    def cached_pixmap(self, dna: str, pose: str) -> Optional[QPixmap]:
-        """Sync read. Returns pixmap if disk entry exists AND is fresh.
-        None for missing, stale (mtime older than TTL), or unreadable."""
+    def _read_fresh(self, dna: str, pose: str) -> Optional[bytes]:
+        """Bytes of a fresh disk entry, or None for missing/stale/unreadable."""
         path = self._path_for(dna, pose)
         try:
-            mtime = os.path.getmtime(path)
+            if time.time() - os.path.getmtime(path) > _TTL_SECONDS:
+                return None
+            with open(path, "rb") as f:
+                return f.read()
         except OSError:
             return None
-        import time as _time
-        if _time.time() - mtime > _TTL_SECONDS:
+
+    def _write_disk(self, dna: str, pose: str, data: bytes) -> None:
+        """Store fetched bytes, then trim the directory back under the cap.
+        Failure is non-fatal (the bytes are still delivered)."""
+        try:
+            with open(self._path_for(dna, pose), "wb") as f:
+                f.write(data)
+        except OSError:
+            return
+        self._prune_disk()
+
+    def _prune_disk(self, cap: int = _DISK_CAP_BYTES) -> None:
+        """Drop expired entries, then the oldest-fetched ones until the cache
+        fits in ``cap`` bytes."""
+        with self._disk_lock:
+            try:
+                names = [n for n in os.listdir(self._cache_dir) if n.endswith(".png")]
+            except OSError:
+                return
+            now = time.time()
+            entries = []
+            for name in names:
+                path = os.path.join(self._cache_dir, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if now - st.st_mtime > _TTL_SECONDS:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+            total = sum(size for _m, size, _p in entries)
+            for _mtime, size, path in sorted(entries):
+                if total <= cap:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    def cached_pixmap(self, dna: str, pose: str) -> Optional[QPixmap]:
+        """Sync read for callers that must paint now (radial snapshot).
+        Memory first; on a miss, falls back to a fresh disk entry (decoded
+        and remembered). None for missing, stale, or unreadable."""
+        key = self._key(dna, pose)
+        pm = self._memory_pixmap(key)
+        if pm is not None:
+            return pm
+        data = self._read_fresh(dna, pose)
+        if data is None:
             return None
-        pm = QPixmap(path)
-        return pm if not pm.isNull() else None
+        img = QImage.fromData(data, "PNG")
+        if img.isNull():
+            return None
+        self._remember(key, img)
+        return QPixmap.fromImage(img)
 
     # -- Async request -------------------------------------------------------
 
     def request(self, dna: str, pose: str) -> None:
-        """Async. If disk cache is fresh, emits pose_ready immediately
-        (via QTimer.singleShot(0) so receivers see a consistent
-        GUI-thread firing). Otherwise queues a worker that fetches the
-        PNG, writes it to disk, and emits via the private signal."""
+        """Async. A memory hit emits pose_ready via QTimer.singleShot(0) so
+        receivers see a consistent GUI-thread firing. Otherwise queues one
+        pool job per (dna, pose) - later requests for the same key ride on
+        it - that reads the disk entry or fetches the PNG, decodes it, and
+        emits via the private signal."""
         from PySide6.QtCore import QTimer
         if not dna or not pose:
             QTimer.singleShot(0, lambda d=dna, p=pose: self.pose_ready.emit(d, p, None))
             return
-        cached = self.cached_pixmap(dna, pose)
+        key = self._key(dna, pose)
+        cached = self._memory_pixmap(key)
         if cached is not None:
             QTimer.singleShot(
                 0, lambda d=dna, p=pose, pm=cached: self.pose_ready.emit(d, p, pm)
             )
             return
-        self._executor.submit(self._fetch_worker, dna, pose)
-
-    def _fetch_worker(self, dna: str, pose: str) -> None:
-        """Runs on a pool thread. NO Qt object construction here -
-        bytes only. The GUI-thread slot decodes."""
-        import urllib.request
-        url = _URL.format(dna=dna, pose=pose)
-        try:
-            req = urllib.request.Request(
-                url, headers={"User-Agent": "ToonTown MultiTool"}
-            )
-            with urllib.request.urlopen(req, timeout=10, context=_ssl_context()) as resp:
-                data = resp.read()
-        except Exception as exc:
-            # Surface the cause instead of failing silently: a bare swallow here
-            # hid a CERTIFICATE_VERIFY_FAILED for ages (see _ssl_context).
-            print(f"[Rendition] fetch failed for {dna}/{pose}: "
-                  f"{type(exc).__name__}: {exc}")
-            self._bytes_ready.emit(dna, pose, None)
+        if key in self._inflight:
             return
-        # Write to disk before signaling so a same-thread reader sees the
-        # bytes. Failure to write is non-fatal (we still emit the bytes).
-        try:
-            with open(self._path_for(dna, pose), "wb") as f:
-                f.write(data)
-        except OSError:
-            pass
-        self._bytes_ready.emit(dna, pose, data)
+        self._inflight.add(key)
+        self._executor.submit(
+            self._fetch_worker, dna, pose, self._generation.get(dna, 0)
+        )
 
-    def _on_bytes_ready(self, dna: str, pose: str, data) -> None:
-        """GUI thread. Decode bytes -> QImage -> QPixmap, then emit public."""
+    def _fetch_worker(self, dna: str, pose: str, gen: int = 0) -> None:
+        """Runs on a pool thread: disk or network bytes -> QImage. No QObject
+        or QPixmap construction here. ``gen`` is the dna's generation at
+        queue time; a job invalidated meanwhile skips the disk write."""
+        data = self._read_fresh(dna, pose)
         if data is None:
-            self.pose_ready.emit(dna, pose, None)
+            url = _URL.format(dna=dna, pose=pose)
+            try:
+                data = _http_get(url)
+            except Exception as exc:
+                # Surface the cause instead of failing silently: a bare swallow
+                # here hid a CERTIFICATE_VERIFY_FAILED for ages (see _ssl_context).
+                print(f"[Rendition] fetch failed for {dna}/{pose}: "
+                      f"{type(exc).__name__}: {exc}")
+                self._image_ready.emit(dna, pose, None, gen)
+                return
+            if self._generation.get(dna, 0) == gen:
+                self._write_disk(dna, pose, data)
+        img = QImage.fromData(data, "PNG")
+        self._image_ready.emit(dna, pose, None if img.isNull() else img, gen)
+
+    def _on_image_ready(self, dna: str, pose: str, img, gen: int) -> None:
+        """GUI thread. Cache the decoded image, upload it, emit public.
+        A result from before the last invalidate_dna is dropped: the key's
+        in-flight slot (if any) belongs to the refresh's own job."""
+        if gen != self._generation.get(dna, 0):
             return
-        img = QImage()
-        if not img.loadFromData(bytes(data), "PNG"):
+        key = self._key(dna, pose)
+        self._inflight.discard(key)
+        if img is None:
             self.pose_ready.emit(dna, pose, None)
             return
+        self._remember(key, img)
         pm = QPixmap.fromImage(img)
         self.pose_ready.emit(dna, pose, pm if not pm.isNull() else None)
 
@@ -229,6 +370,12 @@ class RenditionPoseFetcher(QObject):
     def invalidate_dna(self, dna: str) -> None:
         """Remove all cache entries for `dna`. Called from the refresh
         button in the Toon section."""
+        for key in [k for k in self._images if k[0] == dna]:
+            del self._images[key]
+        # Let the refresh queue new jobs instead of riding on old ones, and
+        # mark any job still running as stale.
+        self._generation[dna] = self._generation.get(dna, 0) + 1
+        self._inflight = {k for k in self._inflight if k[0] != dna}
         prefix = f"{dna}__"
         try:
             for name in os.listdir(self._cache_dir):
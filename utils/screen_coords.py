@@ -51,3 +51,28 @@ def emitted_to_logical(x, y, screens=None):
     if sys.platform == "darwin":
         return (int(x), int(y))
     return native_to_logical(x, y, screens)
+
+
+def logical_rect_to_native(rect, screens=None):
+    """Map a Qt logical (x, y, w, h) rect into native pixels: the inverse of
+    native_to_logical, scaled by the DPR of the screen holding the rect's
+    center (a rect straddling two mixed-DPR screens takes that one's)."""
+    x, y, w, h = rect
+    if screens is None:
+        from PySide6.QtGui import QGuiApplication
+        screens = QGuiApplication.screens()
+    cx, cy = x + w / 2.0, y + h / 2.0
+    target = None
+    for s in screens:
+        g = s.geometry()
+        if g.x() <= cx < g.x() + g.width() and g.y() <= cy < g.y() + g.height():
+            target = s
+            break
+    if target is None:
+        if not screens:
+            return int(x), int(y), int(w), int(h)
+        target = screens[0]
+    g = target.geometry()
+    dpr = target.devicePixelRatio()
+    return (round(g.x() + (x - g.x()) * dpr), round(g.y() + (y - g.y()) * dpr),
+            round(w * dpr), round(h * dpr))
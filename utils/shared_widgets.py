@@ -18,10 +18,12 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import (
     Qt, Signal, QPropertyAnimation, QEasingCurve, QVariantAnimation,
-    Property, QRectF, QSize, QTimer, QEvent,
+    Property, QRectF, QSize, QEvent,
 )
 from PySide6.QtGui import QColor, QPainter, QPen, QFont, QRadialGradient, QFontMetrics
 
+from utils.frame_clock import FrameTimer
+
 
 def repolish(widget) -> None:
     """Re-evaluate a widget's QSS after a dynamic property change.
@@ -411,7 +413,7 @@ class Spinner(QWidget):
     """Indeterminate rotating spinner. Animates only while visible.
 
     Plain QPainter(self) in paintEvent driven by an integer rotation that a
-    QTimer advances. No QGraphicsEffect anywhere on this widget -- combining a
+    FrameTimer advances. No QGraphicsEffect anywhere on this widget -- combining a
     QGraphicsEffect with a custom QPainter(self) paintEvent triggers
     'A paint device can only be painted by one painter at a time'.
     """
@@ -422,7 +424,7 @@ class Spinner(QWidget):
         self.setFixedSize(self._size, self._size)
         self._angle = 0
         self._color = QColor("#8a9bb8")
-        self._timer = QTimer(self)
+        self._timer = FrameTimer(self, name="spinner")
         self._timer.setInterval(70)
         self._timer.timeout.connect(self._advance)
 
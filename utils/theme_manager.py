@@ -3,10 +3,12 @@ from __future__ import annotations
 from PySide6.QtGui import QPalette, QFont, QPixmap, QPainter, QColor, QIcon, QPen, QPainterPath
 from PySide6.QtWidgets import QApplication, QGraphicsDropShadowEffect, QWidget, QLabel
 from PySide6.QtCore import Qt, QRectF, QObject, Signal, Slot
+import functools
 import math
 import os
 import sys
 import time
+from types import MappingProxyType
 
 # Backward compatibility: icon generators moved to utils.icon_factory
 from utils.icon_factory import *  # noqa: F401,F403
@@ -90,9 +92,30 @@ def get_set_color(index: int) -> tuple:
 
 
 # ── Theme Colors ───────────────────────────────────────────────────────────
+#
+# Token tables are built once per theme and handed out as read-only mappings.
+# They used to be rebuilt as fresh dicts on every call, and the callers include
+# hot paths: _c() from apply_visual_state and every restyle, and get_v2_tokens
+# (~50 alpha() conversions per call) from every v2 widget's apply_theme. Copy
+# with dict(...) if you need a table you can modify.
+
+_TOKEN_TABLES: dict = {}
+
+
+def _token_table(kind: str, is_dark: bool, build):
+    key = (kind, bool(is_dark))
+    table = _TOKEN_TABLES.get(key)
+    if table is None:
+        table = _TOKEN_TABLES[key] = MappingProxyType(build(bool(is_dark)))
+    return table
 
-def get_theme_colors(is_dark: bool) -> dict:
-    """Return a dict of semantic color tokens for the current theme."""
+
+def get_theme_colors(is_dark: bool) -> "MappingProxyType[str, str]":
+    """Semantic color tokens for the theme (cached, read-only)."""
+    return _token_table("colors", is_dark, _build_theme_colors)
+
+
+def _build_theme_colors(is_dark: bool) -> dict:
     if is_dark:
         return {
             # Backgrounds  (elevation: sidebar < app < card < card_inner)
@@ -451,11 +474,16 @@ V2_NAV = {
 }
 
 
-def get_v2_tokens(is_dark: bool) -> dict:
+def get_v2_tokens(is_dark: bool) -> "MappingProxyType":
     """Theme-dependent token set for the v2 kit primitives (inset rows,
     pill controls, option tiles, nav pills, badges). Values are exact ports
     of V2_DARK_T / V2_LIGHT_T in settings-v2-widgets.reference.jsx, with
-    rgba alpha expressed 0-255 (this codebase's QSS convention)."""
+    rgba alpha expressed 0-255 (this codebase's QSS convention). Cached and
+    read-only, like get_theme_colors."""
+    return _token_table("v2", is_dark, _build_v2_tokens)
+
+
+def _build_v2_tokens(is_dark: bool) -> dict:
     from utils.color_math import alpha
     if is_dark:
         return {
@@ -518,6 +546,7 @@ def get_v2_tokens(is_dark: bool) -> dict:
     }
 
 
+@functools.lru_cache(maxsize=None)
 def get_overflow_trigger_qss(is_dark: bool) -> str:
     """Glass material for the debug ⋯ overflow trigger (logs redesign spec,
     entry chrome). Solid-composite over the band paint — no backdrop blur
@@ -1177,6 +1206,24 @@ class SystemThemeWatcher(QObject):
 
 _APPLIED_THEME: str | None = None  # set by apply_theme(); used by is_dark_palette()
 
+# Bumped by apply_theme() whenever the applied theme actually changes, so a
+# consumer can remember the version it last styled for and skip a restyle
+# that would reproduce the same sheets.
+_THEME_VERSION = 0
+
+
+def theme_version() -> int:
+    return _THEME_VERSION
+
+
+def prewarm_theme_tables() -> None:
+    """Build every token table and theme-level QSS string ahead of the
+    first theme toggle, so the toggle itself only looks them up."""
+    for is_dark in (True, False):
+        get_theme_colors(is_dark)
+        get_v2_tokens(is_dark)
+        get_overflow_trigger_qss(is_dark)
+
 
 def is_dark_palette() -> bool:
     """Return True if the currently applied app theme is dark.
@@ -1228,15 +1275,17 @@ def _fusion_dark_palette() -> QPalette:
     return p
 
 
-def apply_theme(app, theme: str):
-    global _APPLIED_THEME
-    _APPLIED_THEME = theme if theme in ("dark", "light") else None
-    if theme == "dark":
-        app.setStyleSheet(DARK_THEME)
-    elif theme == "light":
-        app.setStyleSheet(LIGHT_THEME)
-    else:
-        app.setStyleSheet("")
+def apply_theme(app, theme: str) -> int:
+    """Apply the app-wide stylesheet/palette for ``theme`` and return the
+    theme version. Re-applying the theme already in effect is a no-op (no
+    app-wide re-polish) and keeps the version."""
+    global _APPLIED_THEME, _THEME_VERSION
+    applied = theme if theme in ("dark", "light") else None
+    sheet = DARK_THEME if theme == "dark" else LIGHT_THEME if theme == "light" else ""
+    if _THEME_VERSION and applied == _APPLIED_THEME and app.styleSheet() == sheet:
+        return _THEME_VERSION
+    _APPLIED_THEME = applied
+    app.setStyleSheet(sheet)
     # Linux-only: sync Qt's QPalette so the Wayland CSD titlebar (which Qt
     # draws from QPalette, not from the stylesheet) tracks the theme.
     # Skipped on Windows / macOS — Qt 6.5+ delivers a native dark/light
@@ -1251,3 +1300,5 @@ def apply_theme(app, theme: str):
             # default palette," not the stale value we may have overridden
             # during a prior dark-theme apply.
             app.setPalette(app.style().standardPalette())
+    _THEME_VERSION += 1
+    return _THEME_VERSION
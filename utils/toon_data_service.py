@@ -0,0 +1,222 @@
+"""Long-lived toon-data refresh service for the Multitoon tab.
+
+Every refresh trigger (the periodic tick, manual refresh, window changes)
+used to start a fresh thread, which classified each window twice, ran the
+TTR companion query (one more thread per port) and then started yet another
+thread for the CC stdout parse. Every result was pushed to the GUI, even when
+nothing had changed, so each name label, stats label and badge was repainted
+every tick.
+
+``ToonDataService`` owns ONE worker thread with a single-slot request queue:
+
+* ``request()`` replaces any not-yet-started request, so a burst of triggers
+  collapses into one fetch. A request identical to the one already in flight
+  is dropped, because its answer is about to arrive.
+* Each window is classified once per fetch. The CC parse runs on the
+  service's persistent CC thread while the TTR query runs on the worker, and
+  each side is delivered as soon as it is ready.
+* Results are diffed per window against what was last delivered. Only
+  windows whose data changed are passed to ``on_ttr`` / ``on_cc``. A fetch
+  with no changes delivers nothing.
+* ``interval_ms()`` is the adaptive poll interval. It is fast right after
+  something changed (a login, a zone change, a laff hit) and backs off step
+  by step while everything stays put.
+
+Callbacks run on the worker threads. Qt callers marshal them to the GUI
+thread with a Signal.emit, as they did for the old per-fetch threads.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Adaptive poll interval: (unchanged fetches in a row, interval ms). The
+# first few polls after a change stay fast so a login or zone change is
+# followed closely, then the interval backs off to the idle rate.
+_INTERVAL_STEPS = ((3, 2000), (6, 5000))
+_IDLE_INTERVAL_MS = 10000
+
+
+class ToonDataService:
+    """See the module docstring.
+
+    ``classify(wid) -> "ttr" | "cc" | None`` picks the game of a window.
+    ``fetch_ttr(num_slots, wids)`` returns the six per-window lists of
+    ``ttr_api.get_toon_names_by_slot``. ``fetch_cc(num_slots, wids)`` returns
+    a ``CCToonInfo | None`` per window. ``on_ttr(wids, names, styles, colors,
+    laffs, max_laffs, beans)`` and ``on_cc(wids, infos)`` receive only the
+    windows whose data changed."""
+
+    def __init__(self, classify, fetch_ttr, fetch_cc, on_ttr, on_cc):
+        self._classify = classify
+        self._fetch_ttr = fetch_ttr
+        self._fetch_cc = fetch_cc
+        self._on_ttr = on_ttr
+        self._on_cc = on_cc
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread: threading.Thread | None = None
+        self._cc_pool: ThreadPoolExecutor | None = None
+        self._pending: tuple | None = None
+        self._inflight: tuple | None = None
+        self._epoch = 0
+        self._stopped = False
+        # wid -> (game, payload) last delivered for that window.
+        self._delivered: dict = {}
+        self._calm = 0
+        self.requests = 0       # request() calls
+        self.coalesced = 0      # requests absorbed by a pending/in-flight one
+        self.fetches = 0        # fetches actually run
+        self.deliveries = 0     # on_ttr/on_cc calls
+
+    # -- Requests (any thread) -----------------------------------------------
+
+    def request(self, wids, ttr_enabled: bool, cc_enabled: bool) -> bool:
+        """Queue a fetch for ``wids``. Returns False when the request was
+        absorbed by one already pending or in flight."""
+        key = (tuple(wids), bool(ttr_enabled), bool(cc_enabled))
+        with self._lock:
+            if self._stopped:
+                return False
+            self.requests += 1
+            if self._pending is None and key == self._inflight:
+                self.coalesced += 1
+                return False
+            absorbed = self._pending is not None
+            if absorbed:
+                self.coalesced += 1
+            self._pending = key
+            self._idle.clear()
+            self._ensure_thread()
+            self._wake.set()
+            return not absorbed
+
+    def busy(self) -> bool:
+        """True while a fetch is pending or running."""
+        return not self._idle.is_set()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        return self._idle.wait(timeout)
+
+    def invalidate(self) -> None:
+        """Forget what was delivered, so the next fetch delivers every
+        window. Call this after the GUI itself cleared or shifted slot data."""
+        with self._lock:
+            self._delivered = {}
+            self._calm = 0
+
+    def cancel(self) -> None:
+        """Drop the pending request and discard results of the one in flight
+        (service stopped)."""
+        with self._lock:
+            self._pending = None
+            self._epoch += 1
+            self._delivered = {}
+            self._calm = 0
+            if self._inflight is None:
+                self._idle.set()
+
+    def shutdown(self) -> None:
+        self.cancel()
+        with self._lock:
+            self._stopped = True
+            self._wake.set()
+            pool, self._cc_pool = self._cc_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def interval_ms(self) -> int:
+        """Poll interval to use for the next periodic refresh."""
+        calm = self._calm
+        for limit, ms in _INTERVAL_STEPS:
+            if calm < limit:
+                return ms
+        return _IDLE_INTERVAL_MS
+
+    # -- Worker --------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        # Caller holds self._lock.
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="toon-data", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            with self._lock:
+                if self._stopped:
+                    return
+                self._wake.clear()
+                key, self._pending = self._pending, None
+                if key is None:
+                    continue
+                self._inflight = key
+                epoch = self._epoch
+            try:
+                self._fetch(key, epoch)
+            except Exception as e:
+                print(f"[ToonData] Fetch failed: {e}")
+            finally:
+                with self._lock:
+                    self._inflight = None
+                    if self._pending is None:
+                        self._idle.set()
+
+    def _fetch(self, key, epoch: int) -> None:
+        wids, ttr_enabled, cc_enabled = key
+        self.fetches += 1
+        games = {wid: self._classify(wid) for wid in wids}
+        ttr_wids = [w for w in wids if games[w] == "ttr"] if ttr_enabled else []
+        cc_wids = [w for w in wids if games[w] == "cc"] if cc_enabled else []
+
+        cc_future = None
+        if cc_wids:
+            with self._lock:
+                if self._cc_pool is None:
+                    self._cc_pool = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="toon-data-cc")
+                pool = self._cc_pool
+            cc_future = pool.submit(self._fetch_cc, len(cc_wids), list(cc_wids))
+
+        changed = False
+        if ttr_wids:
+            rows = self._fetch_ttr(len(ttr_wids), list(ttr_wids))
+            per_wid = {wid: tuple(col[i] if i < len(col) else None for col in rows)
+                       for i, wid in enumerate(ttr_wids)}
+            fresh = self._diff("ttr", per_wid, epoch)
+            if fresh:
+                changed = True
+                self.deliveries += 1
+                self._on_ttr(fresh, *([per_wid[w][c] for w in fresh]
+                                      for c in range(len(rows))))
+
+        if cc_future is not None:
+            infos = cc_future.result()
+            per_wid = {wid: infos[i] if i < len(infos) else None
+                       for i, wid in enumerate(cc_wids)}
+            fresh = self._diff("cc", per_wid, epoch)
+            if fresh:
+                changed = True
+                self.deliveries += 1
+                self._on_cc(fresh, [per_wid[w] for w in fresh])
+
+        with self._lock:
+            if epoch == self._epoch:
+                self._calm = 0 if changed else self._calm + 1
+
+    def _diff(self, game: str, per_wid: dict, epoch: int) -> list:
+        """Windows whose payload differs from the last delivery, recorded as
+        delivered. Empty when the fetch was cancelled meanwhile."""
+        with self._lock:
+            if epoch != self._epoch:
+                return []
+            fresh = [wid for wid, payload in per_wid.items()
+                     if self._delivered.get(wid) != (game, payload)]
+            for wid in fresh:
+                self._delivered[wid] = (game, per_wid[wid])
+            return fresh
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import os
 import sys
+from collections import OrderedDict
 from typing import Final, Optional
 
 from PySide6.QtCore import Qt
@@ -25,7 +26,10 @@ PATTERN_NAMES: Final = (
 )
 
 _asset_dir_override: Optional[str] = None
-_cache: dict[tuple[str, str, int], QPixmap] = {}
+# LRU-capped: the key includes a free-form color, so a color-picker drag
+# mints a new entry per intermediate shade. Oldest tiles are evicted first.
+_CACHE_CAP: Final = 64
+_cache: "OrderedDict[tuple[str, str, int], QPixmap]" = OrderedDict()
 
 
 def _asset_dir() -> str:
@@ -44,21 +48,16 @@ def tinted_pattern_pixmap(name: str, color: QColor, tile_size: int) -> QPixmap:
     key = (name, color.name(), int(tile_size))
     cached = _cache.get(key)
     if cached is not None:
+        _cache.move_to_end(key)
         return cached
     if name not in PATTERN_NAMES:
-        empty = QPixmap()
-        _cache[key] = empty
-        return empty
+        return _store(key, QPixmap())
     svg_path = os.path.join(_asset_dir(), f"{name}.svg")
     if not os.path.isfile(svg_path):
-        empty = QPixmap()
-        _cache[key] = empty
-        return empty
+        return _store(key, QPixmap())
     renderer = QSvgRenderer(svg_path)
     if not renderer.isValid():
-        empty = QPixmap()
-        _cache[key] = empty
-        return empty
+        return _store(key, QPixmap())
     pm = QPixmap(tile_size, tile_size)
     pm.fill(Qt.transparent)
     painter = QPainter(pm)
@@ -68,5 +67,11 @@ def tinted_pattern_pixmap(name: str, color: QColor, tile_size: int) -> QPixmap:
     painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
     painter.fillRect(pm.rect(), color)
     painter.end()
+    return _store(key, pm)
+
+
+def _store(key: tuple[str, str, int], pm: QPixmap) -> QPixmap:
     _cache[key] = pm
+    while len(_cache) > _CACHE_CAP:
+        _cache.popitem(last=False)
     return pm
@@ -9,7 +9,9 @@ Architecture:
 Fix #7: Smart port scanning
   - Known-good ports (previously responded) are queried every 5s cycle
   - Full port range scan only triggers when new windows are detected or
-    every 30 seconds, avoiding 6 thread spawns on every refresh
+    every 30 seconds
+  - Port queries run on one persistent pool (one worker per port in the
+    range) instead of a fresh thread per port per refresh
 
 Docs: https://www.toontownrewritten.com/api/localapi
 """
@@ -23,6 +25,7 @@ import secrets
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait as _wait_futures
 
 TTR_API_PORT_START = 1547
 TTR_API_PORT_END   = 1552
@@ -30,12 +33,30 @@ TTR_API_HOSTS      = ["::1", "127.0.0.1"]  # TTR prefers IPv6, fall back to IPv4
 TTR_USER_AGENT     = "ToonTown MultiTool"
 _AUTH_TOKEN        = secrets.token_hex(16)
 
+# Created on first query; its idle workers simply park between refreshes.
+_query_pool: ThreadPoolExecutor | None = None
+_query_pool_lock = threading.Lock()
+
+
+def _port_query_pool() -> ThreadPoolExecutor:
+    global _query_pool
+    with _query_pool_lock:
+        if _query_pool is None:
+            _query_pool = ThreadPoolExecutor(
+                max_workers=TTR_API_PORT_END - TTR_API_PORT_START + 1,
+                thread_name_prefix="ttr-api")
+        return _query_pool
+
 _DEBUG = False
 _log_callback = None
 _last_logged = {}  # port -> log string (only log when values change)
 _last_debug_logged = {}  # key -> log string (only log when values change)
 _last_logged_lock = threading.Lock()
 _last_debug_logged_lock = threading.Lock()
+# Dedup memory is only a log-spam guard: past this many distinct keys it is
+# simply reset (worst case one repeated line), so it cannot grow over a
+# long session of port/host churn.
+_DEBUG_LOG_KEY_CAP = 256
 
 
 def set_debug(enabled: bool) -> None:
@@ -57,6 +78,8 @@ def _debug_log(key: str, msg: str) -> None:
     with _last_debug_logged_lock:
         if _last_debug_logged.get(key) == msg:
             return
+        if key not in _last_debug_logged and len(_last_debug_logged) >= _DEBUG_LOG_KEY_CAP:
+            _last_debug_logged.clear()
         _last_debug_logged[key] = msg
     _log_callback(msg)
 
@@ -167,6 +190,20 @@ def _get_window_pids_nspid(window_ids: list, host_pids: set) -> dict:
     return result
 
 
+def _parse_ss_listeners(out: str) -> dict:
+    """{port: pid} for TTREngine listeners in `ss -tlnp` output, limited to
+    the Local API port range."""
+    port_to_host_pid = {}
+    for line in out.splitlines():
+        m = re.search(r":(\d+)\s+.*TTREngine.*pid=(\d+)", line)
+        if m:
+            port = int(m.group(1))
+            pid  = int(m.group(2))
+            if TTR_API_PORT_START <= port <= TTR_API_PORT_END:
+                port_to_host_pid[port] = pid
+    return port_to_host_pid
+
+
 def _build_port_to_window_id(current_window_ids: list, active_ports: set | None = None) -> dict:
     """
     Build and cache a stable mapping of API port -> window ID.
@@ -212,15 +249,15 @@ def _build_port_to_window_id(current_window_ids: list, active_ports: set | None
                 port_to_host_pid = macos_ttr_ports.port_to_host_pid(
                     host_pids, TTR_API_PORT_START, TTR_API_PORT_END)
             else:
-                from utils.host_spawn import host_check_output
-                out = host_check_output(["ss", "-tlnp"], stderr=subprocess.DEVNULL, timeout=5).decode()
-                for line in out.splitlines():
-                    m = re.search(r":(\d+)\s+.*TTREngine.*pid=(\d+)", line)
-                    if m:
-                        port = int(m.group(1))
-                        pid  = int(m.group(2))
-                        if TTR_API_PORT_START <= port <= TTR_API_PORT_END:
-                            port_to_host_pid[port] = pid
+                # /proc first: no subprocess (and no flatpak-spawn round trip);
+                # None means /proc cannot speak for the host, so ask ss.
+                from utils import linux_ttr_ports
+                port_to_host_pid = linux_ttr_ports.port_to_host_pid(
+                    TTR_API_PORT_START, TTR_API_PORT_END)
+                if port_to_host_pid is None:
+                    from utils.host_spawn import host_check_output
+                    out = host_check_output(["ss", "-tlnp"], stderr=subprocess.DEVNULL, timeout=5).decode()
+                    port_to_host_pid = _parse_ss_listeners(out)
         except subprocess.TimeoutExpired:
             _debug_log("port_pid_timeout", "[TTR API] Port->PID probe timed out; skipping this cycle.")
             return {}
@@ -374,17 +411,45 @@ def _mark_full_scan_done(current_window_ids: list):
         _last_full_scan_wids = frozenset(current_window_ids) if current_window_ids else frozenset()
 
 
+# ── Live feed support (utils/ttr_live.py) ─────────────────────────────────────
+
+def approved_ports() -> set:
+    """Ports that have answered an authorized query (safe to stream)."""
+    with _approved_ports_lock:
+        return set(_approved_ports)
+
+
+# Final port -> window mapping of the last fetch, fallback pairings included.
+_last_port_map: dict = {}
+
+
+def window_for_port(port: int):
+    """Window id the last fetch paired with ``port``, or None."""
+    with _wid_to_name_lock:
+        return _last_port_map.get(port)
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
-def get_toon_names_by_slot(num_slots: int, current_window_ids: list = None):
+def get_toon_names_by_slot(num_slots: int, current_window_ids: list = None, live=None):
     """
     Fetch toon names, styles, and head colors ordered by slot.
     Returns (names, styles, colors) — all lists of length num_slots.
+
+    ``live(port)`` (optional, e.g. ``TtrLiveFeed.current``) returns the
+    fields a live stream already holds for a port, or None. A port it
+    answers for is not queried again here.
     """
     found = {}  # port -> (name, style, headColor)
     found_lock = threading.Lock()
 
     def _query(port):
+        fields = live(port) if live is not None else None
+        if fields and fields.get("name"):
+            with found_lock:
+                found[port] = (fields["name"], fields.get("style"), fields.get("color"),
+                               fields.get("laff"), fields.get("max_laff"), fields.get("beans"))
+            return
         with _approved_ports_lock:
             already_approved = port in _approved_ports
         timeout = 0.5 if already_approved else 5.0
@@ -423,14 +488,8 @@ def get_toon_names_by_slot(num_slots: int, current_window_ids: list = None):
     if not ports_to_scan:
         return [None]*num_slots, [None]*num_slots, [None]*num_slots, [None]*num_slots, [None]*num_slots, [None]*num_slots
 
-    threads = [
-        threading.Thread(target=_query, args=(port,), daemon=True)
-        for port in ports_to_scan
-    ]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join(timeout=6.0)
+    pool = _port_query_pool()
+    _wait_futures([pool.submit(_query, port) for port in ports_to_scan], timeout=6.0)
 
     if do_full_scan:
         _mark_full_scan_done(current_window_ids)
@@ -470,6 +529,8 @@ def get_toon_names_by_slot(num_slots: int, current_window_ids: list = None):
         )
 
     with _wid_to_name_lock:
+        _last_port_map.clear()
+        _last_port_map.update(port_to_wid)
         active_wids_with_data = set()
         for port, name in found_names.items():
             wid = port_to_wid.get(port)
@@ -0,0 +1,268 @@
+"""Live per-port TTR Local API feed for laff / jellybean updates.
+
+The periodic toon-data refresh (utils/toon_data_service.py) runs every few
+seconds, so a laff change in battle reached the card up to one refresh
+interval late. Polling every port at battle speed through that path would
+open a fresh TCP connection per port per tick.
+
+``TtrLiveFeed`` keeps one long-lived ``_PortStream`` per authorized game
+instance (the ports ttr_api has already seen answer). Each stream holds ONE
+keep-alive HTTP connection and polls ``/all.json`` on it:
+
+* Requests are conditional when the engine hands out an ETag
+  (``If-None-Match`` -> 304, no body). Otherwise an unchanged body is
+  recognised by its digest and is never parsed.
+* A changed body is parsed and compared field by field against the previous
+  one (the first answer is only a baseline). Only the fields that moved
+  (``name``, ``style``, ``color``, ``laff``, ``max_laff``, ``beans``) go to
+  ``on_change(port, fields)``.
+* A quiet port is polled every ``idle_ms`` (a few hundred ms), so a change
+  reaches ``on_change`` well inside a second. That is cheap because of the
+  two paths above: an unchanged poll is a 304 with no body, or at worst a
+  loopback body that is hashed and dropped. For ``settle_s`` after a change
+  (a battle hit, a jellybean pickup) the stream drops to ``fast_ms`` so
+  follow-up hits land sooner still. A port that stops answering is retried
+  at ``retry_ms``.
+* While a stream answers, ``TtrLiveFeed.current(port)`` hands its fields
+  to the periodic refresh (``ttr_api.get_toon_names_by_slot(live=...)``),
+  which then skips its own ``/all.json`` request for that port. Bodies
+  fetched and parsed for a quiet port therefore stay at the one baseline
+  answer (``bodies`` / ``body_bytes`` count them).
+
+The Local API exposes its data only through these request/response
+endpoints, with no streaming endpoint to subscribe to. The stream is
+therefore the conditional poll over one reused connection, which costs no
+connection setup per request.
+
+``on_change`` runs on the stream's thread. Qt callers marshal it with a
+Signal.emit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import threading
+import time
+
+from utils import ttr_api
+
+
+def extract_fields(data: dict) -> dict:
+    """The per-card fields of one ``/all.json`` document (None if absent)."""
+    toon = data.get("toon") or {}
+    laff = data.get("laff") or {}
+    bank = (data.get("beans") or {}).get("bank") or {}
+    return {
+        "name": toon.get("name"),
+        "style": toon.get("style"),
+        "color": toon.get("headColor"),
+        "laff": laff.get("current"),
+        "max_laff": laff.get("max"),
+        "beans": bank.get("current"),
+    }
+
+
+class _PortStream:
+    """One game instance: a keep-alive connection and its poll thread."""
+
+    def __init__(self, port: int, on_change, hosts, fast_ms: int, idle_ms: int,
+                 settle_s: float, retry_ms: int, timeout: float):
+        self.port = port
+        self._on_change = on_change
+        self._hosts = list(hosts)
+        self._fast = fast_ms / 1000.0
+        self._idle = idle_ms / 1000.0
+        self._settle = settle_s
+        self._retry = retry_ms / 1000.0
+        self._timeout = timeout
+        self._conn: http.client.HTTPConnection | None = None
+        self._host_idx = 0
+        self._etag: str | None = None
+        self._digest: bytes | None = None
+        self._fields: dict = {}
+        self._answering = False
+        self._last_change: float | None = None
+        self._clock = time.monotonic
+        self._stop = threading.Event()
+        self.requests = 0          # requests sent (tests/diagnostics)
+        self.connects = 0          # TCP connections opened
+        self.unchanged = 0         # polls answered 304 or with an identical body
+        self.bodies = 0            # 200 answers, i.e. bodies transferred
+        self.body_bytes = 0        # total size of those bodies
+        self._thread = threading.Thread(
+            target=self._run, name=f"ttr-live-{port}", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def join(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
+
+    def fields(self) -> dict:
+        return dict(self._fields)
+
+    def current(self) -> dict | None:
+        """The latest fields while the port answers, else None."""
+        if not (self._answering and self._fields):
+            return None
+        return dict(self._fields)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            host = self._hosts[self._host_idx % len(self._hosts)]
+            conn_host = f"[{host}]" if ":" in host else host
+            self._conn = http.client.HTTPConnection(
+                conn_host, self.port, timeout=self._timeout)
+            self.connects += 1
+        return self._conn
+
+    def _drop_connection(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def _exchange(self, headers: dict):
+        """GET /all.json on the kept connection -> (status, etag, body).
+        A dead kept connection is reopened once on the same host; a host
+        that refuses a fresh connection hands over to the next one."""
+        attempts = len(self._hosts) + 1
+        last_error: Exception | None = None
+        for _ in range(attempts):
+            conn = self._connection()
+            reused = conn.sock is not None
+            try:
+                conn.request("GET", "/all.json", headers=headers)
+                self.requests += 1
+                resp = conn.getresponse()
+                body = resp.read()
+            except (OSError, http.client.HTTPException) as e:
+                last_error = e
+                self._drop_connection()
+                if not reused:
+                    self._host_idx += 1
+                    self._etag = None
+                continue
+            if resp.will_close:
+                self._drop_connection()
+            return resp.status, resp.getheader("ETag"), body
+        raise OSError(f"no answer: {last_error}")
+
+    def poll_once(self) -> bool | None:
+        """One conditional request. True = fields changed, False = unchanged,
+        None = no answer."""
+        headers = {
+            "Host": f"localhost:{self.port}",
+            "Authorization": ttr_api._AUTH_TOKEN,
+            "User-Agent": ttr_api.TTR_USER_AGENT,
+        }
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        try:
+            status, etag, body = self._exchange(headers)
+        except OSError as e:
+            self._answering = False
+            ttr_api._debug_log(f"live_failed_{self.port}",
+                               f"[TTR Live] Port {self.port} poll failed: {e}")
+            return None
+        self._answering = status in (200, 304)
+        if status == 304:
+            self.unchanged += 1
+            return False
+        if status != 200:
+            return None
+        self.bodies += 1
+        self.body_bytes += len(body)
+        self._etag = etag
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest == self._digest:
+            self.unchanged += 1
+            return False
+        self._digest = digest
+        try:
+            fields = extract_fields(json.loads(body.decode()))
+        except (ValueError, AttributeError):
+            self._answering = False
+            return None
+        # The first answer is the baseline: the periodic fetch that found
+        # this port has already delivered it.
+        seeded = bool(self._fields)
+        changed = {k: v for k, v in fields.items() if self._fields.get(k) != v}
+        self._fields = fields
+        if not (seeded and changed):
+            return False
+        self._on_change(self.port, changed)
+        return True
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                try:
+                    result = self.poll_once()
+                except Exception as e:
+                    print(f"[TTR Live] Port {self.port} stream error: {e}")
+                    result = None
+                self._stop.wait(self._next_wait(result))
+        finally:
+            self._answering = False
+            self._drop_connection()
+
+    def _next_wait(self, result: bool | None) -> float:
+        now = self._clock()
+        if result:
+            self._last_change = now
+        if result is None:
+            return self._retry
+        if self._last_change is not None and now - self._last_change < self._settle:
+            return self._fast
+        return self._idle
+
+
+class TtrLiveFeed:
+    """Set of live port streams; see the module docstring."""
+
+    def __init__(self, on_change, hosts=None, fast_ms: int = 100,
+                 idle_ms: int = 250, settle_s: float = 3.0,
+                 retry_ms: int = 5000, timeout: float = 1.0):
+        self._on_change = on_change
+        self._hosts = list(hosts) if hosts else list(ttr_api.TTR_API_HOSTS)
+        self._opts = (fast_ms, idle_ms, settle_s, retry_ms, timeout)
+        self._streams: dict[int, _PortStream] = {}
+        self._lock = threading.Lock()
+
+    def watch(self, ports) -> None:
+        """Stream exactly ``ports``: start new ones, stop ones no longer
+        listed. Cheap when the set is unchanged."""
+        ports = set(ports)
+        with self._lock:
+            gone = [p for p in self._streams if p not in ports]
+            for p in gone:
+                self._streams.pop(p).stop()
+            for p in sorted(ports - self._streams.keys()):
+                stream = _PortStream(p, self._on_change, self._hosts, *self._opts)
+                self._streams[p] = stream
+                stream.start()
+
+    def ports(self) -> set[int]:
+        with self._lock:
+            return set(self._streams)
+
+    def stream(self, port: int) -> _PortStream | None:
+        with self._lock:
+            return self._streams.get(port)
+
+    def current(self, port: int) -> dict | None:
+        """Fields of ``port``'s stream while it answers, else None. Passed
+        to the periodic refresh so a streamed port is not fetched twice."""
+        stream = self.stream(port)
+        return stream.current() if stream is not None else None
+
+    def stop(self) -> None:
+        self.watch(())
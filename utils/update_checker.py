@@ -17,6 +17,7 @@ from PySide6.QtCore import QObject, QThread, Signal
 
 from utils import build_info, version
 from utils.settings_keys import (
+    UPDATE_HTTP_CACHE,
     UPDATE_LAST_CHECK_AT,
     UPDATE_LAST_CHECK_RESULT,
     UPDATE_SKIPPED_VERSION,
@@ -40,21 +41,92 @@ HTTP_TIMEOUT = 5.0
 GITHUB_API_ROOT = "https://api.github.com/repos/flossbud/ToonTown-MultiTool"
 
 
-def _api_get(path: str):
+# Conditional-request cache for GitHub API reads, persisted in settings
+# under UPDATE_HTTP_CACHE as {url: {"etag", "last_modified", "value"}}.
+# Anonymous API calls are limited to 60 an hour; a 304 answer to a request
+# carrying the stored validators costs none of that budget and no body. When
+# the budget is spent anyway (403/429), the last good value stands in for the
+# answer. Oldest entries are dropped past the cap (tag-ref lookups add one
+# entry per release).
+_HTTP_CACHE_MAX_ENTRIES = 16
+
+
+def _http_cache_load(sm) -> dict:
+    raw = sm.get(UPDATE_HTTP_CACHE) if sm is not None else None
+    if not raw or not isinstance(raw, str):
+        return {}
+    try:
+        cache = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _http_cache_store(sm, cache: dict) -> None:
+    while len(cache) > _HTTP_CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)))
+    try:
+        sm.set(UPDATE_HTTP_CACHE, json.dumps(cache))
+    except Exception:
+        # Best-effort like the check cache; the next check just re-downloads.
+        pass
+
+
+def _is_rate_limited(resp) -> bool:
+    if resp.status_code == 429:
+        return True
+    headers = getattr(resp, "headers", None) or {}
+    return resp.status_code == 403 and (
+        headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in headers)
+
+
+def _conditional_get(sm, url: str, reduce=None):
+    """GET a GitHub API url, conditionally when validators are cached.
+
+    Returns the JSON value, passed through ``reduce`` before it is cached
+    (so the releases list is stored as its selected release, not 30
+    bodies). A 304, or a rate-limited answer for a url with a cached value,
+    returns that cached value. Raises requests.RequestException /
+    ValueError when there is no usable answer."""
+    cache = _http_cache_load(sm)
+    entry = cache.get(url)
+    headers = {
+        "User-Agent": f"ToonTownMultiTool/{version.APP_VERSION}",
+        "Accept": "application/vnd.github+json",
+    }
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    resp = requests.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+    if entry is not None:
+        if resp.status_code == 304:
+            return entry.get("value")
+        if _is_rate_limited(resp):
+            print("[update] GitHub API rate limit reached; using the last good response")
+            return entry.get("value")
+    resp.raise_for_status()
+    value = resp.json()
+    if reduce is not None:
+        value = reduce(value)
+    resp_headers = getattr(resp, "headers", None) or {}
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if sm is not None and (etag or last_modified):
+        cache.pop(url, None)
+        cache[url] = {"etag": etag, "last_modified": last_modified, "value": value}
+        _http_cache_store(sm, cache)
+    return value
+
+
+def _api_get(path: str, sm=None):
     """GET a GitHub API path (e.g. /git/ref/tags/v1.2.3) -> JSON dict or
-    None. Errors (incl. 403/429 rate limits) map to None, which callers
-    treat as UNPROVABLE."""
+    None. Conditional and rate-limit tolerant when ``sm`` is given (see
+    _conditional_get). Errors with nothing cached (incl. 403/429 rate
+    limits) map to None, which callers treat as UNPROVABLE."""
     try:
-        resp = requests.get(
-            f"{GITHUB_API_ROOT}{path}",
-            headers={
-                "User-Agent": f"ToonTownMultiTool/{version.APP_VERSION}",
-                "Accept": "application/vnd.github+json",
-            },
-            timeout=HTTP_TIMEOUT,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = _conditional_get(sm, f"{GITHUB_API_ROOT}{path}")
         return data if isinstance(data, dict) else None
     except (requests.RequestException, ValueError, json.JSONDecodeError):
         return None
@@ -237,24 +309,16 @@ def _perform_check(sm, *, manual: bool) -> dict:
                 return {"kind": "none"}
             return _apply_policy(release, resolved_sha, ctx, from_cache=True)
 
-    # 2. Network.
+    # 2. Network (conditional; a 304 or a rate-limited answer reuses the
+    # release selected from the last full response).
     try:
-        resp = requests.get(
-            f"{GITHUB_API}?per_page=30",
-            headers={
-                "User-Agent": f"ToonTownMultiTool/{local_app_version}",
-                "Accept": "application/vnd.github+json",
-            },
-            timeout=HTTP_TIMEOUT,
-        )
-        resp.raise_for_status()
-        releases = resp.json()
+        chosen = _conditional_get(sm, f"{GITHUB_API}?per_page=30",
+                                  reduce=select_release)
     except requests.RequestException as e:
         return {"kind": "failed", "reason": str(e)}
     except (ValueError, json.JSONDecodeError) as e:
         return {"kind": "failed", "reason": f"bad JSON: {e}"}
 
-    chosen = select_release(releases)
     if chosen is None:
         _write_cache(sm, None, None, local_app_version, local_build, local_head)
         return {"kind": "none"}
@@ -286,7 +350,8 @@ def _apply_policy(release, resolved_sha, ctx, *, from_cache: bool) -> dict:
 
     if ctx["source_run"] and not ctx["manual"]:
         if resolved_sha is None:
-            resolved_sha = _resolve_release_commit(release["tag_name"], _api_get)
+            resolved_sha = _resolve_release_commit(
+                release["tag_name"], lambda path: _api_get(path, sm))
             if from_cache and resolved_sha:
                 # Heal a sha-less cached payload (manual-written, skip-path,
                 # or earlier failed resolution) so later hits within the TTL
@@ -2,12 +2,16 @@
 
 Each install method has its own handler. Handlers run synchronously
 inside the method that called them (most are non-blocking: open browser,
-spawn terminal, etc.). The runner is given a reference to its parent
-widget so it can show dialogs for the copy-command fallback and error
-cases.
+spawn terminal, etc.). The exception is the asset download of the
+Windows/.deb/Flatpak handlers: it runs on a worker QThread, and the
+install step continues on the GUI thread once the verified file is in
+place, so its retries and backoff never freeze the UI. The runner is
+given a reference to its parent widget so it can show dialogs for the
+copy-command fallback and error cases.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import shlex
@@ -15,10 +19,11 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import webbrowser
 from typing import Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QThread, Signal
 
 from utils import build_flavor, install_method
 from utils.install_method import InstallMethod
@@ -31,6 +36,12 @@ _log = logging.getLogger(__name__)
 _AUR_HELPERS = ["paru", "yay", "pikaur"]
 _FLATPAK_APP_ID = "io.github.flossbud.ToonTownMultiTool"
 
+# Asset downloads: attempts per download (each resuming from the partial
+# file) and the pause before each retry.
+_DOWNLOAD_ATTEMPTS = 4
+_DOWNLOAD_BACKOFF_S = (1.0, 3.0, 8.0)
+_DOWNLOAD_CHUNK = 64 * 1024
+
 
 def flatpak_app_id() -> str:
     """Return the Flatpak application ID for this app."""
@@ -75,6 +86,42 @@ def pick_asset(assets: list, *, suffix: str) -> Optional[dict]:
     return None
 
 
+def asset_sha256(asset: dict) -> Optional[str]:
+    """Return the lowercase hex SHA-256 the release API publishes for
+    `asset` (its ``digest`` field, ``"sha256:<hex>"``), or None."""
+    algo, _, value = (asset.get("digest") or "").partition(":")
+    if algo.lower() != "sha256" or len(value) != 64:
+        return None
+    return value.lower()
+
+
+def _validator_path(part_path: str) -> str:
+    return part_path + ".validator"
+
+
+def _read_validator(part_path: str) -> Optional[str]:
+    """The ETag / Last-Modified stored beside a ``.part`` file, or None."""
+    try:
+        with open(_validator_path(part_path), encoding="utf-8") as fh:
+            return fh.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_validator(part_path: str, validator: Optional[str]) -> None:
+    """Remember which response a fresh ``.part`` came from, so a resume can
+    send If-Range. A response without a usable validator removes the old
+    one."""
+    try:
+        if validator:
+            with open(_validator_path(part_path), "w", encoding="utf-8") as fh:
+                fh.write(validator)
+        else:
+            os.unlink(_validator_path(part_path))
+    except OSError:
+        pass
+
+
 def find_aur_helper() -> Optional[str]:
     """Return the path of the first AUR helper found on PATH, or None.
 
@@ -87,6 +134,25 @@ def find_aur_helper() -> Optional[str]:
     return None
 
 
+class _DownloadWorker(QObject):
+    finished = Signal(object)   # verified path, or None
+
+    def __init__(self, download, asset: dict, out_dir: Optional[str]):
+        super().__init__()
+        self._download = download
+        self._asset = asset
+        self._out_dir = out_dir
+
+    def run(self):
+        # Always emit, so the runner never stays stuck "downloading".
+        try:
+            path = self._download(self._asset, out_dir=self._out_dir)
+        except Exception as e:  # noqa: BLE001
+            _log.warning("Asset download raised: %s", e)
+            path = None
+        self.finished.emit(path)
+
+
 class UpdateRunner(QObject):
     """Action dispatcher: runs the right update flow for the current install method.
 
@@ -109,6 +175,9 @@ class UpdateRunner(QObject):
         # callers; we store the reference ourselves for dialog parenting.
         super().__init__(None)
         self._parent = parent_widget
+        self._download_thread: Optional[QThread] = None
+        self._download_worker: Optional[_DownloadWorker] = None
+        self._download_done = None
 
     def run_update(self, release_info: dict) -> None:
         """Dispatch to the appropriate handler for the detected install method."""
@@ -157,7 +226,10 @@ class UpdateRunner(QObject):
         # host path (under ~/.var/app/<id>/cache, shared via --filesystem=home).
         from utils.host_spawn import in_flatpak, host_visible_cache_dir
         out_dir = host_visible_cache_dir("update") if in_flatpak() else None
-        path = self._download_asset(asset, out_dir=out_dir)
+        self._download_then(asset, lambda path: self._install_flatpak(path, info),
+                            out_dir=out_dir)
+
+    def _install_flatpak(self, path: Optional[str], info: dict) -> None:
         if path is None:
             self.failed.emit("Failed to download the Flatpak bundle")
             return
@@ -191,7 +263,9 @@ class UpdateRunner(QObject):
         if asset is None:
             self._open_release_with_toast(info, "Couldn't find a .deb asset")
             return
-        path = self._download_asset(asset)
+        self._download_then(asset, lambda path: self._install_deb(path, info))
+
+    def _install_deb(self, path: Optional[str], info: dict) -> None:
         if path is None:
             self.failed.emit("Failed to download the .deb")
             return
@@ -206,7 +280,9 @@ class UpdateRunner(QObject):
         if asset is None:
             self._open_release_with_toast(info, "Couldn't find the installer for your platform")
             return
-        path = self._download_asset(asset)
+        self._download_then(asset, lambda path: self._install_windows(path, info))
+
+    def _install_windows(self, path: Optional[str], info: dict) -> None:
         if path is None:
             self.failed.emit("Failed to download the installer")
             return
@@ -243,12 +319,73 @@ class UpdateRunner(QObject):
 
     # ── Helpers ──────────────────────────────────────────────────────────
 
+    def _download_then(self, asset: dict, on_done, out_dir: Optional[str] = None) -> None:
+        """Run _download_asset on a worker QThread and call ``on_done(path)``
+        back on the GUI thread (path is None on failure). A second update
+        click while a download runs is refused rather than racing it for
+        the same .part file."""
+        if self._download_thread is not None:
+            self.failed.emit("An update download is already in progress.")
+            return
+        self._download_done = on_done
+        self._download_thread = QThread(self)
+        self._download_worker = _DownloadWorker(self._download_asset, asset, out_dir)
+        self._download_worker.moveToThread(self._download_thread)
+        self._download_thread.started.connect(self._download_worker.run)
+        self._download_worker.finished.connect(self._on_download_finished)
+        self._download_worker.finished.connect(self._download_thread.quit)
+        # Same teardown order as UpdateChecker: no worker deleteLater, refs
+        # are dropped only after the thread has really exited.
+        self._download_thread.finished.connect(self._cleanup_download_thread)
+        self._download_thread.start()
+
+    def download_in_progress(self) -> bool:
+        return self._download_thread is not None
+
+    def _on_download_finished(self, path) -> None:
+        on_done, self._download_done = self._download_done, None
+        if on_done is not None:
+            on_done(path)
+
+    def _cleanup_download_thread(self) -> None:
+        if self._download_thread is not None:
+            self._download_thread.wait(2000)
+        self._download_thread = None
+        self._download_worker = None
+        # Guaranteed-final path: a thread that ended without emitting still
+        # reports the failure.
+        if self._download_done is not None:
+            self._on_download_finished(None)
+
+    def shutdown(self) -> None:
+        """Drain an in-flight download before the owning window closes."""
+        if self._download_thread is not None and self._download_thread.isRunning():
+            self._download_done = None
+            self._download_thread.quit()
+            self._download_thread.wait(2000)
+
     def _download_asset(self, asset: dict, out_dir: Optional[str] = None) -> Optional[str]:
-        import requests
+        """Download `asset` into `out_dir` and return the verified path, or
+        None.
+
+        The bytes land in ``<name>.part`` first. A dropped connection keeps
+        the partial file, and the next attempt (up to _DOWNLOAD_ATTEMPTS,
+        with backoff) asks only for the missing bytes with a Range request.
+        A later update attempt resumes the same way. The response's ETag (or
+        Last-Modified) is kept beside the partial and sent as If-Range, so a
+        partial of a different build is restarted by the server instead of
+        extended; with no validator and no published digest to catch a
+        mismatch, the partial is discarded. The SHA-256 is computed
+        while streaming and compared with the digest the release API
+        publishes. The size must match exactly. A file that fails either
+        check is deleted and never renamed into place, so the installer only
+        ever sees a complete, verified asset.
+        """
         url = asset.get("browser_download_url")
         raw_name = asset.get("name", "download") or "download"
         name = os.path.basename(raw_name) or "download"
-        expected_size = int(asset.get("size", 0))
+        expected_size = int(asset.get("size", 0) or 0)
+        expected_sha = asset_sha256(asset)
         if not url:
             return None
         # Default to the system temp dir; callers that need a host-visible path
@@ -256,34 +393,129 @@ class UpdateRunner(QObject):
         # process) pass an explicit out_dir.
         out_dir = out_dir or tempfile.gettempdir()
         out_path = os.path.join(out_dir, name)
+        part_path = out_path + ".part"
+
+        hasher = hashlib.sha256()
+        have = 0
         try:
-            # `(connect_timeout, read_timeout)`: 15s to establish, 120s
-            # between chunks. The previous single-int timeout only covered
-            # connect+headers, leaving a stalled stream to hang indefinitely.
-            with requests.get(url, stream=True, timeout=(15, 120)) as r:
-                r.raise_for_status()
-                with open(out_path, "wb") as fh:
-                    for chunk in r.iter_content(chunk_size=64 * 1024):
-                        fh.write(chunk)
-        except (requests.RequestException, OSError):
+            have = os.path.getsize(part_path)
+        except OSError:
+            pass
+        if have and expected_size and have > expected_size:
+            have = 0                               # stale partial of another build
+        if have:
+            # Resuming: the digest covers the whole file, so fold in what is
+            # already on disk before the stream continues it.
             try:
-                os.unlink(out_path)
+                with open(part_path, "rb") as fh:
+                    for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+                        hasher.update(chunk)
+            except OSError:
+                hasher, have = hashlib.sha256(), 0
+
+        for attempt in range(_DOWNLOAD_ATTEMPTS):
+            if attempt:
+                time.sleep(_DOWNLOAD_BACKOFF_S[min(attempt - 1, len(_DOWNLOAD_BACKOFF_S) - 1)])
+            if expected_size and have == expected_size:
+                break
+            result = self._fetch_range(url, part_path, have, hasher,
+                                       verifiable=expected_sha is not None)
+            if result is None:
+                break                              # permanent failure
+            have, hasher, complete = result
+            if complete:
+                break
+        else:
+            _log.warning("Asset download gave up after %d attempts (%s)",
+                         _DOWNLOAD_ATTEMPTS, url)
+            return None
+
+        if not self._verify_download(part_path, have, expected_size,
+                                     expected_sha, hasher.hexdigest()):
+            try:
+                os.unlink(part_path)
             except OSError:
                 pass
+            _write_validator(part_path, None)
             return None
-        # Size sanity check (within 1% or 1 KB, whichever is larger).
+        _write_validator(part_path, None)
         try:
-            actual = os.path.getsize(out_path)
-            if expected_size > 0 and abs(actual - expected_size) > max(1024, expected_size // 100):
-                _log.warning(
-                    "Downloaded asset size mismatch: expected %d, got %d (path %s)",
-                    expected_size, actual, out_path,
-                )
-                return None
+            os.replace(part_path, out_path)
         except OSError:
             return None
         return out_path
 
+    def _fetch_range(self, url: str, part_path: str, have: int, hasher,
+                     verifiable: bool = False):
+        """One download attempt appending to `part_path` from byte `have`.
+
+        A resume sends If-Range with the validator stored for the partial;
+        without one it resumes bare only when `verifiable` (a digest will
+        catch a foreign partial), and otherwise starts over.
+
+        Returns ``(have, hasher, complete)`` on success or a recoverable
+        network error (the caller retries from the new `have`), or None on a
+        permanent failure (HTTP error status, unwritable file)."""
+        import requests
+        headers = {}
+        if have:
+            validator = _read_validator(part_path)
+            if validator:
+                headers = {"Range": f"bytes={have}-", "If-Range": validator}
+            elif verifiable:
+                headers = {"Range": f"bytes={have}-"}
+            else:
+                have, hasher = 0, hashlib.sha256()
+        try:
+            # `(connect_timeout, read_timeout)`: 15s to establish, 120s
+            # between chunks. The previous single-int timeout only covered
+            # connect+headers, leaving a stalled stream to hang indefinitely.
+            with requests.get(url, stream=True, timeout=(15, 120), headers=headers) as r:
+                if have and r.status_code == 416:
+                    return have, hasher, True      # partial is already whole
+                r.raise_for_status()
+                if have and r.status_code != 206:
+                    # Server ignored the Range, or If-Range found the asset
+                    # changed: start over from byte 0.
+                    have, hasher = 0, hashlib.sha256()
+                if not have:
+                    etag = r.headers.get("ETag")
+                    if etag and etag.startswith("W/"):
+                        etag = None            # weak ETags are not valid in If-Range
+                    _write_validator(part_path, etag or r.headers.get("Last-Modified"))
+                with open(part_path, "ab" if have else "wb") as fh:
+                    for chunk in r.iter_content(chunk_size=_DOWNLOAD_CHUNK):
+                        fh.write(chunk)
+                        hasher.update(chunk)
+                        have += len(chunk)
+        except requests.HTTPError as e:
+            _log.warning("Asset download failed: %s", e)
+            return None
+        except requests.RequestException as e:
+            _log.info("Asset download interrupted at %d bytes: %s", have, e)
+            return have, hasher, False
+        except OSError as e:
+            _log.warning("Asset download could not write %s: %s", part_path, e)
+            return None
+        return have, hasher, True
+
+    @staticmethod
+    def _verify_download(path: str, have: int, expected_size: int,
+                         expected_sha: Optional[str], actual_sha: str) -> bool:
+        if expected_size > 0 and have != expected_size:
+            _log.warning(
+                "Downloaded asset size mismatch: expected %d, got %d (path %s)",
+                expected_size, have, path,
+            )
+            return False
+        if expected_sha is not None and actual_sha != expected_sha:
+            _log.warning(
+                "Downloaded asset digest mismatch: expected %s, got %s (path %s)",
+                expected_sha, actual_sha, path,
+            )
+            return False
+        return True
+
     def _spawn_terminal_or_fallback(self, cmd: list, info: dict) -> None:
         def _on_exit(rc: int):
             if rc != 0:
@@ -50,6 +50,7 @@ class LaunchSection(QWidget):
     COLLAPSE_DURATION_MS = 180
 
     launcher_clicked       = Signal()
+    launch_all_clicked     = Signal()
     add_account_clicked    = Signal()
     tile_launch            = Signal(str)
     tile_quit              = Signal(str)
@@ -122,6 +123,17 @@ class LaunchSection(QWidget):
         self.launcher_btn.clicked.connect(self.launcher_clicked.emit)
         self.card.add_header_button(self.launcher_btn)
 
+        # "Launch all" starts every idle account in the section together
+        # (LaunchTab.launch_group). Only offered once there is more than one
+        # account to launch; set_page toggles it from the section total.
+        self.launch_all_btn = QuietChipButton()
+        self.launch_all_btn.setText("▶ Launch all")
+        self.launch_all_btn.setCursor(Qt.PointingHandCursor)
+        self.launch_all_btn.setToolTip("Log in and launch every account in this section")
+        self.launch_all_btn.setVisible(False)
+        self.launch_all_btn.clicked.connect(self.launch_all_clicked.emit)
+        self.card.add_header_button(self.launch_all_btn)
+
         # Chevron state indicator. Text is swapped between ▾ (expanded)
         # and ▸ (collapsed); no rotation animation - the height tween
         # carries the motion. Styled in apply_theme.
@@ -226,7 +238,7 @@ class LaunchSection(QWidget):
             " padding: 4px 6px;"
             "}"
         )
-        self.launcher_btn.setStyleSheet(
+        chip_qss = (
             "QToolButton {"
             " background: transparent;"
             f" border: 1px solid {c['border_muted']};"
@@ -239,6 +251,8 @@ class LaunchSection(QWidget):
             f" border-color: {c['border_card']};"
             "}"
         )
+        self.launcher_btn.setStyleSheet(chip_qss)
+        self.launch_all_btn.setStyleSheet(chip_qss)
         # Propagate to children that own their own QSS.
         for tile in self.tiles:
             if hasattr(tile, "apply_theme"):
@@ -493,6 +507,7 @@ class LaunchSection(QWidget):
         # refresh the dots without consulting isVisible() (which is False before show).
         self._show_add = not at_ceiling
         self._show_reorder = show_reorder
+        self.launch_all_btn.setVisible(total_count >= 2)
         while self.grid.count():
             item = self.grid.takeAt(0)
             w = item.widget()
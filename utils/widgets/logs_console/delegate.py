@@ -13,7 +13,7 @@ from PySide6.QtWidgets import QStyle, QStyledItemDelegate
 
 from utils.icon_factory import make_copy_icon
 from utils.widgets.logs_console._tokens import get_logs_tokens
-from utils.widgets.logs_console.model import LINE_ROLE
+from utils.widgets.logs_console.model import BUFFER_CAP, LINE_ROLE
 from utils.widgets.portrait_badge import _qcolor_from_rgba
 
 FONT_PX = 13
@@ -116,7 +116,9 @@ class LogLineDelegate(QStyledItemDelegate):
         if cached is None:
             msg_w = self._msg_w(line, vw)
             cached = self._msg_line_count(line, msg_w) * LINE_H + 2 * PAD_V
-            if len(self._heights) > 4096:
+            # Keys pin their LogLine: cap near the ring buffer so rows the
+            # model already dropped are not kept alive by the cache.
+            if len(self._heights) > 2 * BUFFER_CAP:
                 self._heights.clear()
             self._heights[key] = cached
         return QSize(vw, cached)
@@ -24,6 +24,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from utils.frame_clock import FrameTimer
 from utils.toon_pattern_assets import PATTERN_NAMES
 from utils.widgets.color_constants import PRESET_SWATCHES
 from utils.widgets.color_well import ColorWell
@@ -314,7 +315,7 @@ class _PoseTile(QFrame):
         self.setToolTip(pose)
 
         # Shimmer animation - advance phase at ~25 fps.
-        self._shimmer_timer = QTimer(self)
+        self._shimmer_timer = FrameTimer(self, name="pose_shimmer", gate=self)
         self._shimmer_timer.setInterval(40)
         self._shimmer_timer.timeout.connect(self._on_shimmer_tick)
 
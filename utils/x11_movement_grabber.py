@@ -33,7 +33,7 @@ from utils.input_trace import trace as _itrace, ENABLED as _ITRACE
 
 try:
     from Xlib import display as _xlib_display, X, XK
-    from Xlib.error import BadAccess, ConnectionClosedError
+    from Xlib.error import ConnectionClosedError
     _HAS_XLIB = True
 except ImportError:
     _HAS_XLIB = False
@@ -99,7 +99,7 @@ class MovementKeyGrabber:
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
         self._actions: "_queue.Queue[tuple]" = _queue.Queue()
-        self._grabbed: list[tuple[int, int]] = []
+        self._grabbed: set[tuple[int, int]] = set()
         self._keycode_to_name: dict[int, tuple[str, str]] = {}
         self._current_canonical: Optional[str] = None
         self._on_key: Optional[Callable[[str, str], None]] = None
@@ -222,7 +222,7 @@ class MovementKeyGrabber:
                 pass
             self._display = None
             self._root = None
-            self._grabbed = []
+            self._grabbed = set()
             self._keycode_to_name = {}
             self._current_canonical = None
             self._route_all = False
@@ -261,9 +261,14 @@ class MovementKeyGrabber:
             if self._route_all and self._grab_ok:
                 self._current_canonical = canonical_set
                 return
-            self._uninstall_grabs_inline()
+            # Any CC passive grabs stay PARKED: the server never activates a
+            # passive grab while the keyboard is actively grabbed, so they are
+            # inert under route_all, and a TTR->CC flip back to the same set
+            # then costs zero XGrabKey/XUngrabKey requests instead of
+            # 2 x 4 keys x 64 modifier combos.
+            self._release_keyboard_grab()
+            self._reset_routing_state()
             self._route_all = True
-            self._grab_ok = False
             # Register the movement keysyms so the handler classifies them as
             # "grabbed" (suppress-only; pynput routes them).
             for keysym_name in _ALL_MOVEMENT_KEYSYMS:
@@ -299,6 +304,11 @@ class MovementKeyGrabber:
             except Exception as e:  # noqa: BLE001
                 print(f"[x11_movement_grabber] grab_keyboard failed: {e}")
                 self._keyboard_grabbed = False
+            if not self._keyboard_grabbed:
+                # Without the keyboard grab the parked GrabModeSync grabs would
+                # go live, freeze the keyboard on a conflicting key, and nobody
+                # answers with AllowEvents in route_all. Drop them.
+                self._apply_grab_diff(frozenset())
             try:
                 self._display.sync()
             except Exception:
@@ -308,26 +318,21 @@ class MovementKeyGrabber:
             # inactive so the router does not synthesize to an unsuppressed window.
             self._current_canonical = canonical_set if self._grab_ok else None
             return
-        # ---- legacy CC path (unchanged) ----
+        # ---- legacy CC path ----
         if self._current_canonical == canonical_set and not self._route_all:
             return
-        self._uninstall_grabs_inline()
-        keysyms = self._conflicting_keysyms(canonical_set)
-        for keysym_name in keysyms:
+        self._release_keyboard_grab()
+        self._reset_routing_state()
+        wanted: dict[int, str] = {}
+        for keysym_name in self._conflicting_keysyms(canonical_set):
             ks = XK.string_to_keysym(keysym_name)
             if ks == 0:
                 continue
             keycode = self._display.keysym_to_keycode(ks)
             if keycode == 0:
                 continue
+            wanted[keycode] = keysym_name
             self._keycode_to_name[keycode] = ("grabbed", keysym_name)
-            for mod in _LOCK_MODIFIERS:
-                try:
-                    self._root.grab_key(keycode, mod, True,
-                                        X.GrabModeAsync, X.GrabModeSync)
-                    self._grabbed.append((keycode, mod))
-                except BadAccess:
-                    pass
         for keysym_name in passthrough_keysyms:
             ks = XK.string_to_keysym(keysym_name)
             if ks == 0:
@@ -336,37 +341,75 @@ class MovementKeyGrabber:
             if keycode == 0:
                 continue
             self._keycode_to_name.setdefault(keycode, ("passthrough", keysym_name))
-        try:
-            self._display.sync()
-        except Exception:
-            pass
+        self._apply_grab_diff(frozenset(
+            (keycode, mod) for keycode in wanted for mod in _LOCK_MODIFIERS))
         self._current_canonical = canonical_set
 
-    def _uninstall_grabs_inline(self) -> None:
-        # Release the persistent route_all keyboard grab first so the keyboard is
-        # never left captured (focus-away / toggle-off / shutdown all route here).
-        if self._keyboard_grabbed:
+    def _apply_grab_diff(self, wanted: frozenset) -> bool:
+        """Bring the installed passive grabs to exactly `wanted`
+        ({(keycode, modifier_mask)}), sending only the pairs that differ.
+
+        python-xlib buffers void requests, so every XUngrabKey/XGrabKey below
+        goes out as one pipelined batch on the closing sync() -- a single round
+        trip. Errors arrive asynchronously: each XGrabKey carries an onerror
+        that records its pair, and pairs another client already owns
+        (BadAccess) are dropped from _grabbed after the sync instead of being
+        checked one request at a time. Returns True if anything was sent
+        (and therefore synced)."""
+        drop = sorted(self._grabbed - wanted)
+        add = sorted(wanted - self._grabbed)
+        if not drop and not add:
+            return False
+        failed: list[tuple[int, int]] = []
+        for keycode, mod in drop:
             try:
-                self._display.ungrab_keyboard(X.CurrentTime)
+                self._root.ungrab_key(keycode, mod)
             except Exception:
                 pass
-            self._keyboard_grabbed = False
-        for keycode, mod in self._grabbed:
+        for pair in add:
             try:
-                self._root.ungrab_key(keycode, mod)
+                self._root.grab_key(pair[0], pair[1], True,
+                                    X.GrabModeAsync, X.GrabModeSync,
+                                    onerror=lambda err, req, pair=pair: failed.append(pair))
             except Exception:
-                pass
+                failed.append(pair)
+        self._grabbed = set(wanted)
         try:
-            self._display.sync()
+            self._display.sync()    # flushes the batch and parses async errors
         except Exception:
             pass
-        self._grabbed = []
+        if failed:
+            self._grabbed.difference_update(failed)
+            print(f"[x11_movement_grabber] {len(failed)} of {len(add)} key grabs "
+                  f"refused (in use by another application)")
+        return True
+
+    def _release_keyboard_grab(self) -> None:
+        if self._keyboard_grabbed:
+            try:
+                self._display.ungrab_keyboard(X.CurrentTime)
+            except Exception:
+                pass
+            self._keyboard_grabbed = False
+
+    def _reset_routing_state(self) -> None:
         self._keycode_to_name = {}
         self._current_canonical = None
         self._route_all = False
         self._grab_ok = False
         self._hotkey_keys_down = set()   # held-hotkey state is stale once ungrabbed
 
+    def _uninstall_grabs_inline(self) -> None:
+        # Release the persistent route_all keyboard grab first so the keyboard is
+        # never left captured (focus-away / toggle-off / shutdown all route here).
+        self._release_keyboard_grab()
+        if not self._apply_grab_diff(frozenset()):
+            try:
+                self._display.sync()
+            except Exception:
+                pass
+        self._reset_routing_state()
+
     def _key_physically_down(self, keycode: int) -> bool:
         """True if `keycode` is currently held per the server's physical key
         state (query_keymap). Used to recognize X auto-repeat KeyRelease events